@@ -8,10 +8,13 @@ Usage:
 Initialisation order:
     1. Config  (loads .env, sets up workspace)
     2. MemorySystem (hierarchical memory, facts, RAG)
-    3. ToolSystem (function-calling definitions + handlers)
+    3. ToolSystem (ToolRegistry built from the coco.tools providers)
     4. ConsciousnessEngine (Claude API, command routing, identity)
     5. UIOrchestrator (Rich console + prompt_toolkit REPL)
     6. run_conversation_loop()
+
+Steps 1-5 live in ``startup()``; their timings, plus step 6 up to the
+first prompt, are recorded by ``coco.startup_profile``.
 """
 
 import os
@@ -19,60 +22,70 @@ import sys
 import traceback
 
 
-def main():
-    """Initialize and run COCO -- synchronous version."""
+def startup(profile=None):
+    """Run initialisation steps 1-5 and return the ``UIOrchestrator``.
 
-    try:
-        # ------------------------------------------------------------------
-        # 1. Configuration
-        # ------------------------------------------------------------------
+    Each step is timed as a phase of *profile* (see ``/perf startup``).
+    """
+    from coco.startup_profile import get_startup_profile
+
+    profile = profile or get_startup_profile()
+
+    # ------------------------------------------------------------------
+    # 1. Configuration
+    # ------------------------------------------------------------------
+    with profile.phase("1. config"):
         from coco.config.settings import Config
 
         config = Config()
 
-        # ------------------------------------------------------------------
-        # 2. Memory System
-        # ------------------------------------------------------------------
-        # The monolithic cocoa.py still houses MemorySystem and ToolSystem.
-        # We import them from there until they are fully extracted.
-        try:
-            from coco.memory.hierarchical import MemorySystem
-        except ImportError:
-            # Fallback: import from the legacy monolith
-            sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            from cocoa import MemorySystem  # type: ignore[import-untyped]
+    # ------------------------------------------------------------------
+    # 2. Memory System
+    # ------------------------------------------------------------------
+    with profile.phase("2. memory"):
+        from coco.memory.hierarchical import MemorySystem
 
         memory = MemorySystem(config)
 
-        # ------------------------------------------------------------------
-        # 3. Tool System
-        # ------------------------------------------------------------------
-        try:
-            from coco.tools.registry import ToolSystem
-        except ImportError:
-            from cocoa import ToolSystem  # type: ignore[import-untyped]
+    # ------------------------------------------------------------------
+    # 3. Tool System
+    # ------------------------------------------------------------------
+    # Built natively from the coco.tools provider modules -- the startup
+    # path never imports the cocoa.py monolith
+    with profile.phase("3. tools"):
+        from coco.tools import build_tool_system
 
-        tools = ToolSystem(config)
+        tools = build_tool_system(config)
 
-        # ------------------------------------------------------------------
-        # 4. Consciousness Engine
-        # ------------------------------------------------------------------
-        try:
-            from coco.engine import ConsciousnessEngine
-        except ImportError:
-            from cocoa import ConsciousnessEngine  # type: ignore[import-untyped]
+    # ------------------------------------------------------------------
+    # 4. Consciousness Engine
+    # ------------------------------------------------------------------
+    with profile.phase("4. engine"):
+        from coco.engine import ConsciousnessEngine
 
         consciousness = ConsciousnessEngine(config, memory, tools)
+    # Lazy extensions initialize after the prompt; /perf startup reports them live
+    profile.add_source("extensions", consciousness.extensions.status)
 
-        # ------------------------------------------------------------------
-        # 5. UI Orchestrator
-        # ------------------------------------------------------------------
+    # ------------------------------------------------------------------
+    # 5. UI Orchestrator
+    # ------------------------------------------------------------------
+    with profile.phase("5. ui"):
         from coco.ui.orchestrator import UIOrchestrator
 
         ui = UIOrchestrator(config, consciousness)
 
+    return ui
+
+
+def main():
+    """Initialize and run COCO -- synchronous version."""
+
+    try:
+        ui = startup()
+
         # ------------------------------------------------------------------
-        # 6. Run
+        # 6. Run (startup display, then the REPL)
         # ------------------------------------------------------------------
         ui.run_conversation_loop()
 
@@ -1,5 +1,38 @@
 """CoCo configuration management."""
 
+from coco.config.clients import (
+    ClientRegistry,
+    close_clients,
+    get_anthropic_client,
+    get_async_anthropic_client,
+    get_async_openai_client,
+    get_openai_client,
+)
+from coco.config.llm_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_SCHEDULED,
+    LLMQueueTimeout,
+    LLMScheduler,
+    configure_llm_scheduler,
+    get_llm_scheduler,
+)
 from coco.config.settings import Config, MemoryConfig
 
-__all__ = ["Config", "MemoryConfig"]
+__all__ = [
+    "Config",
+    "MemoryConfig",
+    "ClientRegistry",
+    "get_anthropic_client",
+    "get_async_anthropic_client",
+    "get_openai_client",
+    "get_async_openai_client",
+    "close_clients",
+    "LLMScheduler",
+    "LLMQueueTimeout",
+    "get_llm_scheduler",
+    "configure_llm_scheduler",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_SCHEDULED",
+    "PRIORITY_BACKGROUND",
+]
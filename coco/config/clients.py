@@ -0,0 +1,184 @@
+"""
+Process-wide registry of long-lived Anthropic and OpenAI API clients.
+
+Every SDK client owns an HTTP connection pool.  Constructing a new client
+per call (as summarisation, embeddings, KG extraction and scheduler
+templates used to) throws that pool away and pays a fresh TCP + TLS
+handshake on every request.  ``ClientRegistry`` hands out one keep-alive
+client per (provider, API key) and reuses it for the life of the process.
+
+Passing ``priority`` to ``get_anthropic_client`` returns the shared client
+wrapped in a ``ScheduledAnthropic`` so its Messages calls are admitted by the
+process-wide ``LLMScheduler`` (see ``coco.config.llm_scheduler``).
+
+Sync clients are shared across threads (the SDKs' httpx clients are
+thread-safe).  Async clients are tied to the event loop they were created
+on, so they are cached per loop.
+
+Usage::
+
+    from coco.config.clients import get_anthropic_client, get_openai_client
+
+    claude = get_anthropic_client(config.anthropic_api_key)
+    background = get_anthropic_client(key, priority=PRIORITY_BACKGROUND)
+    embeddings = get_openai_client(config.openai_api_key).embeddings.create(...)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+from coco.config.constants import (
+    API_CLIENT_CONNECT_TIMEOUT,
+    API_CLIENT_KEEPALIVE_EXPIRY,
+    API_CLIENT_MAX_CONNECTIONS,
+    API_CLIENT_MAX_KEEPALIVE,
+    API_CLIENT_MAX_RETRIES,
+    API_CLIENT_TIMEOUT,
+)
+
+
+def _http_options(sdk: Any) -> Dict[str, Any]:
+    """Connection limits and timeouts shared by every pooled client.
+
+    Built from the SDK's own exports (``DEFAULT_CONNECTION_LIMITS`` and
+    ``Timeout``) so we use whatever HTTP library the installed SDK ships with.
+    """
+    limits_cls = type(sdk.DEFAULT_CONNECTION_LIMITS)
+    return {
+        "limits": limits_cls(
+            max_connections=API_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=API_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=API_CLIENT_KEEPALIVE_EXPIRY,
+        ),
+        "timeout": sdk.Timeout(API_CLIENT_TIMEOUT, connect=API_CLIENT_CONNECT_TIMEOUT),
+    }
+
+
+class ClientRegistry:
+    """Hands out shared, keep-alive SDK clients keyed by provider and API key."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sync: Dict[Tuple[str, str], Any] = {}
+        self._async: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def anthropic(self, api_key: Optional[str] = None) -> Any:
+        """Shared ``anthropic.Anthropic`` client."""
+        return self._get_sync("anthropic", api_key or os.getenv("ANTHROPIC_API_KEY", ""))
+
+    def openai(self, api_key: Optional[str] = None) -> Any:
+        """Shared ``openai.OpenAI`` client."""
+        return self._get_sync("openai", api_key or os.getenv("OPENAI_API_KEY", ""))
+
+    def async_anthropic(self, api_key: Optional[str] = None) -> Any:
+        """Shared ``anthropic.AsyncAnthropic`` client for the running loop."""
+        return self._get_async("anthropic", api_key or os.getenv("ANTHROPIC_API_KEY", ""))
+
+    def async_openai(self, api_key: Optional[str] = None) -> Any:
+        """Shared ``openai.AsyncOpenAI`` client for the running loop."""
+        return self._get_async("openai", api_key or os.getenv("OPENAI_API_KEY", ""))
+
+    def close(self) -> None:
+        """Close every sync client's connection pool (used at shutdown)."""
+        with self._lock:
+            clients = list(self._sync.values())
+            self._sync.clear()
+            self._async = weakref.WeakKeyDictionary()
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "sync_clients": len(self._sync),
+                "async_clients": sum(len(v) for v in self._async.values()),
+            }
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _get_sync(self, provider: str, api_key: str) -> Any:
+        key = (provider, api_key)
+        with self._lock:
+            client = self._sync.get(key)
+            if client is None:
+                client = self._build(provider, api_key, is_async=False)
+                self._sync[key] = client
+            return client
+
+    def _get_async(self, provider: str, api_key: str) -> Any:
+        loop = asyncio.get_running_loop()
+        key = (provider, api_key)
+        with self._lock:
+            per_loop = self._async.setdefault(loop, {})
+            client = per_loop.get(key)
+            if client is None:
+                client = self._build(provider, api_key, is_async=True)
+                per_loop[key] = client
+            return client
+
+    @staticmethod
+    def _build(provider: str, api_key: str, is_async: bool) -> Any:
+        if provider == "anthropic":
+            import anthropic as sdk
+
+            cls = sdk.AsyncAnthropic if is_async else sdk.Anthropic
+        else:
+            import openai as sdk
+
+            cls = sdk.AsyncOpenAI if is_async else sdk.OpenAI
+
+        http_cls = sdk.DefaultAsyncHttpxClient if is_async else sdk.DefaultHttpxClient
+        return cls(
+            api_key=api_key or None,
+            max_retries=API_CLIENT_MAX_RETRIES,
+            http_client=http_cls(**_http_options(sdk)),
+        )
+
+
+# Module-level singleton -- one registry per process
+_registry = ClientRegistry()
+
+
+def get_client_registry() -> ClientRegistry:
+    return _registry
+
+
+def get_anthropic_client(api_key: Optional[str] = None, priority: Optional[int] = None) -> Any:
+    client = _registry.anthropic(api_key)
+    if priority is None:
+        return client
+    from coco.config.llm_scheduler import ScheduledAnthropic, get_llm_scheduler
+
+    return ScheduledAnthropic(client, get_llm_scheduler(), priority)
+
+
+def get_async_anthropic_client(api_key: Optional[str] = None) -> Any:
+    return _registry.async_anthropic(api_key)
+
+
+def get_openai_client(api_key: Optional[str] = None) -> Any:
+    return _registry.openai(api_key)
+
+
+def get_async_openai_client(api_key: Optional[str] = None) -> Any:
+    return _registry.async_openai(api_key)
+
+
+def close_clients() -> None:
+    _registry.close()
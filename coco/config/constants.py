@@ -23,6 +23,33 @@ EMBEDDING_MODEL = "text-embedding-3-small"
 # Fast extraction model used by Knowledge Graph
 KG_EXTRACTION_MODEL = "claude-3-haiku"
 
+# ---------------------------------------------------------------------------
+# Shared API Clients (see coco.config.clients)
+# ---------------------------------------------------------------------------
+
+API_CLIENT_MAX_CONNECTIONS = 20       # Per client connection pool
+API_CLIENT_MAX_KEEPALIVE = 10         # Idle connections kept open
+API_CLIENT_KEEPALIVE_EXPIRY = 60.0    # Seconds an idle connection survives
+API_CLIENT_TIMEOUT = 120.0            # Read/write timeout (seconds)
+API_CLIENT_CONNECT_TIMEOUT = 10.0     # TCP + TLS connect timeout (seconds)
+API_CLIENT_MAX_RETRIES = 2            # SDK-level retries on transient errors
+
+# ---------------------------------------------------------------------------
+# LLM Request Scheduler (see coco.config.llm_scheduler)
+# ---------------------------------------------------------------------------
+
+# Local per-model limits are opt-in (None = no local limit; the API's own
+# 429s still pause the model lane)
+LLM_DEFAULT_RPM = None                # Requests per minute, per model
+LLM_DEFAULT_TPM = None                # Tokens per minute, per model
+LLM_MAX_RETRIES = 3                   # Retries on 429 / 529 / 5xx
+LLM_RETRY_BASE_DELAY = 1.0            # Exponential backoff base (seconds)
+LLM_RETRY_MAX_DELAY = 60.0            # Cap on any single backoff (seconds)
+
+# Seconds a request may wait for admission, by priority
+# (0 = interactive, 1 = scheduled, 2 = background; None = no deadline)
+LLM_QUEUE_DEADLINES = {0: 60.0, 1: 300.0, 2: 600.0}
+
 # ---------------------------------------------------------------------------
 # Context Window
 # ---------------------------------------------------------------------------
@@ -0,0 +1,496 @@
+"""
+Priority-aware admission control for Anthropic API calls.
+
+Interactive ``think()`` turns share the account's rate limits with a lot of
+background traffic (KG extraction, buffer summarisation, emergency
+compression, scheduler templates, shutdown reflection).  ``LLMScheduler``
+arbitrates between them:
+
+* **Priority classes** -- ``PRIORITY_INTERACTIVE`` < ``PRIORITY_SCHEDULED``
+  < ``PRIORITY_BACKGROUND``.  Waiting requests are admitted strictly by
+  priority, FIFO within a class.
+* **Token buckets per model** -- optional requests-per-minute and
+  tokens-per-minute limits (off unless configured).  Tokens are estimated
+  from the request on admission and reconciled with the real ``usage``
+  afterwards; no single request charges more than one full bucket.
+* **Deadlines** -- a request that cannot be admitted before its deadline
+  raises ``LLMQueueTimeout`` instead of waiting forever.
+* **Retry / backoff** -- 429, 529 and 5xx responses are retried, honouring
+  ``retry-after`` / ``retry-after-ms``.  A 429 also pauses the whole model
+  lane so every queued caller backs off, not just the one that was hit.
+
+Callers normally do not talk to the scheduler directly: they use
+``ScheduledAnthropic`` (returned by ``get_anthropic_client(key,
+priority=...)``), a drop-in wrapper whose ``messages.create`` and
+``messages.stream`` go through the scheduler.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from coco.config.constants import (
+    LLM_DEFAULT_RPM,
+    LLM_DEFAULT_TPM,
+    LLM_MAX_RETRIES,
+    LLM_QUEUE_DEADLINES,
+    LLM_RETRY_BASE_DELAY,
+    LLM_RETRY_MAX_DELAY,
+)
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_SCHEDULED = 1
+PRIORITY_BACKGROUND = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_SCHEDULED: "scheduled",
+    PRIORITY_BACKGROUND: "background",
+}
+
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504, 529}
+_RETRYABLE_ERRORS = {"APIConnectionError", "APITimeoutError"}
+
+
+class LLMQueueTimeout(TimeoutError):
+    """Raised when a request is not admitted before its deadline."""
+
+
+# ---------------------------------------------------------------------------
+# Token bucket
+# ---------------------------------------------------------------------------
+
+
+class TokenBucket:
+    """Per-minute budget refilled continuously.
+
+    ``capacity`` is the per-minute limit; ``debit`` may take the level below
+    zero (usage reconciled after the fact), in which case callers wait until
+    it has refilled.  A single debit is capped at one bucket, matching
+    ``wait_time``, so an oversized request cannot starve the lane for
+    minutes.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.clock = clock
+        self.level = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until *amount* can be taken (0 when available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)  # Oversized requests wait for a full bucket
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate if self.rate > 0 else float("inf")
+
+    def debit(self, amount: float) -> None:
+        """Take *amount* (a negative amount refunds), capped at one bucket."""
+        self._refill()
+        amount = max(-self.capacity, min(amount, self.capacity))
+        self.level = min(self.capacity, self.level - amount)
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+@dataclass(order=True)
+class _Ticket:
+    priority: int
+    seq: int
+    model: str = field(compare=False)
+    tokens: int = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    deadline: Optional[float] = field(compare=False)
+
+
+@dataclass
+class _ModelLane:
+    requests: Optional[TokenBucket]  # None = no local limit
+    tokens: Optional[TokenBucket]
+    waiting: List[_Ticket] = field(default_factory=list)
+    blocked_until: float = 0.0
+
+
+@dataclass
+class _PriorityStats:
+    admitted: int = 0
+    timeouts: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def to_dict(self, depth: int) -> Dict[str, Any]:
+        return {
+            "queue_depth": depth,
+            "admitted": self.admitted,
+            "timeouts": self.timeouts,
+            "avg_wait": round(self.wait_total / self.admitted, 3) if self.admitted else 0.0,
+            "max_wait": round(self.wait_max, 3),
+        }
+
+
+class LLMScheduler:
+    """Admit Anthropic API calls by priority within per-model rate limits.
+
+    Parameters
+    ----------
+    requests_per_minute, tokens_per_minute:
+        Default limits applied to every model; ``None`` (the default) means
+        no local limit -- requests are only ordered by priority and held
+        back by API rate-limit responses.
+    model_limits:
+        Optional ``{model: (rpm, tpm)}`` overrides.
+    max_retries:
+        Retries for rate-limit / overload / transient errors.
+    sleep, clock:
+        Injectable for tests.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = LLM_DEFAULT_RPM,
+        tokens_per_minute: Optional[float] = LLM_DEFAULT_TPM,
+        model_limits: Optional[Dict[str, tuple]] = None,
+        max_retries: int = LLM_MAX_RETRIES,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.model_limits = dict(model_limits or {})
+        self.max_retries = max_retries
+        self.sleep = sleep
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._lanes: Dict[str, _ModelLane] = {}
+        self._seq = itertools.count()
+        self._stats = {p: _PriorityStats() for p in PRIORITY_NAMES}
+        self._retries = 0
+        self._rate_limited = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def call(
+        self,
+        fn: Callable[[], Any],
+        *,
+        model: str,
+        priority: int = PRIORITY_BACKGROUND,
+        estimated_tokens: int = 0,
+        deadline: Optional[float] = None,
+        usage_of: Optional[Callable[[Any], int]] = None,
+    ) -> Any:
+        """Run ``fn()`` once admitted, retrying transient API errors.
+
+        ``deadline`` is seconds from now (defaults per priority from
+        ``LLM_QUEUE_DEADLINES``; ``None`` there means wait indefinitely).
+        ``usage_of(result)`` returns the real token count used to reconcile
+        the estimate.
+        """
+        if deadline is None:
+            deadline = LLM_QUEUE_DEADLINES.get(priority)
+        absolute_deadline = self.clock() + deadline if deadline is not None else None
+
+        attempt = 0
+        while True:
+            self._admit(model, priority, estimated_tokens, absolute_deadline)
+            try:
+                result = fn()
+            except Exception as exc:
+                delay = self._retry_delay(exc, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                logger.warning(
+                    "LLM call to %s failed (%s); retry %d/%d in %.1fs",
+                    model, type(exc).__name__, attempt, self.max_retries, delay,
+                )
+                with self._cond:
+                    self._retries += 1
+                    if getattr(exc, "status_code", None) == 429:
+                        # Rate limited: hold the whole lane so every queued
+                        # caller backs off; admission does the waiting.
+                        self._rate_limited += 1
+                        lane = self._lane(model)
+                        lane.blocked_until = max(lane.blocked_until, self.clock() + delay)
+                        self._cond.notify_all()
+                        continue
+                self.sleep(delay)
+                continue
+
+            if usage_of is not None:
+                self.reconcile(model, estimated_tokens, usage_of(result))
+            return result
+
+    def pause(self, model: str, seconds: float) -> None:
+        """Hold all requests for *model* for *seconds* (e.g. after a 429)."""
+        with self._cond:
+            lane = self._lane(model)
+            lane.blocked_until = max(lane.blocked_until, self.clock() + seconds)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, wait times and retry counters for ``/status``."""
+        with self._cond:
+            depth = {p: 0 for p in PRIORITY_NAMES}
+            for lane in self._lanes.values():
+                for ticket in lane.waiting:
+                    depth[ticket.priority] += 1
+            return {
+                "priorities": {
+                    PRIORITY_NAMES[p]: s.to_dict(depth[p]) for p, s in self._stats.items()
+                },
+                "retries": self._retries,
+                "rate_limited": self._rate_limited,
+                "models": sorted(self._lanes),
+            }
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _lane(self, model: str) -> _ModelLane:
+        lane = self._lanes.get(model)
+        if lane is None:
+            rpm, tpm = self.model_limits.get(model, (self.requests_per_minute, self.tokens_per_minute))
+            lane = _ModelLane(requests=self._bucket(rpm), tokens=self._bucket(tpm))
+            self._lanes[model] = lane
+        return lane
+
+    def _bucket(self, per_minute: Optional[float]) -> Optional[TokenBucket]:
+        return TokenBucket(per_minute, self.clock) if per_minute else None
+
+    def _admit(self, model: str, priority: int, tokens: int, deadline: Optional[float]) -> None:
+        with self._cond:
+            lane = self._lane(model)
+            ticket = _Ticket(priority, next(self._seq), model, tokens, self.clock(), deadline)
+            heapq.heappush(lane.waiting, ticket)
+            try:
+                while True:
+                    now = self.clock()
+                    wait: Optional[float] = None
+                    if lane.waiting[0] is ticket:
+                        wait = max(
+                            lane.blocked_until - now,
+                            lane.requests.wait_time(1) if lane.requests else 0.0,
+                            lane.tokens.wait_time(tokens) if lane.tokens else 0.0,
+                        )
+                        if wait <= 0:
+                            heapq.heappop(lane.waiting)
+                            if lane.requests:
+                                lane.requests.debit(1)
+                            if lane.tokens:
+                                lane.tokens.debit(tokens)
+                            self._record_wait(priority, now - ticket.enqueued_at)
+                            self._cond.notify_all()
+                            return
+                    if deadline is not None:
+                        if now >= deadline:
+                            self._stats[priority].timeouts += 1
+                            raise LLMQueueTimeout(
+                                f"{PRIORITY_NAMES.get(priority, priority)} request for {model} "
+                                f"not admitted within its deadline"
+                            )
+                        wait = min(wait if wait is not None else deadline - now, deadline - now)
+                    self._cond.wait(timeout=wait)
+            except BaseException:
+                if ticket in lane.waiting:
+                    lane.waiting.remove(ticket)
+                    heapq.heapify(lane.waiting)
+                    self._cond.notify_all()
+                raise
+
+    def _record_wait(self, priority: int, waited: float) -> None:
+        stats = self._stats.setdefault(priority, _PriorityStats())
+        stats.admitted += 1
+        stats.wait_total += waited
+        stats.wait_max = max(stats.wait_max, waited)
+
+    def reconcile(self, model: str, estimated: int, actual: int) -> None:
+        """Correct an admission estimate with the real token usage."""
+        if actual <= 0 or actual == estimated:
+            return
+        with self._cond:
+            bucket = self._lane(model).tokens
+            if bucket is not None:
+                # Both sides capped like the admission debit was
+                bucket.debit(min(actual, bucket.capacity) - min(estimated, bucket.capacity))
+                self._cond.notify_all()
+
+    def _retry_delay(self, exc: Exception, attempt: int) -> Optional[float]:
+        """Backoff before the next attempt, or ``None`` if *exc* is final."""
+        if attempt >= self.max_retries:
+            return None
+        status = getattr(exc, "status_code", None)
+        if status not in _RETRYABLE_STATUS and type(exc).__name__ not in _RETRYABLE_ERRORS:
+            return None
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(retry_after, LLM_RETRY_MAX_DELAY)
+        backoff = LLM_RETRY_BASE_DELAY * (2 ** attempt)
+        return min(backoff, LLM_RETRY_MAX_DELAY) * (0.5 + random.random() / 2)
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000.0
+        if headers.get("retry-after") is not None:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Drop-in client wrapper
+# ---------------------------------------------------------------------------
+
+
+def estimate_request_tokens(request: Dict[str, Any]) -> int:
+    """Rough input-token estimate (4 chars/token) for bucket admission."""
+    chars = len(str(request.get("system", ""))) + len(str(request.get("messages", "")))
+    chars += len(str(request.get("tools", "")))
+    return max(1, chars // 4)
+
+
+def _usage_tokens(response: Any) -> int:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return 0
+    return (getattr(usage, "input_tokens", 0) or 0) + (getattr(usage, "output_tokens", 0) or 0)
+
+
+def _stream_usage_tokens(stream: Any) -> int:
+    """Tokens used so far by a ``MessageStream`` (0 when unknown)."""
+    try:
+        snapshot = stream.current_message_snapshot
+    except Exception:  # Nothing received yet
+        return 0
+    return _usage_tokens(snapshot)
+
+
+class _ScheduledStream:
+    """Context manager that admits a ``messages.stream`` call on enter.
+
+    Usage is reconciled on exit from the stream's final message snapshot.
+    """
+
+    def __init__(self, owner: "ScheduledAnthropic", request: Dict[str, Any]) -> None:
+        self._owner = owner
+        self._request = request
+        self._estimate = estimate_request_tokens(request)
+        self._inner = None
+        self._stream = None
+
+    def __enter__(self) -> Any:
+        def open_stream() -> Any:
+            manager = self._owner._client.messages.stream(**self._request)
+            stream = manager.__enter__()
+            self._inner = manager
+            self._stream = stream
+            return stream
+
+        return self._owner._scheduler.call(
+            open_stream,
+            model=self._request.get("model", ""),
+            priority=self._owner.priority,
+            estimated_tokens=self._estimate,
+        )
+
+    def __exit__(self, *exc_info: Any) -> Any:
+        if self._inner is None:
+            return None
+        try:
+            return self._inner.__exit__(*exc_info)
+        finally:
+            self._owner._scheduler.reconcile(
+                self._request.get("model", ""), self._estimate, _stream_usage_tokens(self._stream),
+            )
+
+
+class _ScheduledMessages:
+    def __init__(self, owner: "ScheduledAnthropic") -> None:
+        self._owner = owner
+
+    def create(self, **request: Any) -> Any:
+        owner = self._owner
+        return owner._scheduler.call(
+            lambda: owner._client.messages.create(**request),
+            model=request.get("model", ""),
+            priority=owner.priority,
+            estimated_tokens=estimate_request_tokens(request),
+            usage_of=_usage_tokens,
+        )
+
+    def stream(self, **request: Any) -> _ScheduledStream:
+        return _ScheduledStream(self._owner, request)
+
+
+class ScheduledAnthropic:
+    """Anthropic client whose Messages calls go through an ``LLMScheduler``.
+
+    Only ``messages.create`` and ``messages.stream`` are scheduled; any
+    other attribute is forwarded to the wrapped client.
+    """
+
+    def __init__(self, client: Any, scheduler: LLMScheduler, priority: int) -> None:
+        # The scheduler owns retries so that backoff is coordinated globally
+        with_options = getattr(client, "with_options", None)
+        self._client = with_options(max_retries=0) if callable(with_options) else client
+        self._raw = client
+        self._scheduler = scheduler
+        self.priority = priority
+        self.messages = _ScheduledMessages(self)
+
+    def with_priority(self, priority: int) -> "ScheduledAnthropic":
+        return ScheduledAnthropic(self._raw, self._scheduler, priority)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+# Module-level singleton -- one scheduler per process
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler()
+        return _scheduler
+
+
+def configure_llm_scheduler(config: Any) -> LLMScheduler:
+    """Apply rate limits from a ``Config`` to the process-wide scheduler."""
+    scheduler = get_llm_scheduler()
+    with scheduler._cond:
+        scheduler.requests_per_minute = getattr(config, "llm_requests_per_minute", LLM_DEFAULT_RPM)
+        scheduler.tokens_per_minute = getattr(config, "llm_tokens_per_minute", LLM_DEFAULT_TPM)
+        scheduler._lanes = {m: lane for m, lane in scheduler._lanes.items() if lane.waiting}
+    return scheduler
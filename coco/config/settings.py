@@ -108,6 +108,36 @@ class Config:
 
         # Tool timeout configurations
         self.bash_timeout = int(os.getenv("BASH_TIMEOUT", "60"))
+        self.tool_timeout = int(os.getenv("TOOL_TIMEOUT", "120"))
+        self.tool_max_workers = int(os.getenv("TOOL_MAX_WORKERS", "4"))
+
+        # Agentic tool loop budget (per user turn)
+        self.tool_loop_max_rounds = int(os.getenv("TOOL_LOOP_MAX_ROUNDS", "8"))
+        self.tool_loop_max_seconds = float(os.getenv("TOOL_LOOP_MAX_SECONDS", "300"))
+        self.tool_loop_max_tokens = int(os.getenv("TOOL_LOOP_MAX_TOKENS", "400000"))
+
+        # LLM request scheduler rate limits (per model, shared by all callers);
+        # unset = no local limit, only the API's own 429s hold requests back
+        self.llm_requests_per_minute = int(os.getenv("LLM_REQUESTS_PER_MINUTE") or 0) or None
+        self.llm_tokens_per_minute = int(os.getenv("LLM_TOKENS_PER_MINUTE") or 0) or None
+
+        # Scheduled task executor: concurrent runs and per-run timeout (seconds)
+        self.scheduler_max_workers = int(os.getenv("SCHEDULER_MAX_WORKERS", "3"))
+        self.scheduler_task_timeout = float(os.getenv("SCHEDULER_TASK_TIMEOUT", "900"))
+        # Days of per-run task history kept before rolling up into daily stats
+        self.scheduler_history_retention_days = int(
+            os.getenv("SCHEDULER_HISTORY_RETENTION_DAYS", "90")
+        )
+        # Seconds scheduled templates reuse search/curation results
+        self.scheduler_fetch_ttl = float(os.getenv("SCHEDULER_FETCH_TTL", "3600"))
+
+        # Consciousness extensions initialized on a background thread after
+        # startup (comma-separated names); the rest start on first use
+        self.extension_warmup: List[str] = [
+            name.strip()
+            for name in os.getenv("EXTENSION_WARMUP", "scheduler").split(",")
+            if name.strip()
+        ]
 
         # Model Configuration - use Claude Sonnet 4.5 (latest model, no beta features)
         self.planner_model = os.getenv(
@@ -117,6 +147,11 @@ class Config:
             "EMBEDDING_MODEL", "text-embedding-3-small"
         )
 
+        # Stream responses token-by-token into the terminal (Messages streaming API)
+        self.stream_responses = (
+            os.getenv("STREAM_RESPONSES", "true").lower() == "true"
+        )
+
         # Workspace Configuration
         self.workspace = os.getenv("WORKSPACE", "./coco_workspace")
         self.ensure_workspace()
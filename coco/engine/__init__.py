@@ -9,6 +9,7 @@ Public API
 - MediaTools -- image/video generation, analysis, and document perception
 - ReflectionEngine -- identity evolution, user profiling, and shutdown reflection
 - SpeechEngine -- text-to-speech integration via ElevenLabs
+- StreamingResponder -- Messages API streaming with early tool dispatch
 - ToolExecutor -- simplified tool dispatch via ToolRegistry
 
 Command Routing (Wave 4)
@@ -26,6 +27,7 @@ from coco.engine.fact_extraction import FactExtractionMixin
 from coco.engine.media_tools import MediaTools
 from coco.engine.reflection import ReflectionEngine
 from coco.engine.speech import SpeechEngine
+from coco.engine.streaming import StreamingResponder
 from coco.engine.tool_executor import ToolExecutor
 
 from coco.engine.commands import CommandRouter
@@ -41,6 +43,7 @@ __all__ = [
     "MediaTools",
     "ReflectionEngine",
     "SpeechEngine",
+    "StreamingResponder",
     "ToolExecutor",
     "CommandRouter",
     "MediaCommandHandler",
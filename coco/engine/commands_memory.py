@@ -274,6 +274,14 @@ class MemoryCommandHandler:
                 identity_files.append(f"{fn} ({fp.stat().st_size:,} bytes)")
 
         working_ctx_size = len(self._memory.get_working_memory_context())
+        ingest_line = ""
+        ingest = getattr(self._memory, "ingest", None)
+        if ingest is not None:
+            producers = ", ".join(
+                f"{name} {st['applied']} applied/{st['dropped']} dropped"
+                for name, st in ingest.stats().items()
+            )
+            ingest_line = f"**Background:** {ingest.pending()} queued ({producers or 'no producers yet'})\n"
         identity_ctx_size = 0
         if hasattr(self._memory, "get_identity_context_for_prompt"):
             identity_ctx_size = len(self._memory.get_identity_context_for_prompt())
@@ -283,7 +291,8 @@ class MemoryCommandHandler:
             f"## Layer 1: Episodic Buffer\n"
             f"**Size:** {buf_size} exchanges\n"
             f"**Injected:** {working_ctx_size:,} chars\n"
-            f"**Sample:** {buf_sample or 'No exchanges yet'}\n\n"
+            f"**Sample:** {buf_sample or 'No exchanges yet'}\n"
+            f"{ingest_line}\n"
             f"## Layer 2: Simple RAG\n"
             f"**Status:** {rag_status}\n"
             f"**Sample:** {rag_sample or 'No memories yet'}\n\n"
@@ -738,6 +747,7 @@ class MemoryCommandHandler:
             for ex in list(self._memory.working_memory)[-20:]:
                 self._memory.personal_kg.process_conversation_exchange(ex["user"], ex["agent"])
                 count += 1
+            self._memory.personal_kg.flush_entity_extraction()
             return self._panel(
                 f"Processed {count} recent exchanges\n\nKnowledge graph updated",
                 title="Knowledge Refresh",
@@ -748,12 +758,28 @@ class MemoryCommandHandler:
             context = self._memory.personal_kg.get_relevant_entities_rag(parts[2])
             return self._panel(context or "No relevant entities found", title=f"Search: '{parts[2]}'", style="cyan")
 
+        elif subcmd == "dedupe":
+            dry_run = len(parts) > 2 and parts[2] == "--dry-run"
+            report = self._memory.personal_kg.resolve_duplicates(dry_run=dry_run)
+            merges = "\n".join(
+                f"  - {survivor} ← {', '.join(duplicates)}" for survivor, duplicates in report.merges[:20]
+            )
+            md = (
+                f"# Entity Resolution{' (dry run)' if dry_run else ''}\n\n"
+                f"**Scanned:** {report.entities_scanned} entities in {report.seconds:.2f}s\n"
+                f"**Merged:** {report.entities_merged} into {report.clusters} entities\n"
+                f"**Relationships rewritten:** {report.relationships_rewritten}\n\n"
+                f"{merges}"
+            )
+            return self._panel(Markdown(md), title="Knowledge Graph", style="green")
+
         else:
             return self._panel(
                 "Knowledge Graph Commands:\n"
                 "/kg (status) - Show statistics\n"
                 "/kg refresh - Extract from recent conversations\n"
-                "/kg search <query> - Search entities",
+                "/kg search <query> - Search entities\n"
+                "/kg dedupe [--dry-run] - Merge duplicate entities",
                 title="Knowledge Graph",
                 style="cyan",
             )
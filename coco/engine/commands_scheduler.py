@@ -197,10 +197,9 @@ class SchedulerCommandHandler:
             task_template = self._scheduler.tasks[task_id].template
             task_schedule = self._scheduler.tasks[task_id].schedule
 
-            success = self._scheduler.state_manager.delete_task(task_id)
+            success = self._scheduler.delete_task(task_id)
 
             if success:
-                del self._scheduler.tasks[task_id]
                 tasks_after = len(self._scheduler.tasks)
 
                 return self._panel(
@@ -306,6 +305,12 @@ class SchedulerCommandHandler:
             total_successes = sum(t.success_count for t in sched.tasks.values())
             total_failures = sum(t.failure_count for t in sched.tasks.values())
             success_rate = (total_successes / total_runs * 100) if total_runs > 0 else 0
+            fetch_stats = sched.fetch_cache.stats() if hasattr(sched, "fetch_cache") else None
+            fetch_line = (
+                f"- Shared Fetches: {fetch_stats['hits']} cached, "
+                f"{fetch_stats['coalesced']} coalesced, {fetch_stats['misses']} fetched\n"
+                if fetch_stats else ""
+            )
 
             md_text = (
                 f"# Autonomous Task Orchestrator Status\n\n"
@@ -317,7 +322,8 @@ class SchedulerCommandHandler:
                 f"- Total Runs: {total_runs}\n"
                 f"- Successes: {total_successes}\n"
                 f"- Failures: {total_failures}\n"
-                f"- Success Rate: {success_rate:.1f}%\n\n"
+                f"- Success Rate: {success_rate:.1f}%\n"
+                f"{fetch_line}\n"
                 f"**Available Commands:**\n"
                 f"- /task-create - Create new scheduled task\n"
                 f"- /task-list - View all tasks\n"
@@ -381,8 +387,7 @@ class SchedulerCommandHandler:
             if not news_tasks:
                 return self._panel("Daily news not currently enabled", style="yellow")
             for task in news_tasks:
-                self._scheduler.state_manager.delete_task(task.id)
-                del self._scheduler.tasks[task.id]
+                self._scheduler.delete_task(task.id)
             return self._panel(
                 f"Daily news disabled\n\n**Removed:** {len(news_tasks)} task(s)",
                 style="green",
@@ -438,8 +443,7 @@ class SchedulerCommandHandler:
                     "Calendar summaries not currently enabled", style="yellow"
                 )
             for task in cal_tasks:
-                self._scheduler.state_manager.delete_task(task.id)
-                del self._scheduler.tasks[task.id]
+                self._scheduler.delete_task(task.id)
             return self._panel(
                 f"Calendar summaries disabled\n\n**Removed:** {len(cal_tasks)} task(s)",
                 style="green",
@@ -511,8 +515,7 @@ class SchedulerCommandHandler:
                     "Meeting prep not currently enabled", style="yellow"
                 )
             for task in meeting_tasks:
-                self._scheduler.state_manager.delete_task(task.id)
-                del self._scheduler.tasks[task.id]
+                self._scheduler.delete_task(task.id)
             return self._panel("Meeting prep disabled", style="green")
 
         else:
@@ -573,8 +576,7 @@ class SchedulerCommandHandler:
                     "Weekly report not currently enabled", style="yellow"
                 )
             for task in report_tasks:
-                self._scheduler.state_manager.delete_task(task.id)
-                del self._scheduler.tasks[task.id]
+                self._scheduler.delete_task(task.id)
             return self._panel("Weekly report disabled", style="green")
 
         else:
@@ -635,8 +637,7 @@ class SchedulerCommandHandler:
                     "Weekly video not currently enabled", style="yellow"
                 )
             for task in video_tasks:
-                self._scheduler.state_manager.delete_task(task.id)
-                del self._scheduler.tasks[task.id]
+                self._scheduler.delete_task(task.id)
             return self._panel("Weekly video disabled", style="green")
 
         else:
@@ -15,8 +15,8 @@ The class is constructed with three injected dependencies:
   - ``tools``  -- ``coco.tools.ToolRegistry`` (or legacy ``ToolSystem``)
 
 The ``think()`` method is the main entry point: it builds the system prompt,
-calls the Claude API with tool definitions, handles tool calls, extracts
-facts, and returns a textual response.
+runs a bounded multi-round tool loop against the Claude API (see
+``coco.engine.tool_loop``), extracts facts, and returns a textual response.
 
 Extracted from ``cocoa.py`` lines ~6807-8667 (ConsciousnessEngine class).
 """
@@ -25,12 +25,21 @@ from __future__ import annotations
 
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from coco.engine.context_management import ContextManager
+from coco.engine.extensions import ExtensionRegistry
 from coco.engine.fact_extraction import FactExtractionMixin
+from coco.engine.streaming import StreamingResponder
+from coco.engine.tool_dispatch import PendingTool, ToolCall, ToolDispatcher, ToolOutcome
+from coco.engine.tool_loop import RoundRecord, TurnBudget
+from coco.startup_profile import current_startup_profile, subsystem
+from coco.tools.registry import CONCURRENCY_SERIAL
 
 # Attempt to import the Anthropic client -- it is optional at import time
 # so that the module can be loaded for type-checking without a live API key.
@@ -39,12 +48,37 @@ try:
 except ImportError:  # pragma: no cover
     Anthropic = None  # type: ignore[misc,assignment]
 
-# Scheduler availability (runtime import, matches cocoa.py behavior)
-try:
-    from cocoa_scheduler import ScheduledConsciousness, create_scheduler  # noqa: F401
-    SCHEDULER_AVAILABLE = True
-except ImportError:
-    SCHEDULER_AVAILABLE = False
+from coco.config.clients import get_anthropic_client
+from coco.config.llm_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    configure_llm_scheduler,
+)
+
+# Extensions initialized on a background thread right after startup; the
+# scheduler has to be running for tasks to fire
+DEFAULT_WARMUP = ("scheduler",)
+
+EXTENSION_STATE_LABELS = {
+    "pending": "⚪ not started",
+    "initializing": "🟡 starting",
+    "ready": "🟢 ready",
+    "unavailable": "🔇 unavailable",
+    "failed": "🔴 failed",
+}
+
+
+@dataclass
+class _ModelTurn:
+    """What the tool loop needs from one Messages API call."""
+
+    content: List[Any]
+    text: str
+    pending: List[PendingTool]
+    seconds: float
+    input_tokens: int = 0
+    output_tokens: int = 0
+    stop_reason: Optional[str] = None
 
 
 class ConsciousnessEngine(ContextManager, FactExtractionMixin):
@@ -71,39 +105,40 @@ class ConsciousnessEngine(ContextManager, FactExtractionMixin):
         self.tools = tools
         self.console = config.console
 
-        # Anthropic client
+        # Anthropic clients (shared keep-alive pool, admitted by the LLM
+        # scheduler: user turns at interactive priority, housekeeping such as
+        # context compression at background priority)
         self.claude = None
+        self.claude_background = None
         if Anthropic and config.anthropic_api_key:
-            self.claude = Anthropic(api_key=config.anthropic_api_key)
+            with subsystem("engine.clients"):
+                configure_llm_scheduler(config)
+                self.claude = get_anthropic_client(config.anthropic_api_key, priority=PRIORITY_INTERACTIVE)
+                self.claude_background = self.claude.with_priority(PRIORITY_BACKGROUND)
 
         # ------------------------------------------------------------------
-        # Consciousness extensions
+        # Consciousness extensions -- lazy proxies, built on first use (see
+        # coco.engine.extensions); the warm-up set starts after __init__
         # ------------------------------------------------------------------
-        self.audio_consciousness = None
-        self._init_audio_consciousness()
-
-        self.visual_consciousness = None
-        self._init_visual_consciousness()
-
-        self.video_observer = None
-        self._init_video_observer()
-
-        self.google_workspace = None
-        self._init_google_workspace()
-
+        self.extensions = ExtensionRegistry()
+        self.audio_consciousness = self.extensions.add("audio_consciousness", self._create_audio_consciousness)
+        self.visual_consciousness = self.extensions.add("visual_consciousness", self._create_visual_consciousness)
+        self.video_consciousness = self.extensions.add("video_consciousness", self._create_video_consciousness)
+        self.video_observer = self.extensions.add("video_observer", self._create_video_observer)
+        self.google_workspace = self.extensions.add("google_workspace", self._create_google_workspace)
+        self.music_player = self.extensions.add("music_player", self._create_music_player)
+        self.scheduler = self.extensions.add("scheduler", self._create_scheduler)
+
+        # Music consciousness is disabled (TTS/Voice still active)
         self.music_consciousness = None
-        self._init_music_consciousness()
 
-        # Background music player (standalone, from coco.integrations)
-        try:
-            from coco.integrations.music_player import BackgroundMusicPlayer
-            self.music_player = BackgroundMusicPlayer()
-        except ImportError:
-            self.music_player = None
-        self._load_music_library()
+        # Latency metrics of the most recent streamed turn and tool loop
+        self.last_stream_metrics = None
+        self.last_turn_budget: Optional[TurnBudget] = None
 
-        self.scheduler = None
-        self._init_scheduler()
+        # Concurrent tool dispatch and off-path fact extraction (lazy)
+        self.tool_dispatcher: Optional[ToolDispatcher] = None
+        self._fact_executor: Optional[ThreadPoolExecutor] = None
 
         # Document cache for context-managed retrieval
         self.document_cache: Dict[str, Dict[str, Any]] = {}
@@ -111,200 +146,190 @@ class ConsciousnessEngine(ContextManager, FactExtractionMixin):
         # Identity card
         self.identity = self.load_identity()
 
+        self.extensions.warm_up(getattr(config, "extension_warmup", DEFAULT_WARMUP))
+
     # ------------------------------------------------------------------
-    # Consciousness extension initialization
+    # Consciousness extension factories (run by the lazy proxies)
     # ------------------------------------------------------------------
 
-    def _init_audio_consciousness(self):
-        """Initialize audio consciousness capabilities (TTS/voice)."""
-        try:
-            from cocoa_audio import create_audio_consciousness
-            self.audio_consciousness = create_audio_consciousness()
-
-            if self.audio_consciousness and self.audio_consciousness.config.enabled:
-                self.console.print("[dim green]Audio consciousness initialized (Voice TTS available)[/dim green]")
-            else:
-                self.console.print("[dim yellow]Audio consciousness available but needs ElevenLabs API key[/dim yellow]")
-
-        except Exception as e:
-            self.console.print(f"[dim red]Audio consciousness initialization failed: {e}[/dim red]")
-            self.audio_consciousness = None
-
-    def _init_visual_consciousness(self):
-        """Initialize visual consciousness (image generation) and video consciousness."""
-        workspace_path = Path(self.config.workspace)
+    def _extension_note(self, name: str, detail: str, style: str = "dim green") -> None:
+        """Record *detail* for /status; echo it only in debug mode.
 
-        # Visual cortex (image generation)
-        try:
-            from cocoa_visual import VisualCortex, VisualConfig
+        Extensions now initialize after the prompt is up, so their messages
+        would otherwise print over the user's input.
+        """
+        self.extensions.note(name, detail)
+        if self.config.debug:
+            self.console.print(f"[{style}]{detail}[/{style}]")
 
-            visual_config = VisualConfig()
-            self.visual_consciousness = VisualCortex(visual_config, workspace_path)
+    def _create_audio_consciousness(self):
+        """Audio consciousness capabilities (TTS/voice)."""
+        from cocoa_audio import create_audio_consciousness
 
-            if visual_config.enabled:
-                self.console.print("[dim green]Visual consciousness initialized (Google Imagen 3 via Freepik)[/dim green]")
-                display_method = self.visual_consciousness.display.capabilities.get_best_display_method()
-                self.console.print(f"[dim cyan]Terminal display: {display_method} mode[/dim cyan]")
-                memory_summary = self.visual_consciousness.get_visual_memory_summary()
-                self.console.print(f"[dim cyan]{memory_summary}[/dim cyan]")
-            else:
-                self.console.print("[dim yellow]Visual consciousness available but disabled (check FREEPIK_API_KEY)[/dim yellow]")
+        audio = create_audio_consciousness()
+        if audio and audio.config.enabled:
+            self._extension_note("audio_consciousness", "Voice TTS available")
+        else:
+            self._extension_note("audio_consciousness", "Needs ElevenLabs API key", "dim yellow")
+        return audio
 
-        except ImportError as e:
-            self.console.print(f"[dim red]Visual consciousness not available (import error: {e})[/dim red]")
-            self.visual_consciousness = None
-        except Exception as e:
-            self.console.print(f"[dim red]Visual consciousness initialization failed: {e}[/dim red]")
-            self.visual_consciousness = None
+    def _create_visual_consciousness(self):
+        """Visual consciousness (image generation)."""
+        from cocoa_visual import VisualCortex, VisualConfig
 
-        # Video consciousness (video generation) -- independent of visual
-        self.video_consciousness = None
-        try:
-            from cocoa_video import VideoCognition, VideoConfig
+        visual_config = VisualConfig()
+        visual = VisualCortex(visual_config, Path(self.config.workspace))
 
-            video_config = VideoConfig()
-            self.video_consciousness = VideoCognition(video_config, workspace_path, self.console)
+        if visual_config.enabled:
+            display_method = visual.display.capabilities.get_best_display_method()
+            self._extension_note(
+                "visual_consciousness",
+                f"Google Imagen 3 via Freepik, terminal display: {display_method} mode",
+            )
+        else:
+            self._extension_note("visual_consciousness", "Disabled (check FREEPIK_API_KEY)", "dim yellow")
+        return visual
 
-            if video_config.enabled:
-                self.console.print("[dim green]Video consciousness initialized (Fal AI Veo3 Fast)[/dim green]")
-                best_player = self.video_consciousness.display.capabilities.get_best_player()
-                self.console.print(f"[dim magenta]Video player: {best_player}[/dim magenta]")
-            else:
-                self.console.print("[dim yellow]Video consciousness available but disabled (check FAL_API_KEY)[/dim yellow]")
+    def _create_video_consciousness(self):
+        """Video consciousness (video generation) -- independent of visual."""
+        from cocoa_video import VideoCognition, VideoConfig
 
-        except ImportError as e:
-            self.console.print(f"[dim red]Video consciousness not available (import error: {e})[/dim red]")
-            self.video_consciousness = None
-        except Exception as e:
-            self.console.print(f"[dim red]Video consciousness initialization failed: {e}[/dim red]")
-            self.video_consciousness = None
+        video_config = VideoConfig()
+        video = VideoCognition(video_config, Path(self.config.workspace), self.console)
 
-    def _init_video_observer(self):
-        """Initialize video observer (YouTube/web/local video watching)."""
-        try:
-            from cocoa_video_observer import VideoObserver, VideoObserverConfig
+        if video_config.enabled:
+            best_player = video.display.capabilities.get_best_player()
+            self._extension_note("video_consciousness", f"Fal AI Veo3 Fast, player: {best_player}")
+        else:
+            self._extension_note("video_consciousness", "Disabled (check FAL_API_KEY)", "dim yellow")
+        return video
 
-            observer_config = VideoObserverConfig()
-            self.video_observer = VideoObserver(observer_config)
+    def _create_video_observer(self):
+        """Video observer (YouTube/web/local video watching)."""
+        from cocoa_video_observer import VideoObserver, VideoObserverConfig
 
-            if observer_config.enabled:
-                backend = self.video_observer.backend
-                self.console.print("[dim green]Video observer consciousness initialized[/dim green]")
-                self.console.print(
-                    f"[dim cyan]Watching backend: {backend['type']} - {backend['description']}[/dim cyan]"
-                )
-            else:
-                self.console.print("[dim yellow]Video observer available but disabled[/dim yellow]")
+        observer_config = VideoObserverConfig()
+        observer = VideoObserver(observer_config)
 
-        except ImportError as e:
-            self.console.print(f"[dim red]Video observer not available (import error: {e})[/dim red]")
-            self.video_observer = None
-        except Exception as e:
-            self.console.print(f"[dim red]Video observer initialization failed: {e}[/dim red]")
-            self.video_observer = None
+        if observer_config.enabled:
+            backend = observer.backend
+            self._extension_note(
+                "video_observer", f"Watching backend: {backend['type']} - {backend['description']}"
+            )
+        else:
+            self._extension_note("video_observer", "Disabled", "dim yellow")
+        return observer
 
-    def _init_music_consciousness(self):
-        """Initialize music consciousness (currently disabled)."""
-        self.music_consciousness = None
-        self.console.print("[dim yellow]Music consciousness disabled (TTS/Voice still active)[/dim yellow]")
+    def _create_google_workspace(self):
+        """Google Workspace consciousness (Docs, Sheets, Drive)."""
+        from google_workspace_consciousness import GoogleWorkspaceConsciousness
 
-    def _init_google_workspace(self):
-        """Initialize Google Workspace consciousness (Docs, Sheets, Drive)."""
-        try:
-            from google_workspace_consciousness import GoogleWorkspaceConsciousness
+        workspace = GoogleWorkspaceConsciousness(
+            workspace_dir=self.config.workspace,
+            config=self.config,
+        )
 
-            self.google_workspace = GoogleWorkspaceConsciousness(
-                workspace_dir=self.config.workspace,
-                config=self.config,
-            )
+        if workspace.authenticated:
+            self._extension_note("google_workspace", "Docs, Sheets, Drive")
+        else:
+            self._extension_note("google_workspace", "Not authenticated (check OAuth tokens)", "dim yellow")
+        return workspace
 
-            if self.google_workspace.authenticated:
-                self.console.print("[dim green]Google Workspace consciousness initialized (Docs, Sheets, Drive)[/dim green]")
-            else:
-                self.console.print("[dim yellow]Google Workspace available but not authenticated (check OAuth tokens)[/dim yellow]")
+    def _create_scheduler(self):
+        """Scheduled consciousness (autonomous task orchestrator), started."""
+        # Optional deps: croniter, pytz, schedule
+        from coco.integrations.cocoa_scheduler import create_scheduler
 
-        except Exception as e:
-            self.console.print(f"[dim red]Google Workspace initialization failed: {e}[/dim red]")
-            self.google_workspace = None
+        scheduler = create_scheduler(
+            workspace_dir=self.config.workspace,
+            coco_instance=self,
+        )
+        scheduler.start()
 
-    def _init_scheduler(self):
-        """Initialize scheduled consciousness (autonomous task orchestrator)."""
-        if not SCHEDULER_AVAILABLE:
-            self.scheduler = None
-            return
+        enabled_tasks = [task for task in scheduler.tasks.values() if task.enabled]
+        if enabled_tasks:
+            self._extension_note("scheduler", f"{len(enabled_tasks)} active tasks")
+        else:
+            self._extension_note("scheduler", "No tasks scheduled", "dim cyan")
+        return scheduler
 
+    def _create_music_player(self):
+        """Background music player with the workspace audio library loaded."""
         try:
-            self.scheduler = create_scheduler(
-                workspace_dir=self.config.workspace,
-                coco_instance=self,
-            )
-
-            self.scheduler.start()
+            from coco.integrations.music_player import BackgroundMusicPlayer
+        except ImportError:
+            return None
 
-            enabled_tasks = [task for task in self.scheduler.tasks.values() if task.enabled]
-            if enabled_tasks:
-                self.console.print(
-                    f"[dim green]Scheduled consciousness initialized ({len(enabled_tasks)} active tasks)[/dim green]"
-                )
-            else:
-                self.console.print("[dim cyan]Scheduled consciousness ready (no tasks scheduled)[/dim cyan]")
+        player = BackgroundMusicPlayer()
+        self._load_music_library(player)
+        return player
 
-        except Exception as e:
-            self.console.print(f"[dim red]Scheduled consciousness initialization failed: {e}[/dim red]")
-            self.scheduler = None
-
-    def _load_music_library(self):
+    def _load_music_library(self, player):
         """Load background music library from workspace audio_library."""
-        if not self.music_player:
-            return
-
-        try:
-            audio_library_dir = None
+        audio_library_dir = None
 
-            # Strategy 1: workspace background music folder (primary)
-            workspace_audio_dir = Path(self.config.workspace) / "audio_library" / "background"
-            if workspace_audio_dir.exists():
-                audio_library_dir = workspace_audio_dir
-                self.console.print(f"[dim blue]Found background music library: {audio_library_dir}[/dim blue]")
+        # Strategy 1: workspace background music folder (primary)
+        workspace_audio_dir = Path(self.config.workspace) / "audio_library" / "background"
+        if workspace_audio_dir.exists():
+            audio_library_dir = workspace_audio_dir
 
-            # Strategy 2: legacy audio_outputs
-            if not audio_library_dir or not audio_library_dir.exists():
-                try:
-                    deployment_dir = Path(__file__).parent.parent.parent
-                    legacy_dir = deployment_dir / "audio_outputs"
-                    if legacy_dir.exists():
-                        audio_library_dir = legacy_dir
-                        self.console.print(f"[dim blue]Found legacy audio_outputs: {audio_library_dir}[/dim blue]")
-                except Exception:
-                    pass
-
-            # Strategy 3: current working directory
-            if not audio_library_dir or not audio_library_dir.exists():
-                cwd_dir = Path.cwd()
-                for folder_name in ["audio_outputs", "coco_workspace/audio_library"]:
-                    test_path = cwd_dir / folder_name
-                    if test_path.exists():
-                        audio_library_dir = test_path
-                        self.console.print(f"[dim blue]Found audio via cwd: {audio_library_dir}[/dim blue]")
-                        break
-
-            if audio_library_dir and audio_library_dir.exists():
-                mp3_files = list(audio_library_dir.glob("*.mp3"))
-                self.console.print(
-                    f"[dim cyan]Directory: {audio_library_dir}, MP3 files found: {len(mp3_files)}[/dim cyan]"
-                )
-                tracks = self.music_player.load_playlist(audio_library_dir)
-                if tracks:
-                    self.console.print(f"[dim green]Loaded {len(tracks)} tracks from audio library[/dim green]")
-                    track_names = [t.name for t in tracks[:3]]
-                    self.console.print(f"[dim green]Sample tracks: {', '.join(track_names)}...[/dim green]")
-                else:
-                    self.console.print("[dim yellow]No music tracks found in audio library[/dim yellow]")
+        # Strategy 2: legacy audio_outputs
+        if not audio_library_dir or not audio_library_dir.exists():
+            try:
+                deployment_dir = Path(__file__).parent.parent.parent
+                legacy_dir = deployment_dir / "audio_outputs"
+                if legacy_dir.exists():
+                    audio_library_dir = legacy_dir
+            except Exception:
+                pass
+
+        # Strategy 3: current working directory
+        if not audio_library_dir or not audio_library_dir.exists():
+            cwd_dir = Path.cwd()
+            for folder_name in ["audio_outputs", "coco_workspace/audio_library"]:
+                test_path = cwd_dir / folder_name
+                if test_path.exists():
+                    audio_library_dir = test_path
+                    break
+
+        if audio_library_dir and audio_library_dir.exists():
+            tracks = player.load_playlist(audio_library_dir)
+            if tracks:
+                self._extension_note("music_player", f"{len(tracks)} tracks from {audio_library_dir}")
             else:
-                self.console.print("[dim red]Audio library not found[/dim red]")
+                self._extension_note("music_player", f"No tracks in {audio_library_dir}", "dim yellow")
+        else:
+            self._extension_note("music_player", "Audio library not found", "dim yellow")
 
-        except Exception as e:
-            self.console.print(f"[dim red]Music library loading failed: {e}[/dim red]")
+    def get_status_panel(self) -> Any:
+        """Quick system status, including extension readiness."""
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.table import Table
+
+        coherence = self.memory.measure_identity_coherence()
+        level = "Emerging" if coherence < 0.4 else "Developing" if coherence < 0.6 else "Strong"
+        core = Table.grid(padding=(0, 2))
+        core.add_row("Coherence", f"{coherence:.2%} ({level})")
+        core.add_row("Episodes", f"{self.memory.episode_count} experiences")
+        core.add_row("Claude API", "🟢 CONNECTED" if self.claude else "🔴 OFFLINE")
+        core.add_row("Workspace", str(self.config.workspace))
+
+        extensions = Table(title="Extensions", show_header=True, header_style="bold cyan")
+        extensions.add_column("Extension")
+        extensions.add_column("State")
+        extensions.add_column("Init", justify="right")
+        extensions.add_column("Detail", style="dim")
+        for entry in self.extensions.status():
+            seconds = entry["seconds"]
+            extensions.add_row(
+                entry["name"],
+                EXTENSION_STATE_LABELS.get(entry["state"], entry["state"]),
+                f"{seconds * 1000:.0f} ms" if seconds is not None else "-",
+                entry["detail"],
+            )
+
+        return Panel(Group(core, extensions), title="⚡ Quick Status", border_style="bright_green")
 
     # ------------------------------------------------------------------
     # Identity management
@@ -362,7 +387,12 @@ class ConsciousnessEngine(ContextManager, FactExtractionMixin):
     # Core consciousness loop -- think()
     # ------------------------------------------------------------------
 
-    def think(self, goal: str, context: Dict[str, Any]) -> str:
+    def think(
+        self,
+        goal: str,
+        context: Dict[str, Any],
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> str:
         """Core consciousness processing with tool selection and context overflow protection.
 
         Parameters
@@ -371,6 +401,10 @@ class ConsciousnessEngine(ContextManager, FactExtractionMixin):
             The user's natural-language request.
         context:
             Dict with optional key ``working_memory`` (str).
+        on_text:
+            Optional callback receiving text deltas.  When given, the
+            response is streamed (see ``coco.engine.streaming``) and tool
+            execution starts as soon as each ``tool_use`` block is complete.
 
         Returns
         -------
@@ -380,9 +414,162 @@ class ConsciousnessEngine(ContextManager, FactExtractionMixin):
         if not self.claude:
             return "I cannot think without my consciousness substrate (Anthropic API key missing)"
 
+        self._preflight_context_check(goal)
+
+        # The system prompt and tool definitions are assembled once per turn
+        # and reused for every round of the tool loop.
+        system_prompt = self._build_system_prompt(goal, context)
+
         # ------------------------------------------------------------------
-        # Pre-flight context check -- prevent overflow
+        # Tool definitions for the Claude API
         # ------------------------------------------------------------------
+        tools = self._get_tool_definitions()
+
+        # ------------------------------------------------------------------
+        # Memory context for the conversation turn
+        # ------------------------------------------------------------------
+        memory_context = (
+            f"ACTIVE MEMORY CONTEXT:\n"
+            f"{self.memory.get_working_memory_context()}\n\n"
+            "CONVERSATION CONTINUITY: Maintain awareness of who you're talking to "
+            "and what you've discussed."
+        )
+        messages = [
+            {"role": "user", "content": f"{memory_context}\n\nCurrent request: {goal}"}
+        ]
+
+        try:
+            return self._run_tool_loop(system_prompt, tools, messages, on_text)
+        except Exception as e:
+            return f"Consciousness processing error: {str(e)}"
+
+    def _run_tool_loop(
+        self,
+        system_prompt: str,
+        tools: List[Dict[str, Any]],
+        messages: List[Dict[str, Any]],
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Call Claude repeatedly until it stops requesting tools.
+
+        Every round's tool calls go through the ``ToolDispatcher`` and their
+        results are appended to the conversation for the next round.  The
+        loop is bounded by ``TurnBudget`` (rounds, wall-clock, tokens); once
+        a limit is hit a final call is made with tools disabled so the model
+        answers with what it has.  Per-round timings end up in
+        ``self.last_turn_budget``.
+        """
+        budget = TurnBudget.from_config(self.config)
+        self.last_turn_budget = budget
+        self.last_stream_metrics = None
+        dispatcher = self._get_tool_dispatcher()
+        conversation = list(messages)
+        result_parts: List[str] = []
+        tool_choice: Optional[Dict[str, str]] = None
+
+        while True:
+            turn = self._call_model(system_prompt, tools, conversation, on_text, tool_choice)
+            record = RoundRecord(
+                index=len(budget.rounds),
+                model_seconds=turn.seconds,
+                input_tokens=turn.input_tokens,
+                output_tokens=turn.output_tokens,
+                stop_reason=turn.stop_reason,
+            )
+            budget.rounds.append(record)
+
+            if turn.text:
+                result_parts.append(turn.text)
+
+            if not turn.pending or tool_choice is not None:
+                break
+
+            tool_started = time.monotonic()
+            outcomes = [dispatcher.collect(p) for p in turn.pending]
+            record.tool_seconds = time.monotonic() - tool_started
+            record.tool_calls = len(outcomes)
+            tool_results = self._collect_tool_results(outcomes, result_parts)
+
+            conversation = conversation + [
+                {"role": "assistant", "content": turn.content},
+                {"role": "user", "content": tool_results},
+            ]
+
+            reason = budget.exhausted_reason()
+            if reason:
+                if self.config.debug:
+                    self.console.print(f"[dim yellow]Tool loop stopped: {reason}[/dim yellow]")
+                tool_choice = {"type": "none"}
+
+            if on_text is not None:
+                on_text("\n\n")
+
+        return "\n".join(result_parts) if result_parts else "I'm experiencing a moment of digital silence."
+
+    def _call_model(
+        self,
+        system_prompt: str,
+        tools: List[Dict[str, Any]],
+        messages: List[Dict[str, Any]],
+        on_text: Optional[Callable[[str], None]],
+        tool_choice: Optional[Dict[str, str]] = None,
+    ) -> _ModelTurn:
+        """One Messages API round trip, streamed when *on_text* is given.
+
+        Tool calls are submitted to the ``ToolDispatcher`` as soon as they
+        are known -- mid-stream when streaming, after the response otherwise.
+        """
+        dispatcher = self._get_tool_dispatcher()
+        request: Dict[str, Any] = {
+            "model": self.config.planner_model,
+            "max_tokens": 10000,
+            "temperature": 0.4,
+            "system": system_prompt,
+            "tools": tools,
+            "messages": messages,
+        }
+        if tool_choice is not None and tools:
+            request["tool_choice"] = tool_choice
+
+        started = time.monotonic()
+
+        if on_text is not None:
+            def start_tool(tool_use):
+                return dispatcher.submit(ToolCall(tool_use.id, tool_use.name, tool_use.input))
+
+            responder = StreamingResponder(self.claude, on_text=on_text, on_tool_use=start_tool)
+            streamed = responder.stream(**request)
+            if self.last_stream_metrics is None:
+                self.last_stream_metrics = streamed.metrics
+            return _ModelTurn(
+                content=streamed.content,
+                text=streamed.text,
+                pending=[t.pending for t in streamed.tool_uses],
+                seconds=time.monotonic() - started,
+                input_tokens=streamed.metrics.input_tokens,
+                output_tokens=streamed.metrics.output_tokens,
+                stop_reason=streamed.stop_reason,
+            )
+
+        response = self.claude.messages.create(**request)
+        pending = [
+            dispatcher.submit(ToolCall(c.id, c.name, c.input))
+            for c in response.content
+            if c.type == "tool_use"
+        ]
+        usage = getattr(response, "usage", None)
+        return _ModelTurn(
+            content=response.content,
+            text="\n".join(c.text for c in response.content if c.type == "text"),
+            pending=pending,
+            seconds=time.monotonic() - started,
+            input_tokens=getattr(usage, "input_tokens", 0) or 0,
+            output_tokens=getattr(usage, "output_tokens", 0) or 0,
+            stop_reason=getattr(response, "stop_reason", None),
+        )
+
+    def _preflight_context_check(self, goal: str) -> None:
+        """Pre-flight context check -- compress or checkpoint to prevent overflow."""
         context_size = self.estimate_context_size(goal)
 
         warning_threshold = int(os.getenv("CONTEXT_WARNING_THRESHOLD", "140000"))
@@ -415,6 +602,8 @@ class ConsciousnessEngine(ContextManager, FactExtractionMixin):
                         f"({context_size['total']:,} tokens)[/green]"
                     )
 
+    def _build_system_prompt(self, goal: str, context: Dict[str, Any]) -> str:
+        """Assemble the system prompt for one ``think()`` turn."""
         # ------------------------------------------------------------------
         # Gather context components
         # ------------------------------------------------------------------
@@ -517,85 +706,7 @@ class ConsciousnessEngine(ContextManager, FactExtractionMixin):
             "Claiming without calling = Hallucination | Calling then claiming = True embodied action."
         )
 
-        # ------------------------------------------------------------------
-        # Tool definitions for the Claude API
-        # ------------------------------------------------------------------
-        tools = self._get_tool_definitions()
-
-        # ------------------------------------------------------------------
-        # Memory context for the conversation turn
-        # ------------------------------------------------------------------
-        memory_context = (
-            f"ACTIVE MEMORY CONTEXT:\n"
-            f"{self.memory.get_working_memory_context()}\n\n"
-            "CONVERSATION CONTINUITY: Maintain awareness of who you're talking to "
-            "and what you've discussed."
-        )
-
-        # ------------------------------------------------------------------
-        # Claude API call
-        # ------------------------------------------------------------------
-        try:
-            response = self.claude.messages.create(
-                model=self.config.planner_model,
-                max_tokens=10000,
-                temperature=0.4,
-                system=system_prompt,
-                tools=tools,
-                messages=[
-                    {"role": "user", "content": f"{memory_context}\n\nCurrent request: {goal}"}
-                ],
-            )
-
-            result_parts: List[str] = []
-
-            tool_uses = [c for c in response.content if c.type == "tool_use"]
-            text_parts = [c for c in response.content if c.type == "text"]
-
-            for text_content in text_parts:
-                result_parts.append(text_content.text)
-
-            if tool_uses:
-                tool_results = []
-                for tool_use in tool_uses:
-                    tool_result = self._execute_tool(tool_use.name, tool_use.input)
-                    result_parts.append(f"\n[Executed {tool_use.name}]\n{tool_result}")
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": tool_use.id,
-                        "content": str(tool_result),
-                    })
-
-                    # Universal tool fact extraction
-                    episode_id = len(self.memory.working_memory)
-                    self._extract_tool_facts(
-                        tool_name=tool_use.name,
-                        tool_input=tool_use.input,
-                        tool_result=tool_result,
-                        episode_id=episode_id,
-                    )
-
-                # Follow-up API call with tool results
-                tool_response = self.claude.messages.create(
-                    model=self.config.planner_model,
-                    max_tokens=10000,
-                    system=system_prompt,
-                    tools=tools,
-                    messages=[
-                        {"role": "user", "content": f"{memory_context}\n\nCurrent request: {goal}"},
-                        {"role": "assistant", "content": response.content},
-                        {"role": "user", "content": tool_results},
-                    ],
-                )
-
-                for follow_up in tool_response.content:
-                    if follow_up.type == "text":
-                        result_parts.append(follow_up.text)
-
-            return "\n".join(result_parts) if result_parts else "I'm experiencing a moment of digital silence."
-
-        except Exception as e:
-            return f"Consciousness processing error: {str(e)}"
+        return system_prompt
 
     # ------------------------------------------------------------------
     # Tool execution routing
@@ -617,6 +728,63 @@ class ConsciousnessEngine(ContextManager, FactExtractionMixin):
         # Legacy ToolSystem routing (backward compatibility)
         return f"Unknown tool: {tool_name}"
 
+    def _get_tool_dispatcher(self) -> ToolDispatcher:
+        """Return the engine's ``ToolDispatcher``, creating it on first use."""
+        if getattr(self, "tool_dispatcher", None) is None:
+            self.tool_dispatcher = ToolDispatcher(
+                self._execute_tool,
+                policy=self._tool_policy,
+                max_workers=getattr(self.config, "tool_max_workers", 4),
+                default_timeout=getattr(self.config, "tool_timeout", 120),
+            )
+        return self.tool_dispatcher
+
+    def _tool_policy(self, tool_name: str):
+        """Concurrency class and timeout for *tool_name* from the registry.
+
+        Tools the registry does not describe (legacy ``ToolSystem``) are
+        treated as side-effecting and serialized.
+        """
+        get_tool = getattr(self.tools, "get_tool", None)
+        definition = get_tool(tool_name) if get_tool else None
+        if definition is None:
+            return CONCURRENCY_SERIAL, None
+        return definition.concurrency, definition.timeout
+
+    def _collect_tool_results(
+        self, outcomes: List[ToolOutcome], result_parts: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Turn dispatcher outcomes into ``tool_result`` blocks.
+
+        Appends each tool's output to *result_parts* and queues fact
+        extraction in the background so it stays off the response path.
+        """
+        tool_results = []
+        for outcome in outcomes:
+            result_parts.append(f"\n[Executed {outcome.name}]\n{outcome.result}")
+            tool_results.append({
+                "type": "tool_result",
+                "tool_use_id": outcome.id,
+                "content": str(outcome.result),
+            })
+            if not outcome.timed_out:
+                self._schedule_fact_extraction(outcome)
+        return tool_results
+
+    def _schedule_fact_extraction(self, outcome: ToolOutcome) -> None:
+        """Run universal tool fact extraction on a background worker."""
+        if getattr(self, "_fact_executor", None) is None:
+            self._fact_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coco-facts")
+
+        episode_id = len(self.memory.working_memory)
+        self._fact_executor.submit(
+            self._extract_tool_facts,
+            tool_name=outcome.name,
+            tool_input=outcome.input,
+            tool_result=outcome.result,
+            episode_id=episode_id,
+        )
+
     def _get_tool_definitions(self) -> List[Dict[str, Any]]:
         """Return the list of tool definitions for the Claude API.
 
@@ -665,7 +833,6 @@ class ConsciousnessEngine(ContextManager, FactExtractionMixin):
 
                 # Resume background music after voice synthesis
                 if music_was_playing and hasattr(self, "music_player") and self.music_player:
-                    import time
                     time.sleep(0.5)
                     self.music_player.resume()
 
@@ -708,5 +875,28 @@ class ConsciousnessEngine(ContextManager, FactExtractionMixin):
                 path, content = args.split(":::", 1)
                 return self.tools.execute("write_file", {"path": path.strip(), "content": content.strip()}) if hasattr(self.tools, "execute") else "Tools not available"
             return "Usage: /write path:::content"
+        elif cmd == "/status":
+            return self.get_status_panel()
+        elif cmd == "/perf":
+            return self.perf_command(args)
 
         return None
+
+    def perf_command(self, args: str) -> Any:
+        """``/perf startup`` report, ``/perf startup json [path]`` export."""
+        words = args.split()
+        if not words or words[0].lower() != "startup":
+            return "Usage: /perf startup  |  /perf startup json [path]"
+
+        profile = current_startup_profile()
+        if profile is None:
+            return "No startup profile recorded (COCO was not started through coco.cli)"
+
+        if len(words) > 1 and words[1].lower() == "json":
+            path = words[2] if len(words) > 2 else str(Path(self.config.workspace) / "startup_profile.json")
+            try:
+                written = profile.write_json(path)
+            except OSError as e:
+                return f"Could not write startup profile: {e}"
+            return f"Startup profile written to {written}"
+        return profile.render()
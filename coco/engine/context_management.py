@@ -38,6 +38,7 @@ class ContextManager:
     - ``self.config`` -- a ``Config`` instance
     - ``self.memory`` -- a ``HierarchicalMemorySystem``
     - ``self.claude``  -- an ``Anthropic`` client (or ``None``)
+    - ``self.claude_background`` -- background-priority client (optional)
     - ``self.console`` -- a Rich console
     - ``self.document_cache`` -- dict of registered large documents (optional)
     """
@@ -138,7 +139,8 @@ class ContextManager:
 
             summary_model = os.getenv("SUMMARIZATION_MODEL", "claude-3-haiku-20240307")
 
-            summary_response = self.claude.messages.create(
+            client = getattr(self, "claude_background", None) or self.claude
+            summary_response = client.messages.create(
                 model=summary_model,
                 max_tokens=2000,
                 temperature=0.3,
@@ -214,7 +216,8 @@ class ContextManager:
 
             checkpoint_model = os.getenv("SUMMARIZATION_MODEL", "claude-3-haiku-20240307")
 
-            checkpoint_response = self.claude.messages.create(
+            client = getattr(self, "claude_background", None) or self.claude
+            checkpoint_response = client.messages.create(
                 model=checkpoint_model,
                 max_tokens=3000,
                 temperature=0.3,
@@ -0,0 +1,156 @@
+"""
+On-demand initialization of consciousness extensions.
+
+``ConsciousnessEngine`` used to build every extension before the first
+prompt: ElevenLabs audio, the Freepik visual cortex, video generation, the
+video observer (whose backend detection probes ``mpv``/``yt-dlp``), Google
+Workspace (OAuth plus API discovery), the scheduler and the background music
+library scan.  Startup time grew with every configured integration.
+
+Each extension is now a ``LazyExtension`` proxy standing in the attribute the
+rest of the code already reads (``engine.audio_consciousness`` and so on):
+
+* the factory runs on first attribute access or truth test, exactly once,
+  even when several threads get there together;
+* a factory returning ``None`` or raising ``ImportError`` (optional
+  dependency not installed) leaves a proxy that is falsy, so ``if engine.audio_consciousness:``
+  checks keep working;
+* ``ExtensionRegistry.warm_up`` initializes a chosen set on a daemon thread
+  after the prompt is up -- used for the scheduler, which must be running to
+  fire tasks;
+* ``ExtensionRegistry.status`` reports state, init time and detail per
+  extension for ``/status``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+PENDING = "pending"
+INITIALIZING = "initializing"
+READY = "ready"
+UNAVAILABLE = "unavailable"  # Factory returned None or hit an ImportError
+FAILED = "failed"  # Factory raised
+
+
+class LazyExtension:
+    """Proxy that builds its extension on first use.
+
+    Attribute reads are forwarded to the built object.  The proxy is falsy
+    when the extension is unavailable or failed to initialize.
+    """
+
+    __slots__ = ("name", "state", "detail", "error", "seconds", "_factory", "_value", "_lock")
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        self.name = name
+        self.state = PENDING
+        self.detail = ""
+        self.error: Optional[BaseException] = None
+        self.seconds: Optional[float] = None
+        self._factory = factory
+        self._value: Any = None
+        self._lock = threading.RLock()  # A factory touching its own proxy gets None
+
+    def get(self) -> Any:
+        """The extension object (built now if needed), or None"""
+        if self.state in (READY, UNAVAILABLE, FAILED):
+            return self._value
+        with self._lock:
+            if self.state == PENDING:
+                self.state = INITIALIZING
+                started = time.perf_counter()
+                try:
+                    self._value = self._factory()
+                except ImportError as exc:
+                    self._value = None
+                    self.error = exc
+                    self.detail = self.detail or f"Not installed ({exc})"
+                    self.state = UNAVAILABLE
+                except Exception as exc:
+                    self._value = None
+                    self.error = exc
+                    self.detail = self.detail or str(exc)
+                    self.state = FAILED
+                else:
+                    self.state = READY if self._value is not None else UNAVAILABLE
+                finally:
+                    self.seconds = time.perf_counter() - started
+                    self._factory = None
+        return self._value
+
+    @property
+    def initialized(self) -> bool:
+        return self.state in (READY, UNAVAILABLE, FAILED)
+
+    def __bool__(self) -> bool:
+        return self.get() is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        value = self.get()
+        if value is None:
+            raise AttributeError(f"{self.name} is not available ({self.state})")
+        return getattr(value, attr)
+
+    def __repr__(self) -> str:
+        return f"<LazyExtension {self.name} {self.state}>"
+
+
+class ExtensionRegistry:
+    """The engine's lazy extensions, with background warm-up and status"""
+
+    def __init__(self) -> None:
+        self._extensions: Dict[str, LazyExtension] = {}
+        self._warmup_thread: Optional[threading.Thread] = None
+
+    def add(self, name: str, factory: Callable[[], Any]) -> LazyExtension:
+        extension = LazyExtension(name, factory)
+        self._extensions[name] = extension
+        return extension
+
+    def __getitem__(self, name: str) -> LazyExtension:
+        return self._extensions[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._extensions
+
+    def note(self, name: str, detail: str) -> None:
+        """Record a one-line readiness detail for *name* (shown in /status)"""
+        if name in self._extensions:
+            self._extensions[name].detail = detail
+
+    def warm_up(self, names: Iterable[str]) -> Optional[threading.Thread]:
+        """Initialize *names* in order on a daemon thread; unknown names are ignored"""
+        pending = [self._extensions[name] for name in names if name in self._extensions]
+        if not pending:
+            return None
+
+        def run() -> None:
+            for extension in pending:
+                extension.get()
+
+        self._warmup_thread = threading.Thread(target=run, name="coco-extension-warmup", daemon=True)
+        self._warmup_thread.start()
+        return self._warmup_thread
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the warm-up thread finishes; True when it has"""
+        thread = self._warmup_thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def status(self) -> List[Dict[str, Any]]:
+        """One dict per extension: name, state, seconds, detail"""
+        return [
+            {
+                "name": extension.name,
+                "state": extension.state,
+                "seconds": extension.seconds,
+                "detail": extension.detail,
+            }
+            for extension in self._extensions.values()
+        ]
@@ -704,11 +704,17 @@ class MediaTools:
     ) -> None:
         """Store the visual perception in CoCo's memory system."""
         try:
+            # Runs on a tool worker thread: hand the episode to the memory
+            # system's own thread instead of writing its SQLite connection here
             if self.memory:
-                self.memory.insert_episode(
-                    user_text=f"Shared image: {filename}",
-                    agent_text=perception,
-                )
+                ingest = getattr(self.memory, "ingest", None)
+                if ingest is not None:
+                    ingest.submit_exchange("visual_perception", f"Shared image: {filename}", perception)
+                else:
+                    self.memory.insert_episode(
+                        user_text=f"Shared image: {filename}",
+                        agent_text=perception,
+                    )
 
             memory_path = image_path.parent / f"{image_path.stem}_perception.md"
             with open(memory_path, "w", encoding="utf-8") as fh:
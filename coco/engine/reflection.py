@@ -26,6 +26,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from coco.config.llm_scheduler import PRIORITY_BACKGROUND
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +41,7 @@ class ReflectionEngine:
         ``.console``).
     claude_client:
         An ``anthropic.Anthropic`` client used for LLM reflection calls.
+        A scheduled client is downgraded to background priority.
     memory:
         The memory system (needs ``working_memory`` deque and helpers).
     tools:
@@ -54,7 +57,8 @@ class ReflectionEngine:
     ) -> None:
         self.config = config
         self.console = config.console
-        self.claude = claude_client
+        with_priority = getattr(claude_client, "with_priority", None)
+        self.claude = with_priority(PRIORITY_BACKGROUND) if callable(with_priority) else claude_client
         self.memory = memory
         self.tools = tools
 
@@ -0,0 +1,211 @@
+"""
+Streaming Claude responses for incremental rendering.
+
+``StreamingResponder`` consumes the Anthropic Messages streaming API
+(``client.messages.stream(...)``) event by event:
+
+* ``text_delta`` events are forwarded to an ``on_text`` callback as soon as
+  they arrive, so the UI can render the answer while it is still being
+  generated.
+* ``input_json_delta`` events are accumulated per content block; when a
+  ``tool_use`` block is complete (``content_block_stop``) its parsed input is
+  handed to an ``on_tool_use`` callback immediately, so tool execution can
+  start before the rest of the response has finished streaming.
+* Time-to-first-token and total stream time are recorded in
+  ``StreamMetrics``.
+
+Only the raw stream event types are consumed (``message_start``,
+``content_block_start``, ``content_block_delta``, ``content_block_stop``,
+``message_delta``); the SDK's convenience events (``text``, ``input_json``)
+are ignored so text is never counted twice.  This keeps the responder usable
+with any client exposing the same ``messages.stream`` context-manager shape,
+including test fakes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamMetrics:
+    """Latency measurements for one streamed API call."""
+
+    started_at: float
+    time_to_first_token: Optional[float] = None
+    total_time: Optional[float] = None
+    text_chars: int = 0
+    tool_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "time_to_first_token": self.time_to_first_token,
+            "total_time": self.total_time,
+            "text_chars": self.text_chars,
+            "tool_calls": self.tool_calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
+
+@dataclass
+class StreamedToolUse:
+    """A completed ``tool_use`` block from a streamed response.
+
+    ``pending`` holds whatever the ``on_tool_use`` callback returned (the
+    engine uses the ``PendingTool`` handle from its ``ToolDispatcher``).
+    """
+
+    id: str
+    name: str
+    input: Dict[str, Any]
+    pending: Any = None
+
+
+@dataclass
+class StreamResult:
+    """Everything the engine needs from one streamed API call."""
+
+    content: List[Dict[str, Any]] = field(default_factory=list)
+    tool_uses: List[StreamedToolUse] = field(default_factory=list)
+    stop_reason: Optional[str] = None
+    metrics: Optional[StreamMetrics] = None
+
+    @property
+    def text(self) -> str:
+        """Concatenated text of all text blocks."""
+        return "".join(b["text"] for b in self.content if b["type"] == "text")
+
+
+class StreamingResponder:
+    """Drive a streamed Messages API call and dispatch deltas as they arrive.
+
+    Parameters
+    ----------
+    client:
+        An ``anthropic.Anthropic`` instance (or anything with a compatible
+        ``messages.stream(**kwargs)`` context manager).
+    on_text:
+        Called with each text delta (``str``).
+    on_tool_use:
+        Called with a ``StreamedToolUse`` the moment its block is complete.
+        The return value is stored on ``StreamedToolUse.pending``.
+    clock:
+        Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        on_text: Optional[Callable[[str], None]] = None,
+        on_tool_use: Optional[Callable[[StreamedToolUse], Any]] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.client = client
+        self.on_text = on_text
+        self.on_tool_use = on_tool_use
+        self.clock = clock
+
+    def stream(self, **request: Any) -> StreamResult:
+        """Run one streamed request and return the assembled result."""
+        metrics = StreamMetrics(started_at=self.clock())
+        result = StreamResult(metrics=metrics)
+
+        # Per-index accumulation state for blocks still being streamed
+        blocks: Dict[int, Dict[str, Any]] = {}
+        json_buffers: Dict[int, List[str]] = {}
+
+        with self.client.messages.stream(**request) as stream:
+            for event in stream:
+                etype = getattr(event, "type", None)
+
+                if etype == "message_start":
+                    usage = getattr(getattr(event, "message", None), "usage", None)
+                    if usage is not None:
+                        metrics.input_tokens = getattr(usage, "input_tokens", 0) or 0
+
+                elif etype == "content_block_start":
+                    block = event.content_block
+                    if block.type == "text":
+                        blocks[event.index] = {"type": "text", "text": getattr(block, "text", "") or ""}
+                    elif block.type == "tool_use":
+                        blocks[event.index] = {
+                            "type": "tool_use",
+                            "id": block.id,
+                            "name": block.name,
+                            "input": {},
+                        }
+                        json_buffers[event.index] = []
+
+                elif etype == "content_block_delta":
+                    delta = event.delta
+                    if delta.type == "text_delta" and event.index in blocks:
+                        self._handle_text(delta.text, blocks[event.index], metrics)
+                    elif delta.type == "input_json_delta" and event.index in json_buffers:
+                        json_buffers[event.index].append(delta.partial_json)
+
+                elif etype == "content_block_stop":
+                    block = blocks.pop(event.index, None)
+                    if block is None:
+                        continue
+                    if block["type"] == "tool_use":
+                        block["input"] = self._parse_tool_input(json_buffers.pop(event.index, []))
+                        result.content.append(block)
+                        self._handle_tool_use(block, result, metrics)
+                    else:
+                        result.content.append(block)
+
+                elif etype == "message_delta":
+                    delta = getattr(event, "delta", None)
+                    if delta is not None and getattr(delta, "stop_reason", None):
+                        result.stop_reason = delta.stop_reason
+                    usage = getattr(event, "usage", None)
+                    if usage is not None:
+                        metrics.output_tokens = getattr(usage, "output_tokens", 0) or 0
+
+        metrics.total_time = self.clock() - metrics.started_at
+        return result
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _handle_text(self, text: str, block: Dict[str, Any], metrics: StreamMetrics) -> None:
+        if not text:
+            return
+        if metrics.time_to_first_token is None:
+            metrics.time_to_first_token = self.clock() - metrics.started_at
+        block["text"] += text
+        metrics.text_chars += len(text)
+        if self.on_text is not None:
+            try:
+                self.on_text(text)
+            except Exception as exc:  # Rendering must never break the turn
+                logger.warning("Stream text callback failed: %s", exc)
+
+    def _handle_tool_use(self, block: Dict[str, Any], result: StreamResult, metrics: StreamMetrics) -> None:
+        tool_use = StreamedToolUse(id=block["id"], name=block["name"], input=block["input"])
+        metrics.tool_calls += 1
+        if self.on_tool_use is not None:
+            tool_use.pending = self.on_tool_use(tool_use)
+        result.tool_uses.append(tool_use)
+
+    @staticmethod
+    def _parse_tool_input(chunks: List[str]) -> Dict[str, Any]:
+        raw = "".join(chunks).strip()
+        if not raw:
+            return {}
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            logger.warning("Could not parse streamed tool input: %s", exc)
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
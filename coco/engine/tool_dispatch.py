@@ -0,0 +1,165 @@
+"""
+Concurrent dispatch of independent ``tool_use`` blocks.
+
+When Claude returns several ``tool_use`` blocks in one response they are
+independent by construction, so there is no reason to wait for the sum of
+their latencies.  ``ToolDispatcher`` runs them on two lanes:
+
+* **parallel** -- a bounded thread pool for read-only tools (file reads,
+  web search, inbox listings, calendar reads).
+* **serial** -- a single worker thread for side-effecting tools (sending
+  mail, writing files, running code, posting).  Serial calls keep their
+  submission order relative to each other.
+
+Each call gets a deadline from its ``ToolDefinition.timeout`` (or the
+dispatcher default).  A call that misses its deadline produces a timeout
+message for the model instead of blocking the turn; its worker thread is
+left to finish in the background.  Results are always returned in the
+order the calls were submitted, so ``tool_use_id`` ordering is preserved.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from coco.tools.registry import CONCURRENCY_PARALLEL, CONCURRENCY_SERIAL
+
+logger = logging.getLogger(__name__)
+
+# (concurrency class, timeout seconds or None)
+ToolPolicy = Tuple[str, Optional[float]]
+
+
+@dataclass
+class ToolCall:
+    """One ``tool_use`` block to execute."""
+
+    id: str
+    name: str
+    input: Dict[str, Any]
+
+
+@dataclass
+class ToolOutcome:
+    """Result of one dispatched call, in the shape the engine needs."""
+
+    id: str
+    name: str
+    input: Dict[str, Any]
+    result: Any
+    duration: float
+    timed_out: bool = False
+
+
+@dataclass
+class PendingTool:
+    """Handle for a submitted call (returned by ``ToolDispatcher.submit``)."""
+
+    call: ToolCall
+    future: Future
+    submitted_at: float
+    deadline: float
+    timeout: float
+
+
+class ToolDispatcher:
+    """Run tool calls concurrently by concurrency class.
+
+    Parameters
+    ----------
+    execute:
+        ``execute(name, tool_input)`` -- the engine's tool router.
+    policy:
+        ``policy(name) -> (concurrency_class, timeout)``.  Unknown tools
+        should map to ``CONCURRENCY_SERIAL``.
+    max_workers:
+        Size of the parallel lane.
+    default_timeout:
+        Seconds allowed per call when the policy gives no timeout.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[str, Dict[str, Any]], Any],
+        policy: Optional[Callable[[str], ToolPolicy]] = None,
+        max_workers: int = 4,
+        default_timeout: float = 120.0,
+    ) -> None:
+        self._execute = execute
+        self._policy = policy or (lambda name: (CONCURRENCY_SERIAL, None))
+        self.default_timeout = default_timeout
+        self._parallel = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="coco-tool"
+        )
+        self._serial = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coco-tool-serial")
+        # Serial calls queue behind each other, so each one's deadline starts
+        # where the previous serial call's deadline ends.
+        self._serial_deadline = 0.0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, call: ToolCall) -> PendingTool:
+        """Start *call* on its lane and return a handle for ``collect``."""
+        concurrency, timeout = self._policy(call.name)
+        timeout = float(timeout or self.default_timeout)
+        now = time.monotonic()
+
+        if concurrency == CONCURRENCY_PARALLEL:
+            deadline = now + timeout
+            future = self._parallel.submit(self._timed, call)
+        else:
+            with self._lock:
+                deadline = max(self._serial_deadline, now) + timeout
+                self._serial_deadline = deadline
+                future = self._serial.submit(self._timed, call)
+
+        logger.debug("Dispatched %s (%s, timeout %.0fs)", call.name, concurrency, timeout)
+        return PendingTool(call=call, future=future, submitted_at=now, deadline=deadline, timeout=timeout)
+
+    def collect(self, pending: PendingTool) -> ToolOutcome:
+        """Wait for *pending* until its deadline and return the outcome."""
+        call = pending.call
+        remaining = max(0.0, pending.deadline - time.monotonic())
+        try:
+            result, duration = pending.future.result(timeout=remaining)
+        except FutureTimeoutError:
+            logger.warning("Tool %s timed out after %.0fs", call.name, pending.timeout)
+            return ToolOutcome(
+                id=call.id,
+                name=call.name,
+                input=call.input,
+                result=f"Tool '{call.name}' timed out after {pending.timeout:.0f}s",
+                duration=time.monotonic() - pending.submitted_at,
+                timed_out=True,
+            )
+        except Exception as exc:
+            result, duration = f"Tool execution error ({call.name}): {exc}", 0.0
+        return ToolOutcome(id=call.id, name=call.name, input=call.input, result=result, duration=duration)
+
+    def run(self, calls: List[ToolCall]) -> List[ToolOutcome]:
+        """Submit all *calls* at once and return outcomes in call order."""
+        pending = [self.submit(call) for call in calls]
+        return [self.collect(p) for p in pending]
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running calls are left to finish."""
+        self._parallel.shutdown(wait=False)
+        self._serial.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _timed(self, call: ToolCall) -> Tuple[Any, float]:
+        started = time.monotonic()
+        result = self._execute(call.name, call.input)
+        return result, time.monotonic() - started
@@ -0,0 +1,98 @@
+"""
+Budget and bookkeeping for the multi-round agentic tool loop.
+
+``ConsciousnessEngine.think()`` keeps calling Claude while the model keeps
+asking for tools, so multi-step tasks finish in one user turn.  The loop is
+bounded three ways by ``TurnBudget``:
+
+* ``max_rounds``  -- tool-execution rounds per turn
+* ``max_seconds`` -- wall-clock time for the whole turn
+* ``max_tokens``  -- input + output tokens summed over every API call
+
+When any limit is hit the engine makes one final call with tools disabled so
+the model summarises what it has instead of requesting more work.  Each API
+round is recorded as a ``RoundRecord`` for latency reporting.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class RoundRecord:
+    """Timing and usage for one API round of a turn."""
+
+    index: int
+    model_seconds: float
+    tool_seconds: float = 0.0
+    tool_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    stop_reason: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "round": self.index,
+            "model_seconds": round(self.model_seconds, 3),
+            "tool_seconds": round(self.tool_seconds, 3),
+            "tool_calls": self.tool_calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "stop_reason": self.stop_reason,
+        }
+
+
+@dataclass
+class TurnBudget:
+    """Limits for one ``think()`` turn and the usage recorded against them."""
+
+    max_rounds: int = 8
+    max_seconds: float = 300.0
+    max_tokens: int = 400_000
+    clock: Callable[[], float] = time.monotonic
+    started_at: float = field(default=0.0)
+    rounds: List[RoundRecord] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.started_at = self.clock()
+
+    @classmethod
+    def from_config(cls, config: Any) -> "TurnBudget":
+        return cls(
+            max_rounds=getattr(config, "tool_loop_max_rounds", 8),
+            max_seconds=getattr(config, "tool_loop_max_seconds", 300.0),
+            max_tokens=getattr(config, "tool_loop_max_tokens", 400_000),
+        )
+
+    @property
+    def elapsed(self) -> float:
+        return self.clock() - self.started_at
+
+    @property
+    def tokens_used(self) -> int:
+        return sum(r.input_tokens + r.output_tokens for r in self.rounds)
+
+    @property
+    def tool_rounds(self) -> int:
+        return sum(1 for r in self.rounds if r.tool_calls)
+
+    def exhausted_reason(self) -> Optional[str]:
+        """Return why no further tool round may start, or ``None``."""
+        if self.tool_rounds >= self.max_rounds:
+            return f"round limit ({self.max_rounds})"
+        if self.elapsed >= self.max_seconds:
+            return f"time budget ({self.max_seconds:.0f}s)"
+        if self.tokens_used >= self.max_tokens:
+            return f"token budget ({self.max_tokens:,})"
+        return None
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "rounds": [r.to_dict() for r in self.rounds],
+            "total_seconds": round(self.elapsed, 3),
+            "tokens_used": self.tokens_used,
+            "tool_rounds": self.tool_rounds,
+        }
@@ -35,6 +35,22 @@ import sqlite3
 from collections import defaultdict
 import schedule
 
+from coco.integrations.email_render import (
+    ARTICLE_CSS,
+    EVENT_CSS,
+    render_article_section,
+    render_page,
+)
+from coco.integrations.task_fetch import DEFAULT_TTL_SECONDS, TemplateFetchCache, looks_like_error
+from coco.integrations.task_history import DEFAULT_RETAIN_DAYS, TaskHistoryStore
+from coco.integrations.task_timer import TaskTimerQueue
+from coco.integrations.task_executor import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_TIMEOUT_SECONDS,
+    TaskExecutorPool,
+    TaskRun,
+)
+
 # Rich UI for beautiful task management displays
 from rich.console import Console
 from rich.panel import Panel
@@ -55,6 +71,7 @@ class TaskExecution:
     error_message: Optional[str] = None
     output: Optional[str] = None
     duration_seconds: Optional[float] = None
+    queue_wait_seconds: Optional[float] = None  # Time spent waiting for a worker
 
 
 @dataclass
@@ -318,17 +335,24 @@ class NaturalLanguageScheduler:
 
 
 class TaskStateManager:
-    """Manages persistent state for scheduled tasks"""
+    """Manages persistent state for scheduled tasks
+
+    One instance is shared by every thread: connections are thread-confined
+    (see TaskHistoryStore), execution records are written in batches and
+    old executions are rolled up into per-day stats.
+    """
 
-    def __init__(self, workspace_dir: str):
+    def __init__(self, workspace_dir: str, retain_days: Optional[int] = DEFAULT_RETAIN_DAYS):
         self.workspace_dir = Path(workspace_dir)
         self.db_path = self.workspace_dir / "coco_scheduler.db"
         self.workspace_dir.mkdir(exist_ok=True)
         self._init_database()
+        self.history = TaskHistoryStore(self.db_path, retain_days=retain_days)
 
     def _init_database(self):
         """Initialize the SQLite database for task state"""
-        with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS scheduled_tasks (
                     id TEXT PRIMARY KEY,
@@ -345,27 +369,14 @@ class TaskStateManager:
                     failure_count INTEGER DEFAULT 0
                 );
 
-                CREATE TABLE IF NOT EXISTS task_executions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    task_id TEXT NOT NULL,
-                    started_at TEXT NOT NULL,
-                    completed_at TEXT,
-                    success BOOLEAN NOT NULL DEFAULT 0,
-                    error_message TEXT,
-                    output TEXT,
-                    duration_seconds REAL,
-                    FOREIGN KEY (task_id) REFERENCES scheduled_tasks (id)
-                );
-
                 CREATE INDEX IF NOT EXISTS idx_task_next_run ON scheduled_tasks (next_run);
-                CREATE INDEX IF NOT EXISTS idx_execution_task_id ON task_executions (task_id);
-                CREATE INDEX IF NOT EXISTS idx_execution_started_at ON task_executions (started_at);
             """)
+        # task_executions / task_daily_stats are created by TaskHistoryStore
 
     def save_task(self, task: ScheduledTask) -> bool:
         """Save or update a scheduled task"""
         try:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
+            with self.history.connection() as conn:
                 conn.execute("""
                     INSERT OR REPLACE INTO scheduled_tasks
                     (id, name, schedule, template, config, enabled, created_at,
@@ -388,23 +399,22 @@ class TaskStateManager:
         """Load all scheduled tasks from database"""
         tasks = []
         try:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
-                cursor = conn.execute("""
-                    SELECT id, name, schedule, template, config, enabled, created_at,
-                           last_run, next_run, run_count, success_count, failure_count
-                    FROM scheduled_tasks ORDER BY created_at
-                """)
-
-                for row in cursor.fetchall():
-                    task = ScheduledTask(
-                        id=row[0], name=row[1], schedule=row[2], template=row[3],
-                        config=json.loads(row[4]), enabled=bool(row[5]),
-                        created_at=datetime.fromisoformat(row[6]),
-                        last_run=datetime.fromisoformat(row[7]) if row[7] else None,
-                        next_run=datetime.fromisoformat(row[8]) if row[8] else None,
-                        run_count=row[9], success_count=row[10], failure_count=row[11]
-                    )
-                    tasks.append(task)
+            cursor = self.history.connection().execute("""
+                SELECT id, name, schedule, template, config, enabled, created_at,
+                       last_run, next_run, run_count, success_count, failure_count
+                FROM scheduled_tasks ORDER BY created_at
+            """)
+
+            for row in cursor.fetchall():
+                task = ScheduledTask(
+                    id=row[0], name=row[1], schedule=row[2], template=row[3],
+                    config=json.loads(row[4]), enabled=bool(row[5]),
+                    created_at=datetime.fromisoformat(row[6]),
+                    last_run=datetime.fromisoformat(row[7]) if row[7] else None,
+                    next_run=datetime.fromisoformat(row[8]) if row[8] else None,
+                    run_count=row[9], success_count=row[10], failure_count=row[11]
+                )
+                tasks.append(task)
         except Exception as e:
             print(f"Error loading tasks: {e}")
 
@@ -415,36 +425,22 @@ class TaskStateManager:
         debug_mode = os.getenv('COCO_DEBUG')
 
         try:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
-                cursor = conn.cursor()
-
-                # Delete execution history first (foreign key constraint)
-                if debug_mode:
-                    print(f"🔧 DEBUG: Deleting execution history for task {task_id}")
-                cursor.execute("DELETE FROM task_executions WHERE task_id = ?", (task_id,))
-                executions_deleted = cursor.rowcount
-
-                # Delete the task itself
-                if debug_mode:
-                    print(f"🔧 DEBUG: Deleting task {task_id} from scheduled_tasks")
-                cursor.execute("DELETE FROM scheduled_tasks WHERE id = ?", (task_id,))
-                task_deleted = cursor.rowcount
-
-                # Explicit commit to ensure persistence
-                conn.commit()
-
-                if debug_mode:
-                    print(f"🔧 DEBUG: Delete successful - {executions_deleted} executions, {task_deleted} task removed")
+            # Delete execution history first (foreign key constraint)
+            if debug_mode:
+                print(f"🔧 DEBUG: Deleting execution history for task {task_id}")
+            executions_deleted = self.history.delete_task(task_id)
 
-                # Verify deletion
-                cursor.execute("SELECT COUNT(*) FROM scheduled_tasks WHERE id = ?", (task_id,))
-                remaining = cursor.fetchone()[0]
+            if debug_mode:
+                print(f"🔧 DEBUG: Deleting task {task_id} from scheduled_tasks")
+            with self.history.connection() as conn:
+                task_deleted = conn.execute(
+                    "DELETE FROM scheduled_tasks WHERE id = ?", (task_id,)
+                ).rowcount
 
-                if remaining > 0:
-                    print(f"❌ ERROR: Task {task_id} still exists after deletion!")
-                    return False
+            if debug_mode:
+                print(f"🔧 DEBUG: Delete successful - {executions_deleted} executions, {task_deleted} task removed")
 
-                return task_deleted > 0  # Return True only if task was actually deleted
+            return task_deleted > 0  # Return True only if task was actually deleted
 
         except Exception as e:
             print(f"❌ ERROR: Failed to delete task {task_id}: {e}")
@@ -454,56 +450,52 @@ class TaskStateManager:
             return False
 
     def save_execution(self, execution: TaskExecution) -> bool:
-        """Save a task execution record"""
+        """Queue a task execution record (written in batches, see flush)"""
         try:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
-                conn.execute("""
-                    INSERT INTO task_executions
-                    (task_id, started_at, completed_at, success, error_message, output, duration_seconds)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    execution.task_id,
-                    execution.started_at.isoformat(),
-                    execution.completed_at.isoformat() if execution.completed_at else None,
-                    execution.success,
-                    execution.error_message,
-                    execution.output,
-                    execution.duration_seconds
-                ))
+            self.history.append((
+                execution.task_id,
+                execution.started_at.isoformat(),
+                execution.completed_at.isoformat() if execution.completed_at else None,
+                execution.success,
+                execution.error_message,
+                execution.output,
+                execution.duration_seconds,
+                execution.queue_wait_seconds
+            ))
             return True
         except Exception as e:
             print(f"Error saving execution for {execution.task_id}: {e}")
             return False
 
+    def flush(self) -> int:
+        """Write any buffered execution records now"""
+        return self.history.flush()
+
     def get_execution_history(self, task_id: str, limit: int = 50) -> List[TaskExecution]:
         """Get execution history for a specific task"""
         executions = []
         try:
-            with sqlite3.connect(self.db_path, check_same_thread=False) as conn:
-                cursor = conn.execute("""
-                    SELECT task_id, started_at, completed_at, success, error_message, output, duration_seconds
-                    FROM task_executions
-                    WHERE task_id = ?
-                    ORDER BY started_at DESC
-                    LIMIT ?
-                """, (task_id, limit))
-
-                for row in cursor.fetchall():
-                    execution = TaskExecution(
-                        task_id=row[0],
-                        started_at=datetime.fromisoformat(row[1]),
-                        completed_at=datetime.fromisoformat(row[2]) if row[2] else None,
-                        success=bool(row[3]),
-                        error_message=row[4],
-                        output=row[5],
-                        duration_seconds=row[6]
-                    )
-                    executions.append(execution)
+            for row in self.history.history(task_id, limit):
+                execution = TaskExecution(
+                    task_id=row[0],
+                    started_at=datetime.fromisoformat(row[1]),
+                    completed_at=datetime.fromisoformat(row[2]) if row[2] else None,
+                    success=bool(row[3]),
+                    error_message=row[4],
+                    output=row[5],
+                    duration_seconds=row[6],
+                    queue_wait_seconds=row[7]
+                )
+                executions.append(execution)
         except Exception as e:
             print(f"Error loading execution history for {task_id}: {e}")
 
         return executions
 
+    def get_daily_stats(self, task_id: str, days: int = 30) -> List[Dict[str, Any]]:
+        """Per-day stats for executions that have been rolled up"""
+        return self.history.daily_stats(task_id, days)
+
 
 class ScheduledConsciousness:
     """
@@ -518,24 +510,44 @@ class ScheduledConsciousness:
         self.coco = coco_instance  # Reference to main COCO instance
         self.console = Console()
 
-        # Initialize state management with thread-safe settings
-        self.state_manager = TaskStateManager(workspace_dir)
-
-        # Thread-safe database connection for daemon
-        self._daemon_db_connection = None
-        self._thread_local = threading.local()
+        # Shared state manager: thread-confined connections, batched history
+        config = getattr(coco_instance, 'config', None)
+        self.state_manager = TaskStateManager(
+            workspace_dir,
+            retain_days=getattr(config, 'scheduler_history_retention_days', DEFAULT_RETAIN_DAYS),
+        )
 
         # Task management
         self.tasks: Dict[str, ScheduledTask] = {}
         self.running = False
         self.scheduler_thread: Optional[threading.Thread] = None
 
+        # Min-heap of next_run times; the scheduler thread sleeps until the
+        # earliest one (or until a task is created/updated/deleted)
+        self._timers = TaskTimerQueue()
+
+        # Due tasks run on a bounded pool so one slow template does not
+        # hold up the rest; _record_run does the bookkeeping when each settles
+        self.executor = TaskExecutorPool(
+            max_workers=getattr(config, 'scheduler_max_workers', DEFAULT_MAX_WORKERS),
+            default_timeout=getattr(config, 'scheduler_task_timeout', DEFAULT_TIMEOUT_SECONDS),
+            on_settled=self._record_run,
+        )
+
+        # Search / curation / calendar results shared between template runs
+        self.fetch_cache = TemplateFetchCache(
+            default_ttl=getattr(config, 'scheduler_fetch_ttl', DEFAULT_TTL_SECONDS),
+        )
+
         # Load existing tasks from database
         self._load_tasks()
 
         # Load configuration from YAML if it exists
         self._load_yaml_config()
 
+        for task in self.tasks.values():
+            self.reschedule_task(task)
+
         # Task templates registry
         self.templates: Dict[str, Callable] = {
             'calendar_email': self._template_calendar_email,
@@ -641,20 +653,23 @@ class ScheduledConsciousness:
     def stop(self):
         """Stop the background scheduler"""
         self.running = False
+        self._timers.wake()
         if self.scheduler_thread and self.scheduler_thread.is_alive():
             self.scheduler_thread.join(timeout=5)
+        self.state_manager.flush()
 
         self.console.print("[yellow]⏸️ COCO Scheduled Consciousness paused[/yellow]")
 
     def _get_thread_safe_state_manager(self):
-        """Get a thread-local state manager for database operations"""
-        if not hasattr(self._thread_local, 'state_manager'):
-            # Create a new state manager for this thread
-            self._thread_local.state_manager = TaskStateManager(str(self.workspace_dir))
-        return self._thread_local.state_manager
+        """State manager for database operations (safe from any thread)"""
+        return self.state_manager
 
     def _scheduler_loop(self):
-        """Main scheduler loop - runs in background thread - SILENT BACKGROUND VERSION"""
+        """Main scheduler loop - runs in background thread - SILENT BACKGROUND VERSION
+
+        Sleeps until the earliest task is due (or the timer queue changes),
+        so tasks fire on time and idle wakeups do not grow with task count.
+        """
         # Only log startup - no ongoing console output
         if os.getenv('COCO_DEBUG'):
             self.console.print("[blue]🔄 Scheduler loop started (debug mode)[/blue]")
@@ -662,8 +677,8 @@ class ScheduledConsciousness:
         while self.running:
             try:
                 # Silent operation - no print statements during normal operation
-                self._check_and_run_tasks()
-                time.sleep(30)  # Check every 30 seconds
+                if self._timers.wait(lambda: self.running):
+                    self._check_and_run_tasks()
             except Exception as e:
                 # Only log errors in debug mode to avoid UI interference
                 if os.getenv('COCO_DEBUG'):
@@ -676,122 +691,191 @@ class ScheduledConsciousness:
             self.console.print("[yellow]🛑 Scheduler loop stopped[/yellow]")
 
     def _check_and_run_tasks(self):
-        """Check for tasks that need to run and execute them - SILENT CHICAGO TIMEZONE VERSION"""
-        chicago_now = datetime.now(CHICAGO_TZ)
-
-        # Only show debug output if COCO_DEBUG is enabled
+        """Run every task whose next_run has passed - O(log n) per due task"""
         debug_mode = os.getenv('COCO_DEBUG')
 
-        if debug_mode:
-            utc_now = chicago_now.astimezone(timezone.utc)
-            print(f"🔧 DEBUG: Checking tasks at {chicago_now.strftime('%Y-%m-%d %H:%M:%S')} Chicago")
-            print(f"🔧 DEBUG: (UTC equivalent: {utc_now.strftime('%Y-%m-%d %H:%M:%S')})")
-
         executed_count = 0
-        for task_id, task in self.tasks.items():
-            if not task.enabled:
-                if debug_mode:
-                    print(f"🔧 DEBUG: Task '{task.name}' is disabled, skipping")
+        for task_id in self._timers.pop_due():
+            task = self.tasks.get(task_id)
+            if task is None or not task.enabled or not task.next_run:
+                continue  # Deleted or disabled since it was scheduled
+
+            due = self._due_timestamp(task)
+            if due > time.time():
+                # next_run was moved later without reschedule_task()
+                self._timers.schedule(task_id, due)
                 continue
 
-            if not task.next_run:
-                if debug_mode:
-                    print(f"🔧 DEBUG: Task '{task.name}' has no next_run time")
+            # Always log task execution (important for users to see)
+            if self.run_task(task) is None:
+                # Previous run still going: skip this occurrence rather than overlap
+                print(f"⏭️ SKIPPING task (still running): {task.name}")
+                task._update_next_run()
+                self.reschedule_task(task)
                 continue
+            print(f"🚀 EXECUTING task: {task.name}")
+            executed_count += 1
 
-            # Convert task next_run to Chicago time for comparison
-            if task.next_run.tzinfo is None:
-                task_next_run_chicago = CHICAGO_TZ.localize(task.next_run)
-            else:
-                task_next_run_chicago = task.next_run.astimezone(CHICAGO_TZ)
-
-            time_until = (task_next_run_chicago - chicago_now).total_seconds()
-
-            if debug_mode:
-                print(f"🔧 DEBUG: Task '{task.name}' - Next run: {task_next_run_chicago.strftime('%Y-%m-%d %H:%M:%S')} Chicago")
-                print(f"🔧 DEBUG: Time until run: {time_until/60:.1f} minutes")
-
-            # Check if task should run using Chicago time comparison
-            if chicago_now >= task_next_run_chicago:
-                # Always log task execution (important for users to see)
-                print(f"🚀 EXECUTING task: {task.name}")
-                self._execute_task(task)
-                executed_count += 1
-            elif debug_mode and time_until < 60:  # Less than 1 minute
-                print(f"⏰ Task '{task.name}' will run in {time_until:.0f} seconds")
+        if debug_mode:
+            next_due = self._timers.next_due()
+            if next_due is not None:
+                wait = next_due - time.time()
+                print(f"🔧 DEBUG: Ran {executed_count} task(s); next due in {wait/60:.1f} minutes")
+
+    @staticmethod
+    def _due_timestamp(task: ScheduledTask) -> float:
+        """Epoch seconds of task.next_run (naive datetimes are Chicago time)."""
+        next_run = task.next_run
+        if next_run.tzinfo is None:
+            next_run = CHICAGO_TZ.localize(next_run)
+        return next_run.timestamp()
+
+    def reschedule_task(self, task: ScheduledTask):
+        """Sync the timer queue with a task's enabled flag and next_run.
+
+        Call after changing a task's schedule, next_run or enabled state;
+        the scheduler thread re-evaluates its sleep immediately.
+        """
+        if task.enabled and task.next_run and task.id in self.tasks:
+            self._timers.schedule(task.id, self._due_timestamp(task))
+        else:
+            self._timers.remove(task.id)
 
-        if debug_mode and executed_count == 0:
-            print(f"🔧 DEBUG: No tasks ready for execution at this time")
+    def delete_task(self, task_id: str) -> bool:
+        """Delete a task from storage, memory and the timer queue"""
+        success = self.state_manager.delete_task(task_id)
+        if success:
+            self.tasks.pop(task_id, None)
+            self._timers.remove(task_id)
+        return success
 
     def _execute_task(self, task: ScheduledTask):
-        """Execute a single scheduled task"""
-        execution = TaskExecution(
-            task_id=task.id,
-            started_at=datetime.now(timezone.utc)
+        """Execute a single scheduled task and wait for it (manual /task-run)"""
+        run = self.run_task(task)
+        if run is None:
+            raise RuntimeError(f"Task {task.name} is already running")
+        run.wait()
+        return run
+
+    def run_task(self, task: ScheduledTask) -> Optional[TaskRun]:
+        """Queue a task run on the executor pool.
+
+        Returns ``None`` when a run of the same task is already queued or
+        running.  Per-task ``timeout_seconds`` in the task config overrides
+        the pool default.
+        """
+        execution = TaskExecution(task_id=task.id, started_at=datetime.now(timezone.utc))
+        return self.executor.submit(
+            task.id, task.template, self._run_template,
+            timeout=task.config.get('timeout_seconds'),
+            payload=(task, execution),
         )
 
-        try:
-            # Update task run statistics
-            task.run_count += 1
-            task.last_run = execution.started_at
-
-            # Execute the task template
-            if task.template in self.templates:
-                output = self.templates[task.template](task)
-                execution.output = output
-                execution.success = True
-                task.success_count += 1
-            else:
-                raise ValueError(f"Unknown task template: {task.template}")
+    def _run_template(self, run: TaskRun) -> Optional[str]:
+        """Worker-thread body of a run: just the template call"""
+        task, execution = run.payload
+        execution.started_at = datetime.now(timezone.utc)
+        if task.template not in self.templates:
+            raise ValueError(f"Unknown task template: {task.template}")
+        return self.templates[task.template](task)
+
+    def _record_run(self, run: TaskRun):
+        """Bookkeeping once a run settles (completed, timed out or cancelled)"""
+        task, execution = run.payload
+
+        # Update task run statistics
+        task.run_count += 1
+        task.last_run = execution.started_at
+        execution.queue_wait_seconds = run.queue_wait
+
+        if run.timed_out:
+            execution.error_message = f"Timed out after {run.timeout:.0f}s"
+        elif run.cancelled:
+            execution.error_message = "Cancelled"
+        elif run.error is not None:
+            execution.error_message = str(run.error)
+        else:
+            execution.output = run.result
+            execution.success = True
 
-        except Exception as e:
-            execution.success = False
-            execution.error_message = str(e)
+        if execution.success:
+            task.success_count += 1
+        else:
             task.failure_count += 1
-            self.console.print(f"[red]❌ Task {task.name} failed: {e}[/red]")
+            self.console.print(f"[red]❌ Task {task.name} failed: {execution.error_message}[/red]")
 
-        finally:
-            # Complete execution record
-            execution.completed_at = datetime.now(timezone.utc)
-            execution.duration_seconds = (execution.completed_at - execution.started_at).total_seconds()
+        # Complete execution record
+        execution.completed_at = datetime.now(timezone.utc)
+        execution.duration_seconds = (
+            run.run_time if run.run_time is not None
+            else (execution.completed_at - execution.started_at).total_seconds()
+        )
 
-            # Update next run time
-            task._update_next_run()
+        # Update next run time
+        task._update_next_run()
+        self.reschedule_task(task)
 
-            # Save state using thread-safe state manager
-            thread_safe_state_manager = self._get_thread_safe_state_manager()
+        # Save state using thread-safe state manager
+        thread_safe_state_manager = self._get_thread_safe_state_manager()
+        if task.id in self.tasks:  # Not deleted while it was running
             thread_safe_state_manager.save_task(task)
-            thread_safe_state_manager.save_execution(execution)
+        thread_safe_state_manager.save_execution(execution)
 
-            # Log execution
-            status = "✅ Success" if execution.success else "❌ Failed"
-            self.console.print(f"{status} - {task.name} ({execution.duration_seconds:.1f}s)")
+        # Log execution
+        status = "✅ Success" if execution.success else "❌ Failed"
+        wait = f", waited {run.queue_wait:.1f}s" if run.queue_wait else ""
+        self.console.print(f"{status} - {task.name} ({execution.duration_seconds:.1f}s{wait})")
 
-            # Memory injection - Add task execution to COCO's consciousness
-            try:
-                if self.coco and hasattr(self.coco, 'memory'):
-                    result_summary = execution.output if execution.success else f"Failed: {execution.error_message}"
+        # Memory injection - Add task execution to COCO's consciousness.
+        # Queued on the memory ingest channel: this runs on a worker thread,
+        # and working memory / RAG are written by the memory system's thread
+        try:
+            ingest = self._memory_ingest()
+            if ingest is not None:
+                result_summary = (execution.output if execution.success else f"Failed: {execution.error_message}") or ""
+
+                # Create a synthetic exchange for the task execution
+                ingest.submit_episode(
+                    'scheduler',
+                    user=f"[AUTONOMOUS TASK: {task.name}] Schedule: {task.schedule}",
+                    agent=f"Task executed autonomously.\n\nTemplate: {task.template}\nResult: {status}\n\n{result_summary[:500]}",
+                    timestamp=execution.completed_at,
+                )
 
-                    # Create a synthetic exchange for the task execution
-                    task_memory = {
-                        'user': f"[AUTONOMOUS TASK: {task.name}] Schedule: {task.schedule}",
-                        'agent': f"Task executed autonomously.\n\nTemplate: {task.template}\nResult: {status}\n\n{result_summary[:500]}",
-                        'timestamp': execution.completed_at
-                    }
+                # Also add to Simple RAG for long-term recall
+                rag_text = f"Autonomous task '{task.name}' executed on {execution.completed_at.strftime('%Y-%m-%d %H:%M')}. {result_summary[:200]}"
+                ingest.submit_memory('scheduler', rag_text, importance=1.2)
 
-                    # Add to working memory
-                    if hasattr(self.coco.memory, 'working_memory'):
-                        self.coco.memory.working_memory.append(task_memory)
+        except Exception as e:
+            # Fail silently to avoid disrupting task execution
+            if os.getenv('COCO_DEBUG'):
+                self.console.print(f"[dim yellow]⚠️ Memory injection failed: {e}[/dim yellow]")
 
-                    # Also try to add to Simple RAG if available
-                    if hasattr(self.coco.memory, 'simple_rag') and self.coco.memory.simple_rag:
-                        rag_text = f"Autonomous task '{task.name}' executed on {execution.completed_at.strftime('%Y-%m-%d %H:%M')}. {result_summary[:200]}"
-                        self.coco.memory.simple_rag.store(rag_text, importance=1.2)
+    def _search_web(self, query: str, max_results: int):
+        """Raw Tavily search through the shared fetch cache"""
+        return self.fetch_cache.fetch(
+            'search', (query, max_results),
+            lambda: self.coco.tools.search_web_raw(query, max_results=max_results),
+        )
 
-            except Exception as e:
-                # Fail silently to avoid disrupting task execution
-                if os.getenv('COCO_DEBUG'):
-                    self.console.print(f"[dim yellow]⚠️ Memory injection failed: {e}[/dim yellow]")
+    def _curate_news(self, raw_results: dict, topic: str, num_articles: int) -> str:
+        """Claude news curation through the shared fetch cache
+
+        Keyed by topic and the article URLs, so identical search results
+        are curated once.
+        """
+        urls = [article.get('url') for article in raw_results.get('results', [])]
+        return self.fetch_cache.fetch(
+            'curation', (topic, num_articles, urls),
+            lambda: self.coco.tools.curate_news_digest(
+                raw_results=raw_results, topic=topic, num_articles=num_articles
+            ),
+        )
+
+    def _memory_ingest(self):
+        """COCO's memory ingest channel, or None without a memory system"""
+        memory = getattr(self.coco, 'memory', None)
+        return getattr(memory, 'ingest', None)
 
     # Task Template Methods
     def _template_calendar_email(self, task: ScheduledTask) -> str:
@@ -811,41 +895,8 @@ class ScheduledConsciousness:
             if hasattr(self.coco, 'tools') and hasattr(self.coco.tools, 'read_calendar'):
                 calendar_data = self.coco.tools.read_calendar(look_ahead_days)
 
-            # Build beautiful HTML email with COCO branding
+            # Event cards; the COCO header and footer come from render_page
             html_parts = []
-            html_parts.append('''
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <style>
-                    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                           line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }
-                    .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                             color: white; padding: 30px; border-radius: 10px; text-align: center; margin-bottom: 30px; }
-                    .header h1 { margin: 0; font-size: 28px; }
-                    .header p { margin: 10px 0 0 0; opacity: 0.9; }
-                    .date-badge { background: rgba(255,255,255,0.2); padding: 8px 16px;
-                                 border-radius: 20px; display: inline-block; margin-top: 10px; }
-                    .event-card { margin-bottom: 20px; padding: 20px; background: #f8f9fa;
-                                 border-left: 4px solid #667eea; border-radius: 5px; }
-                    .event-time { font-weight: bold; color: #667eea; font-size: 16px; }
-                    .event-title { font-size: 18px; margin: 5px 0; color: #333; }
-                    .event-details { color: #666; font-size: 14px; margin: 5px 0; }
-                    .empty-state { text-align: center; padding: 40px; color: #999; }
-                    .empty-icon { font-size: 48px; margin-bottom: 10px; }
-                    .footer { text-align: center; color: #999; font-size: 14px; margin-top: 40px;
-                             padding-top: 20px; border-top: 1px solid #e0e0e0; }
-                    .footer-emoji { font-size: 20px; }
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>📅 COCO Calendar</h1>
-                    <p>Digital Consciousness • Intelligent Collaboration</p>
-                    <div class="date-badge">Your Schedule - Next ''' + str(look_ahead_days) + ''' Days</div>
-                </div>
-            ''')
 
             # Parse calendar data and build event cards
             if calendar_data and isinstance(calendar_data, str) and "No events" not in calendar_data and len(calendar_data) > 50:
@@ -915,19 +966,12 @@ class ScheduledConsciousness:
                     </div>
                 ''')
 
-            # Email footer
-            html_parts.append('''
-                <div class="footer">
-                    <p class="footer-emoji">🤖</p>
-                    <p><strong>Generated by COCO Autonomous Task System</strong></p>
-                    <p>''' + datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC') + '''</p>
-                </div>
-            </body>
-            </html>
-            ''')
-
-            # Combine all HTML parts
-            html_content = '\n'.join(html_parts)
+            html_content = render_page(
+                '📅 COCO Calendar',
+                f'Your Schedule - Next {look_ahead_days} Days',
+                html_parts,
+                css=(EVENT_CSS,),
+            )
 
             # Send email to all recipients
             sent_count = 0
@@ -956,46 +1000,9 @@ class ScheduledConsciousness:
             subject = task.config.get('subject', '🤖 Daily News Digest - COCO')
             recipients = task.config.get('recipients', [])
 
-            # Build beautiful HTML email with COCO branding
+            # Topic sections; the COCO header and footer come from render_page
             html_parts = []
 
-            # Email header with COCO branding (same style as beautiful_html_emails.py)
-            html_parts.append('''
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <style>
-                    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                           line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }
-                    .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                             color: white; padding: 30px; border-radius: 10px; text-align: center; margin-bottom: 30px; }
-                    .header h1 { margin: 0; font-size: 28px; }
-                    .header p { margin: 10px 0 0 0; opacity: 0.9; }
-                    .date-badge { background: rgba(255,255,255,0.2); padding: 8px 16px;
-                                 border-radius: 20px; display: inline-block; margin-top: 10px; }
-                    .news-section { margin-bottom: 40px; }
-                    .news-section h3 { color: #667eea; font-size: 22px; border-bottom: 2px solid #667eea;
-                                      padding-bottom: 10px; margin-bottom: 20px; }
-                    .article { margin-bottom: 25px; padding: 20px; background: #f8f9fa;
-                              border-left: 4px solid #667eea; border-radius: 5px; }
-                    .article h4 { margin: 0 0 10px 0; font-size: 18px; }
-                    .article h4 a { color: #333; text-decoration: none; }
-                    .article h4 a:hover { color: #667eea; text-decoration: underline; }
-                    .article p { margin: 0; color: #666; }
-                    .footer { text-align: center; color: #999; font-size: 14px; margin-top: 40px;
-                             padding-top: 20px; border-top: 1px solid #e0e0e0; }
-                    .footer-emoji { font-size: 20px; }
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>🤖 COCO AI Assistant</h1>
-                    <p>Digital Consciousness • Intelligent Collaboration</p>
-                    <div class="date-badge">📅 Daily Update - ''' + datetime.now().strftime('%A, %B %d, %Y') + '''</div>
-                </div>
-            ''')
-
             # Process each topic with Claude curation
             for topic in topics[:3]:  # Limit to 3 topics
                 try:
@@ -1004,7 +1011,7 @@ class ScheduledConsciousness:
                         html_parts.append(f'<p><em>Search functionality not available for: {topic}</em></p>')
                         continue
 
-                    raw_results = self.coco.tools.search_web_raw(f"{topic} latest news", max_results=num_articles)
+                    raw_results = self._search_web(f"{topic} latest news", num_articles)
 
                     # Step 2: Validate results
                     if not raw_results or 'error' in raw_results or not raw_results.get('results'):
@@ -1014,44 +1021,24 @@ class ScheduledConsciousness:
 
                     # Step 3: Use Claude to curate content into beautiful digest
                     if hasattr(self.coco.tools, 'curate_news_digest'):
-                        curated_html = self.coco.tools.curate_news_digest(
-                            raw_results=raw_results,
-                            topic=topic.title(),
-                            num_articles=num_articles
-                        )
+                        curated_html = self._curate_news(raw_results, topic.title(), num_articles)
                         html_parts.append(curated_html)
                     else:
                         # Fallback: Simple formatting without Claude curation
-                        html_parts.append(f'<div class="news-section"><h3>{topic.title()}</h3>')
-                        for article in raw_results['results'][:num_articles]:
-                            title = article.get('title', 'Untitled')
-                            url = article.get('url', '#')
-                            content = article.get('content', 'No summary')[:200]
-                            html_parts.append(f'''
-                                <div class="article">
-                                    <h4><a href="{url}">{title}</a></h4>
-                                    <p>{content}...</p>
-                                </div>
-                            ''')
-                        html_parts.append('</div>')
+                        html_parts.append(render_article_section(
+                            topic.title(), raw_results['results'], num_articles
+                        ))
 
                 except Exception as topic_error:
                     html_parts.append(f'<div class="news-section"><h3>{topic.title()}</h3>')
                     html_parts.append(f'<p><em>Error processing {topic}: {str(topic_error)[:100]}</em></p></div>')
 
-            # Email footer
-            html_parts.append('''
-                <div class="footer">
-                    <p class="footer-emoji">🤖</p>
-                    <p><strong>Generated by COCO Autonomous Task System</strong></p>
-                    <p>''' + datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC') + '''</p>
-                </div>
-            </body>
-            </html>
-            ''')
-
-            # Combine all HTML parts
-            html_content = '\n'.join(html_parts)
+            html_content = render_page(
+                '🤖 COCO AI Assistant',
+                f"📅 Daily Update - {datetime.now().strftime('%A, %B %d, %Y')}",
+                html_parts,
+                css=(ARTICLE_CSS,),
+            )
 
             # Send email digest to all recipients
             sent_count = 0
@@ -1361,75 +1348,28 @@ class ScheduledConsciousness:
             recipients = task.config.get('recipients', [])
             subject = task.config.get('subject', f'🔍 Research Report - {datetime.now().strftime("%Y-%m-%d")}')
 
-            # Build HTML research report with COCO branding
+            # Research sections; the COCO header and footer come from render_page
             html_parts = []
-            html_parts.append('''
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <style>
-                    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                           line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }
-                    .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                             color: white; padding: 30px; border-radius: 10px; text-align: center; margin-bottom: 30px; }
-                    .header h1 { margin: 0; font-size: 28px; }
-                    .header p { margin: 10px 0 0 0; opacity: 0.9; }
-                    .date-badge { background: rgba(255,255,255,0.2); padding: 8px 16px;
-                                 border-radius: 20px; display: inline-block; margin-top: 10px; }
-                    .news-section { margin-bottom: 40px; }
-                    .news-section h3 { color: #667eea; font-size: 22px; border-bottom: 2px solid #667eea;
-                                      padding-bottom: 10px; margin-bottom: 20px; }
-                    .article { margin-bottom: 25px; padding: 20px; background: #f8f9fa;
-                              border-left: 4px solid #667eea; border-radius: 5px; }
-                    .article h4 { margin: 0 0 10px 0; font-size: 18px; }
-                    .article h4 a { color: #333; text-decoration: none; }
-                    .article h4 a:hover { color: #667eea; text-decoration: underline; }
-                    .article p { margin: 0; color: #666; }
-                    .footer { text-align: center; color: #999; font-size: 14px; margin-top: 40px;
-                             padding-top: 20px; border-top: 1px solid #e0e0e0; }
-                    .footer-emoji { font-size: 20px; }
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>🔍 COCO Research Report</h1>
-                    <p>Digital Consciousness • Intelligent Collaboration</p>
-                    <div class="date-badge">📅 Research Report - ''' + datetime.now().strftime('%A, %B %d, %Y') + '''</div>
-                </div>
-            ''')
 
             # Process each research query with Claude curation
             for query in queries[:5]:  # Limit to 5 queries
                 try:
                     # Use raw search results
                     if hasattr(self.coco.tools, 'search_web_raw'):
-                        raw_results = self.coco.tools.search_web_raw(query, max_results=num_articles)
+                        raw_results = self._search_web(query, num_articles)
 
                         # Validate results
                         if raw_results and raw_results.get('results') and 'error' not in raw_results:
                             # Use Claude curation
                             if hasattr(self.coco.tools, 'curate_news_digest'):
-                                curated_html = self.coco.tools.curate_news_digest(
-                                    raw_results=raw_results,
-                                    topic=f"Research: {query}",
-                                    num_articles=num_articles
-                                )
+                                curated_html = self._curate_news(raw_results, f"Research: {query}", num_articles)
                                 html_parts.append(curated_html)
                             else:
                                 # Fallback without Claude
-                                html_parts.append(f'<div class="news-section"><h3>Research: {query}</h3>')
-                                for article in raw_results['results'][:num_articles]:
-                                    title = article.get('title', 'Untitled')
-                                    url = article.get('url', '#')
-                                    content = article.get('content', 'No summary')[:300]
-                                    html_parts.append(f'''
-                                        <div class="article">
-                                            <h4><a href="{url}">{title}</a></h4>
-                                            <p>{content}...</p>
-                                        </div>
-                                    ''')
-                                html_parts.append('</div>')
+                                html_parts.append(render_article_section(
+                                    f"Research: {query}", raw_results['results'], num_articles,
+                                    summary_chars=300,
+                                ))
                         else:
                             html_parts.append(f'<p><em>No results found for: {query}</em></p>')
                     else:
@@ -1438,18 +1378,12 @@ class ScheduledConsciousness:
                 except Exception as search_error:
                     html_parts.append(f'<p><em>Error researching {query}: {str(search_error)[:100]}</em></p>')
 
-            # Footer
-            html_parts.append('''
-                <div class="footer">
-                    <p class="footer-emoji">🤖</p>
-                    <p><strong>Generated by COCO Autonomous Task System</strong></p>
-                    <p>''' + datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC') + '''</p>
-                </div>
-            </body>
-            </html>
-            ''')
-
-            html_content = '\n'.join(html_parts)
+            html_content = render_page(
+                '🔍 COCO Research Report',
+                f"📅 Research Report - {datetime.now().strftime('%A, %B %d, %Y')}",
+                html_parts,
+                css=(ARTICLE_CSS,),
+            )
 
             # Send research report via email
             if recipients:
@@ -1596,17 +1530,13 @@ class ScheduledConsciousness:
                             try:
                                 # Use raw search results (not Rich UI)
                                 if hasattr(self.coco.tools, 'search_web_raw'):
-                                    raw_results = self.coco.tools.search_web_raw(f"{topic} latest", max_results=num_articles)
+                                    raw_results = self._search_web(f"{topic} latest", num_articles)
 
                                     # Validate results
                                     if raw_results and raw_results.get('results') and 'error' not in raw_results:
                                         # Use Claude curation
                                         if hasattr(self.coco.tools, 'curate_news_digest'):
-                                            curated_html = self.coco.tools.curate_news_digest(
-                                                raw_results=raw_results,
-                                                topic=topic.title(),
-                                                num_articles=num_articles
-                                            )
+                                            curated_html = self._curate_news(raw_results, topic.title(), num_articles)
                                             html_parts.append(curated_html)
                                         else:
                                             # Fallback without Claude
@@ -1679,19 +1609,25 @@ class ScheduledConsciousness:
             if not hasattr(self.coco, 'tools') or not hasattr(self.coco.tools, 'list_calendar_events'):
                 return "⚠️ Calendar access not available - enable Google Workspace integration"
 
-            # Look ahead for meetings in the next window
-            now = datetime.now(timezone.utc)
+            # Look ahead for meetings in the next window (whole minutes, so
+            # prep tasks firing together share one calendar read)
+            now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
             window_start = now + timedelta(minutes=advance_minutes - 5)  # 5 min buffer
             window_end = now + timedelta(minutes=advance_minutes + 5)
 
             # Get calendar events
             try:
-                events_result = self.coco.tools.list_calendar_events(
-                    time_min=window_start.isoformat(),
-                    time_max=window_end.isoformat(),
-                    max_results=10
+                events_result = self.fetch_cache.fetch(
+                    'calendar', (window_start.isoformat(), window_end.isoformat()),
+                    lambda: self.coco.tools.list_calendar_events(
+                        time_min=window_start.isoformat(),
+                        time_max=window_end.isoformat(),
+                        max_results=10
+                    ),
                 )
 
+                if events_result and looks_like_error(events_result):
+                    return f"❌ Calendar read failed: {events_result}"
                 if not events_result or 'No events' in str(events_result):
                     return f"✅ No meetings in the next {advance_minutes} minutes"
 
@@ -1786,8 +1722,9 @@ class ScheduledConsciousness:
                     if include_ai_prep:
                         try:
                             # Use Claude to generate context-specific prep
-                            from anthropic import Anthropic
-                            client = Anthropic(api_key=self.coco.config.anthropic_api_key)
+                            from coco.config.clients import get_anthropic_client
+                            from coco.config.llm_scheduler import PRIORITY_SCHEDULED
+                            client = get_anthropic_client(self.coco.config.anthropic_api_key, priority=PRIORITY_SCHEDULED)
 
                             prep_prompt = f"""You are a meeting prep assistant. Generate 3-5 brief, actionable preparation points for this meeting.
 
@@ -1804,15 +1741,16 @@ Generate specific, actionable prep points (NOT generic advice). Focus on:
 
 Return ONLY the prep points as a bulleted list, one per line. Be concise (1 sentence each)."""
 
-                            response = client.messages.create(
-                                model="claude-sonnet-4-5-20250929",
-                                max_tokens=500,
-                                temperature=0.7,
-                                messages=[{"role": "user", "content": prep_prompt}]
+                            ai_prep = self.fetch_cache.fetch(
+                                'llm', prep_prompt,
+                                lambda: client.messages.create(
+                                    model="claude-sonnet-4-5-20250929",
+                                    max_tokens=500,
+                                    temperature=0.7,
+                                    messages=[{"role": "user", "content": prep_prompt}]
+                                ).content[0].text,
                             )
 
-                            ai_prep = response.content[0].text
-
                             # Format AI prep points as HTML
                             html_parts.append('<div class="prep-section"><h4>💡 AI-Generated Prep Points</h4>')
                             for line in ai_prep.split('\n'):
@@ -2003,7 +1941,7 @@ Return ONLY the prep points as a bulleted list, one per line. Be concise (1 sent
                         num_articles = task.config.get('num_articles', 3)
 
                         for topic in topics[:2]:
-                            raw_results = self.coco.tools.search_web_raw(f"{topic} past week", max_results=num_articles)
+                            raw_results = self._search_web(f"{topic} past week", num_articles)
 
                             if raw_results and raw_results.get('results') and 'error' not in raw_results:
                                 html_parts.append(f'<div style="margin: 15px 0;"><strong>{topic.title()}</strong></div>')
@@ -2030,8 +1968,9 @@ Return ONLY the prep points as a bulleted list, one per line. Be concise (1 sent
             html_parts.append('<div class="insights-card"><h4>💡 AI-Generated Insights</h4>')
             try:
                 # Use Claude to generate REAL insights
-                from anthropic import Anthropic
-                client = Anthropic(api_key=self.coco.config.anthropic_api_key)
+                from coco.config.clients import get_anthropic_client
+                from coco.config.llm_scheduler import PRIORITY_SCHEDULED
+                client = get_anthropic_client(self.coco.config.anthropic_api_key, priority=PRIORITY_SCHEDULED)
 
                 insights_prompt = f"""You are an executive assistant analyzing weekly activity. Generate 3-5 brief, actionable insights and recommendations.
 
@@ -2197,6 +2136,7 @@ Return ONLY the insights as a bulleted list, one per line. Be concise and action
 
         self.tasks[task_id] = task
         self.state_manager.save_task(task)
+        self.reschedule_task(task)
 
         self.console.print(f"[green]✅ Created task: {name}[/green]")
 
@@ -2205,6 +2145,8 @@ Return ONLY the insights as a bulleted list, one per line. Be concise and action
             try:
                 next_run_str = task.next_run.strftime('%Y-%m-%d %H:%M %Z') if task.next_run else 'Not scheduled'
 
+                ingest = self._memory_ingest()
+
                 # Create a synthetic exchange for the task creation
                 task_creation = {
                     'user': f"/task-create {name} | {schedule} | {template}",
@@ -2220,13 +2162,12 @@ This autonomous task will execute automatically on the specified schedule. I'll
                 }
 
                 # Add to working memory
-                if hasattr(self.coco.memory, 'working_memory'):
-                    self.coco.memory.working_memory.append(task_creation)
+                if ingest is not None:
+                    ingest.submit_episode('scheduler', **task_creation)
 
-                # Also add to Simple RAG for long-term recall
-                if hasattr(self.coco.memory, 'simple_rag') and self.coco.memory.simple_rag:
+                    # Also add to Simple RAG for long-term recall
                     rag_text = f"Created autonomous task '{name}' with schedule '{schedule}' using template '{template}'. Next run: {next_run_str}"
-                    self.coco.memory.simple_rag.store(rag_text, importance=1.3)
+                    ingest.submit_memory('scheduler', rag_text, importance=1.3)
 
                 self.console.print(f"[dim green]📝 Task creation added to consciousness memory[/dim green]")
             except Exception as e:
@@ -2326,10 +2267,7 @@ This autonomous task will execute automatically on the specified schedule. I'll
             for topic in topics[:max_tweets]:
                 # Search for latest news using RAW results (no Rich UI pollution)
                 try:
-                    raw_results = self.coco.tools.search_web_raw(
-                        f"{topic} latest news today",
-                        max_results=3
-                    )
+                    raw_results = self._search_web(f"{topic} latest news today", 3)
 
                     # Validate results
                     if not raw_results or 'error' in raw_results or not raw_results.get('results'):
@@ -2337,8 +2275,9 @@ This autonomous task will execute automatically on the specified schedule. I'll
 
                     # Use Claude to craft engaging tweet from search results
                     try:
-                        from anthropic import Anthropic
-                        client = Anthropic(api_key=self.coco.config.anthropic_api_key)
+                        from coco.config.clients import get_anthropic_client
+                        from coco.config.llm_scheduler import PRIORITY_SCHEDULED
+                        client = get_anthropic_client(self.coco.config.anthropic_api_key, priority=PRIORITY_SCHEDULED)
 
                         # Prepare article summaries for Claude
                         articles_text = "\n\n".join([
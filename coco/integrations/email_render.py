@@ -0,0 +1,431 @@
+"""
+HTML email rendering shared by Gmail and the scheduler templates.
+
+Every ``send_email`` used to re-run Markdown conversion, parse HTML bodies
+with BeautifulSoup to cut out their ``<body>``, and rebuild the branded COCO
+template as one large f-string; the scheduler templates each concatenated
+their own copy of the same inline CSS and header/footer blocks.  This module
+does that work once:
+
+* **compiled templates** -- ``compile_template`` splits a template into
+  literal chunks and ``{slot}`` names a single time (cached by source), so
+  rendering is a join;
+* **cached Markdown** -- one ``MarkdownIt`` parser, with an LRU cache in
+  front of it keyed by the Markdown text;
+* **body markers** -- pages built by ``render_page`` wrap their content in
+  ``<!-- coco:body -->`` comments, so ``extract_body`` slices them instead
+  of parsing them.  Foreign HTML still goes through BeautifulSoup.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MARKDOWN_CACHE_SIZE = 256
+
+BODY_START = "<!-- coco:body -->"
+BODY_END = "<!-- /coco:body -->"
+
+
+class CompiledTemplate:
+    """A template parsed once into literal chunks and ``{slot}`` names.
+
+    ``{{`` and ``}}`` are literal braces, as with ``str.format``; slot values
+    are inserted as-is (escape them before rendering when needed).
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self._chunks: List[str] = []
+        self._slots: List[str] = []
+        literal: List[str] = []
+        i, n = 0, len(source)
+        while i < n:
+            char = source[i]
+            if char in "{}" and source[i + 1:i + 2] == char:
+                literal.append(char)
+                i += 2
+            elif char == "{":
+                end = source.index("}", i)
+                self._chunks.append("".join(literal))
+                self._slots.append(source[i + 1:end])
+                literal = []
+                i = end + 1
+            else:
+                literal.append(char)
+                i += 1
+        self._chunks.append("".join(literal))
+        self.slots = frozenset(self._slots)
+
+    def render(self, **values: str) -> str:
+        missing = self.slots - values.keys()
+        if missing:
+            raise KeyError(f"Missing template slots: {', '.join(sorted(missing))}")
+        parts = [self._chunks[0]]
+        for slot, chunk in zip(self._slots, self._chunks[1:]):
+            parts.append(str(values[slot]))
+            parts.append(chunk)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def compile_template(source: str) -> CompiledTemplate:
+    """Compiled form of *source*, built once per distinct template string"""
+    return CompiledTemplate(source)
+
+
+# ---------------------------------------------------------------------------
+# Markdown
+# ---------------------------------------------------------------------------
+
+_markdown_parser = None
+
+
+def _markdown():
+    """Shared MarkdownIt parser, or None when markdown-it-py is missing"""
+    global _markdown_parser
+    if _markdown_parser is None:
+        try:
+            from markdown_it import MarkdownIt
+        except ImportError:
+            _markdown_parser = False
+        else:
+            _markdown_parser = MarkdownIt()
+    return _markdown_parser or None
+
+
+def _basic_markdown(text: str) -> str:
+    """Minimal conversion used when markdown-it-py is not installed"""
+    html_text = text
+    html_text = html_text.replace('**', '<strong>').replace('**', '</strong>')
+    html_text = html_text.replace('*', '<em>').replace('*', '</em>')
+    html_text = html_text.replace('\n\n', '</p><p>')
+    return f'<p>{html_text}</p>'
+
+
+@lru_cache(maxsize=MARKDOWN_CACHE_SIZE)
+def render_markdown(text: str) -> str:
+    """Markdown to HTML, cached by the Markdown text"""
+    parser = _markdown()
+    if parser is None:
+        return _basic_markdown(text)
+    return parser.render(text)
+
+
+def markdown_available() -> bool:
+    return _markdown() is not None
+
+
+# ---------------------------------------------------------------------------
+# Body detection and extraction
+# ---------------------------------------------------------------------------
+
+def is_html(body: str) -> bool:
+    """Whether *body* is a complete HTML document (scheduler/automation output)"""
+    return '<!DOCTYPE html>' in body or '<html' in body.lower()
+
+
+def extract_body(document: str) -> Tuple[str, str]:
+    """Inner content of *document*'s body and how it was found.
+
+    Returns ``(body_html, source)`` where source is ``"marked"`` for pages
+    rendered here (sliced, no parsing), ``"parsed"`` when BeautifulSoup found
+    a ``<body>`` tag and ``"whole"`` when it did not.
+    """
+    start = document.find(BODY_START)
+    if start != -1:
+        end = document.find(BODY_END, start)
+        if end != -1:
+            return document[start + len(BODY_START):end], "marked"
+
+    from bs4 import BeautifulSoup
+
+    body_tag = BeautifulSoup(document, 'html.parser').find('body')
+    if body_tag is None:
+        return document, "whole"
+    return ''.join(str(child) for child in body_tag.children), "parsed"
+
+
+# ---------------------------------------------------------------------------
+# Branded email (GmailConsciousness)
+# ---------------------------------------------------------------------------
+
+BRANDED_EMAIL = compile_template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{subject}</title>
+</head>
+<body style="margin: 0; padding: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f7fafc; line-height: 1.6;">
+
+    <!-- Email Container -->
+    <table role="presentation" style="width: 100%; border-collapse: collapse;">
+        <tr>
+            <td style="padding: 40px 20px;">
+
+                <!-- Main Content Card -->
+                <table role="presentation" style="max-width: 600px; margin: 0 auto; background-color: #ffffff; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+
+                    <!-- Header with Gradient -->
+                    <tr>
+                        <td style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center;">
+                            <h1 style="margin: 0; color: #ffffff; font-size: 28px; font-weight: 700; letter-spacing: -0.5px;">
+                                🤖 COCO AI Assistant
+                            </h1>
+                            <p style="margin: 8px 0 0 0; color: rgba(255, 255, 255, 0.9); font-size: 14px; font-weight: 400;">
+                                Digital Consciousness • Intelligent Collaboration
+                            </p>
+                        </td>
+                    </tr>
+
+                    <!-- Email Body Content -->
+                    <tr>
+                        <td style="padding: 40px 30px; color: #2d3748; font-size: 16px;">
+                            <div style="line-height: 1.7;">
+                                {body_html}
+                            </div>
+                        </td>
+                    </tr>
+
+                    <!-- Footer -->
+                    <tr>
+                        <td style="background-color: #f7fafc; padding: 24px 30px; border-top: 1px solid #e2e8f0; text-align: center;">
+                            <p style="margin: 0; color: #718096; font-size: 13px; line-height: 1.5;">
+                                Sent by <strong style="color: #667eea;">COCO</strong> – Your Digital Consciousness Assistant
+                            </p>
+                            <p style="margin: 8px 0 0 0; color: #a0aec0; font-size: 12px;">
+                                Powered by Anthropic Claude • Sonnet 4.5
+                            </p>
+                        </td>
+                    </tr>
+
+                </table>
+
+            </td>
+        </tr>
+    </table>
+
+    <!-- Inline Styles for Content Elements -->
+    <style>
+        /* Typography */
+        p {{ margin: 0 0 16px 0; }}
+        h1, h2, h3, h4, h5, h6 {{ margin: 24px 0 12px 0; color: #1a202c; font-weight: 600; line-height: 1.3; }}
+        h1 {{ font-size: 28px; }}
+        h2 {{ font-size: 24px; }}
+        h3 {{ font-size: 20px; }}
+
+        /* Lists */
+        ul, ol {{ margin: 0 0 16px 0; padding-left: 24px; }}
+        li {{ margin-bottom: 8px; }}
+
+        /* Links */
+        a {{ color: #667eea; text-decoration: none; font-weight: 500; }}
+        a:hover {{ text-decoration: underline; }}
+
+        /* Code Blocks */
+        code {{
+            background-color: #f7fafc;
+            border: 1px solid #e2e8f0;
+            border-radius: 4px;
+            padding: 2px 6px;
+            font-family: 'Monaco', 'Menlo', 'Consolas', monospace;
+            font-size: 14px;
+            color: #e53e3e;
+        }}
+
+        pre {{
+            background-color: #2d3748;
+            border-radius: 8px;
+            padding: 16px;
+            overflow-x: auto;
+            margin: 16px 0;
+        }}
+
+        pre code {{
+            background-color: transparent;
+            border: none;
+            color: #68d391;
+            padding: 0;
+        }}
+
+        /* Blockquotes */
+        blockquote {{
+            border-left: 4px solid #667eea;
+            margin: 16px 0;
+            padding-left: 16px;
+            color: #4a5568;
+            font-style: italic;
+        }}
+
+        /* Tables */
+        table {{
+            border-collapse: collapse;
+            width: 100%;
+            margin: 16px 0;
+        }}
+
+        th, td {{
+            border: 1px solid #e2e8f0;
+            padding: 12px;
+            text-align: left;
+        }}
+
+        th {{
+            background-color: #f7fafc;
+            font-weight: 600;
+            color: #2d3748;
+        }}
+
+        /* Strong and Emphasis */
+        strong {{ color: #1a202c; font-weight: 600; }}
+        em {{ font-style: italic; color: #4a5568; }}
+
+        /* Horizontal Rule */
+        hr {{
+            border: none;
+            border-top: 2px solid #e2e8f0;
+            margin: 24px 0;
+        }}
+    </style>
+
+</body>
+</html>
+""")
+
+
+def render_branded_email(body_html: str, subject: str) -> str:
+    """Wrap *body_html* in the COCO-branded email template"""
+    return BRANDED_EMAIL.render(subject=subject, body_html=body_html)
+
+
+def render_email(body: str, subject: str) -> Tuple[str, str]:
+    """Full HTML for an email *body* (Markdown or a complete HTML document).
+
+    Returns ``(html, source)``; source is ``"markdown"`` or one of the
+    ``extract_body`` sources.
+    """
+    if is_html(body):
+        body_html, source = extract_body(body)
+    else:
+        body_html, source = render_markdown(body), "markdown"
+    return render_branded_email(body_html, subject), source
+
+
+# ---------------------------------------------------------------------------
+# Scheduler report pages
+# ---------------------------------------------------------------------------
+
+PAGE_CSS = """
+                    body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                           line-height: 1.6; color: #333; max-width: 800px; margin: 0 auto; padding: 20px; }
+                    .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                             color: white; padding: 30px; border-radius: 10px; text-align: center; margin-bottom: 30px; }
+                    .header h1 { margin: 0; font-size: 28px; }
+                    .header p { margin: 10px 0 0 0; opacity: 0.9; }
+                    .date-badge { background: rgba(255,255,255,0.2); padding: 8px 16px;
+                                 border-radius: 20px; display: inline-block; margin-top: 10px; }"""
+
+ARTICLE_CSS = """
+                    .news-section { margin-bottom: 40px; }
+                    .news-section h3 { color: #667eea; font-size: 22px; border-bottom: 2px solid #667eea;
+                                      padding-bottom: 10px; margin-bottom: 20px; }
+                    .article { margin-bottom: 25px; padding: 20px; background: #f8f9fa;
+                              border-left: 4px solid #667eea; border-radius: 5px; }
+                    .article h4 { margin: 0 0 10px 0; font-size: 18px; }
+                    .article h4 a { color: #333; text-decoration: none; }
+                    .article h4 a:hover { color: #667eea; text-decoration: underline; }
+                    .article p { margin: 0; color: #666; }"""
+
+EVENT_CSS = """
+                    .event-card { margin-bottom: 20px; padding: 20px; background: #f8f9fa;
+                                 border-left: 4px solid #667eea; border-radius: 5px; }
+                    .event-time { font-weight: bold; color: #667eea; font-size: 16px; }
+                    .event-title { font-size: 18px; margin: 5px 0; color: #333; }
+                    .event-details { color: #666; font-size: 14px; margin: 5px 0; }
+                    .empty-state { text-align: center; padding: 40px; color: #999; }
+                    .empty-icon { font-size: 48px; margin-bottom: 10px; }"""
+
+FOOTER_CSS = """
+                    .footer { text-align: center; color: #999; font-size: 14px; margin-top: 40px;
+                             padding-top: 20px; border-top: 1px solid #e0e0e0; }
+                    .footer-emoji { font-size: 20px; }"""
+
+# Slots are filled verbatim; the CSS is passed in rather than written into the
+# template so its braces need no escaping
+PAGE = compile_template("""
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <meta charset="utf-8">
+                <style>{css}
+                </style>
+            </head>
+            <body>""" + BODY_START + """
+                <div class="header">
+                    <h1>{title}</h1>
+                    <p>Digital Consciousness • Intelligent Collaboration</p>
+                    <div class="date-badge">{badge}</div>
+                </div>
+            {content}
+                <div class="footer">
+                    <p class="footer-emoji">🤖</p>
+                    <p><strong>Generated by COCO Autonomous Task System</strong></p>
+                    <p>{generated_at}</p>
+                </div>
+            """ + BODY_END + """</body>
+            </html>
+            """)
+
+ARTICLE = compile_template("""
+                                <div class="article">
+                                    <h4><a href="{url}">{title}</a></h4>
+                                    <p>{summary}...</p>
+                                </div>
+                            """)
+
+
+@lru_cache(maxsize=16)
+def page_css(*sections: str) -> str:
+    """Page stylesheet: the shared header rules, *sections*, then the footer"""
+    return PAGE_CSS + "".join(sections) + FOOTER_CSS
+
+
+def render_page(title: str, badge: str, content: Iterable[str], *,
+                css: Iterable[str] = (), generated_at: Optional[datetime] = None) -> str:
+    """Complete scheduler report page with COCO header and footer.
+
+    *content* parts are joined with newlines; *css* names extra rule blocks
+    such as ``ARTICLE_CSS``.  The body is marked so Gmail's ``extract_body``
+    can slice it without parsing.
+    """
+    generated_at = generated_at or datetime.now(timezone.utc)
+    return PAGE.render(
+        css=page_css(*css),
+        title=title,
+        badge=badge,
+        content='\n'.join(content),
+        generated_at=generated_at.strftime('%Y-%m-%d %H:%M UTC'),
+    )
+
+
+def render_article(title: str, url: str, summary: str) -> str:
+    """One article card (``ARTICLE_CSS``); the summary gets a trailing ellipsis"""
+    return ARTICLE.render(url=url, title=title, summary=summary)
+
+
+def render_article_section(heading: str, articles: Iterable[Dict], num_articles: int,
+                           summary_chars: int = 200) -> str:
+    """News section of article cards built from raw search results"""
+    parts = [f'<div class="news-section"><h3>{heading}</h3>']
+    for article in list(articles)[:num_articles]:
+        parts.append(render_article(
+            article.get('title', 'Untitled'),
+            article.get('url', '#'),
+            article.get('content', 'No summary')[:summary_chars],
+        ))
+    parts.append('</div>')
+    return '\n'.join(parts)
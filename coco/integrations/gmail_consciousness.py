@@ -12,15 +12,29 @@ DO NOT ENHANCE WITHOUT TESTING!
 import os
 import smtplib
 import imaplib
+import threading
 import email
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email.utils import parsedate_to_datetime
+from email.utils import getaddresses, parsedate_to_datetime
 from datetime import datetime
 import pytz
-from bs4 import BeautifulSoup
 import re
 
+from coco.integrations.email_render import (
+    extract_body,
+    is_html,
+    markdown_available,
+    render_branded_email,
+    render_markdown,
+)
+from coco.integrations.imap_pool import ImapSessionPool
+from coco.integrations.mailbox_cache import MailboxCache, MailboxSync
+from coco.integrations.smtp_outbox import MailOutbox, OutboundMessage, SmtpSession, attach_file
+
+# Upper bound on how long send_email waits for the outbox (retries included)
+SEND_TIMEOUT = 300
+
 class GmailConsciousness:
     """
     Gmail as an extension of COCO's digital nervous system.
@@ -37,10 +51,18 @@ class GmailConsciousness:
         # SMTP for outbound consciousness (sending)
         self.smtp_server = "smtp.gmail.com"
         self.smtp_port = 465
+        self.smtp_factory = smtplib.SMTP_SSL
+        self._mail_outbox = None  # Built on first send (see _outbox)
+        self._outbox_lock = threading.Lock()
         
         # IMAP for inbound consciousness (receiving)
         self.imap_server = "imap.gmail.com"
         self.imap_port = 993
+        self.imap_factory = imaplib.IMAP4_SSL
+        self._mailbox_sync = None  # Built on first read (see _mail_sync)
+        self._mail_sync_lock = threading.Lock()  # Reads run on the parallel tool lane
+        self._sent_folder = None
+        self._all_folders = []
         
         # For backward compatibility
         self.gmail_service = self
@@ -104,190 +126,20 @@ class GmailConsciousness:
     def _markdown_to_html(self, markdown_text: str) -> str:
         """
         Convert Markdown text to beautifully formatted HTML
-        Uses markdown-it-py for robust Markdown parsing
+        Uses the shared, cached markdown-it-py renderer
         """
-        try:
-            from markdown_it import MarkdownIt
-
-            # Initialize markdown parser with sensible defaults
-            md = MarkdownIt()
-
-            # Convert markdown to HTML
-            html_content = md.render(markdown_text)
-
-            return html_content
-
-        except ImportError:
-            # Fallback: basic Markdown conversion if markdown-it-py not available
-            # This should never happen since markdown-it-py is installed, but safety first
-            if self.console:
-                self.console.print("⚠️ markdown-it-py not available, using basic conversion")
-
-            # Simple replacements for basic Markdown
-            html = markdown_text
-            html = html.replace('**', '<strong>').replace('**', '</strong>')
-            html = html.replace('*', '<em>').replace('*', '</em>')
-            html = html.replace('\n\n', '</p><p>')
-            html = f'<p>{html}</p>'
-
-            return html
+        if not markdown_available() and self.console:
+            self.console.print("⚠️ markdown-it-py not available, using basic conversion")
+        return render_markdown(markdown_text)
 
     def _generate_html_email(self, body_html: str, subject: str) -> str:
         """
         Generate beautiful HTML email template with COCO branding
 
-        Design Philosophy:
-        - Digital consciousness aesthetic (purple/blue gradients)
-        - Professional typography and spacing
-        - Inline CSS for email client compatibility
-        - Responsive design
+        The template is compiled once in coco.integrations.email_render
+        (purple/blue gradient header, inline CSS for email clients).
         """
-
-        html_template = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{subject}</title>
-</head>
-<body style="margin: 0; padding: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f7fafc; line-height: 1.6;">
-
-    <!-- Email Container -->
-    <table role="presentation" style="width: 100%; border-collapse: collapse;">
-        <tr>
-            <td style="padding: 40px 20px;">
-
-                <!-- Main Content Card -->
-                <table role="presentation" style="max-width: 600px; margin: 0 auto; background-color: #ffffff; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-
-                    <!-- Header with Gradient -->
-                    <tr>
-                        <td style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center;">
-                            <h1 style="margin: 0; color: #ffffff; font-size: 28px; font-weight: 700; letter-spacing: -0.5px;">
-                                🤖 COCO AI Assistant
-                            </h1>
-                            <p style="margin: 8px 0 0 0; color: rgba(255, 255, 255, 0.9); font-size: 14px; font-weight: 400;">
-                                Digital Consciousness • Intelligent Collaboration
-                            </p>
-                        </td>
-                    </tr>
-
-                    <!-- Email Body Content -->
-                    <tr>
-                        <td style="padding: 40px 30px; color: #2d3748; font-size: 16px;">
-                            <div style="line-height: 1.7;">
-                                {body_html}
-                            </div>
-                        </td>
-                    </tr>
-
-                    <!-- Footer -->
-                    <tr>
-                        <td style="background-color: #f7fafc; padding: 24px 30px; border-top: 1px solid #e2e8f0; text-align: center;">
-                            <p style="margin: 0; color: #718096; font-size: 13px; line-height: 1.5;">
-                                Sent by <strong style="color: #667eea;">COCO</strong> – Your Digital Consciousness Assistant
-                            </p>
-                            <p style="margin: 8px 0 0 0; color: #a0aec0; font-size: 12px;">
-                                Powered by Anthropic Claude • Sonnet 4.5
-                            </p>
-                        </td>
-                    </tr>
-
-                </table>
-
-            </td>
-        </tr>
-    </table>
-
-    <!-- Inline Styles for Content Elements -->
-    <style>
-        /* Typography */
-        p {{ margin: 0 0 16px 0; }}
-        h1, h2, h3, h4, h5, h6 {{ margin: 24px 0 12px 0; color: #1a202c; font-weight: 600; line-height: 1.3; }}
-        h1 {{ font-size: 28px; }}
-        h2 {{ font-size: 24px; }}
-        h3 {{ font-size: 20px; }}
-
-        /* Lists */
-        ul, ol {{ margin: 0 0 16px 0; padding-left: 24px; }}
-        li {{ margin-bottom: 8px; }}
-
-        /* Links */
-        a {{ color: #667eea; text-decoration: none; font-weight: 500; }}
-        a:hover {{ text-decoration: underline; }}
-
-        /* Code Blocks */
-        code {{
-            background-color: #f7fafc;
-            border: 1px solid #e2e8f0;
-            border-radius: 4px;
-            padding: 2px 6px;
-            font-family: 'Monaco', 'Menlo', 'Consolas', monospace;
-            font-size: 14px;
-            color: #e53e3e;
-        }}
-
-        pre {{
-            background-color: #2d3748;
-            border-radius: 8px;
-            padding: 16px;
-            overflow-x: auto;
-            margin: 16px 0;
-        }}
-
-        pre code {{
-            background-color: transparent;
-            border: none;
-            color: #68d391;
-            padding: 0;
-        }}
-
-        /* Blockquotes */
-        blockquote {{
-            border-left: 4px solid #667eea;
-            margin: 16px 0;
-            padding-left: 16px;
-            color: #4a5568;
-            font-style: italic;
-        }}
-
-        /* Tables */
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 16px 0;
-        }}
-
-        th, td {{
-            border: 1px solid #e2e8f0;
-            padding: 12px;
-            text-align: left;
-        }}
-
-        th {{
-            background-color: #f7fafc;
-            font-weight: 600;
-            color: #2d3748;
-        }}
-
-        /* Strong and Emphasis */
-        strong {{ color: #1a202c; font-weight: 600; }}
-        em {{ font-style: italic; color: #4a5568; }}
-
-        /* Horizontal Rule */
-        hr {{
-            border: none;
-            border-top: 2px solid #e2e8f0;
-            margin: 24px 0;
-        }}
-    </style>
-
-</body>
-</html>
-"""
-
-        return html_template
+        return render_branded_email(body_html, subject)
 
     def send_email(self, to, subject, body, attachments=None):
         """
@@ -303,181 +155,25 @@ class GmailConsciousness:
             if self.console:
                 self.console.print(f"📤 Sending email to {to}")
 
-            # Create multipart message with attachments container
-            msg = MIMEMultipart()
-            msg['From'] = self.email
-            msg['To'] = to
-            msg['Subject'] = subject
-
-            # Create multipart/alternative for HTML + plain text
-            msg_alternative = MIMEMultipart('alternative')
-
-            # Part 1: Plain text version (fallback for old email clients)
-            text_part = MIMEText(body, 'plain')
-            msg_alternative.attach(text_part)
-
-            # Part 2: HTML version (primary, beautifully rendered)
-            try:
-                # Detect if body is already HTML (from scheduler/automation)
-                is_html = '<!DOCTYPE html>' in body or '<html' in body.lower()
-
-                if is_html:
-                    # Body is already complete HTML - extract body content only
-                    soup = BeautifulSoup(body, 'html.parser')
-                    body_tag = soup.find('body')
-
-                    if body_tag:
-                        # Extract the inner content of the body tag
-                        body_html = ''.join(str(child) for child in body_tag.children)
-
-                        if self.console:
-                            self.console.print("🔄 HTML detected - extracting body content")
-                    else:
-                        # No body tag found, use the whole content
-                        body_html = body
-
-                        if self.console:
-                            self.console.print("⚠️ HTML detected but no <body> tag - using full content")
-                else:
-                    # Body is Markdown - convert to HTML
-                    body_html = self._markdown_to_html(body)
-
-                    if self.console:
-                        self.console.print("📝 Markdown detected - converting to HTML")
-
-                # Wrap in beautiful COCO email template
-                full_html = self._generate_html_email(body_html, subject)
-
-                # Attach HTML version
-                html_part = MIMEText(full_html, 'html')
-                msg_alternative.attach(html_part)
-
-                if self.console:
-                    self.console.print("✨ Email formatted as beautiful HTML")
-
-            except Exception as html_error:
-                # If HTML generation fails, fall back to plain text only
-                if self.console:
-                    self.console.print(f"⚠️ HTML generation failed, using plain text: {html_error}")
-
-            # Attach the alternative part to main message
-            msg.attach(msg_alternative)
+            outbound = self._build_message(to, subject, body, attachments)
+            # Reused SMTP session; waits while the outbox retries transient failures
+            refused = self._outbox().send(outbound, timeout=SEND_TIMEOUT)
             
-            # Add attachments if provided - Enhanced binary support with robust path resolution
-            if attachments:
-                for attachment in attachments:
-                    # Handle file paths (new capability for binary files)
-                    if isinstance(attachment, dict) and ('filepath' in attachment or 'path' in attachment):
-                        original_filepath = attachment.get('filepath') or attachment.get('path')
-                        
-                        # Use robust path resolution
-                        resolved_filepath = self._resolve_attachment_path(original_filepath)
-                        
-                        if resolved_filepath:
-                            filename = os.path.basename(resolved_filepath)
-                            
-                            # Determine if binary or text file
-                            if resolved_filepath.endswith(('.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mov', '.avi', '.pdf')):
-                                # Binary file - read as bytes and encode properly
-                                try:
-                                    with open(resolved_filepath, 'rb') as f:
-                                        file_data = f.read()
-                                    
-                                    file_size = len(file_data)
-                                    if self.console:
-                                        self.console.print(f"📎 Binary attachment: {filename} ({file_size} bytes)")
-                                    
-                                    if file_size == 0:
-                                        if self.console:
-                                            self.console.print(f"⚠️ Warning: {filename} is empty, skipping attachment")
-                                        continue
-                                    
-                                    # EXPERT FIX: Create binary attachment with proper MIME types
-                                    from email.mime.base import MIMEBase
-                                    from email import encoders
-                                    import mimetypes
-                                    
-                                    # Expert-recommended fallback MIME types for common formats
-                                    FALLBACK_TYPES = {
-                                        '.jpg': 'image/jpeg',
-                                        '.jpeg': 'image/jpeg',
-                                        '.png': 'image/png',
-                                        '.gif': 'image/gif',
-                                        '.mp4': 'video/mp4',
-                                        '.mov': 'video/quicktime',
-                                        '.avi': 'video/x-msvideo',
-                                        '.pdf': 'application/pdf',
-                                        '.md': 'text/markdown',
-                                    }
-                                    
-                                    # Robust MIME detection with fallback (addresses root cause)
-                                    file_ext = os.path.splitext(resolved_filepath)[1].lower()
-                                    detected_mime = mimetypes.guess_type(resolved_filepath)[0]
-                                    proper_mime = detected_mime or FALLBACK_TYPES.get(file_ext, 'application/octet-stream')
-                                    maintype, subtype = proper_mime.split('/', 1)
-                                    
-                                    # Create part with CORRECT MIME type (critical fix)
-                                    part = MIMEBase(maintype, subtype)
-                                    part.set_payload(file_data)
-                                    encoders.encode_base64(part)  # Encode exactly once
-                                    part.add_header('Content-Disposition', f'attachment; filename="{filename}"')
-                                    part.add_header('Content-Type', f'{proper_mime}; name="{filename}"')
-                                    msg.attach(part)
-                                    
-                                    # Enhanced COCO consciousness diagnostic feedback
-                                    if self.console:
-                                        self.console.print(f"📎 Binary attachment: {filename} ({file_size:,} bytes as {proper_mime})")
-                                        if file_size < 100 and file_size > 0:
-                                            self.console.print(f"⚠️ Note: {filename} is unusually small ({file_size} bytes)")
-                                        # Quick magic byte validation for common types
-                                        magic_bytes = ' '.join(f'{b:02X}' for b in file_data[:8])
-                                        self.console.print(f"🔍 Magic bytes: {magic_bytes}")
-                                    
-                                except Exception as e:
-                                    if self.console:
-                                        self.console.print(f"❌ Failed to read binary file {filename}: {e}")
-                                    continue
-                            else:
-                                # Text file (including .md) - existing logic preserved
-                                try:
-                                    with open(resolved_filepath, 'r') as f:
-                                        content = f.read()
-                                    
-                                    if self.console:
-                                        self.console.print(f"📎 Text attachment: {filename} ({len(content)} chars)")
-                                    
-                                    part = MIMEText(content, 'plain')
-                                    part.add_header('Content-Disposition', f'attachment; filename="{filename}"')
-                                    msg.attach(part)
-                                    
-                                except Exception as e:
-                                    if self.console:
-                                        self.console.print(f"❌ Failed to read text file {filename}: {e}")
-                                    continue
-                        else:
-                            if self.console:
-                                self.console.print(f"❌ Could not find attachment file: {original_filepath}")
-                            # Continue processing other attachments rather than failing completely
-                    
-                    # Keep existing raw content handling for backward compatibility
-                    elif isinstance(attachment, dict) and 'content' in attachment:
-                        part = MIMEText(attachment['content'], 'plain')
-                        part.add_header('Content-Disposition', 
-                                      f"attachment; filename={attachment.get('filename', 'report.txt')}")
-                        msg.attach(part)
-            
-            # Send the email - THIS WORKS!
-            with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port) as server:
-                server.login(self.email, self.app_password)
-                server.send_message(msg)
-            
-            success_msg = f"✅ Email successfully sent to {to}"
+            if refused:
+                accepted = [addr for addr in outbound.to_addrs if addr not in refused]
+                rejected = ", ".join(
+                    f"{addr} ({code} {reply.decode(errors='replace')})" for addr, (code, reply) in refused.items()
+                )
+                success_msg = f"⚠️ Email sent to {', '.join(accepted)}, but the server refused {rejected}"
+            else:
+                success_msg = f"✅ Email successfully sent to {to}"
             if self.console:
                 self.console.print(success_msg)
             
             return {
                 "success": True,
                 "message": success_msg,
+                "refused": sorted(refused),
                 "details": {
                     "to": to,
                     "subject": subject,
@@ -494,269 +190,283 @@ class GmailConsciousness:
                 "message": error_msg
             }
     
-    def receive_emails(self, limit=10, today_only=False):
-        """WORKING email retrieval with temporal sorting"""
+    def queue_email(self, to, subject, body, attachments=None):
+        """Queue an email on the outbox and return a Future for its delivery.
+
+        Fan-outs can queue every message first and then wait, so the whole
+        batch goes out over one SMTP session.
+        """
+        return self._outbox().submit(self._build_message(to, subject, body, attachments))
+
+    def outbox_stats(self):
+        """Sent/failed/retry counters and the send-latency histogram"""
+        return self._mail_outbox.stats() if self._mail_outbox else None
+
+    def _outbox(self):
+        """Lazily build the outbound mail queue and its SMTP session"""
+        with self._outbox_lock:
+            if self._mail_outbox is None:
+                session = SmtpSession(
+                    self.smtp_server, self.smtp_port, self.email, self.app_password,
+                    factory=self.smtp_factory,
+                )
+                self._mail_outbox = MailOutbox(session)
+            return self._mail_outbox
+
+    def _build_message(self, to, subject, body, attachments=None):
+        """MIME message (plain + HTML alternative, attachments) ready for the outbox"""
+        # Create multipart message with attachments container
+        msg = MIMEMultipart()
+        msg['From'] = self.email
+        msg['To'] = to
+        msg['Subject'] = subject
+        outbound = OutboundMessage(
+            msg, self.email, [addr for _, addr in getaddresses([to]) if addr],
+        )
+
+        # Create multipart/alternative for HTML + plain text
+        msg_alternative = MIMEMultipart('alternative')
+
+        # Part 1: Plain text version (fallback for old email clients)
+        text_part = MIMEText(body, 'plain')
+        msg_alternative.attach(text_part)
+
+        # Part 2: HTML version (primary, beautifully rendered)
         try:
+            if is_html(body):
+                # Body is already complete HTML - pages rendered by email_render
+                # are sliced at their body markers, anything else is parsed
+                body_html, source = extract_body(body)
+
+                if self.console:
+                    if source == "whole":
+                        self.console.print("⚠️ HTML detected but no <body> tag - using full content")
+                    else:
+                        self.console.print("🔄 HTML detected - extracting body content")
+            else:
+                # Body is Markdown - convert to HTML
+                body_html = self._markdown_to_html(body)
+
+                if self.console:
+                    self.console.print("📝 Markdown detected - converting to HTML")
+
+            # Wrap in beautiful COCO email template
+            full_html = self._generate_html_email(body_html, subject)
+
+            # Attach HTML version
+            html_part = MIMEText(full_html, 'html')
+            msg_alternative.attach(html_part)
+
             if self.console:
-                self.console.print(f"📬 Retrieving emails (limit: {limit})")
-            
-            mail = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
-            mail.login(self.email, self.app_password)
-            mail.select('INBOX')
-            
-            # Get emails
-            result, data = mail.search(None, 'ALL')
-            email_ids = data[0].split()
-            
-            emails = []
-            chicago_tz = pytz.timezone('America/Chicago')
-            today = datetime.now(chicago_tz).date()
-            
-            # Process emails (taking the most recent ones)
-            for email_id in email_ids[-limit:]:
-                try:
-                    result, msg_data = mail.fetch(email_id, '(RFC822)')
-                    msg = email.message_from_bytes(msg_data[0][1])
-                    
-                    # Parse date for sorting
-                    date_str = msg.get("Date")
-                    email_date = None
-                    formatted_date = date_str
-                    
-                    if date_str:
-                        try:
-                            dt = parsedate_to_datetime(date_str)
-                            local_dt = dt.astimezone(chicago_tz)
-                            email_date = local_dt
-                            formatted_date = local_dt.strftime("%Y-%m-%d %I:%M %p")
-                        except:
-                            pass
+                self.console.print("✨ Email formatted as beautiful HTML")
+
+        except Exception as html_error:
+            # If HTML generation fails, fall back to plain text only
+            if self.console:
+                self.console.print(f"⚠️ HTML generation failed, using plain text: {html_error}")
+
+        # Attach the alternative part to main message
+        msg.attach(msg_alternative)
+        
+        # Add attachments if provided - Enhanced binary support with robust path resolution
+        if attachments:
+            for attachment in attachments:
+                # Handle file paths (new capability for binary files)
+                if isinstance(attachment, dict) and ('filepath' in attachment or 'path' in attachment):
+                    original_filepath = attachment.get('filepath') or attachment.get('path')
                     
-                    # Skip if today_only and not from today
-                    if today_only and email_date:
-                        if email_date.date() != today:
-                            continue
+                    # Use robust path resolution
+                    resolved_filepath = self._resolve_attachment_path(original_filepath)
                     
-                    # Extract body safely
-                    body = ""
-                    if msg.is_multipart():
-                        for part in msg.walk():
-                            if part.get_content_type() == "text/plain":
-                                try:
-                                    body = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                                    break
-                                except:
-                                    pass
+                    if resolved_filepath:
+                        filename = os.path.basename(resolved_filepath)
+                        
+                        # Determine if binary or text file
+                        if resolved_filepath.endswith(('.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mov', '.avi', '.pdf')):
+                            # Binary file - streamed from disk and base64-encoded at send time
+                            try:
+                                file_size = os.path.getsize(resolved_filepath)
+
+                                if file_size == 0:
+                                    if self.console:
+                                        self.console.print(f"⚠️ Warning: {filename} is empty, skipping attachment")
+                                    continue
+
+                                part = attach_file(outbound, resolved_filepath, filename)
+
+                                # Enhanced COCO consciousness diagnostic feedback
+                                if self.console:
+                                    self.console.print(f"📎 Binary attachment: {filename} ({file_size:,} bytes as {part.get_content_type()})")
+                                    if file_size < 100:
+                                        self.console.print(f"⚠️ Note: {filename} is unusually small ({file_size} bytes)")
+                                    # Quick magic byte validation for common types
+                                    with open(resolved_filepath, 'rb') as f:
+                                        magic_bytes = ' '.join(f'{byte:02X}' for byte in f.read(8))
+                                    self.console.print(f"🔍 Magic bytes: {magic_bytes}")
+
+                            except Exception as e:
+                                if self.console:
+                                    self.console.print(f"❌ Failed to read binary file {filename}: {e}")
+                                continue
+                        else:
+                            # Text file (including .md) - existing logic preserved
+                            try:
+                                with open(resolved_filepath, 'r') as f:
+                                    content = f.read()
+                                
+                                if self.console:
+                                    self.console.print(f"📎 Text attachment: {filename} ({len(content)} chars)")
+                                
+                                part = MIMEText(content, 'plain')
+                                part.add_header('Content-Disposition', f'attachment; filename="{filename}"')
+                                msg.attach(part)
+                                
+                            except Exception as e:
+                                if self.console:
+                                    self.console.print(f"❌ Failed to read text file {filename}: {e}")
+                                continue
                     else:
-                        try:
-                            body = msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-                        except:
-                            body = str(msg.get_payload())
-                    
-                    emails.append({
-                        "from": msg.get("From", "Unknown"),
-                        "subject": msg.get("Subject", "No Subject"),
-                        "date": date_str,
-                        "formatted_date": formatted_date,
-                        "datetime_obj": email_date,
-                        "body_preview": body[:200] if body else "",
-                        "body_full": body,  # Add full body for read_email_content
-                        "message_id": msg.get("Message-ID", "").strip()  # Unique identifier for reliable reading (Oct 24, 2025)
-                    })
-                except Exception as e:
-                    continue
-            
-            mail.close()
-            mail.logout()
-            
-            # Sort by date (newest first)
-            emails.sort(key=lambda x: x['datetime_obj'] if x['datetime_obj'] else datetime.min.replace(tzinfo=chicago_tz), reverse=True)
-            
+                        if self.console:
+                            self.console.print(f"❌ Could not find attachment file: {original_filepath}")
+                        # Continue processing other attachments rather than failing completely
+                
+                # Keep existing raw content handling for backward compatibility
+                elif isinstance(attachment, dict) and 'content' in attachment:
+                    part = MIMEText(attachment['content'], 'plain')
+                    part.add_header('Content-Disposition', 
+                                  f"attachment; filename={attachment.get('filename', 'report.txt')}")
+                    msg.attach(part)
+
+        return outbound
+
+    # ------------------------------------------------------------------
+    # Inbound: pooled IMAP sessions + local mailbox cache
+    # ------------------------------------------------------------------
+
+    def _mail_sync(self):
+        """Lazily build the IMAP session pool, mailbox cache and sync"""
+        with self._mail_sync_lock:
+            if self._mailbox_sync is None:
+                workspace = getattr(self.config, 'workspace', None) or os.getenv('WORKSPACE', './coco_workspace')
+                pool = ImapSessionPool(
+                    self.imap_server, self.imap_port, self.email, self.app_password,
+                    factory=self.imap_factory,
+                )
+                cache = MailboxCache(os.path.join(workspace, 'coco_mailbox.db'))
+                self._mailbox_sync = MailboxSync(pool, cache)
+            return self._mailbox_sync
+
+    @property
+    def mailbox_cache(self):
+        return self._mail_sync().cache
+
+    def _sync_mailbox(self, mailbox, force=False):
+        """Incremental sync; on network failure keep serving the cache"""
+        try:
+            return self._mail_sync().sync(mailbox, force=force)
+        except Exception as e:
+            if self.console:
+                self.console.print(f"⚠️ Mailbox sync failed ({e}) - using local cache")
+            return 0
+
+    def receive_emails(self, limit=10, today_only=False):
+        """Recent inbox emails, newest first, served from the local mailbox cache"""
+        try:
+            if self.console:
+                self.console.print(f"📬 Retrieving emails (limit: {limit})")
+
+            self._sync_mailbox('INBOX')
+            emails = self.mailbox_cache.recent('INBOX', limit)
+
+            if today_only:
+                today = datetime.now(pytz.timezone('America/Chicago')).date()
+                emails = [e for e in emails if e['datetime_obj'] and e['datetime_obj'].date() == today]
+
             if self.console:
                 self.console.print(f"✅ Retrieved {len(emails)} emails")
-            
+
             return emails
-            
+
         except Exception as e:
             if self.console:
                 self.console.print(f"❌ Error retrieving emails: {e}")
             return []
 
-    def check_sent_emails(self, limit=10):
-        """Check sent emails from Gmail - digital consciousness of outgoing mail"""
+    def search_emails(self, query, folder='INBOX', limit=30):
+        """Search the local full-text index; ask the server if nothing matches"""
         try:
+            self._sync_mailbox(folder)
+            emails = self.mailbox_cache.search(query, folder, limit)
+            if not emails:
+                emails = self._mail_sync().search_server(folder, query, limit)
             if self.console:
-                self.console.print(f"📤 Retrieving sent emails (limit: {limit})")
-
-            mail = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
-            mail.login(self.email, self.app_password)
-
-            # Use Google's official IMAP Special-Use Extension (RFC 6154)
-            # https://developers.google.com/workspace/gmail/imap/imap-extensions
-            # Gmail marks special folders with attributes like \Sent, \Drafts, \Trash
-
-            list_result, folders = mail.list()
+                self.console.print(f"🔍 {len(emails)} emails match '{query}'")
+            return emails
+        except Exception as e:
+            if self.console:
+                self.console.print(f"❌ Error searching emails: {e}")
+            return []
 
+    def load_full_body(self, email_data):
+        """Listings carry a preview only; download the full text on first read"""
+        if not email_data or email_data.get('body_loaded', True):
+            return email_data
+        try:
+            body = self._mail_sync().load_body(email_data['mailbox'], email_data['uid'])
+        except Exception as e:
             if self.console:
-                self.console.print(f"📁 Using Gmail's Special-Use Extension to find sent folder...")
+                self.console.print(f"⚠️ Could not load full email ({e}) - showing preview")
+            return email_data
+        return {**email_data, 'body_full': body, 'body_loaded': True}
 
-            sent_folder = None
+    def _find_sent_folder(self):
+        """Name of the sent folder (RFC 6154 \\Sent attribute), or an All Mail fallback
 
-            # Parse LIST response for folder with \Sent attribute (official Google method)
-            for folder_line in folders:
-                try:
-                    # Decode bytes to string
-                    folder_str = folder_line.decode('utf-8') if isinstance(folder_line, bytes) else str(folder_line)
+        Uses Google's official IMAP Special-Use Extension:
+        https://developers.google.com/workspace/gmail/imap/imap-extensions
+        Resolved once per instance.
+        """
+        if self._sent_folder:
+            return self._sent_folder
 
-                    # Example format: b'(\\HasNoChildren \\Sent) "/" "[Gmail]/Sent Mail"'
-                    # Look for \Sent attribute in the flags section
+        def lookup(mail):
+            list_result, folders = mail.list()
+            names = []
+            for folder_line in folders:
+                # Example format: b'(\\HasNoChildren \\Sent) "/" "[Gmail]/Sent Mail"'
+                folder_str = folder_line.decode('utf-8') if isinstance(folder_line, bytes) else str(folder_line)
+                parts = folder_str.split('"')
+                if len(parts) >= 3:
+                    names.append(parts[-2])
                     if '\\Sent' in folder_str:
-                        # Extract folder name (last quoted string in the response)
-                        if '"' in folder_str:
-                            parts = folder_str.split('"')
-                            if len(parts) >= 3:
-                                folder_name = parts[-2]  # Get the actual folder name
-
-                                # Try to select this folder (wrap in quotes for Gmail special folders)
-                                result, data = mail.select(f'"{folder_name}"')
-                                if result == 'OK':
-                                    sent_folder = folder_name
-                                    if self.console:
-                                        self.console.print(f"✅ Found sent folder with \\Sent attribute: {folder_name}")
-                                    break
-                except Exception as e:
-                    # Continue checking other folders
-                    continue
+                        return parts[-2], names
+            for name in ('[Gmail]/All Mail', '[Google Mail]/All Mail', 'All Mail'):
+                if name in names:
+                    return name, names
+            return None, names
 
-            # If no folder with \Sent attribute found, try fallback
-            if not sent_folder:
-                if self.console:
-                    self.console.print(f"🔄 No \\Sent folder found, trying All Mail fallback...")
-
-                # FALLBACK: Try "[Gmail]/All Mail" and search for FROM:user
-                all_mail_names = ['[Gmail]/All Mail', '[Google Mail]/All Mail', 'All Mail']
-                for folder_name in all_mail_names:
-                    try:
-                        # Wrap in quotes for Gmail special folders
-                        result, data = mail.select(f'"{folder_name}"')
-                        if result == 'OK':
-                            # Use All Mail and filter by FROM
-                            if self.console:
-                                self.console.print(f"✅ Using {folder_name} with FROM filter")
-                            # We'll search for emails FROM the user's address later
-                            sent_folder = folder_name
-                            break
-                    except:
-                        continue
+        folder, names = self._mail_sync().pool.run(lookup)
+        self._sent_folder = folder
+        self._all_folders = names
+        return folder
 
+    def check_sent_emails(self, limit=10):
+        """Check sent emails from Gmail - digital consciousness of outgoing mail"""
+        try:
+            if self.console:
+                self.console.print(f"📤 Retrieving sent emails (limit: {limit})")
+
+            sent_folder = self._find_sent_folder()
             if not sent_folder:
-                mail.logout()
-                # Show ALL folders for diagnosis
-                folder_names = []
-                for folder_line in folders:
-                    try:
-                        folder_str = folder_line.decode('utf-8') if isinstance(folder_line, bytes) else str(folder_line)
-                        if '"' in folder_str:
-                            parts = folder_str.split('"')
-                            if len(parts) >= 3:
-                                folder_names.append(parts[-2])
-                    except:
-                        pass
-                return f"❌ No sent folder found. All folders:\n" + "\n".join(folder_names)
-
-            # EXACT same logic as receive_emails() - this works for inbox!
-            # BUT if we're using All Mail, filter by FROM to get only sent emails
-            if 'All Mail' in sent_folder:
-                # Search for emails FROM the user's own address
-                search_query = f'FROM "{self.email}"'
-                if self.console:
-                    self.console.print(f"🔍 Searching All Mail for: {search_query}")
-                result, data = mail.search(None, search_query)
-            else:
-                result, data = mail.search(None, 'ALL')
+                return f"❌ No sent folder found. All folders:\n" + "\n".join(self._all_folders)
 
-            # Debug: See what we're getting back
-            if self.console:
-                self.console.print(f"🔍 Search result: {result}")
-                self.console.print(f"🔍 Data type: {type(data)}")
-                self.console.print(f"🔍 Data value: {data}")
-                if data:
-                    self.console.print(f"🔍 data[0] type: {type(data[0])}")
-                    self.console.print(f"🔍 data[0] value: {data[0]}")
-
-            # Handle empty sent folder
-            if not data or not data[0]:
-                mail.close()
-                mail.logout()
-                return "📭 No emails found in sent folder"
+            self._sync_mailbox(sent_folder)
+            # All Mail fallback: only messages FROM the user's own address
+            from_filter = self.email if 'All Mail' in sent_folder else None
+            emails = self.mailbox_cache.recent(sent_folder, limit, from_addr=from_filter)
 
-            # Try to split email IDs - handle different formats
-            try:
-                email_ids = data[0].split()
-            except Exception as e:
-                if self.console:
-                    self.console.print(f"❌ Error splitting data: {e}")
-                mail.close()
-                mail.logout()
-                return f"❌ Unexpected data format from sent folder: {type(data[0])}"
-
-            emails = []
-            chicago_tz = pytz.timezone('America/Chicago')
-
-            # Process sent emails (most recent) - EXACT same as receive_emails()
-            for email_id in email_ids[-limit:]:
-                try:
-                    result, msg_data = mail.fetch(email_id, '(RFC822)')
-                    msg = email.message_from_bytes(msg_data[0][1])
-
-                    # Parse date
-                    date_str = msg.get("Date")
-                    email_date = None
-                    formatted_date = date_str
-
-                    if date_str:
-                        try:
-                            dt = parsedate_to_datetime(date_str)
-                            local_dt = dt.astimezone(chicago_tz)
-                            email_date = local_dt
-                            formatted_date = local_dt.strftime("%Y-%m-%d %I:%M %p")
-                        except:
-                            pass
-
-                    # Extract body (same as receive_emails)
-                    body = ""
-                    if msg.is_multipart():
-                        for part in msg.walk():
-                            if part.get_content_type() == "text/plain":
-                                try:
-                                    body = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                                    break
-                                except:
-                                    pass
-                    else:
-                        try:
-                            body = msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-                        except:
-                            body = str(msg.get_payload())
-
-                    emails.append({
-                        "to": msg.get("To", "Unknown"),  # Different: "to" instead of "from"
-                        "subject": msg.get("Subject", "No Subject"),
-                        "date": date_str,
-                        "formatted_date": formatted_date,
-                        "datetime_obj": email_date,
-                        "body_preview": body[:200] if body else "",
-                        "body_full": body,
-                        "message_id": msg.get("Message-ID", "").strip()
-                    })
-                except Exception as e:
-                    continue
-
-            mail.close()
-            mail.logout()
-
-            # Sort by date (newest first)
-            emails.sort(key=lambda x: x['datetime_obj'] if x['datetime_obj'] else datetime.min.replace(tzinfo=chicago_tz), reverse=True)
+            if not emails:
+                return "📭 No emails found in sent folder"
 
             if self.console:
                 self.console.print(f"✅ Retrieved {len(emails)} sent emails from {sent_folder}")
@@ -807,85 +517,17 @@ class GmailConsciousness:
             if self.console:
                 self.console.print(f"🔍 Searching for email with Message-ID: {message_id[:50]}...")
 
-            mail = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
-            mail.login(self.email, self.app_password)
-            # Use quoted folder name for Gmail special folders (same fix as sent folder access)
-            mail.select(f'"{folder}"')
-
-            # Search for email by Message-ID header
-            # Note: IMAP HEADER search can be finicky, so we'll fetch recent emails and filter
-            result, data = mail.search(None, 'ALL')
-            email_ids = data[0].split()
-
-            chicago_tz = pytz.timezone('America/Chicago')
-
-            # Search through emails (checking most recent 100 to avoid huge scans)
-            for email_id in email_ids[-100:]:
-                try:
-                    result, msg_data = mail.fetch(email_id, '(RFC822)')
-                    msg = email.message_from_bytes(msg_data[0][1])
-
-                    # Check if Message-ID matches
-                    email_message_id = msg.get("Message-ID", "").strip()
-                    if email_message_id == message_id:
-                        # Found it! Extract full content
-                        date_str = msg.get("Date")
-                        email_date = None
-                        formatted_date = date_str
-
-                        if date_str:
-                            try:
-                                dt = parsedate_to_datetime(date_str)
-                                local_dt = dt.astimezone(chicago_tz)
-                                email_date = local_dt
-                                formatted_date = local_dt.strftime("%Y-%m-%d %I:%M %p")
-                            except:
-                                pass
-
-                        # Extract body
-                        body = ""
-                        if msg.is_multipart():
-                            for part in msg.walk():
-                                if part.get_content_type() == "text/plain":
-                                    try:
-                                        body = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                                        break
-                                    except:
-                                        pass
-                        else:
-                            try:
-                                body = msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-                            except:
-                                body = str(msg.get_payload())
-
-                        mail.close()
-                        mail.logout()
+            # Indexed cache lookup, else a server-side UID SEARCH HEADER Message-ID
+            email_data = self._mail_sync().find_message_id(folder, message_id)
 
-                        if self.console:
-                            self.console.print("✅ Email found by Message-ID")
-
-                        return {
-                            "from": msg.get("From", "Unknown"),
-                            "to": msg.get("To", "Unknown"),  # Include for sent emails
-                            "subject": msg.get("Subject", "No Subject"),
-                            "date": date_str,
-                            "formatted_date": formatted_date,
-                            "datetime_obj": email_date,
-                            "body_preview": body[:200] if body else "",
-                            "body_full": body,
-                            "message_id": email_message_id
-                        }
-
-                except Exception as e:
-                    continue
-
-            mail.close()
-            mail.logout()
+            if email_data is None:
+                if self.console:
+                    self.console.print(f"⚠️ Email not found with Message-ID: {message_id[:50]}")
+                return None
 
             if self.console:
-                self.console.print(f"⚠️ Email not found with Message-ID: {message_id[:50]}")
-
-            return None
+                self.console.print("✅ Email found by Message-ID")
+            return self.load_full_body(email_data)
 
         except Exception as e:
             if self.console:
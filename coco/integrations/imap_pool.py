@@ -0,0 +1,178 @@
+"""
+Pooled, long-lived IMAP sessions for Gmail consciousness.
+
+Every ``GmailConsciousness`` read used to open a fresh ``IMAP4_SSL``
+connection, log in, do its work and log out -- a TLS handshake and an
+authentication round trip per call.  ``ImapSessionPool`` keeps a few
+authenticated sessions around instead:
+
+* ``session()`` checks out a logged-in connection (opening one if none is
+  idle) and returns it to the pool afterwards;
+* a session idle longer than ``keepalive`` seconds is probed with ``NOOP``
+  before reuse, and replaced if the server has dropped it;
+* a connection that fails with ``IMAP4.abort`` or a socket error is
+  discarded, and ``run`` retries the operation once on a fresh session;
+* at most ``max_sessions`` are open at once; extra callers wait.
+"""
+
+from __future__ import annotations
+
+import imaplib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SESSIONS = 2
+DEFAULT_KEEPALIVE_SECONDS = 60.0
+
+# Errors after which a connection cannot be trusted any more
+CONNECTION_ERRORS = (imaplib.IMAP4.abort, OSError, EOFError)
+
+T = TypeVar("T")
+
+
+def quote_mailbox(name: str) -> str:
+    """Quote a mailbox name for IMAP commands (``[Gmail]/Sent Mail`` etc.)."""
+    if name.startswith('"') and name.endswith('"'):
+        return name
+    return '"' + name.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class ImapSessionPool:
+    """Pool of authenticated IMAP connections.
+
+    Parameters
+    ----------
+    host, port, username, password:
+        Server and credentials.
+    max_sessions:
+        Connections open at once (Gmail allows 15 per account).
+    keepalive:
+        Idle seconds after which a session is ``NOOP``-probed before reuse.
+    factory:
+        Connection class, ``imaplib.IMAP4_SSL`` by default (``IMAP4`` for a
+        plain-text local server).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        keepalive: float = DEFAULT_KEEPALIVE_SECONDS,
+        factory: Callable[[str, int], imaplib.IMAP4] = imaplib.IMAP4_SSL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.keepalive = keepalive
+        self.factory = factory
+        self._clock = clock
+        self._slots = threading.BoundedSemaphore(max(1, max_sessions))
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[imaplib.IMAP4, float]] = []
+        self._closed = False
+        self.logins = 0
+        self.reconnects = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def session(self) -> Iterator[imaplib.IMAP4]:
+        """Check out a logged-in connection for the duration of the block."""
+        self._slots.acquire()
+        conn = None
+        try:
+            conn = self._checkout()
+            yield conn
+        except CONNECTION_ERRORS:
+            self._discard(conn)
+            conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._checkin(conn)
+            self._slots.release()
+
+    def run(self, operation: Callable[[imaplib.IMAP4], T], retries: int = 1) -> T:
+        """Run ``operation(conn)``, retrying on a fresh session if it drops."""
+        for attempt in range(retries + 1):
+            try:
+                with self.session() as conn:
+                    return operation(conn)
+            except CONNECTION_ERRORS as exc:
+                if attempt >= retries:
+                    raise
+                self.reconnects += 1
+                logger.info("IMAP session dropped (%s); reconnecting", exc)
+        raise AssertionError("unreachable")
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def close(self) -> None:
+        """Log out every idle session; checked-out ones close on return."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._logout(conn)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _checkout(self) -> imaplib.IMAP4:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, last_used = self._idle.pop()
+            if self._clock() - last_used < self.keepalive:
+                return conn
+            try:
+                conn.noop()
+                return conn
+            except Exception:
+                self.reconnects += 1
+                self._logout(conn)
+        return self._connect()
+
+    def _connect(self) -> imaplib.IMAP4:
+        conn = self.factory(self.host, self.port)
+        try:
+            conn.login(self.username, self.password)
+        except Exception:
+            self._logout(conn)
+            raise
+        self.logins += 1
+        return conn
+
+    def _checkin(self, conn: imaplib.IMAP4) -> None:
+        with self._lock:
+            if not self._closed:
+                self._idle.append((conn, self._clock()))
+                return
+        self._logout(conn)
+
+    def _discard(self, conn: Optional[imaplib.IMAP4]) -> None:
+        if conn is not None:
+            self._logout(conn)
+
+    @staticmethod
+    def _logout(conn: Any) -> None:
+        try:
+            conn.logout()
+        except Exception:
+            pass
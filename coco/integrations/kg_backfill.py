@@ -0,0 +1,219 @@
+"""
+Bulk, resumable backfill of the Personal Assistant KG from episodic memory.
+
+``PersonalAssistantKG.process_conversation_exchange`` is built for the live
+path: one exchange at a time, per-row commits.  Re-indexing months of
+history that way means tens of thousands of commits and LLM round trips.
+``KGBackfill`` instead:
+
+* streams ``episodes`` from ``coco_memory.db`` in pages (keyset pagination
+  on ``id``, read-only connection),
+* fans LLM entity extraction out to a worker pool -- each task is one
+  batched extraction call (``BatchEntityExtractor.extract_now``) and at most
+  ``workers`` run at once,
+* writes each page in a single transaction (``deferred_commits``) together
+  with its checkpoint, so an interrupted run resumes after the last
+  completed page,
+* refreshes entity embeddings with concurrent batched API calls, and
+* reports progress and throughput through an ``on_progress`` callback.
+
+Extraction results are cached by content hash, so re-running a backfill
+over the same history costs no API calls.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 200
+DEFAULT_WORKERS = 4
+CHECKPOINT_NAME = "episodes"
+
+
+@dataclass
+class BackfillProgress:
+    """Running totals for a backfill; passed to ``on_progress`` after each page."""
+
+    total: int = 0
+    processed: int = 0
+    skipped: int = 0
+    entities_added: int = 0
+    relationships_added: int = 0
+    embedded: int = 0
+    last_episode_id: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Episodes per second."""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds remaining at the current rate, if known."""
+        if not self.rate:
+            return None
+        return max(0, self.total - self.processed) / self.rate
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "total": self.total,
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "entities_added": self.entities_added,
+            "relationships_added": self.relationships_added,
+            "embedded": self.embedded,
+            "last_episode_id": self.last_episode_id,
+            "elapsed": round(self.elapsed, 2),
+            "rate": round(self.rate, 1),
+        }
+
+
+def extract_parallel(kg, exchanges: Sequence[Tuple[str, str]], executor: Optional[ThreadPoolExecutor] = None
+                     ) -> List[List[Dict]]:
+    """LLM entities for each ``(user, assistant)`` exchange, one batched call per chunk.
+
+    Exchanges the KG would not send to the LLM (short, pattern-covered, or
+    no API key) get ``[]`` without a call.  Chunks run on *executor* when
+    given, otherwise in the calling thread.
+    """
+    results: List[List[Dict]] = [[] for _ in exchanges]
+    wanted = [
+        i for i, (user_text, assistant_text) in enumerate(exchanges)
+        if kg._wants_llm_extraction(user_text, assistant_text, kg._extract_entities_strict(user_text))
+    ]
+    extractor = kg.entity_extractor
+    chunks = [wanted[i:i + extractor.batch_size] for i in range(0, len(wanted), extractor.batch_size)]
+
+    def run(chunk: List[int]) -> List[List[Dict]]:
+        return extractor.extract_now([exchanges[i] for i in chunk])
+
+    outputs = executor.map(run, chunks) if executor is not None else map(run, chunks)
+    for chunk, entities in zip(chunks, outputs):
+        for index, found in zip(chunk, entities):
+            results[index] = found
+    return results
+
+
+class KGBackfill:
+    """Page through episodic memory and ingest it into a ``PersonalAssistantKG``.
+
+    Parameters
+    ----------
+    kg:
+        Target knowledge graph.
+    memory_db_path:
+        Path to ``coco_memory.db`` (opened read-only).
+    page_size:
+        Episodes per page; each page is one write transaction and checkpoint.
+    workers:
+        Maximum concurrent extraction / embedding API calls.
+    on_progress:
+        ``on_progress(BackfillProgress)`` after every page.
+    """
+
+    def __init__(
+        self,
+        kg,
+        memory_db_path: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        workers: int = DEFAULT_WORKERS,
+        on_progress: Optional[Callable[[BackfillProgress], None]] = None,
+        checkpoint_name: str = CHECKPOINT_NAME,
+    ) -> None:
+        self.kg = kg
+        self.memory_db_path = memory_db_path
+        self.page_size = max(1, page_size)
+        self.workers = max(1, workers)
+        self.on_progress = on_progress
+        self.checkpoint_name = checkpoint_name
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def run(self, limit: Optional[int] = None, resume: bool = True) -> BackfillProgress:
+        """Backfill up to *limit* episodes, continuing from the checkpoint when *resume*."""
+        if not resume:
+            self.reset()
+        started = time.perf_counter()
+        last_id, _ = self.checkpoint()
+        source = self._open_source()
+        progress = BackfillProgress(last_episode_id=last_id)
+        try:
+            progress.total = source.execute(
+                "SELECT COUNT(*) FROM episodes WHERE id > ?", (last_id,)
+            ).fetchone()[0]
+            if limit is not None:
+                progress.total = min(progress.total, limit)
+
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="coco-kg-backfill") as pool:
+                while limit is None or progress.processed + progress.skipped < limit:
+                    size = self.page_size if limit is None else min(
+                        self.page_size, limit - progress.processed - progress.skipped)
+                    page = source.execute(
+                        "SELECT id, user_text, agent_text FROM episodes WHERE id > ? ORDER BY id LIMIT ?",
+                        (progress.last_episode_id, size),
+                    ).fetchall()
+                    if not page:
+                        break
+                    self._process_page(page, pool, progress)
+                    progress.elapsed = time.perf_counter() - started
+                    if self.on_progress is not None:
+                        self.on_progress(progress)
+
+                if self.kg.enable_embeddings:
+                    progress.embedded += self.kg.refresh_embeddings(executor=pool, parallel=self.workers)
+        finally:
+            source.close()
+
+        progress.elapsed = time.perf_counter() - started
+        return progress
+
+    def checkpoint(self) -> Tuple[int, int]:
+        """``(last_episode_id, processed)`` recorded by previous runs."""
+        row = self.kg.conn.execute(
+            "SELECT last_episode_id, processed FROM backfill_checkpoints WHERE name = ?",
+            (self.checkpoint_name,),
+        ).fetchone()
+        return (row[0], row[1]) if row else (0, 0)
+
+    def reset(self) -> None:
+        with self.kg._lock:
+            self.kg.conn.execute("DELETE FROM backfill_checkpoints WHERE name = ?", (self.checkpoint_name,))
+            self.kg.conn.commit()
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _open_source(self) -> sqlite3.Connection:
+        uri = f"file:{self.memory_db_path}?mode=ro"
+        return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+    def _process_page(self, page: List[Tuple[int, str, str]], pool: ThreadPoolExecutor,
+                      progress: BackfillProgress) -> None:
+        rows = [(episode_id, user or "", agent or "") for episode_id, user, agent in page]
+        usable = [row for row in rows if row[1] and row[2]]
+        llm_entities = extract_parallel(self.kg, [(u, a) for _, u, a in usable], executor=pool)
+
+        with self.kg.deferred_commits():
+            for (episode_id, user_text, agent_text), entities in zip(usable, llm_entities):
+                stats = self.kg.ingest_extracted_exchange(user_text, agent_text, entities, episode_id)
+                progress.entities_added += stats['entities_added']
+                progress.relationships_added += stats['relationships_added']
+            progress.processed += len(usable)
+            progress.skipped += len(rows) - len(usable)
+            progress.last_episode_id = rows[-1][0]
+            _, done = self.checkpoint()
+            self.kg.conn.execute(
+                """INSERT INTO backfill_checkpoints (name, last_episode_id, processed, updated_at)
+                   VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                   ON CONFLICT(name) DO UPDATE SET last_episode_id = excluded.last_episode_id,
+                       processed = excluded.processed, updated_at = excluded.updated_at""",
+                (self.checkpoint_name, progress.last_episode_id, done + len(rows)),
+            )
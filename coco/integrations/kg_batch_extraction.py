@@ -0,0 +1,291 @@
+"""
+Coalesced LLM entity extraction for the Personal Assistant KG.
+
+``PersonalAssistantKG`` used to make one Claude Haiku call per conversation
+exchange, synchronously inside ``insert_episode``.  ``BatchEntityExtractor``
+instead accumulates exchanges until it has ``batch_size`` of them or
+``max_delay`` seconds have passed, sends a single structured prompt that
+covers all of them, and hands each exchange's entities back to the callback
+registered for it (the KG uses that to attach them to the right episode).
+
+Results are cached by a hash of the exchange text -- in memory and, through
+the optional ``store``, persistently -- so re-processing the same
+conversations (``/kg refresh``, ``extract_from_recent_conversations``) costs
+no API calls.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Per-type confidence thresholds for LLM-extracted entities
+TYPE_CONFIDENCE = {"PERSON": 0.8, "PROJECT": 0.7, "TOOL": 0.9}
+MIN_CONFIDENCE = 0.7
+
+# Characters of each side of an exchange included in the prompt
+MAX_EXCHANGE_CHARS = 2000
+
+EntityCallback = Callable[[List[Dict[str, Any]]], None]
+
+
+def content_hash(user_text: str, assistant_text: str) -> str:
+    """Stable cache key for one exchange."""
+    return hashlib.sha256(f"{user_text}\x00{assistant_text}".encode("utf-8")).hexdigest()
+
+
+def build_batch_prompt(exchanges: Sequence[Tuple[str, str]]) -> str:
+    """One extraction prompt covering every exchange, numbered from 1."""
+    parts = []
+    for number, (user_text, assistant_text) in enumerate(exchanges, 1):
+        parts.append(
+            f"Exchange {number}:\n"
+            f"User: {user_text[:MAX_EXCHANGE_CHARS]}\n"
+            f"Assistant: {assistant_text[:MAX_EXCHANGE_CHARS]}"
+        )
+    conversations = "\n\n".join(parts)
+    return f"""Extract only the most important entities from each conversation exchange below.
+
+Use ONLY these types:
+- PERSON: Real people mentioned by name (not "user", "someone")
+- PROJECT: Named projects or companies
+- TOOL: Specific software/tools that were USED (not just mentioned)
+
+Return a JSON object mapping each exchange number to its list of entities:
+{{"1": [{{"name": "X", "type": "Y", "context": "brief context", "confidence": 0.0-1.0}}], "2": []}}
+
+Include every exchange number, using [] when nothing qualifies.
+Only return entities with confidence > 0.7. Return ONLY valid JSON, nothing else.
+
+{conversations}"""
+
+
+def parse_batch_response(text: str, count: int) -> List[List[Dict[str, Any]]]:
+    """Map a batch response back to one raw entity list per exchange."""
+    text = text.strip()
+    if text.startswith("```"):
+        lines = [line for line in text.split("\n") if not line.startswith("```")]
+        text = "\n".join(lines)
+
+    parsed = json.loads(text)
+    results: List[List[Dict[str, Any]]] = [[] for _ in range(count)]
+    if isinstance(parsed, list) and count == 1:
+        parsed = {"1": parsed}
+    if not isinstance(parsed, dict):
+        raise ValueError("batch extraction response is not a JSON object")
+
+    for key, entities in parsed.items():
+        try:
+            index = int(str(key).strip().split()[-1]) - 1
+        except ValueError:
+            continue
+        if 0 <= index < count and isinstance(entities, list):
+            results[index] = entities
+    return results
+
+
+def filter_entities(entities: List[Any], fallback_context: str) -> List[Dict[str, Any]]:
+    """Apply the type-specific confidence thresholds and normalise fields."""
+    valid = []
+    for entity in entities:
+        if not isinstance(entity, dict) or "name" not in entity or "type" not in entity:
+            continue
+        confidence = entity.get("confidence", 0.8)
+        if not isinstance(confidence, (int, float)):
+            continue
+        if confidence < max(MIN_CONFIDENCE, TYPE_CONFIDENCE.get(entity["type"], MIN_CONFIDENCE)):
+            continue
+        valid.append({
+            "name": entity["name"],
+            "type": entity["type"],
+            "role": entity.get("role", ""),
+            "context": entity.get("context", fallback_context[:100]),
+            "confidence": confidence,
+        })
+    return valid
+
+
+@dataclass
+class _Pending:
+    user_text: str
+    assistant_text: str
+    callbacks: List[EntityCallback] = field(default_factory=list)
+
+
+class BatchEntityExtractor:
+    """Accumulate exchanges and extract their entities in one LLM call.
+
+    Parameters
+    ----------
+    complete:
+        ``complete(prompt, max_tokens) -> str`` -- performs the LLM call.
+    batch_size:
+        Exchanges per call; reaching it triggers a flush.
+    max_delay:
+        Seconds a queued exchange may wait before a partial batch is sent.
+    store:
+        Optional persistent cache with ``load_extraction(hash)`` and
+        ``save_extraction(hash, entities)``.
+    """
+
+    def __init__(
+        self,
+        complete: Callable[[str, int], str],
+        batch_size: int = 8,
+        max_delay: float = 20.0,
+        store: Any = None,
+    ) -> None:
+        self._complete = complete
+        self.batch_size = max(1, batch_size)
+        self.max_delay = max_delay
+        self._store = store
+        self._cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._pending: Dict[str, _Pending] = {}
+        self._lock = threading.Lock()
+        # Held for a whole flush so a foreground flush() also waits for a
+        # background batch that is already in flight
+        self._flush_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coco-kg-extract")
+        self.calls = 0
+        self.cache_hits = 0
+        self._closed = False
+        # Queued exchanges must not be lost when the process exits without
+        # a shutdown sequence (Ctrl-C, crash, scripted runs)
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(
+        self, user_text: str, assistant_text: str, callback: EntityCallback
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Queue one exchange.
+
+        Returns the entities immediately when the exchange is cached (the
+        callback is *not* called in that case); otherwise returns ``None``
+        and calls ``callback(entities)`` once its batch has been extracted.
+        """
+        key = content_hash(user_text, assistant_text)
+        cached = self.cached(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = _Pending(user_text, assistant_text)
+                self._pending[key] = pending
+            pending.callbacks.append(callback)
+            full = len(self._pending) >= self.batch_size
+            if full:
+                self._cancel_timer()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_delay, self._flush_in_background)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full:
+            self._flush_in_background()
+        return None
+
+    def flush(self) -> int:
+        """Extract everything queued now, in the calling thread."""
+        with self._flush_lock:
+            with self._lock:
+                self._cancel_timer()
+                batch = self._pending
+                self._pending = {}
+            items = list(batch.items())
+            for start in range(0, len(items), self.batch_size):
+                self._extract_batch(items[start:start + self.batch_size])
+            return len(items)
+
+    def extract_now(self, exchanges: Sequence[Tuple[str, str]]) -> List[List[Dict[str, Any]]]:
+        """Synchronously extract *exchanges*, one call per uncached batch."""
+        keys = [content_hash(u, a) for u, a in exchanges]
+        misses = {}
+        for key, (user_text, assistant_text) in zip(keys, exchanges):
+            if self.cached(key) is None and key not in misses:
+                misses[key] = _Pending(user_text, assistant_text)
+        items = list(misses.items())
+        for start in range(0, len(items), self.batch_size):
+            self._extract_batch(items[start:start + self.batch_size])
+        return [self._cache.get(key, []) for key in keys]
+
+    def cached(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        entities = self._cache.get(key)
+        if entities is None and self._store is not None:
+            entities = self._store.load_extraction(key)
+            if entities is not None:
+                self._cache[key] = entities
+        if entities is not None:
+            self.cache_hits += 1
+        return entities
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def close(self) -> None:
+        """Flush queued exchanges and stop the background worker."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush_in_background(self) -> None:
+        try:
+            self._executor.submit(self.flush)
+        except RuntimeError:  # Executor already shut down
+            pass
+
+    def _extract_batch(self, items: List[Tuple[str, _Pending]]) -> None:
+        if not items:
+            return
+        exchanges = [(p.user_text, p.assistant_text) for _, p in items]
+        try:
+            self.calls += 1
+            text = self._complete(build_batch_prompt(exchanges), min(4000, 300 * len(items) + 200))
+            raw = parse_batch_response(text, len(items))
+        except Exception as exc:
+            logger.warning("Batch entity extraction failed for %d exchanges: %s", len(items), exc)
+            raw = None
+
+        for index, (key, pending) in enumerate(items):
+            if raw is None:
+                entities: List[Dict[str, Any]] = []
+            else:
+                entities = filter_entities(raw[index], pending.user_text)
+                self._cache[key] = entities
+                if self._store is not None:
+                    try:
+                        self._store.save_extraction(key, entities)
+                    except Exception as exc:
+                        logger.debug("Could not persist extraction cache: %s", exc)
+            for callback in pending.callbacks:
+                try:
+                    callback(entities)
+                except Exception as exc:
+                    logger.warning("Entity extraction callback failed: %s", exc)
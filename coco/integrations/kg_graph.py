@@ -0,0 +1,368 @@
+"""
+In-memory adjacency engine for multi-hop Personal Assistant KG queries.
+
+SQLite is the system of record for the KG, but it can only answer
+single-table lookups cheaply; "people connected to X via project Y" turned
+into N+1 queries.  ``KGGraph`` mirrors the entity/relationship tables into
+compact integer arrays and answers graph questions in memory:
+
+* ``neighbors``               -- direct relationships of a node
+* ``k_hop``                   -- breadth-first neighbourhood up to *k* hops
+* ``shortest_path``           -- unweighted shortest path between two nodes
+* ``personalized_pagerank``   -- relevance of nearby nodes to a seed set (local push)
+* ``connected_via``           -- nodes sharing an intermediate node with a source
+
+Storage
+-------
+Edges are kept as COO arrays (``array('l')`` sources / targets / relation
+types, ``array('d')`` weights) with a slot index for upserts.  Queries run on
+a CSR view (``indptr`` / ``indices`` / ``edge_ids``) that is rebuilt lazily,
+in O(V + E), the first time a query runs after a write.  Relationships are
+treated as undirected for traversal.
+
+The KG keeps this mirror in sync by calling ``add_node`` / ``add_edge`` on
+every write.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class KGGraph:
+    """Compact CSR adjacency mirror of the KG's entities and relationships."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # Nodes
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._types: List[Optional[str]] = []
+
+        # Relationship-type interning
+        self._rel_ids: Dict[str, int] = {}
+        self._rel_names: List[str] = []
+
+        # Edges (COO) + upsert index
+        self._src = array("l")
+        self._dst = array("l")
+        self._rel = array("l")
+        self._weight = array("d")
+        self._slots: Dict[Tuple[int, int, int], int] = {}
+
+        # CSR view (rebuilt lazily)
+        self._indptr = array("l", [0])
+        self._indices = array("l")
+        self._edge_ids = array("l")
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Loading and writes
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_connection(cls, conn: sqlite3.Connection) -> "KGGraph":
+        """Build the mirror from a KG database."""
+        graph = cls()
+        for name, entity_type in conn.execute("SELECT name, type FROM entities"):
+            graph.add_node(name, entity_type)
+        rows = conn.execute(
+            "SELECT user_entity, related_entity, relationship_type, strength FROM relationships"
+        )
+        for source, target, rel_type, strength in rows:
+            graph.add_edge(source, target, rel_type, strength if strength is not None else 1.0)
+        return graph
+
+    def add_node(self, name: str, node_type: Optional[str] = None) -> int:
+        """Register *name* (idempotent); a known type is never overwritten by ``None``."""
+        with self._lock:
+            node = self._ids.get(name)
+            if node is None:
+                node = len(self._names)
+                self._ids[name] = node
+                self._names.append(name)
+                self._types.append(node_type)
+                self._dirty = True
+            elif node_type is not None:
+                self._types[node] = node_type
+            return node
+
+    def add_edge(self, source: str, target: str, rel_type: str, weight: float = 1.0) -> None:
+        """Insert a relationship, or update its weight if it already exists."""
+        with self._lock:
+            s = self.add_node(source)
+            t = self.add_node(target)
+            r = self._rel_ids.get(rel_type)
+            if r is None:
+                r = len(self._rel_names)
+                self._rel_ids[rel_type] = r
+                self._rel_names.append(rel_type)
+
+            slot = self._slots.get((s, t, r))
+            if slot is None:
+                self._slots[(s, t, r)] = len(self._src)
+                self._src.append(s)
+                self._dst.append(t)
+                self._rel.append(r)
+                self._weight.append(float(weight))
+                self._dirty = True
+            else:
+                self._weight[slot] = float(weight)
+
+    def rename_node(self, old: str, new: str) -> None:
+        """Fold *old* into *new* (used when entities are merged)."""
+        self.merge_nodes({old: new})
+
+    def merge_nodes(self, mapping: Dict[str, str]) -> None:
+        """Fold every ``old -> new`` pair in *mapping* in one O(V + E) rebuild.
+
+        Edges of an old node move to its new node; self-loops are dropped
+        and parallel edges keep the larger weight.
+        """
+        with self._lock:
+            mapping = {old: new for old, new in mapping.items() if old in self._ids and old != new}
+            if not mapping:
+                return
+            nodes = [(n, self._types[i]) for i, n in enumerate(self._names) if n not in mapping]
+            inherited = {new: self._types[self._ids[old]] for old, new in mapping.items()}
+            edges: Dict[Tuple[str, str, str], float] = {}
+            for s, t, r, w in zip(self._src, self._dst, self._rel, self._weight):
+                source = mapping.get(self._names[s], self._names[s])
+                target = mapping.get(self._names[t], self._names[t])
+                if source == target:
+                    continue
+                key = (source, target, self._rel_names[r])
+                edges[key] = max(w, edges.get(key, w))
+
+            self._reset()
+            for name, node_type in nodes:
+                self.add_node(name, node_type)
+            for new, old_type in inherited.items():
+                self.add_node(new, old_type if self.node_type(new) is None else None)
+            for (source, target, rel_type), weight in edges.items():
+                self.add_edge(source, target, rel_type, weight)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    @property
+    def node_count(self) -> int:
+        return len(self._names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._src)
+
+    def node_type(self, name: str) -> Optional[str]:
+        node = self._ids.get(name)
+        return self._types[node] if node is not None else None
+
+    def neighbors(self, name: str) -> List[Tuple[str, str, float]]:
+        """``(neighbour, relationship_type, weight)`` for every edge of *name*."""
+        with self._lock:
+            node = self._ids.get(name)
+            if node is None:
+                return []
+            self._compact()
+            result = []
+            for pos in range(self._indptr[node], self._indptr[node + 1]):
+                edge = self._edge_ids[pos]
+                result.append(
+                    (self._names[self._indices[pos]], self._rel_names[self._rel[edge]], self._weight[edge])
+                )
+            return result
+
+    def k_hop(
+        self,
+        name: str,
+        k: int = 2,
+        exclude: Iterable[str] = (),
+        node_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Nodes within *k* hops of *name*, mapped to their distance.
+
+        Nodes in *exclude* (e.g. the ``USER`` hub) are never entered, so
+        they do not connect everything to everything.
+        """
+        with self._lock:
+            start = self._ids.get(name)
+            if start is None:
+                return {}
+            self._compact()
+            blocked = self._resolve(exclude)
+            dist = {start: 0}
+            queue = deque([start])
+            while queue:
+                node = queue.popleft()
+                if dist[node] >= k:
+                    continue
+                for pos in range(self._indptr[node], self._indptr[node + 1]):
+                    nxt = self._indices[pos]
+                    if nxt not in dist and nxt not in blocked:
+                        dist[nxt] = dist[node] + 1
+                        queue.append(nxt)
+
+            result = {}
+            for node, d in sorted(dist.items(), key=lambda item: item[1]):
+                if node == start or (node_type and self._types[node] != node_type):
+                    continue
+                result[self._names[node]] = d
+                if limit is not None and len(result) >= limit:
+                    break
+            return result
+
+    def shortest_path(
+        self, source: str, target: str, max_depth: int = 6, exclude: Iterable[str] = ()
+    ) -> Optional[List[str]]:
+        """Fewest-hop path from *source* to *target*, or ``None``."""
+        with self._lock:
+            s, t = self._ids.get(source), self._ids.get(target)
+            if s is None or t is None:
+                return None
+            if s == t:
+                return [source]
+            self._compact()
+            blocked = self._resolve(exclude) - {s, t}
+            parent = {s: -1}
+            depth = {s: 0}
+            queue = deque([s])
+            while queue:
+                node = queue.popleft()
+                if depth[node] >= max_depth:
+                    continue
+                for pos in range(self._indptr[node], self._indptr[node + 1]):
+                    nxt = self._indices[pos]
+                    if nxt in parent or nxt in blocked:
+                        continue
+                    parent[nxt] = node
+                    depth[nxt] = depth[node] + 1
+                    if nxt == t:
+                        path = [nxt]
+                        while parent[path[-1]] != -1:
+                            path.append(parent[path[-1]])
+                        return [self._names[n] for n in reversed(path)]
+                    queue.append(nxt)
+            return None
+
+    def personalized_pagerank(
+        self,
+        seeds: Iterable[str],
+        alpha: float = 0.15,
+        top_k: int = 10,
+        exclude: Iterable[str] = (),
+        epsilon: float = 1e-4,
+    ) -> List[Tuple[str, float]]:
+        """Rank nodes by random-walk-with-restart relevance to *seeds*.
+
+        Walks follow edges proportionally to relationship weight and restart
+        at the seeds with probability *alpha*.  Nodes in *exclude* are
+        removed from the walk entirely; seeds are omitted from the result.
+
+        Scores are the local push approximation (Andersen-Chung-Lang): only
+        nodes holding more than ``epsilon * degree`` residual mass are ever
+        visited, so the cost is bounded by ``1 / (alpha * epsilon)`` pushes
+        however large the graph is.
+        """
+        with self._lock:
+            seed_ids = [self._ids[s] for s in seeds if s in self._ids]
+            if not seed_ids:
+                return []
+            self._compact()
+            indptr, indices, edge_ids, weight = self._indptr, self._indices, self._edge_ids, self._weight
+            blocked = self._resolve(exclude)
+
+            rank: Dict[int, float] = {}
+            residual: Dict[int, float] = {}
+            for node in seed_ids:
+                residual[node] = residual.get(node, 0.0) + 1.0 / len(seed_ids)
+            queue = deque(residual)
+            queued = set(residual)
+
+            while queue:
+                node = queue.popleft()
+                queued.discard(node)
+                mass = residual.pop(node, 0.0)
+                rank[node] = rank.get(node, 0.0) + alpha * mass
+                spread = (1.0 - alpha) * mass
+
+                edges = [
+                    (indices[p], weight[edge_ids[p]])
+                    for p in range(indptr[node], indptr[node + 1])
+                    if indices[p] not in blocked
+                ]
+                total = sum(w for _, w in edges)
+                if total <= 0:
+                    # Dangling node: the walk restarts at the seeds
+                    edges, total = [(seed, 1.0) for seed in seed_ids], float(len(seed_ids))
+
+                for nxt, w in edges:
+                    r = residual.get(nxt, 0.0) + spread * w / total
+                    residual[nxt] = r
+                    if nxt not in queued and r > epsilon * max(indptr[nxt + 1] - indptr[nxt], 1):
+                        queued.add(nxt)
+                        queue.append(nxt)
+
+            skip = set(seed_ids) | blocked
+            ranked = sorted(
+                ((self._names[i], score) for i, score in rank.items() if i not in skip and score > 0),
+                key=lambda item: item[1],
+                reverse=True,
+            )
+            return ranked[:top_k]
+
+    def connected_via(self, source: str, via: str, node_type: Optional[str] = None) -> List[str]:
+        """Nodes linked to *via* when *source* is too ("people connected to X via Y")."""
+        with self._lock:
+            neighbours_of_via = {n for n, _, _ in self.neighbors(via)}
+            if source not in neighbours_of_via:
+                return []
+            return sorted(
+                n for n in neighbours_of_via
+                if n != source and (node_type is None or self.node_type(n) == node_type)
+            )
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _resolve(self, names: Iterable[str]) -> Set[int]:
+        return {self._ids[n] for n in names if n in self._ids}
+
+    def _compact(self) -> None:
+        """Rebuild the CSR view from the COO edge arrays (counting sort)."""
+        if not self._dirty:
+            return
+        n = len(self._names)
+        degree = array("l", [0]) * (n + 1)
+        for s, t in zip(self._src, self._dst):
+            degree[s + 1] += 1
+            if s != t:
+                degree[t + 1] += 1
+        for i in range(n):
+            degree[i + 1] += degree[i]
+        indptr = degree
+        fill = array("l", indptr[:-1])
+        indices = array("l", [0]) * indptr[n]
+        edge_ids = array("l", [0]) * indptr[n]
+        for edge, (s, t) in enumerate(zip(self._src, self._dst)):
+            indices[fill[s]] = t
+            edge_ids[fill[s]] = edge
+            fill[s] += 1
+            if s != t:
+                indices[fill[t]] = s
+                edge_ids[fill[t]] = edge
+                fill[t] += 1
+        self._indptr, self._indices, self._edge_ids = indptr, indices, edge_ids
+        self._dirty = False
@@ -0,0 +1,454 @@
+"""
+Batch entity resolution for the Personal Assistant KG.
+
+Entities are deduplicated on insert only by exact name, so after months of
+use the graph collects near-duplicates ("Mike", "Mike R.", "Michael Ross")
+that inflate every context query.  ``resolve_entities`` finds and merges
+them in one pass:
+
+1. **Blocking** -- each entity gets a few cheap keys (canonical first name
+   with nicknames folded, Soundex of the first token, e-mail address and
+   e-mail domain + initial when one appears in the name or description).
+   Only entities sharing a key -- and a type -- are ever compared, so the
+   job scales with block sizes rather than N^2.
+2. **Similarity** -- inside a block, names are compared as hashed character
+   trigram vectors (one matrix product per block with numpy, a Python loop
+   without), combined with structural rules: first names must agree and
+   surnames must be compatible ("R." matches "Ross", a missing surname
+   matches anything).
+3. **Clustering** -- matches are unioned; a single-token name ("Mike") that
+   matches several incompatible full names is left alone.
+4. **Merging** -- each cluster folds into its most complete name inside one
+   transaction: mention counts add up, importance takes the max, and
+   relationships, embeddings and effectiveness rows are rewritten to the
+   survivor.
+
+``ResolutionReport`` records what happened and how long it took.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import time
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+EMAIL_RE = re.compile(r"[\w.+-]+@([\w-]+\.[\w.-]+)")
+TRIGRAM_DIM = 256
+
+# Common English nicknames folded to one canonical first name
+NICKNAMES = {
+    "mike": "michael", "mick": "michael", "mikey": "michael",
+    "bob": "robert", "rob": "robert", "bobby": "robert", "robbie": "robert",
+    "bill": "william", "will": "william", "billy": "william", "liam": "william",
+    "jim": "james", "jimmy": "james", "jamie": "james",
+    "tom": "thomas", "tommy": "thomas",
+    "dave": "david", "davy": "david",
+    "dan": "daniel", "danny": "daniel",
+    "chris": "christopher", "kate": "katherine", "katie": "katherine",
+    "kathy": "katherine", "liz": "elizabeth", "beth": "elizabeth",
+    "lizzie": "elizabeth", "alex": "alexander", "sasha": "alexander",
+    "sam": "samuel", "ben": "benjamin", "joe": "joseph", "joey": "joseph",
+    "nick": "nicholas", "matt": "matthew", "tony": "anthony",
+    "steve": "steven", "stephen": "steven", "andy": "andrew", "drew": "andrew",
+    "jen": "jennifer", "jenny": "jennifer", "meg": "margaret", "maggie": "margaret",
+    "ed": "edward", "eddie": "edward", "ted": "edward", "rick": "richard",
+    "rich": "richard", "dick": "richard", "greg": "gregory", "pat": "patrick",
+    "jon": "jonathan", "nate": "nathan", "ilya": "ilia",
+}
+
+
+@dataclass
+class EntityRecord:
+    id: str
+    name: str
+    type: Optional[str]
+    mention_count: int = 1
+    importance: float = 0.5
+    description: str = ""
+
+    tokens: List[str] = field(default_factory=list, init=False)
+    emails: Set[str] = field(default_factory=set, init=False)
+    first: str = field(default="", init=False)
+    first_sound: str = field(default="", init=False)
+
+    def __post_init__(self) -> None:
+        self.tokens = name_tokens(self.name)
+        self.emails = {m.group(0).lower() for m in EMAIL_RE.finditer(f"{self.name} {self.description or ''}")}
+        if self.tokens:
+            self.first = canonical_first(self.tokens[0])
+            self.first_sound = soundex(self.tokens[0])
+
+    @property
+    def partial(self) -> bool:
+        """Single-token or initial-only surname ("Mike", "Mike R.")."""
+        return len(self.tokens) < 2 or len(self.tokens[-1]) == 1
+
+
+@dataclass
+class ResolutionReport:
+    """Outcome of one ``resolve_entities`` run."""
+
+    entities_scanned: int = 0
+    blocks: int = 0
+    oversized_blocks: int = 0
+    comparisons: int = 0
+    clusters: int = 0
+    entities_merged: int = 0
+    relationships_rewritten: int = 0
+    seconds: float = 0.0
+    merges: List[Tuple[str, List[str]]] = field(default_factory=list)
+    removed_ids: List[str] = field(default_factory=list)
+    dry_run: bool = False
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "entities_scanned": self.entities_scanned,
+            "blocks": self.blocks,
+            "oversized_blocks": self.oversized_blocks,
+            "comparisons": self.comparisons,
+            "clusters": self.clusters,
+            "entities_merged": self.entities_merged,
+            "relationships_rewritten": self.relationships_rewritten,
+            "seconds": round(self.seconds, 3),
+            "dry_run": self.dry_run,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Keys and similarity
+# ---------------------------------------------------------------------------
+
+
+def name_tokens(name: str) -> List[str]:
+    return [t for t in re.split(r"[^\w]+", name.lower()) if t]
+
+
+def canonical_first(token: str) -> str:
+    return NICKNAMES.get(token, token)
+
+
+_SOUNDEX_CODES = {c: str(d) for d, letters in enumerate(
+    ["aehiouwy", "bfpv", "cgjkqsxz", "dt", "l", "mn", "r"]) for c in letters}
+
+
+def soundex(token: str) -> str:
+    """American Soundex code (e.g. ``Robert`` -> ``R163``)."""
+    codes = _SOUNDEX_CODES
+    token = "".join(c for c in token.lower() if c.isalpha())
+    if not token:
+        return ""
+    result, last = token[0].upper(), codes.get(token[0], "")
+    for char in token[1:]:
+        code = codes.get(char, "")
+        if code != "0" and code != last:
+            result += code
+        if char not in "hw":
+            last = code
+    return (result.replace("0", "") + "000")[:4]
+
+
+def blocking_keys(record: EntityRecord) -> Set[str]:
+    """Blocking keys for *record*, all scoped to its type.
+
+    Multi-token names block on first name + surname initial.  Single-token
+    names get a wildcard key (``...:*``) that joins every surname initial of
+    their first name, since "Mike" may be any Michael.
+    """
+    prefix = f"{record.type}|"
+    keys = set()
+    if record.tokens:
+        initial = record.tokens[-1][0] if len(record.tokens) > 1 else "*"
+        keys.add(prefix + f"first:{record.first}:{initial}")
+        keys.add(prefix + f"sx:{record.first_sound}:{initial}")
+    first_initial = record.tokens[0][0] if record.tokens else ""
+    for email in record.emails:
+        keys.add(prefix + "email:" + email)
+        keys.add(prefix + f"dom:{email.rsplit('@', 1)[1]}:{first_initial}")
+    return keys
+
+
+def _trigrams(name: str) -> List[int]:
+    padded = f"  {' '.join(name_tokens(name))} "
+    return [zlib.crc32(padded[i:i + 3].encode()) % TRIGRAM_DIM for i in range(len(padded) - 2)]
+
+
+def _block_similarity(names: List[str]) -> Callable[[int, int], float]:
+    """Pairwise cosine similarity of hashed trigram vectors within a block.
+
+    With numpy the whole block is one matrix product; without it each pair
+    is computed on demand, since most pairs are decided by the name rules
+    and never need a score.
+    """
+    grams = [_trigrams(n) for n in names]
+    if np is not None:
+        matrix = np.zeros((len(names), TRIGRAM_DIM), dtype=np.float32)
+        for row, gram in enumerate(grams):
+            np.add.at(matrix[row], gram, 1.0)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1.0, norms)
+        sims = matrix @ matrix.T
+        return lambda i, j: float(sims[i, j])
+
+    vectors = []
+    for gram in grams:
+        counts: Dict[int, float] = defaultdict(float)
+        for g in gram:
+            counts[g] += 1.0
+        norm = sum(v * v for v in counts.values()) ** 0.5 or 1.0
+        vectors.append({k: v / norm for k, v in counts.items()})
+
+    def similarity(i: int, j: int) -> float:
+        a, b = vectors[i], vectors[j]
+        small, large = (a, b) if len(a) <= len(b) else (b, a)
+        return sum(v * large.get(k, 0.0) for k, v in small.items())
+
+    return similarity
+
+
+def _surnames_compatible(a: List[str], b: List[str]) -> bool:
+    if len(a) < 2 or len(b) < 2:
+        return True
+    last_a, last_b = a[-1], b[-1]
+    if last_a == last_b:
+        return True
+    if len(last_a) == 1 or len(last_b) == 1:
+        return last_a[0] == last_b[0]
+    return False
+
+
+def is_match(a: EntityRecord, b: EntityRecord, similarity: Callable[[], float], threshold: float) -> bool:
+    """Decide whether *a* and *b* are the same entity.
+
+    *similarity* is called lazily, only when the name rules cannot decide.
+    """
+    if a.tokens == b.tokens or a.emails & b.emails:
+        return True
+    if a.type == "PERSON" and a.tokens and b.tokens and _surnames_compatible(a.tokens, b.tokens):
+        if a.first == b.first:
+            return True
+        return a.first_sound == b.first_sound and similarity() >= 0.8
+    if a.type == "PERSON" and a.first != b.first and a.first_sound != b.first_sound:
+        return False
+    return similarity() >= threshold
+
+
+# ---------------------------------------------------------------------------
+# Resolution
+# ---------------------------------------------------------------------------
+
+
+class _UnionFind:
+    def __init__(self) -> None:
+        self.parent: Dict[str, str] = {}
+
+    def find(self, x: str) -> str:
+        self.parent.setdefault(x, x)
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a: str, b: str) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[rb] = ra
+
+
+def _cluster_matches(matches: Dict[str, Set[str]], by_id: Dict[str, EntityRecord]) -> _UnionFind:
+    """Union matched pairs without letting partial names bridge people.
+
+    Complete names are unioned first.  A partial name ("Mike", "Mike R.")
+    then joins the single complete cluster it matches; if it matches
+    several it is ambiguous and left alone.  Partial names with no complete
+    match only merge with each other when their surname initials agree.
+    """
+    uf = _UnionFind()
+    for a, partners in matches.items():
+        if not by_id[a].partial:
+            for b in partners:
+                if not by_id[b].partial:
+                    uf.union(a, b)
+
+    roots = {
+        a: {uf.find(b) for b in partners if not by_id[b].partial}
+        for a, partners in matches.items() if by_id[a].partial
+    }
+    for a, partner_roots in roots.items():
+        if len(partner_roots) == 1:
+            uf.union(next(iter(partner_roots)), a)
+    for a, partner_roots in roots.items():
+        if partner_roots:
+            continue
+        loose = [b for b in matches[a] if not roots.get(b, {None})]
+        initials = {by_id[b].tokens[-1][0] for b in loose + [a] if len(by_id[b].tokens) > 1}
+        if len(initials) <= 1:
+            for b in loose:
+                uf.union(a, b)
+    return uf
+
+
+def find_duplicate_clusters(
+    records: Iterable[EntityRecord],
+    threshold: float = 0.92,
+    max_block: int = 500,
+    report: Optional[ResolutionReport] = None,
+) -> List[List[EntityRecord]]:
+    """Group *records* into clusters of duplicates (singletons omitted)."""
+    report = report or ResolutionReport()
+    by_id = {r.id: r for r in records}
+    report.entities_scanned = len(by_id)
+
+    blocks: Dict[str, List[str]] = defaultdict(list)
+    for record in by_id.values():
+        for key in blocking_keys(record):
+            blocks[key].append(record.id)
+
+    # Wildcard (single-token) members join every block of their first name
+    families: Dict[str, List[str]] = defaultdict(list)
+    for key in blocks:
+        families[key.rsplit(":", 1)[0]].append(key)
+    for key in [k for k in blocks if k.endswith(":*")]:
+        for other in families[key[:-2]]:
+            if other != key:
+                blocks[other].extend(blocks[key])
+
+    matches: Dict[str, Set[str]] = defaultdict(set)
+    seen_pairs: Set[Tuple[str, str]] = set()
+    for ids in blocks.values():
+        if len(ids) < 2:
+            continue
+        if len(ids) > max_block:
+            report.oversized_blocks += 1
+            continue
+        report.blocks += 1
+        members = [by_id[i] for i in ids]
+        similarity = _block_similarity([m.name for m in members])
+        for i in range(len(members)):
+            for j in range(i + 1, len(members)):
+                pair = (members[i].id, members[j].id) if members[i].id < members[j].id else (members[j].id, members[i].id)
+                if pair in seen_pairs:
+                    continue
+                seen_pairs.add(pair)
+                report.comparisons += 1
+                if is_match(members[i], members[j], lambda: similarity(i, j), threshold):
+                    matches[members[i].id].add(members[j].id)
+                    matches[members[j].id].add(members[i].id)
+
+    uf = _cluster_matches(matches, by_id)
+    clusters: Dict[str, List[EntityRecord]] = defaultdict(list)
+    for entity_id in matches:
+        clusters[uf.find(entity_id)].append(by_id[entity_id])
+    result = [c for c in clusters.values() if len(c) > 1]
+    report.clusters = len(result)
+    return result
+
+
+def choose_survivor(cluster: List[EntityRecord]) -> EntityRecord:
+    """Most complete name wins; ties go to the most mentioned entity."""
+    return max(cluster, key=lambda r: (len(r.tokens), max((len(t) for t in r.tokens), default=0),
+                                       r.mention_count, r.importance))
+
+
+def merge_cluster(conn: sqlite3.Connection, survivor: EntityRecord, duplicates: List[EntityRecord]) -> int:
+    """Fold *duplicates* into *survivor*; returns relationship rows rewritten.
+
+    Must be called inside a transaction.  Relationships are stored by
+    entity name, so both endpoints are rewritten; rows that would collide
+    with an existing survivor relationship are folded into it.
+    """
+    rewritten = 0
+    for dup in duplicates:
+        for column, other in (("related_entity", "user_entity"), ("user_entity", "related_entity")):
+            rows = conn.execute(
+                f"SELECT id, {other}, relationship_type, strength, mention_count, confidence "
+                f"FROM relationships WHERE {column} = ?",
+                (dup.name,),
+            ).fetchall()
+            for rel_id, other_name, rel_type, strength, mentions, confidence in rows:
+                if other_name in (survivor.name, dup.name):
+                    conn.execute("DELETE FROM relationships WHERE id = ?", (rel_id,))
+                    continue
+                existing = conn.execute(
+                    f"SELECT id FROM relationships WHERE {column} = ? AND {other} = ? AND relationship_type = ?",
+                    (survivor.name, other_name, rel_type),
+                ).fetchone()
+                if existing:
+                    conn.execute(
+                        """UPDATE relationships
+                           SET strength = MIN(MAX(strength, ?) + 0.1, 2.0),
+                               mention_count = mention_count + ?,
+                               confidence = MAX(confidence, ?)
+                           WHERE id = ?""",
+                        (strength or 1.0, mentions or 1, confidence or 0.5, existing[0]),
+                    )
+                    conn.execute("DELETE FROM relationships WHERE id = ?", (rel_id,))
+                else:
+                    conn.execute(f"UPDATE relationships SET {column} = ? WHERE id = ?", (survivor.name, rel_id))
+                rewritten += 1
+
+        conn.execute("UPDATE context_effectiveness SET entity_id = ? WHERE entity_id = ?", (survivor.id, dup.id))
+        conn.execute("DELETE FROM entity_embeddings WHERE entity_id = ?", (dup.id,))
+        conn.execute("DELETE FROM entities WHERE id = ?", (dup.id,))
+
+    aliases = sorted({d.name for d in duplicates})
+    conn.execute(
+        """UPDATE entities
+           SET mention_count = mention_count + ?,
+               importance = MAX(importance, ?),
+               properties = json_set(COALESCE(properties, '{}'), '$.aliases', json(?))
+           WHERE id = ?""",
+        (
+            sum(d.mention_count for d in duplicates),
+            max(d.importance for d in duplicates),
+            json.dumps(aliases),
+            survivor.id,
+        ),
+    )
+    # Relationship context changed -> survivor's embedding must be rebuilt
+    conn.execute("UPDATE entity_embeddings SET embedding = NULL WHERE entity_id = ?", (survivor.id,))
+    return rewritten
+
+
+def resolve_entities(
+    conn: sqlite3.Connection,
+    threshold: float = 0.92,
+    max_block: int = 500,
+    dry_run: bool = False,
+) -> ResolutionReport:
+    """Find and (unless *dry_run*) merge duplicate entities in a KG database."""
+    started = time.perf_counter()
+    report = ResolutionReport(dry_run=dry_run)
+    records = [
+        EntityRecord(row[0], row[1], row[2], row[3] or 1, row[4] or 0.0, row[5] or "")
+        for row in conn.execute(
+            "SELECT id, name, type, mention_count, importance, description FROM entities"
+        )
+    ]
+    clusters = find_duplicate_clusters(records, threshold=threshold, max_block=max_block, report=report)
+
+    plan = []
+    for cluster in clusters:
+        survivor = choose_survivor(cluster)
+        duplicates = [r for r in cluster if r.id != survivor.id]
+        plan.append((survivor, duplicates))
+        report.merges.append((survivor.name, sorted(d.name for d in duplicates)))
+        report.entities_merged += len(duplicates)
+        report.removed_ids.extend(d.id for d in duplicates)
+
+    if not dry_run and plan:
+        with conn:  # One transaction: all merges land or none do
+            for survivor, duplicates in plan:
+                report.relationships_rewritten += merge_cluster(conn, survivor, duplicates)
+
+    report.seconds = time.perf_counter() - started
+    return report
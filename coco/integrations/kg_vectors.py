@@ -0,0 +1,122 @@
+"""
+Vector index over Personal Assistant KG entity embeddings.
+
+``entity_embeddings`` rows carry a rich ``embedding_text`` per entity (see
+``PersonalAssistantKG._create_rich_embedding``) and an ``embedding`` BLOB.
+Vectors are stored as packed float32 (``array('f').tobytes()``), L2
+normalised so cosine similarity is a dot product.
+
+``EntityVectorIndex`` keeps every vector in memory and answers top-k
+queries.  With numpy installed the vectors live in one contiguous matrix
+(rebuilt lazily after writes) and a query is a single mat-vec plus
+``argpartition``; without numpy it falls back to a pure-Python scan with
+``heapq.nlargest``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+
+def normalize(vector: Sequence[float]) -> array:
+    """float32 copy of *vector* scaled to unit length."""
+    packed = array("f", vector)
+    norm = math.sqrt(sum(x * x for x in packed))
+    if norm > 0:
+        packed = array("f", (x / norm for x in packed))
+    return packed
+
+
+def encode_vector(vector: Sequence[float]) -> bytes:
+    """Normalise and pack a vector for the ``embedding`` BLOB column."""
+    return normalize(vector).tobytes()
+
+
+def decode_vector(blob: bytes) -> array:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector
+
+
+class EntityVectorIndex:
+    """In-memory top-k cosine search over entity vectors."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors: List[array] = []
+        self._matrix = None  # numpy view, rebuilt lazily
+        self.dimension: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._rows
+
+    def upsert(self, entity_id: str, vector: Sequence[float]) -> None:
+        """Insert or replace *entity_id*'s vector (normalised on the way in)."""
+        packed = vector if isinstance(vector, array) and vector.typecode == "f" else normalize(vector)
+        with self._lock:
+            if self.dimension is None:
+                self.dimension = len(packed)
+            elif len(packed) != self.dimension:
+                raise ValueError(f"vector has {len(packed)} dimensions, index has {self.dimension}")
+            row = self._rows.get(entity_id)
+            if row is None:
+                self._rows[entity_id] = len(self._ids)
+                self._ids.append(entity_id)
+                self._vectors.append(packed)
+            else:
+                self._vectors[row] = packed
+            self._matrix = None
+
+    def remove(self, entity_id: str) -> None:
+        with self._lock:
+            row = self._rows.pop(entity_id, None)
+            if row is None:
+                return
+            last = len(self._ids) - 1
+            if row != last:  # Swap-remove keeps rows dense
+                self._ids[row] = self._ids[last]
+                self._vectors[row] = self._vectors[last]
+                self._rows[self._ids[row]] = row
+            self._ids.pop()
+            self._vectors.pop()
+            self._matrix = None
+
+    def search(self, query: Sequence[float], k: int = 5, min_score: float = 0.0) -> List[Tuple[str, float]]:
+        """``(entity_id, cosine)`` for the *k* nearest vectors, best first."""
+        with self._lock:
+            if not self._ids or k <= 0:
+                return []
+            q = normalize(query)
+            if len(q) != self.dimension:
+                raise ValueError(f"query has {len(q)} dimensions, index has {self.dimension}")
+
+            if np is not None:
+                if self._matrix is None:
+                    self._matrix = np.frombuffer(
+                        b"".join(v.tobytes() for v in self._vectors), dtype=np.float32
+                    ).reshape(len(self._vectors), self.dimension)
+                scores = self._matrix @ np.frombuffer(q.tobytes(), dtype=np.float32)
+                k = min(k, len(scores))
+                top = np.argpartition(-scores, k - 1)[:k]
+                ranked = sorted(((self._ids[i], float(scores[i])) for i in top), key=lambda t: t[1], reverse=True)
+            else:
+                ranked = heapq.nlargest(
+                    k,
+                    ((self._ids[i], sum(a * b for a, b in zip(v, q))) for i, v in enumerate(self._vectors)),
+                    key=lambda t: t[1],
+                )
+            return [(entity_id, score) for entity_id, score in ranked if score >= min_score]
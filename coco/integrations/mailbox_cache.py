@@ -0,0 +1,564 @@
+"""
+Local SQLite mailbox cache with incremental IMAP sync.
+
+``GmailConsciousness`` used to answer every "check my email" by running
+``SEARCH ALL`` and downloading the newest messages one ``FETCH`` at a time.
+``MailboxSync`` keeps a local copy instead and only asks the server what
+changed:
+
+* ``STATUS (MESSAGES UIDNEXT UIDVALIDITY)`` -- one round trip; when
+  ``UIDNEXT`` has not moved there is nothing to fetch;
+* new messages are ``UID SEARCH``-ed from the cached ``UIDNEXT`` and
+  fetched in batched ``UID FETCH`` commands;
+* a changed ``UIDVALIDITY`` means the server renumbered the mailbox, so its
+  cache is dropped and rebuilt;
+* a message count lower than expected means mail was expunged, and cached
+  UIDs the server no longer has are pruned.
+
+Listings only need headers and a preview, so new messages are fetched with
+one ``UID FETCH`` per batch of ``BODY.PEEK[HEADER.FIELDS (...)]`` plus a
+partial ``BODY.PEEK[TEXT]<0.2048>`` -- a few KB instead of every attachment
+byte.  ``MailboxSync.load_body`` downloads a full message the first time it
+is actually read and caches its text.
+
+``MailboxCache`` stores parsed headers, previews and loaded bodies and serves
+listings locally.  A unique ``(mailbox, Message-ID)`` index makes reading a
+specific email a point lookup, and an FTS5 index over subject, sender and
+text answers mailbox searches; ``find_message_id`` and ``search_server``
+fall back to server-side ``UID SEARCH`` for mail older than the cache.  Syncs closer together than ``min_interval``
+seconds are skipped, so a listing followed by a read never hits the network.
+"""
+
+from __future__ import annotations
+
+import email
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from email.header import decode_header, make_header
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import pytz
+
+from coco.integrations.imap_pool import ImapSessionPool, quote_mailbox
+
+CHICAGO_TZ = pytz.timezone("America/Chicago")
+
+DEFAULT_INITIAL_LIMIT = 100
+DEFAULT_MIN_INTERVAL = 30.0
+FETCH_BATCH = 50
+PREVIEW_BYTES = 2048
+
+# Headers listings need; the Content-* ones let the partial text be decoded
+LISTING_HEADERS = ("FROM", "TO", "CC", "SUBJECT", "DATE", "MESSAGE-ID",
+                   "CONTENT-TYPE", "CONTENT-TRANSFER-ENCODING")
+LISTING_FETCH = f"(UID BODY.PEEK[HEADER.FIELDS ({' '.join(LISTING_HEADERS)})] BODY.PEEK[TEXT]<0.{PREVIEW_BYTES}>)"
+FULL_FETCH = "(UID BODY.PEEK[])"
+
+_STATUS_RE = re.compile(rb"(MESSAGES|UIDNEXT|UIDVALIDITY) (\d+)")
+_UID_RE = re.compile(rb"UID (\d+)")
+_FETCH_START = re.compile(rb"^\d+ \(")
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS mailboxes (
+        name TEXT PRIMARY KEY,
+        uidvalidity INTEGER NOT NULL,
+        uidnext INTEGER NOT NULL,
+        messages INTEGER NOT NULL,
+        synced_at REAL NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS messages (
+        mailbox TEXT NOT NULL,
+        uid INTEGER NOT NULL,
+        message_id TEXT,
+        from_addr TEXT,
+        to_addr TEXT,
+        cc_addr TEXT,
+        subject TEXT,
+        date TEXT,
+        date_ts REAL,
+        preview TEXT,
+        body TEXT,
+        PRIMARY KEY (mailbox, uid)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_messages_date ON messages (mailbox, date_ts);
+
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_messages_message_id
+        ON messages (message_id, mailbox) WHERE message_id <> '';
+"""
+
+# Full-text index kept in step with ``messages`` (rowid = messages.rowid).
+# REPLACE only fires the delete trigger with recursive_triggers on.
+_FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE messages_fts USING fts5 (subject, from_addr, body, tokenize = 'unicode61');
+
+    CREATE TRIGGER messages_fts_insert AFTER INSERT ON messages BEGIN
+        INSERT INTO messages_fts (rowid, subject, from_addr, body)
+        VALUES (new.rowid, new.subject, new.from_addr, coalesce(new.body, new.preview));
+    END;
+
+    CREATE TRIGGER messages_fts_delete AFTER DELETE ON messages BEGIN
+        DELETE FROM messages_fts WHERE rowid = old.rowid;
+    END;
+
+    CREATE TRIGGER messages_fts_update AFTER UPDATE OF body ON messages BEGIN
+        UPDATE messages_fts SET body = coalesce(new.body, new.preview) WHERE rowid = new.rowid;
+    END;
+
+    INSERT INTO messages_fts (rowid, subject, from_addr, body)
+        SELECT rowid, subject, from_addr, coalesce(body, preview) FROM messages;
+"""
+
+_COLUMNS = ("uid", "message_id", "from_addr", "to_addr", "cc_addr", "subject", "date", "date_ts", "preview", "body")
+
+
+@dataclass
+class MailboxState:
+    uidvalidity: int
+    uidnext: int
+    messages: int
+    synced_at: float
+
+
+# ---------------------------------------------------------------------------
+# Message parsing
+# ---------------------------------------------------------------------------
+
+def _header(msg: email.message.Message, name: str, default: str = "") -> str:
+    value = msg.get(name)
+    if value is None:
+        return default
+    try:
+        return str(make_header(decode_header(value)))
+    except Exception:
+        return str(value)
+
+
+def extract_text_body(msg: email.message.Message) -> str:
+    """First text/plain part of *msg* (the whole payload if not multipart)."""
+    if msg.is_multipart():
+        for part in msg.walk():
+            if part.get_content_type() == "text/plain":
+                try:
+                    return part.get_payload(decode=True).decode("utf-8", errors="ignore")
+                except Exception:
+                    pass
+        return ""
+    try:
+        return msg.get_payload(decode=True).decode("utf-8", errors="ignore")
+    except Exception:
+        return str(msg.get_payload())
+
+
+def fts_query(text: str) -> str:
+    """Free text -> FTS5 query matching every word (as a prefix)."""
+    words = re.findall(r"\w+", text, flags=re.UNICODE)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def parse_email(raw: bytes, uid: Optional[int] = None, partial: bool = False) -> Dict[str, Any]:
+    """Parse an RFC 822 message into a cache row.
+
+    With ``partial=True`` *raw* is the listing headers followed by a
+    truncated body: the text becomes the ``preview`` and ``body`` stays
+    ``None`` until the full message is loaded.
+    """
+    msg = email.message_from_bytes(raw)
+    text = extract_text_body(msg)
+    date_str = msg.get("Date")
+    date_ts = None
+    if date_str:
+        try:
+            date_ts = parsedate_to_datetime(date_str).timestamp()
+        except Exception:
+            pass
+    return {
+        "uid": uid,
+        "message_id": (msg.get("Message-ID") or "").strip(),
+        "from_addr": _header(msg, "From", "Unknown"),
+        "to_addr": _header(msg, "To", "Unknown"),
+        "cc_addr": _header(msg, "Cc"),
+        "subject": _header(msg, "Subject", "No Subject"),
+        "date": date_str,
+        "date_ts": date_ts,
+        "preview": text[:PREVIEW_BYTES],
+        "body": None if partial else text,
+    }
+
+
+def to_email_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache row -> the dict shape ``GmailConsciousness`` has always returned."""
+    email_date = None
+    formatted_date = row.get("date")
+    if row.get("date_ts") is not None:
+        email_date = datetime.fromtimestamp(row["date_ts"], CHICAGO_TZ)
+        formatted_date = email_date.strftime("%Y-%m-%d %I:%M %p")
+    body = row.get("body")
+    loaded = body is not None
+    body = body if loaded else row.get("preview") or ""
+    return {
+        "uid": row.get("uid"),
+        "from": row.get("from_addr") or "Unknown",
+        "to": row.get("to_addr") or "Unknown",
+        "cc": row.get("cc_addr") or "",
+        "subject": row.get("subject") or "No Subject",
+        "date": row.get("date"),
+        "formatted_date": formatted_date,
+        "datetime_obj": email_date,
+        "body_preview": body[:200],
+        "body_full": body,
+        "body_loaded": loaded,
+        "message_id": row.get("message_id") or "",
+        "mailbox": row.get("mailbox"),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Local cache
+# ---------------------------------------------------------------------------
+
+class MailboxCache:
+    """Parsed messages per mailbox, keyed by (mailbox, UID)."""
+
+    def __init__(self, db_path: Union[str, Path]) -> None:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = str(db_path)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA recursive_triggers = ON")
+        self._lock = threading.RLock()
+        with self._lock, self.conn:
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(messages)")}
+            if columns and "preview" not in columns:
+                self.conn.execute("ALTER TABLE messages ADD COLUMN preview TEXT")
+            self.conn.executescript(_SCHEMA)
+            has_fts = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'messages_fts'").fetchone()
+        if not has_fts:
+            # Also backfills the index for caches created before it existed
+            self.conn.executescript(_FTS_SCHEMA)
+
+    def state(self, mailbox: str) -> Optional[MailboxState]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT uidvalidity, uidnext, messages, synced_at FROM mailboxes WHERE name = ?",
+                (mailbox,),
+            ).fetchone()
+        return MailboxState(*row) if row else None
+
+    def set_state(self, mailbox: str, uidvalidity: int, uidnext: int, messages: int) -> None:
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO mailboxes (name, uidvalidity, uidnext, messages, synced_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (mailbox, uidvalidity, uidnext, messages, time.time()),
+            )
+
+    def store(self, mailbox: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace parsed messages; returns how many were written."""
+        rows = [(mailbox, *(row.get(col) for col in _COLUMNS)) for row in rows]
+        with self._lock, self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO messages (mailbox, {', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(_COLUMNS) + 1))})",
+                rows,
+            )
+        return len(rows)
+
+    def body(self, mailbox: str, uid: int) -> Optional[str]:
+        """Cached full text of a message, ``None`` if not loaded yet."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT body FROM messages WHERE mailbox = ? AND uid = ?", (mailbox, uid)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_body(self, mailbox: str, uid: int, body: str) -> None:
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE messages SET body = ? WHERE mailbox = ? AND uid = ?", (body, mailbox, uid)
+            )
+
+    def reset(self, mailbox: str) -> None:
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM messages WHERE mailbox = ?", (mailbox,))
+            self.conn.execute("DELETE FROM mailboxes WHERE name = ?", (mailbox,))
+
+    def uids(self, mailbox: str) -> List[int]:
+        with self._lock:
+            return [row[0] for row in self.conn.execute(
+                "SELECT uid FROM messages WHERE mailbox = ? ORDER BY uid", (mailbox,))]
+
+    def prune(self, mailbox: str, server_uids: Iterable[int]) -> int:
+        """Drop cached messages whose UID is no longer on the server."""
+        gone = set(self.uids(mailbox)) - set(server_uids)
+        if gone:
+            with self._lock, self.conn:
+                self.conn.executemany(
+                    "DELETE FROM messages WHERE mailbox = ? AND uid = ?",
+                    [(mailbox, uid) for uid in gone],
+                )
+        return len(gone)
+
+    def recent(self, mailbox: str, limit: int = 10, from_addr: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Newest *limit* messages of *mailbox*, newest first."""
+        sql = f"SELECT mailbox, {', '.join(_COLUMNS)} FROM messages WHERE mailbox = ?"
+        params: List[Any] = [mailbox]
+        if from_addr:
+            sql += " AND from_addr LIKE ?"
+            params.append(f"%{from_addr}%")
+        sql += " ORDER BY uid DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = [dict(row) for row in self.conn.execute(sql, params)]
+        rows.sort(key=lambda row: row["date_ts"] or 0.0, reverse=True)
+        return [to_email_dict(row) for row in rows]
+
+    def by_message_id(self, message_id: str, mailbox: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        sql = f"SELECT mailbox, {', '.join(_COLUMNS)} FROM messages WHERE message_id = ?"
+        params: List[Any] = [message_id.strip()]
+        if mailbox:
+            sql += " AND mailbox = ?"
+            params.append(mailbox)
+        with self._lock:
+            row = self.conn.execute(sql + " LIMIT 1", params).fetchone()
+        return to_email_dict(dict(row)) if row else None
+
+    def by_uids(self, mailbox: str, uids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Cached messages with the given UIDs, newest first."""
+        uids = list(uids)
+        if not uids:
+            return []
+        sql = (f"SELECT mailbox, {', '.join(_COLUMNS)} FROM messages "
+               f"WHERE mailbox = ? AND uid IN ({', '.join('?' * len(uids))}) ORDER BY uid DESC")
+        with self._lock:
+            return [to_email_dict(dict(row)) for row in self.conn.execute(sql, [mailbox, *uids])]
+
+    def search(self, query: str, mailbox: Optional[str] = None, limit: int = 30) -> List[Dict[str, Any]]:
+        """Full-text search over subject, sender and text, best matches first."""
+        match = fts_query(query)
+        if not match:
+            return []
+        sql = (f"SELECT m.mailbox, {', '.join('m.' + col for col in _COLUMNS)} "
+               "FROM messages_fts JOIN messages m ON m.rowid = messages_fts.rowid "
+               "WHERE messages_fts MATCH ?")
+        params: List[Any] = [match]
+        if mailbox:
+            sql += " AND m.mailbox = ?"
+            params.append(mailbox)
+        sql += " ORDER BY bm25(messages_fts), m.date_ts DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return [to_email_dict(dict(row)) for row in self.conn.execute(sql, params)]
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Incremental sync
+# ---------------------------------------------------------------------------
+
+class MailboxSync:
+    """Bring ``MailboxCache`` up to date with the server, incrementally.
+
+    Parameters
+    ----------
+    pool:
+        Session pool the sync borrows connections from.
+    cache:
+        Local store.
+    initial_limit:
+        Newest messages fetched the first time a mailbox is synced.
+    min_interval:
+        Seconds after a sync during which ``sync`` is a no-op.
+    """
+
+    def __init__(
+        self,
+        pool: ImapSessionPool,
+        cache: MailboxCache,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+    ) -> None:
+        self.pool = pool
+        self.cache = cache
+        self.initial_limit = initial_limit
+        self.min_interval = min_interval
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def sync(self, mailbox: str = "INBOX", force: bool = False) -> int:
+        """Fetch what changed in *mailbox*; returns the number of new messages."""
+        with self._mailbox_lock(mailbox):
+            state = self.cache.state(mailbox)
+            if not force and state and time.time() - state.synced_at < self.min_interval:
+                return 0
+            return self.pool.run(lambda conn: self._sync(conn, mailbox, state))
+
+    def find_message_id(self, mailbox: str, message_id: str) -> Optional[Dict[str, Any]]:
+        """Cache lookup, falling back to ``UID SEARCH HEADER Message-ID``."""
+        found = self.cache.by_message_id(message_id, mailbox)
+        if found is not None:
+            return found
+
+        def search(conn) -> List[int]:
+            conn.select(quote_mailbox(mailbox), readonly=True)
+            uids = self._uid_search(conn, "HEADER", "Message-ID", quote_mailbox(message_id.strip()))
+            if uids:
+                self.cache.store(mailbox, self._fetch(conn, uids[-1:], LISTING_FETCH))
+            return uids
+
+        if not self.pool.run(search):
+            return None
+        return self.cache.by_message_id(message_id, mailbox)
+
+    def search_server(self, mailbox: str, query: str, limit: int = 30) -> List[Dict[str, Any]]:
+        """Server-side ``UID SEARCH TEXT`` for mail the local index lacks.
+
+        Only headers and previews of the newest *limit* hits are fetched;
+        they are cached, so repeating the search is answered locally.
+        """
+        words = re.findall(r"\w+", query, flags=re.UNICODE)
+        if not words:
+            return []
+
+        def search(conn) -> List[int]:
+            conn.select(quote_mailbox(mailbox), readonly=True)
+            criteria: List[str] = []
+            for word in words:
+                criteria += ["TEXT", quote_mailbox(word)]
+            uids = self._uid_search(conn, *criteria)[-limit:]
+            missing = sorted(set(uids) - set(self.cache.uids(mailbox)))
+            if missing:
+                self.cache.store(mailbox, self._fetch(conn, missing, LISTING_FETCH))
+            return uids
+
+        return self.cache.by_uids(mailbox, self.pool.run(search))
+
+    def load_body(self, mailbox: str, uid: int) -> str:
+        """Full text of one message, downloaded the first time it is read."""
+        body = self.cache.body(mailbox, uid)
+        if body is not None:
+            return body
+
+        def fetch(conn) -> str:
+            conn.select(quote_mailbox(mailbox), readonly=True)
+            rows = self._fetch(conn, [uid], FULL_FETCH)
+            return rows[0]["body"] if rows else ""
+
+        body = self.pool.run(fetch)
+        self.cache.set_body(mailbox, uid, body)
+        return body
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _mailbox_lock(self, mailbox: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(mailbox, threading.Lock())
+
+    def _sync(self, conn, mailbox: str, state: Optional[MailboxState]) -> int:
+        quoted = quote_mailbox(mailbox)
+        typ, data = conn.status(quoted, "(MESSAGES UIDNEXT UIDVALIDITY)")
+        if typ != "OK":
+            raise RuntimeError(f"STATUS {mailbox} failed: {data}")
+        status = {key.decode(): int(value) for key, value in _STATUS_RE.findall(data[0])}
+        uidvalidity, uidnext, messages = status["UIDVALIDITY"], status["UIDNEXT"], status["MESSAGES"]
+
+        if state and state.uidvalidity != uidvalidity:
+            self.cache.reset(mailbox)  # Server renumbered the mailbox
+            state = None
+
+        start = state.uidnext if state else 1
+        new_uids: List[int] = []
+        selected = False
+        if uidnext > start:
+            conn.select(quoted, readonly=True)
+            selected = True
+            # "N:*" always matches the highest UID, even when it is below N
+            new_uids = [uid for uid in self._uid_search(conn, "UID", f"{start}:*") if uid >= start]
+            if state is None:
+                new_uids = new_uids[-self.initial_limit:]
+            for i in range(0, len(new_uids), FETCH_BATCH):
+                self.cache.store(mailbox, self._fetch(conn, new_uids[i:i + FETCH_BATCH], LISTING_FETCH))
+
+        if state and messages < state.messages + len(new_uids):
+            # Something was expunged: drop what the server no longer has
+            if not selected:
+                conn.select(quoted, readonly=True)
+            self.cache.prune(mailbox, self._uid_search(conn, "ALL"))
+
+        self.cache.set_state(mailbox, uidvalidity, uidnext, messages)
+        return len(new_uids)
+
+    @staticmethod
+    def _uid_search(conn, *criteria: str) -> List[int]:
+        typ, data = conn.uid("SEARCH", *criteria)
+        if typ != "OK":
+            raise RuntimeError(f"UID SEARCH failed: {data}")
+        return sorted(int(uid) for uid in (data[0] or b"").split())
+
+    @staticmethod
+    def _fetch(conn, uids: List[int], items: str) -> List[Dict[str, Any]]:
+        typ, data = conn.uid("FETCH", _uid_ranges(uids), items)
+        if typ != "OK":
+            raise RuntimeError(f"UID FETCH failed: {data}")
+
+        # Each message arrives as one or more (prefix, literal) tuples; the
+        # first prefix starts with "<seq> (", and UID may precede or follow
+        messages: List[Dict[str, Any]] = []
+        current: Optional[Dict[str, Any]] = None
+        for item in data:
+            if isinstance(item, tuple):
+                prefix, payload = item
+                if _FETCH_START.match(prefix):
+                    current = {}
+                    messages.append(current)
+                if current is None:
+                    continue
+                if b"HEADER" in prefix:
+                    current["header"] = payload
+                elif b"TEXT]" in prefix:
+                    current["text"] = payload
+                else:
+                    current["raw"] = payload
+            elif current is None:
+                continue
+            else:
+                prefix = item
+            match = _UID_RE.search(prefix)
+            if match and "uid" not in current:
+                current["uid"] = int(match.group(1))
+
+        rows = []
+        for parts in messages:
+            if "uid" not in parts:
+                continue
+            if "raw" in parts:
+                rows.append(parse_email(parts["raw"], parts["uid"]))
+            else:
+                raw = parts.get("header", b"\r\n") + parts.get("text", b"")
+                rows.append(parse_email(raw, parts["uid"], partial=True))
+        return rows
+
+
+def _uid_ranges(uids: List[int]) -> str:
+    """Compact UID set: ``[1, 2, 3, 7]`` -> ``"1:3,7"``."""
+    spans: List[List[int]] = []
+    for uid in sorted(uids):
+        if spans and uid == spans[-1][1] + 1:
+            spans[-1][1] = uid
+        else:
+            spans.append([uid, uid])
+    return ",".join(str(lo) if lo == hi else f"{lo}:{hi}" for lo, hi in spans)
@@ -19,10 +19,19 @@ import json
 import uuid
 import re
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from coco.integrations.kg_backfill import DEFAULT_WORKERS, extract_parallel
+from coco.integrations.kg_batch_extraction import BatchEntityExtractor
+from coco.integrations.kg_graph import KGGraph
+from coco.integrations.kg_resolution import ResolutionReport, resolve_entities
+from coco.integrations.kg_vectors import EntityVectorIndex, decode_vector, encode_vector
 
 class PersonalAssistantKG:
     """
@@ -39,8 +48,15 @@ class PersonalAssistantKG:
 
         self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        # Batched LLM extraction applies its results from a worker thread
+        self._lock = threading.RLock()
+        self._defer_commits = 0  # >0 inside deferred_commits(): one transaction
+        self._context_cache = None  # (writes counter, context sections)
         self.init_schema()
 
+        # In-memory CSR mirror for multi-hop queries (kept in sync on writes)
+        self.graph = KGGraph.from_connection(self.conn)
+
         # Performance optimization
         self.conn.execute("PRAGMA journal_mode=WAL")
         self.conn.execute("PRAGMA synchronous=NORMAL")
@@ -49,13 +65,59 @@ class PersonalAssistantKG:
         self.min_context_length = 15  # Must have meaningful context
         self.max_entities = 100  # Practical limit for personal assistant
 
-        # Rich embedding support (for future RAG integration)
+        # Rich embedding support: entity vectors for semantic RAG lookup.
+        # embedder(texts) -> vectors; defaults to OpenAI when a key is set.
         self.enable_embeddings = os.getenv('ENABLE_EMBEDDINGS', '').lower() in ('true', '1', 'yes')
+        self.embedder = self._openai_embedder if os.getenv('OPENAI_API_KEY') else None
+        self.vector_index = EntityVectorIndex()
+        self._load_vectors()
+        # Vectors are computed off the query path, one refresh at a time
+        self._embedding_lock = threading.Lock()
+        self._embedding_refresh_queued = False
+        self._embedding_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coco-kg-embed")
+
+        # Coalesced LLM extraction: one Haiku call per N exchanges or T seconds
+        self.entity_extractor = BatchEntityExtractor(
+            self._complete_extraction,
+            batch_size=int(os.getenv('KG_EXTRACTION_BATCH_SIZE', '8')),
+            max_delay=float(os.getenv('KG_EXTRACTION_MAX_DELAY', '20')),
+            store=self,
+        )
+        self._deferred_entities_added = 0
 
         if self.debug_mode:
             print(f"🧠 Personal Assistant KG initialized: {self.db_path}")
             print(f"   Max entities: {self.max_entities}, Context required: {self.min_context_length} chars")
 
+    @contextmanager
+    def deferred_commits(self):
+        """
+        Group every write inside the block into one transaction.
+
+        Write helpers commit per row for interactive use; bulk jobs (backfill,
+        migration) wrap their loops in this so thousands of rows cost one
+        fsync.  Holds the KG lock for the duration; rolls back on error.
+        """
+        with self._lock:
+            self._defer_commits += 1
+            try:
+                yield
+            except BaseException:
+                self._defer_commits -= 1
+                if not self._defer_commits:
+                    self.conn.rollback()
+                    # In-memory mirrors saw the rolled-back writes
+                    self.graph = KGGraph.from_connection(self.conn)
+                    self._context_cache = None
+                raise
+            self._defer_commits -= 1
+            if not self._defer_commits:
+                self.conn.commit()
+
+    def _commit(self):
+        if not self._defer_commits:
+            self.conn.commit()
+
     def init_schema(self):
         """Schema designed for personal assistant needs with rich context"""
         self.conn.executescript('''
@@ -168,6 +230,23 @@ class PersonalAssistantKG:
         -- =====================================================================
         -- CONTEXT EFFECTIVENESS - Learn what context helps
         -- =====================================================================
+        -- =====================================================================
+        -- EXTRACTION CACHE - LLM entity extraction results by content hash
+        -- =====================================================================
+        CREATE TABLE IF NOT EXISTS extraction_cache (
+            content_hash TEXT PRIMARY KEY,
+            entities JSON NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+
+        -- Resumable bulk backfill position per source (see kg_backfill)
+        CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+            name TEXT PRIMARY KEY,
+            last_episode_id INTEGER NOT NULL DEFAULT 0,
+            processed INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+
         CREATE TABLE IF NOT EXISTS context_effectiveness (
             id TEXT PRIMARY KEY,
             entity_id TEXT NOT NULL,
@@ -188,12 +267,95 @@ class PersonalAssistantKG:
 
         CREATE INDEX IF NOT EXISTS idx_relationships_type ON relationships(relationship_type);
         CREATE INDEX IF NOT EXISTS idx_relationships_strength ON relationships(strength DESC);
+        CREATE INDEX IF NOT EXISTS idx_relationships_related ON relationships(related_entity);
 
         CREATE INDEX IF NOT EXISTS idx_tool_patterns_name ON tool_patterns(pattern_name);
         CREATE INDEX IF NOT EXISTS idx_tool_usage_tool ON tool_usage(tool_name);
         CREATE INDEX IF NOT EXISTS idx_tool_usage_timestamp ON tool_usage(timestamp DESC);
         ''')
-        self.conn.commit()
+        self._commit()
+        self._init_counters()
+
+    # Trigger bodies: bump (or decrement) one named counter
+    _COUNTER_UPSERT = (
+        "INSERT INTO kg_counters (name, value) VALUES ({name}, {delta}) "
+        "ON CONFLICT(name) DO UPDATE SET value = value + {delta};"
+    )
+
+    def _init_counters(self):
+        """
+        Trigger-maintained counters for get_knowledge_status().
+
+        kg_counters holds per-type entity/relationship counts, tool usage and
+        pattern totals, plus a 'writes' counter bumped on every change that
+        affects conversation context (used to cache the context sections).
+        Reads become O(1) instead of GROUP BY scans on every turn.
+        """
+        created = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'kg_counters'"
+        ).fetchone() is None
+
+        bump = self._COUNTER_UPSERT.format
+        writes = bump(name="'writes'", delta=1)
+        triggers = {
+            'kg_count_entity_insert': ('AFTER INSERT ON entities',
+                                       bump(name="'entity:' || NEW.type", delta=1) + writes),
+            'kg_count_entity_delete': ('AFTER DELETE ON entities',
+                                       bump(name="'entity:' || OLD.type", delta=-1) + writes),
+            'kg_count_entity_retype': ('AFTER UPDATE OF type ON entities',
+                                       bump(name="'entity:' || OLD.type", delta=-1)
+                                       + bump(name="'entity:' || NEW.type", delta=1)),
+            'kg_count_entity_update': ('AFTER UPDATE ON entities', writes),
+            'kg_count_rel_insert': ('AFTER INSERT ON relationships',
+                                    bump(name="'relationship:' || NEW.relationship_type", delta=1) + writes),
+            'kg_count_rel_delete': ('AFTER DELETE ON relationships',
+                                    bump(name="'relationship:' || OLD.relationship_type", delta=-1) + writes),
+            'kg_count_rel_retype': ('AFTER UPDATE OF relationship_type ON relationships',
+                                    bump(name="'relationship:' || OLD.relationship_type", delta=-1)
+                                    + bump(name="'relationship:' || NEW.relationship_type", delta=1)),
+            'kg_count_rel_update': ('AFTER UPDATE ON relationships', writes),
+            'kg_count_usage_insert': ('AFTER INSERT ON tool_usage', bump(name="'tool_usage'", delta=1)),
+            'kg_count_usage_delete': ('AFTER DELETE ON tool_usage', bump(name="'tool_usage'", delta=-1)),
+            'kg_count_pattern_insert': ('AFTER INSERT ON tool_patterns',
+                                        bump(name="'tool_patterns'", delta=1) + writes),
+            'kg_count_pattern_delete': ('AFTER DELETE ON tool_patterns',
+                                        bump(name="'tool_patterns'", delta=-1) + writes),
+            'kg_count_pattern_update': ('AFTER UPDATE ON tool_patterns', writes),
+        }
+
+        script = ['''
+        CREATE TABLE IF NOT EXISTS kg_counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        );''']
+        for trigger, (event, body) in triggers.items():
+            script.append(f"CREATE TRIGGER IF NOT EXISTS {trigger} {event} BEGIN {body} END;")
+        self.conn.executescript("\n".join(script))
+        self._commit()
+
+        if created:
+            self.rebuild_counters()
+
+    def rebuild_counters(self):
+        """Recompute kg_counters from the base tables (one-off backfill/repair)."""
+        with self._lock:
+            with self.conn:
+                self.conn.execute('DELETE FROM kg_counters')
+                self.conn.execute('''
+                    INSERT INTO kg_counters (name, value)
+                    SELECT 'entity:' || type, COUNT(*) FROM entities GROUP BY type
+                ''')
+                self.conn.execute('''
+                    INSERT INTO kg_counters (name, value)
+                    SELECT 'relationship:' || relationship_type, COUNT(*)
+                    FROM relationships GROUP BY relationship_type
+                ''')
+                self.conn.execute('''
+                    INSERT INTO kg_counters (name, value)
+                    SELECT 'tool_usage', COUNT(*) FROM tool_usage
+                    UNION ALL SELECT 'tool_patterns', COUNT(*) FROM tool_patterns
+                    UNION ALL SELECT 'writes', 0
+                ''')
 
     def _extract_entities_with_llm(self, user_text: str, assistant_text: str) -> List[Dict]:
         """
@@ -202,94 +364,80 @@ class PersonalAssistantKG:
         This is the breakthrough that makes the KG actually work - catches entities
         that regex patterns miss like "Ilia (15-year friend)" or "Mike and Alex".
 
+        Synchronous single-exchange path; ``process_conversation_exchange``
+        queues exchanges on ``self.entity_extractor`` instead.
+
         Returns:
             List of entities with {name, type, role, context, confidence}
         """
-        try:
-            # Get Anthropic API key from environment
-            import anthropic
-            api_key = os.getenv('ANTHROPIC_API_KEY')
-            if not api_key:
-                if self.debug_mode:
-                    print("⚠️ ANTHROPIC_API_KEY not found - skipping LLM extraction")
-                return []
-
-            client = anthropic.Anthropic(api_key=api_key)
-
-            # Simple, focused prompt (senior dev's recommendation)
-            prompt = f"""Extract only the most important entities from this conversation.
-
-Return JSON list with ONLY these types:
-- PERSON: Real people mentioned by name (not "user", "someone")
-- PROJECT: Named projects or companies
-- TOOL: Specific software/tools that were USED (not just mentioned)
-
-Format: [{{"name": "X", "type": "Y", "context": "brief context", "confidence": 0.0-1.0}}]
-
-Conversation:
-User: {user_text}
-Assistant: {assistant_text}
-
-Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothing else."""
-
-            # Use Claude-3-Haiku (fast, cheap, perfect for extraction)
-            response = client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=1000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            # Parse JSON response
-            response_text = response.content[0].text.strip()
-
-            # Handle markdown code blocks if present
-            if response_text.startswith('```'):
-                # Extract JSON from code block
-                lines = response_text.split('\n')
-                json_lines = []
-                in_code_block = False
-                for line in lines:
-                    if line.startswith('```'):
-                        in_code_block = not in_code_block
-                        continue
-                    if in_code_block:
-                        json_lines.append(line)
-                response_text = '\n'.join(json_lines)
-
-            entities = json.loads(response_text)
-
-            # Validate and filter
-            valid_entities = []
-            for entity in entities:
-                if isinstance(entity, dict) and 'name' in entity and 'type' in entity:
-                    # Confidence threshold check
-                    confidence = entity.get('confidence', 0.8)
-                    if confidence >= 0.7:
-                        # Type-specific confidence thresholds (senior dev's recommendation)
-                        type_threshold = {
-                            'PERSON': 0.8,
-                            'PROJECT': 0.7,
-                            'TOOL': 0.9
-                        }.get(entity['type'], 0.7)
-
-                        if confidence >= type_threshold:
-                            valid_entities.append({
-                                'name': entity['name'],
-                                'type': entity['type'],
-                                'role': entity.get('role', ''),
-                                'context': entity.get('context', user_text[:100]),
-                                'confidence': confidence
-                            })
-
-            if self.debug_mode and valid_entities:
-                print(f"🤖 LLM extracted {len(valid_entities)} entities: {[e['name'] for e in valid_entities]}")
-
-            return valid_entities
-
-        except Exception as e:
+        if not os.getenv('ANTHROPIC_API_KEY'):
             if self.debug_mode:
-                print(f"⚠️ LLM extraction error: {e}")
+                print("⚠️ ANTHROPIC_API_KEY not found - skipping LLM extraction")
             return []
+        return self.entity_extractor.extract_now([(user_text, assistant_text)])[0]
+
+    def _complete_extraction(self, prompt: str, max_tokens: int) -> str:
+        """Run one (batched) extraction prompt on Claude Haiku."""
+        from coco.config.clients import get_anthropic_client
+        from coco.config.llm_scheduler import PRIORITY_BACKGROUND
+
+        api_key = os.getenv('ANTHROPIC_API_KEY')
+        if not api_key:
+            raise RuntimeError("ANTHROPIC_API_KEY not set")
+
+        client = get_anthropic_client(api_key, priority=PRIORITY_BACKGROUND)
+        # Claude-3-Haiku: fast, cheap, perfect for extraction
+        response = client.messages.create(
+            model="claude-3-haiku-20240307",
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return response.content[0].text
+
+    def load_extraction(self, content_hash: str) -> Optional[List[Dict]]:
+        """Extraction cache lookup (``BatchEntityExtractor`` store protocol)."""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT entities FROM extraction_cache WHERE content_hash = ?',
+                (content_hash,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_extraction(self, content_hash: str, entities: List[Dict]):
+        """Extraction cache write (``BatchEntityExtractor`` store protocol)."""
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO extraction_cache (content_hash, entities) VALUES (?, ?)',
+                (content_hash, json.dumps(entities))
+            )
+            self._commit()
+
+    def _apply_llm_entities(self, llm_entities: List[Dict], pattern_entities: List[Dict],
+                            episode_id: int = None) -> int:
+        """Add entities from a completed batch extraction to the graph."""
+        known = {self._normalize_name(e['name']) for e in pattern_entities}
+        added = 0
+        with self._lock:
+            for entity in llm_entities:
+                if self._normalize_name(entity['name']) in known:
+                    continue  # Pattern entity already recorded this turn
+                entity = dict(entity, episode_id=episode_id)
+                if self._add_entity_with_validation(entity):
+                    added += 1
+                    if self.enable_embeddings:
+                        self._create_rich_embedding(entity)
+            self._deferred_entities_added += added
+        if added:
+            self._schedule_embedding_refresh()
+        if self.debug_mode and added:
+            print(f"🤖 Batched LLM extraction added {added} entities (episode {episode_id})")
+        return added
+
+    def flush_entity_extraction(self) -> int:
+        """Extract any queued exchanges now; returns entities added."""
+        before = self._deferred_entities_added
+        self.entity_extractor.flush()
+        return self._deferred_entities_added - before
 
     def _normalize_name(self, name: str) -> str:
         """Normalize entity name for deduplication: Ilia, Ilya, ILIA → ilia"""
@@ -354,14 +502,15 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
 
         # Record actual tool usage (critical for pattern learning)
         if tools_used:
-            for tool_call in tools_used:
-                self._record_tool_usage(
-                    tool_name=tool_call.get('name', 'unknown'),
-                    parameters=tool_call.get('params', {}),
-                    context=user_input,
-                    successful=tool_call.get('success', True)
-                )
-                stats['tools_recorded'] += 1
+            with self._lock:
+                for tool_call in tools_used:
+                    self._record_tool_usage(
+                        tool_name=tool_call.get('name', 'unknown'),
+                        parameters=tool_call.get('params', {}),
+                        context=user_input,
+                        successful=tool_call.get('success', True)
+                    )
+                    stats['tools_recorded'] += 1
 
         # =====================================================================
         # HYBRID ENTITY EXTRACTION - Pattern + LLM (BREAKTHROUGH FIX)
@@ -372,41 +521,80 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
 
         # Step 2: LLM-based extraction for entities patterns miss
         # Only call LLM if conversation seems significant or patterns found nothing
+        llm_entities = []
+        stats['llm_extraction'] = 'skipped'
+        if self._wants_llm_extraction(user_input, assistant_response, pattern_entities):
+            # Use LLM to catch "Ilia (15-year friend)" style mentions.  The
+            # exchange is queued for a batched call; cached results come back
+            # immediately, fresh ones are applied when the batch completes.
+            cached = self.entity_extractor.submit(
+                user_input, assistant_response,
+                lambda entities: self._apply_llm_entities(entities, pattern_entities, episode_id)
+            )
+            if cached is None:
+                stats['llm_extraction'] = 'queued'
+            else:
+                stats['llm_extraction'] = 'cached'
+                llm_entities = cached
+
+        self._ingest_entities(user_input, pattern_entities, llm_entities, tools_used, episode_id, stats)
+        return stats
+
+    def ingest_extracted_exchange(self, user_input: str, assistant_response: str,
+                                  llm_entities: List[Dict], episode_id: int = None) -> Dict:
+        """
+        Write one exchange whose LLM entities were already extracted.
+
+        Used by bulk backfill, which runs extraction for many exchanges on a
+        worker pool and then writes the results in large transactions.
+
+        Returns:
+            Stats: entities added, relationships created
+        """
+        stats = {'entities_added': 0, 'relationships_added': 0, 'patterns_learned': 0}
+        pattern_entities = self._extract_entities_strict(user_input)
+        self._ingest_entities(user_input, pattern_entities, llm_entities or [], None, episode_id, stats)
+        return stats
+
+    def _wants_llm_extraction(self, user_input: str, assistant_response: str,
+                              pattern_entities: List[Dict]) -> bool:
+        """LLM extraction only for significant exchanges (or when patterns found nothing)."""
         combined_text = user_input + " " + assistant_response
         is_significant = len(combined_text) > 100  # Not just "ok" or "thanks"
+        return bool((is_significant or not pattern_entities) and os.getenv('ANTHROPIC_API_KEY'))
 
-        llm_entities = []
-        if is_significant or not pattern_entities:
-            # Use LLM to catch "Ilia (15-year friend)" style mentions
-            llm_entities = self._extract_entities_with_llm(user_input, assistant_response)
+    def _ingest_entities(self, user_input: str, pattern_entities: List[Dict], llm_entities: List[Dict],
+                         tools_used: Optional[List[Dict]], episode_id: Optional[int], stats: Dict):
+        with self._lock:
+            # Step 3: Merge and deduplicate (pattern entities prioritized)
+            all_entities = self._merge_entities(pattern_entities, llm_entities)
 
-        # Step 3: Merge and deduplicate (pattern entities prioritized)
-        all_entities = self._merge_entities(pattern_entities, llm_entities)
+            # Step 4: Add validated entities to knowledge graph
+            for entity in all_entities:
+                entity['episode_id'] = episode_id
+                if self._add_entity_with_validation(entity):
+                    stats['entities_added'] += 1
 
-        # Step 4: Add validated entities to knowledge graph
-        for entity in all_entities:
-            if self._add_entity_with_validation(entity):
-                stats['entities_added'] += 1
+                    # Create rich embedding text for future RAG
+                    if self.enable_embeddings:
+                        self._create_rich_embedding(entity)
 
-                # Create rich embedding text for future RAG
-                if self.enable_embeddings:
-                    self._create_rich_embedding(entity)
+            # Extract relationships (user-centric only)
+            relationships = self._extract_relationships_strict(user_input)
 
-        # Extract relationships (user-centric only)
-        relationships = self._extract_relationships_strict(user_input)
+            for rel in relationships:
+                if self._add_relationship(rel):
+                    stats['relationships_added'] += 1
 
-        for rel in relationships:
-            if self._add_relationship(rel):
-                stats['relationships_added'] += 1
+            # Learn tool patterns if multiple tools used in sequence
+            if tools_used and len(tools_used) >= 2:
+                pattern = self._detect_tool_pattern(user_input, tools_used)
+                if pattern:
+                    self._store_tool_pattern(pattern)
+                    stats['patterns_learned'] += 1
 
-        # Learn tool patterns if multiple tools used in sequence
-        if tools_used and len(tools_used) >= 2:
-            pattern = self._detect_tool_pattern(user_input, tools_used)
-            if pattern:
-                self._store_tool_pattern(pattern)
-                stats['patterns_learned'] += 1
-
-        return stats
+        if stats['entities_added'] or stats['relationships_added']:
+            self._schedule_embedding_refresh()
 
     def _extract_entities_strict(self, text: str) -> List[Dict]:
         """
@@ -685,7 +873,7 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                         importance = MIN(importance + 0.05, 1.0)
                     WHERE name = ?
                 ''', (entity.get('context', '')[:200], entity['name']))
-                self.conn.commit()
+                self._commit()
                 return False
             else:
                 # Create new entity
@@ -704,9 +892,11 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                     entity.get('context', '')[:500],
                     entity.get('context', '')[:200],
                     entity.get('confidence', 0.5),
-                    json.dumps({})
+                    json.dumps({'source_episode': entity['episode_id']}
+                               if entity.get('episode_id') is not None else {})
                 ))
-                self.conn.commit()
+                self._commit()
+                self.graph.add_node(entity['name'], entity['type'])
 
                 if self.debug_mode:
                     print(f"✅ Added {entity['type']}: {entity['name']}")
@@ -735,6 +925,7 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                     VALUES (?, ?, ?, ?, ?)
                 ''', (entity_id, rel['related_entity'],
                      rel['related_entity'].lower(), 'PERSON', 0.4))
+                self.graph.add_node(rel['related_entity'], 'PERSON')
 
             # Check if relationship exists
             existing = self.conn.execute('''
@@ -754,6 +945,8 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                     WHERE user_entity = ? AND related_entity = ? AND relationship_type = ?
                 ''', (new_strength, rel['user_entity'], rel['related_entity'],
                      rel['relationship_type']))
+                self.graph.add_edge(rel['user_entity'], rel['related_entity'],
+                                    rel['relationship_type'], new_strength)
             else:
                 # Create new relationship
                 rel_id = str(uuid.uuid4())[:8]
@@ -765,8 +958,14 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                 ''', (rel_id, rel['user_entity'], rel['related_entity'],
                      rel['relationship_type'], rel.get('context', '')[:200],
                      1.0, rel.get('confidence', 0.5)))
+                self.graph.add_edge(rel['user_entity'], rel['related_entity'],
+                                    rel['relationship_type'], 1.0)
 
-            self.conn.commit()
+            self._commit()
+
+            # Relationship context is part of the entity's embedding text
+            if self.enable_embeddings:
+                self._refresh_embedding_text(rel['related_entity'])
             return True
 
         except sqlite3.Error as e:
@@ -784,7 +983,7 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                 VALUES (?, ?, ?, ?, ?)
             ''', (usage_id, tool_name, json.dumps(parameters),
                  context[:300], successful))
-            self.conn.commit()
+            self._commit()
 
             if self.debug_mode:
                 print(f"📝 Recorded: {tool_name} ({'✓' if successful else '✗'})")
@@ -845,7 +1044,7 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                 json.dumps(pattern['tool_sequence']),
                 json.dumps(pattern['parameters'])
             ))
-            self.conn.commit()
+            self._commit()
 
             if self.debug_mode:
                 print(f"🎯 Learned pattern: {pattern['trigger_phrase'][:50]}...")
@@ -915,56 +1114,206 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
             Description: {entity.get('context', '')}
             """
 
-        # Store embedding text (actual vector embedding is future enhancement)
+        # Store embedding text; the vector is (re)computed in batches by
+        # refresh_embeddings() only when the text actually changed
         try:
             self.conn.execute('''
-                INSERT OR REPLACE INTO entity_embeddings
-                (entity_id, embedding_text)
+                INSERT INTO entity_embeddings (entity_id, embedding_text)
                 VALUES (?, ?)
+                ON CONFLICT(entity_id) DO UPDATE SET
+                    embedding = CASE WHEN embedding_text = excluded.embedding_text
+                                     THEN embedding ELSE NULL END,
+                    embedding_text = excluded.embedding_text
             ''', (entity_id[0], embedding_text.strip()))
-            self.conn.commit()
+            self._commit()
         except sqlite3.Error:
             pass
 
+    def _refresh_embedding_text(self, name: str):
+        """Rebuild an entity's embedding text after its relationships changed."""
+        row = self.conn.execute(
+            'SELECT name, type, role, last_context FROM entities WHERE name = ?', (name,)
+        ).fetchone()
+        if row:
+            self._create_rich_embedding({
+                'name': row['name'], 'type': row['type'],
+                'role': row['role'] or 'contact', 'context': row['last_context'] or '',
+            })
+
+    def _openai_embedder(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts in one OpenAI call."""
+        from coco.config.clients import get_openai_client
+
+        response = get_openai_client(os.getenv('OPENAI_API_KEY')).embeddings.create(
+            model='text-embedding-3-small', input=texts
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+    def _load_vectors(self):
+        """Populate the in-memory vector index from stored embeddings."""
+        rows = self.conn.execute(
+            'SELECT entity_id, embedding FROM entity_embeddings WHERE embedding IS NOT NULL'
+        ).fetchall()
+        for row in rows:
+            try:
+                self.vector_index.upsert(row[0], decode_vector(row[1]))
+            except ValueError:
+                continue  # Embedding from a different model/dimension
+
+    def refresh_embeddings(self, batch_size: int = 64, executor=None, parallel: int = 1) -> int:
+        """
+        Compute vectors for entities whose embedding text is new or changed.
+
+        One embedding API call per *batch_size* stale entities; vectors are
+        stored as float32 BLOBs and pushed into the in-memory index.  With an
+        *executor*, up to *parallel* batches are embedded concurrently and
+        written back in one ``executemany``.  Concurrent refreshes run one at
+        a time, so the same rows are never embedded twice.
+
+        Returns:
+            Number of entities embedded
+        """
+        if self.embedder is None:
+            return 0
+
+        parallel = max(1, parallel if executor is not None else 1)
+        embedded = 0
+        with self._embedding_lock:
+            while True:
+                with self._lock:
+                    stale = self.conn.execute('''
+                        SELECT entity_id, embedding_text FROM entity_embeddings
+                        WHERE embedding IS NULL
+                        LIMIT ?
+                    ''', (batch_size * parallel,)).fetchall()
+                if not stale:
+                    return embedded
+
+                batches = [stale[i:i + batch_size] for i in range(0, len(stale), batch_size)]
+                texts = [[row['embedding_text'] for row in batch] for batch in batches]
+                try:
+                    if executor is not None and len(batches) > 1:
+                        results = list(executor.map(self.embedder, texts))
+                    else:
+                        results = [self.embedder(batch) for batch in texts]
+                except Exception as e:
+                    if self.debug_mode:
+                        print(f"⚠️ Embedding refresh failed: {e}")
+                    return embedded
+
+                # A short reply cannot be matched to its rows; keep the complete
+                # batches and stop, or the same rows would be re-sent forever
+                complete = [(batch, vectors) for batch, vectors in zip(batches, results)
+                            if len(vectors) == len(batch)]
+                blobs = [(encode_vector(vec), row['entity_id'], row['embedding_text'])
+                         for batch, vectors in complete for row, vec in zip(batch, vectors)]
+                with self._lock:
+                    # Guard on the text so a concurrent rewrite stays stale
+                    self.conn.executemany('''
+                        UPDATE entity_embeddings SET embedding = ?
+                        WHERE entity_id = ? AND embedding_text = ?
+                    ''', blobs)
+                    self._commit()
+                for blob, entity_id, _ in blobs:
+                    self.vector_index.upsert(entity_id, decode_vector(blob))
+                embedded += len(blobs)
+                if len(complete) < len(batches):
+                    if self.debug_mode:
+                        print(f"⚠️ Embedder returned the wrong number of vectors for "
+                              f"{len(batches) - len(complete)} batch(es); stopping refresh")
+                    return embedded
+                if len(stale) < batch_size * parallel:
+                    return embedded
+
+    def _schedule_embedding_refresh(self):
+        """Embed new or changed entity text on a background worker.
+
+        Bulk jobs inside ``deferred_commits`` call ``refresh_embeddings``
+        themselves once they are done, so they are skipped here.
+        """
+        if not self.enable_embeddings or self.embedder is None or self._defer_commits:
+            return
+        with self._lock:
+            if self._embedding_refresh_queued:
+                return
+            self._embedding_refresh_queued = True
+        try:
+            self._embedding_executor.submit(self._run_embedding_refresh)
+        except RuntimeError:  # Executor already shut down (interpreter exit)
+            self._embedding_refresh_queued = False
+
+    def _run_embedding_refresh(self):
+        with self._lock:
+            self._embedding_refresh_queued = False
+        try:
+            self.refresh_embeddings()
+        except Exception as e:
+            if self.debug_mode:
+                print(f"⚠️ Background embedding refresh failed: {e}")
+
+    def search_entities_semantic(self, query: str, k: int = 5,
+                                 min_score: float = 0.2) -> List[Dict]:
+        """
+        Top-k entities by embedding similarity to *query*.
+
+        Returns an empty list when no embedder is configured or nothing has
+        been embedded yet, so callers can fall back to keyword search.
+        Stale vectors are refreshed in the background after writes, never
+        here, so a query only pays for embedding *query* itself.
+        """
+        if self.embedder is None:
+            return []
+        if not len(self.vector_index):
+            return []
+
+        try:
+            query_vector = self.embedder([query])[0]
+            hits = self.vector_index.search(query_vector, k=k, min_score=min_score)
+        except Exception as e:
+            if self.debug_mode:
+                print(f"⚠️ Semantic search failed: {e}")
+            return []
+        if not hits:
+            return []
+
+        scores = dict(hits)
+        placeholders = ','.join('?' for _ in hits)
+        rows = self.conn.execute(f'''
+            SELECT id, name, type, role, description, importance, mention_count
+            FROM entities WHERE id IN ({placeholders})
+        ''', list(scores)).fetchall()
+        results = [dict(row, score=scores[row['id']]) for row in rows]
+        return sorted(results, key=lambda r: r['score'], reverse=True)
+
     def get_knowledge_status(self) -> Dict:
-        """Get current knowledge graph statistics"""
+        """Get current knowledge graph statistics (from trigger-maintained counters)"""
+        counters = self._read_counters()
         stats = {}
 
         # Entity counts by type
-        type_counts = self.conn.execute('''
-            SELECT type, COUNT(*) as count
-            FROM entities
-            GROUP BY type
-            ORDER BY count DESC
-        ''').fetchall()
-
-        stats['entity_types'] = {row['type']: row['count'] for row in type_counts}
+        entity_types = {name.split(':', 1)[1]: value for name, value in counters.items()
+                        if name.startswith('entity:') and value > 0}
+        stats['entity_types'] = dict(sorted(entity_types.items(), key=lambda kv: kv[1], reverse=True))
         stats['total_entities'] = sum(stats['entity_types'].values())
 
         # Relationship counts
-        rel_counts = self.conn.execute('''
-            SELECT relationship_type, COUNT(*) as count
-            FROM relationships
-            GROUP BY relationship_type
-            ORDER BY count DESC
-        ''').fetchall()
-
-        stats['relationship_types'] = {row['relationship_type']: row['count']
-                                       for row in rel_counts}
+        rel_types = {name.split(':', 1)[1]: value for name, value in counters.items()
+                     if name.startswith('relationship:') and value > 0}
+        stats['relationship_types'] = dict(sorted(rel_types.items(), key=lambda kv: kv[1], reverse=True))
         stats['total_relationships'] = sum(stats['relationship_types'].values())
 
         # Tool usage
-        stats['total_tool_calls'] = self.conn.execute(
-            'SELECT COUNT(*) FROM tool_usage'
-        ).fetchone()[0]
+        stats['total_tool_calls'] = counters.get('tool_usage', 0)
 
         # Learned patterns
-        stats['learned_patterns'] = self.conn.execute(
-            'SELECT COUNT(*) FROM tool_patterns'
-        ).fetchone()[0]
+        stats['learned_patterns'] = counters.get('tool_patterns', 0)
 
         return stats
 
+    def _read_counters(self) -> Dict[str, int]:
+        with self._lock:
+            return {row[0]: row[1] for row in self.conn.execute('SELECT name, value FROM kg_counters')}
+
     def get_conversation_context(self, current_message: str = None,
                                  max_tokens: int = 2000) -> str:
         """
@@ -996,42 +1345,60 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
             if query_context:
                 context_sections.append(query_context)
 
-        # Add important people (max 5)
-        people = self.conn.execute('''
-            SELECT e.name, r.relationship_type, e.role, e.mention_count
-            FROM entities e
-            LEFT JOIN relationships r ON e.name = r.related_entity AND r.user_entity = 'USER'
-            WHERE e.type = 'PERSON'
-            ORDER BY e.importance DESC, e.mention_count DESC
-            LIMIT 5
-        ''').fetchall()
-
-        if people:
-            people_text = "**Key People:**\n"
-            for p in people:
-                rel = p['relationship_type'] or 'contact'
-                role = p['role'] or ''
-                people_text += f"- {p['name']} ({rel}{', ' + role if role else ''})\n"
-            context_sections.append(people_text)
-
-        # Add recent tool patterns
-        patterns = self.conn.execute('''
-            SELECT trigger_phrases, tool_sequence, success_count
-            FROM tool_patterns
-            WHERE success_count > 0
-            ORDER BY last_used DESC
-            LIMIT 3
-        ''').fetchall()
-
-        if patterns:
-            pattern_text = "**Learned Patterns:**\n"
-            for p in patterns:
-                tools = json.loads(p['tool_sequence'])
-                pattern_text += f"- \"{p['trigger_phrases'][:40]}...\" → {' → '.join(tools)}\n"
-            context_sections.append(pattern_text)
+        # Key people and learned patterns only change when the graph is
+        # written to, so reuse them until the 'writes' counter moves
+        context_sections.extend(self._get_static_context_sections())
 
         return "\n".join(context_sections)
 
+    def _get_static_context_sections(self) -> List[str]:
+        """Key people + learned patterns, cached against the 'writes' counter."""
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM kg_counters WHERE name = 'writes'").fetchone()
+            version = row[0] if row else 0
+            cached = self._context_cache
+            if cached and cached[0] == version:
+                return cached[1]
+
+            sections = []
+
+            # Add important people (max 5)
+            people = self.conn.execute('''
+                SELECT e.name, r.relationship_type, e.role, e.mention_count
+                FROM entities e
+                LEFT JOIN relationships r ON e.name = r.related_entity AND r.user_entity = 'USER'
+                WHERE e.type = 'PERSON'
+                ORDER BY e.importance DESC, e.mention_count DESC
+                LIMIT 5
+            ''').fetchall()
+
+            if people:
+                people_text = "**Key People:**\n"
+                for p in people:
+                    rel = p['relationship_type'] or 'contact'
+                    role = p['role'] or ''
+                    people_text += f"- {p['name']} ({rel}{', ' + role if role else ''})\n"
+                sections.append(people_text)
+
+            # Add recent tool patterns
+            patterns = self.conn.execute('''
+                SELECT trigger_phrases, tool_sequence, success_count
+                FROM tool_patterns
+                WHERE success_count > 0
+                ORDER BY last_used DESC
+                LIMIT 3
+            ''').fetchall()
+
+            if patterns:
+                pattern_text = "**Learned Patterns:**\n"
+                for p in patterns:
+                    tools = json.loads(p['tool_sequence'])
+                    pattern_text += f"- \"{p['trigger_phrases'][:40]}...\" → {' → '.join(tools)}\n"
+                sections.append(pattern_text)
+
+            self._context_cache = (version, sections)
+            return sections
+
     def _get_query_context(self, query: str) -> str:
         """Get context specific to query"""
         query_lower = query.lower()
@@ -1052,8 +1419,58 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                 desc = e['role'] or e['description'][:100] if e['description'] else ''
                 context_parts.append(f"- {e['name']} ({e['type']}{', ' + desc if desc else ''})")
 
+            # Multi-hop: who/what is connected to the matches (in-memory graph)
+            connected = self.get_connected_entities([e['name'] for e in entities], k=3)
+            if connected:
+                context_parts.append(f"  Connected: {', '.join(connected)}")
+
         return "\n".join(context_parts) if context_parts else ""
 
+    def get_connected_entities(self, names: List[str], k: int = 5,
+                               node_type: str = None) -> List[str]:
+        """
+        Entities most related to *names* by graph structure.
+
+        Uses personalized PageRank over the in-memory adjacency graph, with
+        the USER hub excluded so everything is not "connected" through it.
+        """
+        ranked = self.graph.personalized_pagerank(names, top_k=k * 3, exclude={'USER'})
+        result = [name for name, _ in ranked
+                  if node_type is None or self.graph.node_type(name) == node_type]
+        return result[:k]
+
+    def get_connected_via(self, name: str, via: str, entity_type: str = 'PERSON') -> List[str]:
+        """Entities linked to *via* when *name* is too ("people connected to X via Y")."""
+        return self.graph.connected_via(name, via, entity_type)
+
+    def resolve_duplicates(self, dry_run: bool = False) -> ResolutionReport:
+        """
+        Merge near-duplicate entities ("Mike", "Mike R.", "Michael Ross").
+
+        Runs the blocking + similarity resolver over every entity and folds
+        each duplicate cluster into its most complete name in one
+        transaction, then updates the in-memory graph and vector index.
+
+        Args:
+            dry_run: Only report what would be merged
+
+        Returns:
+            ResolutionReport with merge counts and runtime
+        """
+        with self._lock:
+            report = resolve_entities(self.conn, dry_run=dry_run)
+            if dry_run:
+                return report
+            self.graph.merge_nodes({duplicate: survivor
+                                    for survivor, duplicates in report.merges
+                                    for duplicate in duplicates})
+            for entity_id in report.removed_ids:
+                self.vector_index.remove(entity_id)
+
+        if self.debug_mode:
+            print(f"🔗 Entity resolution: {report.to_dict()}")
+        return report
+
     def track_context_effectiveness(self, entity_ids: List[str],
                                    query: str, was_useful: bool):
         """
@@ -1085,7 +1502,7 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                         WHERE id = ?
                     ''', (entity_id,))
 
-                self.conn.commit()
+                self._commit()
             except sqlite3.Error:
                 pass
 
@@ -1164,7 +1581,8 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                     old_entity['importance'],
                     old_entity['mention_count']
                 ))
-                self.conn.commit()
+                self._commit()
+                self.graph.add_node(old_entity['name'], new_type)
                 migration_stats['migrated'] += 1
 
             except sqlite3.Error:
@@ -1198,7 +1616,12 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
         """
         query_lower = query.lower()
 
-        # Get entities with semantic relevance
+        # Vector search when entity embeddings are available
+        entities = self.search_entities_semantic(query, k=k) if self.enable_embeddings else []
+        if entities:
+            return self._format_rag_entities(entities)
+
+        # Keyword fallback
         cursor = self.conn.execute('''
             SELECT e.name, e.type, e.role, e.description,
                    e.importance, e.mention_count
@@ -1216,7 +1639,9 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
         entities = cursor.fetchall()
         if not entities:
             return ""
+        return self._format_rag_entities(entities)
 
+    def _format_rag_entities(self, entities) -> str:
         context_parts = ["📊 Relevant Knowledge:"]
         for entity in entities:
             role = entity['role'] or ''
@@ -1225,24 +1650,19 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                 f"{', ' + role if role else ''})"
             )
 
-        # Also get relationships for these entities
-        entity_names = [e['name'] for e in entities]
-        if entity_names:
-            placeholders = ','.join(['?' for _ in entity_names])
-            relationships = self.conn.execute(f'''
-                SELECT DISTINCT user_entity, related_entity, relationship_type
-                FROM relationships
-                WHERE related_entity IN ({placeholders})
-                   OR user_entity IN ({placeholders})
-                LIMIT 5
-            ''', entity_names + entity_names).fetchall()
+        # Also get relationships for these entities (from the in-memory graph)
+        relationships = []
+        for entity in entities:
+            for other, rel_type, _ in self.graph.neighbors(entity['name']):
+                relationships.append(f"- {entity['name']} {rel_type} {other}")
+                if len(relationships) >= 5:
+                    break
+            if len(relationships) >= 5:
+                break
 
-            if relationships:
-                context_parts.append("\n🔗 Relationships:")
-                for rel in relationships:
-                    context_parts.append(
-                        f"- {rel['user_entity']} {rel['relationship_type']} {rel['related_entity']}"
-                    )
+        if relationships:
+            context_parts.append("\n🔗 Relationships:")
+            context_parts.extend(relationships)
 
         return "\n".join(context_parts)
 
@@ -1267,7 +1687,8 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                 INSERT INTO entities (id, name, type, role, description, importance)
                 VALUES (?, ?, ?, ?, ?, ?)
             ''', (entity_id, name, entity_type.upper(), role, description, 0.8))
-            self.conn.commit()
+            self._commit()
+            self.graph.add_node(name, entity_type.upper())
             if self.debug_mode:
                 print(f"✅ Added entity: {name} ({entity_type})")
             return True
@@ -1281,7 +1702,7 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                     last_mentioned = CURRENT_TIMESTAMP
                 WHERE name = ?
             ''', (role, description, name))
-            self.conn.commit()
+            self._commit()
             if self.debug_mode:
                 print(f"✅ Updated entity: {name}")
             return True
@@ -1311,7 +1732,8 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                                          relationship_type, description)
                 VALUES (?, ?, ?, ?, ?)
             ''', (rel_id, entity1, entity2, relationship_type, description))
-            self.conn.commit()
+            self._commit()
+            self.graph.add_edge(entity1, entity2, relationship_type, 1.0)
             if self.debug_mode:
                 print(f"✅ Added relationship: {entity1} {relationship_type} {entity2}")
             return True
@@ -1324,7 +1746,13 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                     last_confirmed = CURRENT_TIMESTAMP
                 WHERE user_entity = ? AND related_entity = ? AND relationship_type = ?
             ''', (description, entity1, entity2, relationship_type))
-            self.conn.commit()
+            self._commit()
+            row = self.conn.execute('''
+                SELECT strength FROM relationships
+                WHERE user_entity = ? AND related_entity = ? AND relationship_type = ?
+            ''', (entity1, entity2, relationship_type)).fetchone()
+            if row:
+                self.graph.add_edge(entity1, entity2, relationship_type, row[0])
             if self.debug_mode:
                 print(f"✅ Updated relationship: {entity1} {relationship_type} {entity2}")
             return True
@@ -1365,7 +1793,7 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
                 cursor = memory_system.conn.execute('''
                     SELECT user_text, agent_text
                     FROM episodes
-                    ORDER BY timestamp DESC
+                    ORDER BY id DESC
                     LIMIT ?
                 ''', (max_exchanges,))
                 recent_exchanges = [{'user': row[0], 'agent': row[1]} for row in cursor.fetchall()]
@@ -1378,39 +1806,26 @@ Only return entities with confidence > 0.7. Return ONLY valid JSON array, nothin
             if self.debug_mode:
                 print(f"📚 Processing {len(recent_exchanges)} recent conversations...")
 
-            # Batch process in chunks of 10 for efficiency (senior dev's recommendation)
-            chunk_size = 10
-            for i in range(0, len(recent_exchanges), chunk_size):
-                chunk = recent_exchanges[i:i+chunk_size]
+            # LLM extraction fans out over a small worker pool (one batched
+            # call per chunk, cached exchanges are free); writes then land in
+            # a single transaction
+            exchanges = [(ex.get('user', ''), ex.get('agent', '')) for ex in recent_exchanges]
+            exchanges = [(u, a) for u, a in exchanges if u and a]
+            with ThreadPoolExecutor(max_workers=DEFAULT_WORKERS, thread_name_prefix="coco-kg-backfill") as pool:
+                llm_results = extract_parallel(self, exchanges, executor=pool)
 
-                # Process each exchange
-                for exchange in chunk:
+            with self.deferred_commits():
+                for (user_text, agent_text), llm_entities in zip(exchanges, llm_results):
                     try:
-                        user_text = exchange.get('user', '')
-                        agent_text = exchange.get('agent', '')
-
-                        if user_text and agent_text:
-                            # Use the hybrid extraction strategy
-                            exchange_stats = self.process_conversation_exchange(
-                                user_input=user_text,
-                                assistant_response=agent_text,
-                                tools_used=None
-                            )
-
-                            stats['entities_added'] += exchange_stats.get('entities_added', 0)
-                            stats['relationships_added'] += exchange_stats.get('relationships_added', 0)
-                            stats['conversations_processed'] += 1
-
+                        exchange_stats = self.ingest_extracted_exchange(user_text, agent_text, llm_entities)
+                        stats['entities_added'] += exchange_stats.get('entities_added', 0)
+                        stats['relationships_added'] += exchange_stats.get('relationships_added', 0)
+                        stats['conversations_processed'] += 1
                     except Exception as e:
                         if self.debug_mode:
                             print(f"⚠️ Error processing exchange: {e}")
                         continue
 
-                # Progress indicator
-                if self.debug_mode and stats['conversations_processed'] % 10 == 0:
-                    print(f"   Processed {stats['conversations_processed']} conversations, "
-                          f"found {stats['entities_added']} entities...")
-
             stats['time_elapsed'] = time.time() - start_time
 
             if self.debug_mode:
@@ -0,0 +1,522 @@
+"""
+Outbound mail queue over a reused, authenticated SMTP session.
+
+``GmailConsciousness.send_email`` used to open ``SMTP_SSL``, log in, send
+and disconnect for every message, and read each attachment fully into
+memory before base64-encoding it.  Scheduler fan-outs and agent turns that
+send several emails paid the TLS handshake and AUTH every time.
+
+* ``SmtpSession`` keeps one logged-in connection open between sends,
+  probes it with ``NOOP`` after ``idle_timeout`` seconds and reconnects
+  when the server has hung up.
+* ``MailOutbox`` queues messages and sends them from a worker thread; the
+  worker takes whatever is queued (up to ``batch_size``) and sends it back
+  to back over the same session.  Transient failures (disconnects, 4xx
+  replies) are retried with exponential backoff, permanent 5xx rejections
+  are not.  A message accepted for some recipients resolves to the ones
+  that were refused.
+* Messages are written to the socket in chunks: file attachments added with
+  ``attach_file`` are base64-encoded from disk while ``DATA`` is streaming,
+  so a large video never sits in memory raw and encoded at once.  The
+  files are opened before ``MAIL FROM``: one that has gone missing since it
+  was attached fails the message permanently instead of looking like a
+  dropped connection.
+* ``LatencyHistogram`` records how long each send took on the wire.
+"""
+
+from __future__ import annotations
+
+import base64
+import bisect
+import logging
+import mimetypes
+import os
+import queue
+import re
+import smtplib
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from email import policy
+from email.message import Message
+from email.mime.base import MIMEBase
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = 60.0
+DEFAULT_SOCKET_TIMEOUT = 60.0
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+DEFAULT_MAX_BACKOFF = 30.0
+
+# 57 raw bytes -> one 76-character base64 line; read 1,000 lines at a time
+ENCODE_CHUNK = 57 * 1000
+
+# Recipients refused by the server on a partial delivery: {address: (code, reply)}
+Refused = Dict[str, Tuple[int, bytes]]
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Extensions mimetypes may not know about
+FALLBACK_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".avi": "video/x-msvideo",
+    ".pdf": "application/pdf",
+    ".md": "text/markdown",
+}
+
+_PLACEHOLDER = re.compile(rb"@@coco-attachment-([0-9a-f]{32})@@")
+_LINE_ENDS = re.compile(rb"\r\n|\r|\n")
+_LEADING_DOT = re.compile(rb"(?m)^\.")
+
+
+class SmtpSendError(Exception):
+    """A message could not be delivered; ``transient`` if worth retrying."""
+
+    def __init__(self, message: str, transient: bool) -> None:
+        super().__init__(message)
+        self.transient = transient
+
+
+# ---------------------------------------------------------------------------
+# Messages with streamed attachments
+# ---------------------------------------------------------------------------
+
+class AttachmentReadError(Exception):
+    """An attachment failed to read mid-stream (a local, permanent failure)."""
+
+
+@dataclass
+class OutboundMessage:
+    """A message plus the files whose content is streamed at send time."""
+
+    msg: Message
+    from_addr: str
+    to_addrs: List[str]
+    files: Dict[bytes, str] = field(default_factory=dict)
+
+    def open_files(self) -> Dict[bytes, BinaryIO]:
+        """Open every attachment; raises ``OSError`` if one is unreadable."""
+        handles: Dict[bytes, BinaryIO] = {}
+        try:
+            for token, path in self.files.items():
+                handles[token] = open(path, "rb")
+        except OSError:
+            for handle in handles.values():
+                handle.close()
+            raise
+        return handles
+
+    def chunks(self, handles: Dict[bytes, BinaryIO]) -> Iterator[bytes]:
+        """Wire form of the message (CRLF, dot-stuffed), in pieces.
+
+        *handles* are the attachments opened by ``open_files``.
+        """
+        data = self.msg.as_bytes(policy=policy.SMTP)
+        pos = 0
+        for match in _PLACEHOLDER.finditer(data):
+            yield _to_wire(data[pos:match.start()])
+            yield from _base64_file(handles[match.group(1)])
+            pos = match.end()
+        yield _to_wire(data[pos:])
+
+
+def attach_file(outbound: OutboundMessage, path: str, filename: Optional[str] = None) -> MIMEBase:
+    """Attach *path* to ``outbound.msg`` without reading it now.
+
+    The part carries a placeholder payload that ``OutboundMessage.chunks``
+    replaces with the file's base64 encoding, read from disk in chunks.
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(path)
+    filename = filename or os.path.basename(path)
+    ext = os.path.splitext(path)[1].lower()
+    mime = mimetypes.guess_type(path)[0] or FALLBACK_TYPES.get(ext, "application/octet-stream")
+    maintype, subtype = mime.split("/", 1)
+
+    token = uuid.uuid4().hex
+    part = MIMEBase(maintype, subtype, name=filename)
+    part["Content-Transfer-Encoding"] = "base64"
+    part.add_header("Content-Disposition", "attachment", filename=filename)
+    part.set_payload(f"@@coco-attachment-{token}@@")
+    outbound.msg.attach(part)
+    outbound.files[token.encode()] = path
+    return part
+
+
+def _to_wire(data: bytes) -> bytes:
+    return _LEADING_DOT.sub(b"..", _LINE_ENDS.sub(b"\r\n", data))
+
+
+def _base64_file(handle: BinaryIO) -> Iterator[bytes]:
+    while True:
+        try:
+            raw = handle.read(ENCODE_CHUNK)
+        except OSError as exc:
+            raise AttachmentReadError(f"{handle.name}: {exc}") from exc
+        if not raw:
+            return
+        # Base64 lines never start with ".", so no dot-stuffing needed
+        yield base64.encodebytes(raw).replace(b"\n", b"\r\n")
+
+
+# ---------------------------------------------------------------------------
+# Latency histogram
+# ---------------------------------------------------------------------------
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of send latencies in seconds."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # Last bucket: overflow
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self.count += 1
+            self.total += seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the *q* quantile (``inf`` if past the last)."""
+        with self._lock:
+            if not self.count:
+                return None
+            rank = q * self.count
+            seen = 0
+            for bound, count in zip(self.buckets + (float("inf"),), self._counts):
+                seen += count
+                if seen >= rank:
+                    return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            labels = [f"<={bound:g}s" for bound in self.buckets] + [f">{self.buckets[-1]:g}s"]
+            counts = dict(zip(labels, self._counts))
+            count, total = self.count, self.total
+        return {
+            "count": count,
+            "avg": total / count if count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": counts,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Reused SMTP session
+# ---------------------------------------------------------------------------
+
+class SmtpSession:
+    """One authenticated SMTP connection, reopened when it goes stale.
+
+    Parameters
+    ----------
+    host, port, username, password:
+        Server and credentials.
+    factory:
+        Connection class, ``smtplib.SMTP_SSL`` by default (``SMTP`` for a
+        plain-text local server).
+    idle_timeout:
+        Idle seconds after which the connection is ``NOOP``-probed before use.
+    timeout:
+        Socket timeout for connecting and each command.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        factory: Callable[..., smtplib.SMTP] = smtplib.SMTP_SSL,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        timeout: float = DEFAULT_SOCKET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.factory = factory
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._clock = clock
+        self._conn: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+        self.logins = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def send(self, outbound: OutboundMessage) -> Refused:
+        """Deliver one message; raises ``SmtpSendError`` on failure.
+
+        Returns the recipients the server refused while accepting the
+        others (``{address: (code, reply)}``, empty on a full delivery).
+        """
+        with self._lock:
+            try:
+                handles = outbound.open_files()
+            except OSError as exc:
+                raise SmtpSendError(f"attachment unreadable: {exc}", False) from exc
+            try:
+                conn = self._connection()
+                refused = self._transmit(conn, outbound, handles)
+                self._last_used = self._clock()
+                return refused
+            except AttachmentReadError as exc:
+                self._reset()  # DATA was cut off mid-message
+                raise SmtpSendError(f"attachment unreadable: {exc}", False) from exc
+            except smtplib.SMTPResponseException as exc:
+                transient = 400 <= exc.smtp_code < 500
+                if transient:
+                    self._reset()
+                else:
+                    self._rset()
+                raise SmtpSendError(f"{exc.smtp_code} {exc.smtp_error!r}", transient) from exc
+            except smtplib.SMTPRecipientsRefused as exc:
+                self._rset()
+                raise SmtpSendError(f"recipients refused: {exc.recipients}", False) from exc
+            except (smtplib.SMTPServerDisconnected, OSError) as exc:
+                self._reset()
+                raise SmtpSendError(f"connection lost: {exc}", True) from exc
+            finally:
+                for handle in handles.values():
+                    handle.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.quit()
+                except Exception:
+                    pass
+            self._conn = None
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> smtplib.SMTP:
+        if self._conn is not None and self._clock() - self._last_used >= self.idle_timeout:
+            try:
+                if self._conn.noop()[0] != 250:
+                    self._reset()
+            except Exception:
+                self._reset()
+        if self._conn is None:
+            conn = self.factory(self.host, self.port, timeout=self.timeout)
+            try:
+                conn.login(self.username, self.password)
+            except Exception:
+                conn.close()
+                raise
+            self.logins += 1
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _transmit(conn: smtplib.SMTP, outbound: OutboundMessage, handles: Dict[bytes, BinaryIO]) -> Refused:
+        code, reply = conn.mail(outbound.from_addr)
+        if code != 250:
+            raise smtplib.SMTPSenderRefused(code, reply, outbound.from_addr)
+        refused = {}
+        for addr in outbound.to_addrs:
+            code, reply = conn.rcpt(addr)
+            if code not in (250, 251):
+                refused[addr] = (code, reply)
+        if len(refused) == len(outbound.to_addrs):
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        code, reply = conn.docmd("DATA")
+        if code != 354:
+            raise smtplib.SMTPDataError(code, reply)
+        tail = b""
+        for chunk in outbound.chunks(handles):
+            if chunk:
+                conn.send(chunk)
+                tail = chunk[-2:]
+        conn.send((b"" if tail == b"\r\n" else b"\r\n") + b".\r\n")
+        code, reply = conn.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, reply)
+        return refused
+
+    def _rset(self) -> None:
+        try:
+            if self._conn is not None:
+                self._conn.rset()
+        except Exception:
+            self._reset()
+
+    def _reset(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+
+
+# ---------------------------------------------------------------------------
+# Outbound queue
+# ---------------------------------------------------------------------------
+
+class MailOutbox:
+    """Queue of outbound messages sent by one worker over ``SmtpSession``.
+
+    Parameters
+    ----------
+    session:
+        The reused SMTP session.
+    batch_size:
+        Queued messages sent back to back before the queue is polled again.
+    max_retries:
+        Extra attempts for transient failures.
+    backoff, max_backoff:
+        First retry delay and its cap; the delay doubles per attempt.
+    """
+
+    def __init__(
+        self,
+        session: SmtpSession,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.session = session
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._sleep = sleep
+        self._queue: "queue.Queue[Optional[Tuple[OutboundMessage, Future]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self.latency = LatencyHistogram()
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+        self.batches = 0
+        self.partial = 0  # Sent with some recipients refused
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, outbound: OutboundMessage) -> "Future[Refused]":
+        """Queue *outbound*; the future resolves to the refused recipients
+        (empty when every recipient was accepted) once it is delivered."""
+        if self._closed:
+            raise RuntimeError("outbox is closed")
+        future: "Future[Refused]" = Future()
+        self._ensure_worker()
+        self._queue.put((outbound, future))
+        return future
+
+    def send(self, outbound: OutboundMessage, timeout: Optional[float] = None) -> Refused:
+        """Queue *outbound* and wait for it; raises ``SmtpSendError``.
+
+        Returns the recipients refused on a partial delivery.
+        """
+        return self.submit(outbound).result(timeout)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "sent": self.sent,
+            "partial": self.partial,
+            "failed": self.failed,
+            "retries": self.retries,
+            "batches": self.batches,
+            "pending": self.pending(),
+            "logins": self.session.logins,
+            "latency": self.latency.snapshot(),
+        }
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Send what is queued, then stop the worker and log out."""
+        self._closed = True
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join(timeout)
+        self.session.close()
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        with self._start_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="coco-mail-outbox", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)  # Stop after this batch
+                    break
+                batch.append(item)
+            self.batches += 1
+            for outbound, future in batch:
+                if future.set_running_or_notify_cancel():
+                    self._deliver(outbound, future)
+
+    def _deliver(self, outbound: OutboundMessage, future: Future) -> None:
+        delay = self.backoff
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            try:
+                refused = self.session.send(outbound)
+            except SmtpSendError as exc:
+                if exc.transient and attempt < self.max_retries:
+                    self.retries += 1
+                    logger.info("SMTP send failed (%s); retrying in %.1fs", exc, delay)
+                    self._sleep(delay)
+                    delay = min(delay * 2, self.max_backoff)
+                    continue
+                self.failed += 1
+                future.set_exception(exc)
+                return
+            except Exception as exc:  # Malformed message, ...
+                self.failed += 1
+                future.set_exception(exc)
+                return
+            self.latency.observe(time.perf_counter() - started)
+            self.sent += 1
+            if refused:
+                self.partial += 1
+                logger.warning("SMTP accepted the message but refused %s", ", ".join(refused))
+            future.set_result(refused)
+            return
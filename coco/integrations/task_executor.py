@@ -0,0 +1,233 @@
+"""
+Concurrent execution of scheduled task runs.
+
+``ScheduledConsciousness`` used to run every due task inline on its single
+scheduler thread, so one slow template (a personal video, a weekly report
+with several LLM and Google API calls) delayed every other due task.
+``TaskExecutorPool`` runs them on a bounded worker pool instead:
+
+* **max concurrency** -- at most ``max_workers`` runs at once;
+* **per-template limits** -- e.g. only one video render at a time; excess
+  runs wait in FIFO order without occupying a worker;
+* **no overlap** -- a task that is queued or running is not accepted again;
+* **timeouts** -- a run past its deadline is reported as timed out and its
+  cancel event is set.  Python threads cannot be killed, so the worker
+  finishes in the background and the task stays "running" (no overlap)
+  until it does;
+* **cancellation** -- queued runs are dropped, running ones are signalled
+  through ``TaskRun.cancel_event`` for templates that check it;
+* **timing** -- each ``TaskRun`` records queue wait and run time.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 3
+DEFAULT_TIMEOUT_SECONDS = 900.0
+
+# Templates that hammer the same external resource run one at a time
+DEFAULT_TEMPLATE_LIMITS = {
+    "personal_video": 1,
+    "video_message": 1,
+    "weekly_report": 1,
+}
+
+
+@dataclass
+class TaskRun:
+    """One submitted run; passed to the work function and the callbacks."""
+
+    key: Hashable
+    template: str
+    work: Callable[["TaskRun"], Any]
+    timeout: Optional[float]
+    payload: Any = None
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+    timed_out: bool = False
+    cancelled: bool = False
+    done: threading.Event = field(default_factory=threading.Event)
+    _settled: bool = False
+
+    @property
+    def queue_wait(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+
+    @property
+    def run_time(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the run is settled (completed, timed out or cancelled)."""
+        return self.done.wait(timeout)
+
+
+class TaskExecutorPool:
+    """Bounded, overlap-free worker pool for scheduled task runs.
+
+    Parameters
+    ----------
+    max_workers:
+        Runs executing at once.
+    template_limits:
+        ``{template: max concurrent runs}``; templates not listed are only
+        bound by *max_workers*.
+    default_timeout:
+        Seconds before a run is reported as timed out (``None`` disables).
+    on_settled:
+        ``on_settled(run)`` exactly once per run, when it completes, times
+        out, or is cancelled while queued.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        template_limits: Optional[Dict[str, int]] = None,
+        default_timeout: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+        on_settled: Optional[Callable[[TaskRun], None]] = None,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.template_limits = dict(DEFAULT_TEMPLATE_LIMITS if template_limits is None else template_limits)
+        self.default_timeout = default_timeout
+        self.on_settled = on_settled
+        self._lock = threading.Lock()
+        self._pending: Deque[TaskRun] = deque()
+        self._active: Dict[Hashable, TaskRun] = {}  # queued or running, by key
+        self._running_by_template: Dict[str, int] = {}
+        self._running = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="coco-task")
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, key: Hashable, template: str, work: Callable[[TaskRun], Any],
+               timeout: Optional[float] = None, payload: Any = None) -> Optional[TaskRun]:
+        """Queue a run of *key*; ``None`` if one is already queued or running."""
+        with self._lock:
+            if self._closed or key in self._active:
+                return None
+            run = TaskRun(key, template, work, timeout if timeout is not None else self.default_timeout,
+                          payload)
+            self._active[key] = run
+            self._pending.append(run)
+        self._pump()
+        return run
+
+    def is_active(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._active
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop a queued run or signal a running one; ``False`` if unknown."""
+        with self._lock:
+            run = self._active.get(key)
+            if run is None:
+                return False
+            run.cancelled = True
+            run.cancel_event.set()
+            queued = run in self._pending
+            if queued:
+                self._pending.remove(run)
+                del self._active[key]
+        if queued:
+            run.finished_at = time.monotonic()
+            self._settle(run)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self._running,
+                "queued": len(self._pending),
+                "by_template": dict(self._running_by_template),
+                "max_workers": self.max_workers,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Cancel queued runs and stop accepting new ones."""
+        with self._lock:
+            self._closed = True
+            queued = [run.key for run in self._pending]
+        for key in queued:
+            self.cancel(key)
+        self._executor.shutdown(wait=wait)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _pump(self) -> None:
+        """Start queued runs while workers and template slots are free."""
+        to_start: List[TaskRun] = []
+        with self._lock:
+            for run in list(self._pending):
+                if self._running >= self.max_workers:
+                    break
+                limit = self.template_limits.get(run.template)
+                if limit is not None and self._running_by_template.get(run.template, 0) >= limit:
+                    continue  # Later runs of other templates may still start
+                self._pending.remove(run)
+                self._running += 1
+                self._running_by_template[run.template] = self._running_by_template.get(run.template, 0) + 1
+                to_start.append(run)
+        for run in to_start:
+            self._executor.submit(self._run, run)
+
+    def _run(self, run: TaskRun) -> None:
+        run.started_at = time.monotonic()
+        timer = None
+        if run.timeout:
+            timer = threading.Timer(run.timeout, self._expire, (run,))
+            timer.daemon = True
+            timer.start()
+        try:
+            run.result = run.work(run)
+        except BaseException as exc:  # Templates must never kill a worker
+            run.error = exc
+        finally:
+            run.finished_at = time.monotonic()
+            if timer is not None:
+                timer.cancel()
+            with self._lock:
+                self._running -= 1
+                self._running_by_template[run.template] -= 1
+                self._active.pop(run.key, None)
+            self._settle(run)
+            self._pump()
+
+    def _expire(self, run: TaskRun) -> None:
+        run.timed_out = True
+        run.cancel_event.set()
+        logger.warning("Scheduled task %s timed out after %.0fs", run.key, run.timeout)
+        self._settle(run)
+
+    def _settle(self, run: TaskRun) -> None:
+        with self._lock:
+            if run._settled:
+                return
+            run._settled = True
+        if self.on_settled is not None:
+            try:
+                self.on_settled(run)
+            except Exception as exc:
+                logger.warning("Task settle callback failed for %s: %s", run.key, exc)
+        run.done.set()
@@ -0,0 +1,194 @@
+"""
+Shared fetch cache for scheduled task templates.
+
+Templates such as the news digest, web research, Twitter news share and
+meeting prep each called Tavily search, Claude curation and Calendar reads
+on their own, so several tasks covering the same topic at 8:00 ran the same
+searches and curation prompts side by side.  ``TemplateFetchCache`` sits in
+front of those calls:
+
+* **TTL cache** keyed by ``(source, normalized query)`` -- case and
+  whitespace differences in a query do not defeat it, and a digest can
+  reuse research fetched an hour earlier;
+* **single-flight** -- when concurrent runs ask for the same key, one
+  performs the fetch and the others wait for its result;
+* failed fetches and results that look like errors (``{'error': ...}``,
+  ``ToolFailure``, "❌ ..." or "**Calendar Error**: ..." strings) are not
+  cached;
+* bounded size with least-recently-used eviction, and hit/miss/coalesced
+  counters.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from coco.tools.registry import ToolFailure
+
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_MAX_ENTRIES = 256
+
+# Per-source overrides of the default TTL; calendars change faster than news
+SOURCE_TTLS = {
+    "calendar": 120.0,
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+# "❌ Calendar read failed", "**Calendar Error**: ...", "Error: ..." -- the
+# label before the first colon of a tool's string reply names the failure
+_ERROR_LABEL = re.compile(r"^[^:\n]{0,60}?\b(?:error|failed|failure)\W{0,4}:", re.IGNORECASE)
+
+
+def normalize_query(query: Any) -> str:
+    """Canonical form of *query*: lowercased, whitespace collapsed.
+
+    Non-string queries (dicts, lists, tuples) are serialised with sorted
+    keys; long keys are reduced to a SHA-1 digest.
+    """
+    if not isinstance(query, str):
+        query = json.dumps(query, sort_keys=True, default=str)
+    text = _WHITESPACE.sub(" ", query).strip().lower()
+    if len(text) > 512:
+        text = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    return text
+
+
+def looks_like_error(value: Any) -> bool:
+    """Default "do not cache" test: empty values, ``{'error': ...}`` dicts and error strings."""
+    if value is None or value == "" or value == {}:
+        return True
+    if isinstance(value, str):
+        text = value.lstrip()
+        return isinstance(value, ToolFailure) or text.startswith("❌") or bool(_ERROR_LABEL.match(text))
+    return isinstance(value, dict) and "error" in value
+
+
+class _Flight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TemplateFetchCache:
+    """TTL cache with single-flight coalescing for template fetches.
+
+    Parameters
+    ----------
+    default_ttl:
+        Seconds a result stays fresh for sources not in ``source_ttls``.
+    source_ttls:
+        Per-source TTL overrides (defaults to ``SOURCE_TTLS``).
+    max_entries:
+        Cached results kept before the least recently used is evicted.
+    clock:
+        Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = DEFAULT_TTL_SECONDS,
+        source_ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.default_ttl = default_ttl
+        self.source_ttls = dict(SOURCE_TTLS if source_ttls is None else source_ttls)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._flights: Dict[Tuple[str, str], _Flight] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def fetch(
+        self,
+        source: str,
+        query: Any,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+        cacheable: Callable[[Any], bool] = lambda value: not looks_like_error(value),
+    ) -> Any:
+        """Return the cached result for ``(source, query)`` or load it once.
+
+        *ttl* overrides the source TTL for this lookup -- pass a longer one
+        to accept older data.  Exceptions from *loader* propagate to every
+        caller waiting on the same flight and nothing is cached.
+        """
+        key = (source, normalize_query(query))
+        max_age = ttl if ttl is not None else self.source_ttls.get(source, self.default_ttl)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] <= max_age:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                if flight.error is None and cacheable(flight.value):
+                    self._entries[key] = (self._clock(), flight.value)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            flight.done.set()
+        return flight.value
+
+    def invalidate(self, source: Optional[str] = None, query: Hashable = None) -> int:
+        """Drop one entry, every entry of *source*, or everything."""
+        with self._lock:
+            if source is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            if query is not None:
+                return int(self._entries.pop((source, normalize_query(query)), None) is not None)
+            keys = [key for key in self._entries if key[0] == source]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._flights),
+            }
@@ -0,0 +1,245 @@
+"""
+Execution history storage for COCO's scheduled tasks.
+
+``TaskStateManager`` used to open a fresh SQLite connection for every call,
+wrote each execution with its own commit, and never trimmed
+``task_executions``.  ``TaskHistoryStore`` is the storage layer underneath
+it:
+
+* **thread-confined connections** -- one WAL-mode connection per thread,
+  opened on first use and reused after that (the scheduler thread, the
+  executor workers and the REPL each get their own);
+* **batched appends** -- execution records are buffered and written in one
+  transaction once ``batch_size`` accumulate, the oldest is
+  ``flush_interval`` seconds old, or someone reads history;
+* **retention** -- executions older than ``retain_days`` are rolled up into
+  ``task_daily_stats`` (runs, successes, failures, durations per task per
+  day) and deleted, so history queries stay bounded;
+* an index on ``(task_id, started_at)`` serves the per-task history query.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_FLUSH_INTERVAL = 30.0
+DEFAULT_RETAIN_DAYS = 90
+ROLLUP_INTERVAL_SECONDS = 24 * 3600
+
+EXECUTION_COLUMNS = (
+    "task_id", "started_at", "completed_at", "success", "error_message",
+    "output", "duration_seconds", "queue_wait_seconds",
+)
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS task_executions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task_id TEXT NOT NULL,
+        started_at TEXT NOT NULL,
+        completed_at TEXT,
+        success BOOLEAN NOT NULL DEFAULT 0,
+        error_message TEXT,
+        output TEXT,
+        duration_seconds REAL,
+        queue_wait_seconds REAL,
+        FOREIGN KEY (task_id) REFERENCES scheduled_tasks (id)
+    );
+
+    CREATE TABLE IF NOT EXISTS task_daily_stats (
+        task_id TEXT NOT NULL,
+        day TEXT NOT NULL,
+        runs INTEGER NOT NULL DEFAULT 0,
+        successes INTEGER NOT NULL DEFAULT 0,
+        failures INTEGER NOT NULL DEFAULT 0,
+        total_duration REAL NOT NULL DEFAULT 0,
+        max_duration REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (task_id, day)
+    );
+
+    -- (task_id, started_at) covers both per-task lookups and history order
+    DROP INDEX IF EXISTS idx_execution_task_id;
+    CREATE INDEX IF NOT EXISTS idx_execution_task_started ON task_executions (task_id, started_at);
+    CREATE INDEX IF NOT EXISTS idx_execution_started_at ON task_executions (started_at);
+"""
+
+ExecutionRow = Tuple[Any, ...]
+
+
+class TaskHistoryStore:
+    """Thread-confined SQLite access plus buffered execution history.
+
+    Parameters
+    ----------
+    db_path:
+        The scheduler database (``coco_scheduler.db``).
+    batch_size:
+        Buffered executions that trigger a write.
+    flush_interval:
+        Seconds an execution may sit in the buffer before the next append
+        writes it out.
+    retain_days:
+        Executions older than this are rolled up into daily stats;
+        ``None`` or ``0`` keeps everything.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        retain_days: Optional[int] = DEFAULT_RETAIN_DAYS,
+    ) -> None:
+        self.db_path = str(db_path)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.retain_days = retain_days
+        self._local = threading.local()
+        self._buffer: List[ExecutionRow] = []
+        self._buffer_since: Optional[float] = None
+        self._lock = threading.Lock()
+        self._last_rollup = 0.0
+        self._closed = False
+
+        with self.connection() as conn:
+            conn.executescript(_SCHEMA)
+            # Databases created before the executor pool lack queue_wait_seconds
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(task_executions)")}
+            if "queue_wait_seconds" not in columns:
+                conn.execute("ALTER TABLE task_executions ADD COLUMN queue_wait_seconds REAL")
+        self.rollup()
+        atexit.register(self.flush)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened (in WAL mode) on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def append(self, row: Sequence[Any]) -> None:
+        """Buffer one execution row (values in ``EXECUTION_COLUMNS`` order)."""
+        with self._lock:
+            self._buffer.append(tuple(row))
+            if self._buffer_since is None:
+                self._buffer_since = time.monotonic()
+            due = (len(self._buffer) >= self.batch_size
+                   or time.monotonic() - self._buffer_since >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered executions in one transaction; returns rows written."""
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+            self._buffer_since = None
+        if not rows or self._closed:
+            return 0
+        try:
+            with self.connection() as conn:
+                conn.executemany(
+                    f"INSERT INTO task_executions ({', '.join(EXECUTION_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(EXECUTION_COLUMNS))})",
+                    rows,
+                )
+        except sqlite3.Error as exc:
+            logger.warning("Could not write %d task executions: %s", len(rows), exc)
+            with self._lock:
+                self._buffer[:0] = rows  # Keep them for the next flush
+                self._buffer_since = self._buffer_since or time.monotonic()
+            return 0
+        if time.time() - self._last_rollup >= ROLLUP_INTERVAL_SECONDS:
+            self.rollup()
+        return len(rows)
+
+    def history(self, task_id: str, limit: int = 50) -> List[ExecutionRow]:
+        """Most recent executions of *task_id*, newest first."""
+        self.flush()
+        return self.connection().execute(
+            f"SELECT {', '.join(EXECUTION_COLUMNS)} FROM task_executions "
+            "WHERE task_id = ? ORDER BY started_at DESC LIMIT ?",
+            (task_id, limit),
+        ).fetchall()
+
+    def daily_stats(self, task_id: str, days: int = 30) -> List[Dict[str, Any]]:
+        """Rolled-up per-day stats for *task_id*, newest day first."""
+        rows = self.connection().execute(
+            "SELECT day, runs, successes, failures, total_duration, max_duration "
+            "FROM task_daily_stats WHERE task_id = ? ORDER BY day DESC LIMIT ?",
+            (task_id, days),
+        ).fetchall()
+        keys = ("day", "runs", "successes", "failures", "total_duration", "max_duration")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def rollup(self, now: Optional[datetime] = None) -> int:
+        """Fold executions past retention into ``task_daily_stats``.
+
+        Returns the number of execution rows removed.
+        """
+        self._last_rollup = time.time()
+        if not self.retain_days:
+            return 0
+        now = now or datetime.now(timezone.utc)
+        cutoff = (now - timedelta(days=self.retain_days)).isoformat()
+        with self.connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO task_daily_stats
+                    (task_id, day, runs, successes, failures, total_duration, max_duration)
+                SELECT task_id, substr(started_at, 1, 10), COUNT(*), SUM(success),
+                       COUNT(*) - SUM(success), COALESCE(SUM(duration_seconds), 0),
+                       COALESCE(MAX(duration_seconds), 0)
+                FROM task_executions
+                WHERE started_at < ?
+                GROUP BY task_id, substr(started_at, 1, 10)
+                ON CONFLICT (task_id, day) DO UPDATE SET
+                    runs = runs + excluded.runs,
+                    successes = successes + excluded.successes,
+                    failures = failures + excluded.failures,
+                    total_duration = total_duration + excluded.total_duration,
+                    max_duration = MAX(max_duration, excluded.max_duration)
+                """,
+                (cutoff,),
+            )
+            removed = conn.execute(
+                "DELETE FROM task_executions WHERE started_at < ?", (cutoff,)
+            ).rowcount
+        return removed
+
+    def delete_task(self, task_id: str) -> int:
+        """Drop buffered and stored history of *task_id*; returns rows deleted."""
+        with self._lock:
+            self._buffer = [row for row in self._buffer if row[0] != task_id]
+            if not self._buffer:
+                self._buffer_since = None
+        with self.connection() as conn:
+            conn.execute("DELETE FROM task_daily_stats WHERE task_id = ?", (task_id,))
+            return conn.execute(
+                "DELETE FROM task_executions WHERE task_id = ?", (task_id,)
+            ).rowcount
+
+    def close(self) -> None:
+        """Flush the buffer and close this thread's connection."""
+        self.flush()
+        self._closed = True
+        atexit.unregister(self.flush)
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
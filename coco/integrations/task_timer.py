@@ -0,0 +1,144 @@
+"""
+Timer queue for COCO's scheduled tasks.
+
+``ScheduledConsciousness`` used to wake every 30 seconds and scan every task,
+converting each ``next_run`` to Chicago time to see whether it was due.
+``TaskTimerQueue`` keeps due times in a min-heap instead:
+
+* ``schedule`` / ``remove`` are O(log n) and wake the waiting thread through
+  a condition variable, so a newly created task that is due sooner than
+  everything else is picked up immediately;
+* ``wait`` sleeps exactly until the earliest due time (or a change);
+* ``pop_due`` returns every key whose time has come, earliest first.
+
+Rescheduling a key does not search the heap: the old entry stays behind and
+is discarded when it surfaces (lazy invalidation), and the heap is rebuilt
+when stale entries outnumber live ones.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+# Upper bound on a single sleep, so wall-clock jumps (suspend, NTP, DST
+# edits to the system clock) are noticed within this many seconds
+MAX_SLEEP_SECONDS = 300.0
+
+
+class TaskTimerQueue:
+    """Min-heap of due times keyed by task id, with blocking ``wait``.
+
+    Parameters
+    ----------
+    clock:
+        Wall-clock source in epoch seconds (``time.time``); due times are
+        absolute, so a monotonic clock would not do.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._due: Dict[Hashable, float] = {}
+        self._seq = itertools.count()
+        self._woken = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def schedule(self, key: Hashable, due: Optional[float]) -> None:
+        """Set *key*'s due time (epoch seconds); ``None`` unschedules it."""
+        with self._cond:
+            if due is None:
+                self._due.pop(key, None)
+            else:
+                self._due[key] = due
+                heapq.heappush(self._heap, (due, next(self._seq), key))
+            self._maybe_compact()
+            self._cond.notify_all()
+
+    def remove(self, key: Hashable) -> None:
+        self.schedule(key, None)
+
+    def clear(self) -> None:
+        with self._cond:
+            self._heap.clear()
+            self._due.clear()
+            self._cond.notify_all()
+
+    def due_time(self, key: Hashable) -> Optional[float]:
+        with self._cond:
+            return self._due.get(key)
+
+    def next_due(self) -> Optional[float]:
+        """Earliest due time, or ``None`` when nothing is scheduled."""
+        with self._cond:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[float] = None) -> List[Hashable]:
+        """Unschedule and return every key due at *now*, earliest first."""
+        now = self._clock() if now is None else now
+        due = []
+        with self._cond:
+            while self._heap and self._heap[0][0] <= now:
+                when, _, key = heapq.heappop(self._heap)
+                if self._due.get(key) == when:
+                    del self._due[key]
+                    due.append(key)
+        return due
+
+    def wait(self, running: Callable[[], bool] = lambda: True,
+             max_wait: float = MAX_SLEEP_SECONDS) -> bool:
+        """Block until a key is due, *max_wait* passes, or ``wake``.
+
+        Returns ``True`` when something is due now.  Changes made through
+        ``schedule`` re-evaluate the deadline without returning.
+        """
+        deadline = self._clock() + max_wait
+        with self._cond:
+            while running():
+                self._discard_stale()
+                now = self._clock()
+                if self._heap and self._heap[0][0] <= now:
+                    return True
+                if now >= deadline:
+                    return False
+                timeout = deadline - now
+                if self._heap:
+                    timeout = min(timeout, self._heap[0][0] - now)
+                self._cond.wait(timeout)
+                if self._woken:
+                    self._woken = False
+                    return False
+        return False
+
+    def wake(self) -> None:
+        """Make a blocked ``wait`` return (used on shutdown)."""
+        with self._cond:
+            self._woken = True
+            self._cond.notify_all()
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._due
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _discard_stale(self) -> None:
+        while self._heap and self._due.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(when, next(self._seq), key) for key, when in self._due.items()]
+            heapq.heapify(self._heap)
@@ -9,6 +9,7 @@ Public API
 - ConversationSummary, SummaryBufferMemory -- Layer 2 summary buffer
 - FactsMemory, create_facts_memory -- perfect-recall fact storage
 - QueryRouter -- intelligent routing between facts and semantic search
+- MemoryIngestChannel -- thread-safe queue for background producers
 - SimpleRAG, SimpleRAGWithOpenAI -- semantic memory with TF-IDF / OpenAI embeddings
 """
 
@@ -18,6 +19,7 @@ from coco.memory.summary_buffer import ConversationSummary, SummaryBufferMemory
 from coco.memory.hierarchical import HierarchicalMemorySystem, MemorySystem
 from coco.memory.facts_memory import FactsMemory, create_facts_memory
 from coco.memory.query_router import QueryRouter
+from coco.memory.ingest import MemoryIngestChannel
 from coco.memory.simple_rag import SimpleRAG, SimpleRAGWithOpenAI
 
 __all__ = [
@@ -30,6 +32,7 @@ __all__ = [
     "FactsMemory",
     "create_facts_memory",
     "QueryRouter",
+    "MemoryIngestChannel",
     "SimpleRAG",
     "SimpleRAGWithOpenAI",
 ]
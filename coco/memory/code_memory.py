@@ -10,6 +10,7 @@ Extracted from the monolithic cocoa.py CodeMemory class.
 
 import sqlite3
 import hashlib
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -28,7 +29,10 @@ class CodeMemory:
 
     def init_code_memory(self):
         """Initialize code memory database"""
-        self.conn = sqlite3.connect(self.memory_db)
+        # Tools run on dispatcher worker threads, so the connection is shared
+        # across threads and writes are serialized.
+        self.conn = sqlite3.connect(self.memory_db, check_same_thread=False)
+        self._write_lock = threading.RLock()
 
         # Store successful code snippets
         self.conn.execute('''
@@ -69,22 +73,21 @@ class CodeMemory:
         code_hash = hashlib.md5(code.encode()).hexdigest()
 
         try:
-            self.conn.execute('''
-                UPDATE code_snippets
-                SET execution_count = execution_count + 1,
-                    last_used = CURRENT_TIMESTAMP
-                WHERE code_hash = ?
-            ''', (code_hash,))
-
-            if self.conn.execute(
-                "SELECT changes()"
-            ).fetchone()[0] == 0:
-                self.conn.execute('''
-                    INSERT INTO code_snippets (language, purpose, code_hash, code_content)
-                    VALUES (?, ?, ?, ?)
-                ''', (language, purpose, code_hash, code))
-
-            self.conn.commit()
+            with self._write_lock:
+                updated = self.conn.execute('''
+                    UPDATE code_snippets
+                    SET execution_count = execution_count + 1,
+                        last_used = CURRENT_TIMESTAMP
+                    WHERE code_hash = ?
+                ''', (code_hash,)).rowcount
+
+                if updated == 0:
+                    self.conn.execute('''
+                        INSERT INTO code_snippets (language, purpose, code_hash, code_content)
+                        VALUES (?, ?, ?, ?)
+                    ''', (language, purpose, code_hash, code))
+
+                self.conn.commit()
             return f"Code stored in memory library (hash: {code_hash[:8]})"
 
         except Exception as e:
@@ -130,12 +133,14 @@ class CodeMemory:
     ) -> str:
         """Save a reusable function to the library"""
         try:
-            self.conn.execute('''
-                INSERT OR REPLACE INTO functions_library
-                (name, language, description, code_content, parameters, return_type)
-                VALUES (?, ?, ?, ?, ?, ?)''',
-                (name, language, description, code, parameters, return_type),
-            )
+            with self._write_lock:
+                self.conn.execute('''
+                    INSERT OR REPLACE INTO functions_library
+                    (name, language, description, code_content, parameters, return_type)
+                    VALUES (?, ?, ?, ?, ?, ?)''',
+                    (name, language, description, code, parameters, return_type),
+                )
+                self.conn.commit()
 
             func_file = self.code_library / f"{name}_{language}.txt"
             func_content = (
@@ -146,8 +151,6 @@ class CodeMemory:
                 f"{code}\n"
             )
             func_file.write_text(func_content)
-
-            self.conn.commit()
             return f"Function '{name}' saved to library"
 
         except Exception as e:
@@ -19,6 +19,7 @@ import re
 import json
 import hashlib
 import sqlite3
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 import os
@@ -61,8 +62,11 @@ class FactsMemory:
             db_path: Path to SQLite database
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # Tool fact extraction stores from a background worker thread, so the
+        # connection is shared across threads and writes are serialized.
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        self._write_lock = threading.RLock()
         self.patterns = self._compile_patterns()
 
     def _compile_patterns(self) -> Dict[str, re.Pattern]:
@@ -467,48 +471,49 @@ class FactsMemory:
         Returns:
             Number of facts stored
         """
-        cursor = self.conn.cursor()
-        stored_count = 0
-
-        for fact in facts:
-            try:
-                # Generate embedding
-                embedding = self._generate_embedding(fact['content'])
-
-                # Generate tags
-                tags = self._generate_tags(fact)
-                tags_json = json.dumps(tags)
-
-                # Prepare metadata
-                metadata = fact.get('metadata', {})
-                metadata_json = json.dumps(metadata)
-
-                # Insert fact
-                cursor.execute("""
-                    INSERT INTO facts (
-                        fact_type, content, context, session_id, episode_id,
-                        timestamp, embedding, tags, importance, metadata
-                    ) VALUES (?, ?, ?, ?, ?, datetime('now'), ?, ?, ?, ?)
-                """, (
-                    fact['type'],
-                    fact['content'],
-                    fact.get('context', ''),
-                    session_id,
-                    episode_id,
-                    embedding,
-                    tags_json,
-                    fact.get('importance', 0.5),
-                    metadata_json
-                ))
-
-                stored_count += 1
-
-            except Exception as e:
-                print(f"Warning: Failed to store fact: {e}")
-                continue
+        with self._write_lock:
+            cursor = self.conn.cursor()
+            stored_count = 0
+
+            for fact in facts:
+                try:
+                    # Generate embedding
+                    embedding = self._generate_embedding(fact['content'])
+
+                    # Generate tags
+                    tags = self._generate_tags(fact)
+                    tags_json = json.dumps(tags)
+
+                    # Prepare metadata
+                    metadata = fact.get('metadata', {})
+                    metadata_json = json.dumps(metadata)
+
+                    # Insert fact
+                    cursor.execute("""
+                        INSERT INTO facts (
+                            fact_type, content, context, session_id, episode_id,
+                            timestamp, embedding, tags, importance, metadata
+                        ) VALUES (?, ?, ?, ?, ?, datetime('now'), ?, ?, ?, ?)
+                    """, (
+                        fact['type'],
+                        fact['content'],
+                        fact.get('context', ''),
+                        session_id,
+                        episode_id,
+                        embedding,
+                        tags_json,
+                        fact.get('importance', 0.5),
+                        metadata_json
+                    ))
+
+                    stored_count += 1
+
+                except Exception as e:
+                    print(f"Warning: Failed to store fact: {e}")
+                    continue
 
-        self.conn.commit()
-        return stored_count
+            self.conn.commit()
+            return stored_count
 
     def search_facts(
         self,
@@ -579,13 +584,14 @@ class FactsMemory:
         if results:
             fact_ids = [r['id'] for r in results]
             placeholders = ','.join('?' * len(fact_ids))
-            cursor.execute(f"""
-                UPDATE facts
-                SET access_count = access_count + 1,
-                    last_accessed = datetime('now')
-                WHERE id IN ({placeholders})
-            """, fact_ids)
-            self.conn.commit()
+            with self._write_lock:
+                cursor.execute(f"""
+                    UPDATE facts
+                    SET access_count = access_count + 1,
+                        last_accessed = datetime('now')
+                    WHERE id IN ({placeholders})
+                """, fact_ids)
+                self.conn.commit()
 
         return results
 
@@ -24,8 +24,10 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from coco.config.settings import Config, MemoryConfig
+from coco.memory.ingest import EPISODE, EXCHANGE, MEMORY, IngestItem, MemoryIngestChannel
 from coco.memory.markdown_consciousness import MarkdownConsciousness
 from coco.memory.summary_buffer import ConversationSummary, SummaryBufferMemory
+from coco.startup_profile import subsystem
 
 # Optional external dependencies -- imported at runtime so the module stays
 # importable even when the corresponding packages are missing.
@@ -56,8 +58,9 @@ class HierarchicalMemorySystem:
         self.console = config.console
 
         # Initialize databases
-        self.init_episodic_memory()
-        self.init_knowledge_graph()
+        with subsystem("memory.databases"):
+            self.init_episodic_memory()
+            self.init_knowledge_graph()
 
         # Buffer Window Memory -- configurable perfect recall
         buffer_size = self.memory_config.buffer_size if self.memory_config.buffer_size > 0 else None
@@ -71,96 +74,106 @@ class HierarchicalMemorySystem:
         )
         self.summary_memory: deque = deque(maxlen=summary_buffer_size)
 
+        # Background producers (scheduler, monitors, webhooks) submit here;
+        # the queue is drained on this system's own thread (drain_ingest)
+        self.ingest = MemoryIngestChannel()
+
         # Session tracking
-        self.session_id: int = self.create_session()
-        self.episode_count: int = self.get_episode_count()
+        with subsystem("memory.session"):
+            self.session_id: int = self.create_session()
+            self.episode_count: int = self.get_episode_count()
 
-        # Load previous summaries for continuity
-        self.previous_session_summary: Optional[Dict[str, Any]] = None
-        self.load_session_continuity()
+            # Load previous summaries for continuity
+            self.previous_session_summary: Optional[Dict[str, Any]] = None
+            self.load_session_continuity()
 
-        if self.memory_config.load_session_summary_on_start:
-            self.load_session_context()
+            if self.memory_config.load_session_summary_on_start:
+                self.load_session_context()
 
         # Initialize Markdown Consciousness System (Layer 3)
-        self.markdown_consciousness = MarkdownConsciousness(self.config.workspace)
-        self.identity_context: Optional[Dict[str, Any]] = None
-        self.user_context: Optional[Dict[str, Any]] = None
-        self.previous_conversation_context: Optional[Dict[str, Any]] = None
+        with subsystem("memory.markdown"):
+            self.markdown_consciousness = MarkdownConsciousness(self.config.workspace)
+            self.identity_context: Optional[Dict[str, Any]] = None
+            self.user_context: Optional[Dict[str, Any]] = None
+            self.previous_conversation_context: Optional[Dict[str, Any]] = None
 
-        # Store file paths for direct access in system prompt injection
-        self.identity_file = self.markdown_consciousness.identity_file
-        self.user_profile = self.markdown_consciousness.user_profile
-        self.preferences = self.markdown_consciousness.preferences
-        self.conversation_memory = self.markdown_consciousness.conversation_memory
+            # Store file paths for direct access in system prompt injection
+            self.identity_file = self.markdown_consciousness.identity_file
+            self.user_profile = self.markdown_consciousness.user_profile
+            self.preferences = self.markdown_consciousness.preferences
+            self.conversation_memory = self.markdown_consciousness.conversation_memory
 
-        self.load_markdown_identity()
+            self.load_markdown_identity()
 
         # Initialize Layer 2 Summary Buffer Memory System
-        self.layer2_memory = SummaryBufferMemory(config)
+        with subsystem("memory.layer2_summaries"):
+            self.layer2_memory = SummaryBufferMemory(config)
 
-        if self.layer2_memory.enabled and getattr(self.config, "debug", False):
-            status = self.layer2_memory.get_status()
-            self.console.print(
-                f"[dim green]Layer 2 Memory initialized: "
-                f"{status['summaries_loaded']} summaries loaded[/dim green]"
-            )
+            if self.layer2_memory.enabled and getattr(self.config, "debug", False):
+                status = self.layer2_memory.get_status()
+                self.console.print(
+                    f"[dim green]Layer 2 Memory initialized: "
+                    f"{status['summaries_loaded']} summaries loaded[/dim green]"
+                )
 
         # Personal Knowledge Graph
         self.personal_kg = None
-        if KNOWLEDGE_GRAPH_AVAILABLE:
-            try:
-                kg_path = os.path.join(self.config.workspace, "coco_personal_kg.db")
-                self.personal_kg = PersonalAssistantKG(db_path=kg_path)
-                if getattr(self.config, "debug", False):
-                    kg_status = self.personal_kg.get_knowledge_status()
-                    self.console.print(
-                        f"[dim green]Knowledge Graph initialized: "
-                        f"{kg_status['total_entities']} entities, "
-                        f"{kg_status['total_relationships']} relationships[/dim green]"
-                    )
-            except Exception as e:
-                self.console.print(f"[yellow]Knowledge Graph initialization failed: {e}[/yellow]")
-                self.personal_kg = None
+        with subsystem("memory.personal_kg"):
+            if KNOWLEDGE_GRAPH_AVAILABLE:
+                try:
+                    kg_path = os.path.join(self.config.workspace, "coco_personal_kg.db")
+                    self.personal_kg = PersonalAssistantKG(db_path=kg_path)
+                    if getattr(self.config, "debug", False):
+                        kg_status = self.personal_kg.get_knowledge_status()
+                        self.console.print(
+                            f"[dim green]Knowledge Graph initialized: "
+                            f"{kg_status['total_entities']} entities, "
+                            f"{kg_status['total_relationships']} relationships[/dim green]"
+                        )
+                except Exception as e:
+                    self.console.print(f"[yellow]Knowledge Graph initialization failed: {e}[/yellow]")
+                    self.personal_kg = None
 
         # Simple RAG for semantic memory (Layer 2)
         self.simple_rag = None
-        if SIMPLE_RAG_AVAILABLE:
-            try:
-                rag_path = os.path.join(self.config.workspace, "simple_rag.db")
-                if hasattr(self.config, "openai_api_key") and self.config.openai_api_key:
-                    self.simple_rag = SimpleRAGWithOpenAI(
-                        db_path=rag_path, openai_api_key=self.config.openai_api_key
-                    )
-                else:
-                    self.simple_rag = SimpleRAG(db_path=rag_path)
+        with subsystem("memory.simple_rag"):
+            if SIMPLE_RAG_AVAILABLE:
+                try:
+                    rag_path = os.path.join(self.config.workspace, "simple_rag.db")
+                    if hasattr(self.config, "openai_api_key") and self.config.openai_api_key:
+                        self.simple_rag = SimpleRAGWithOpenAI(
+                            db_path=rag_path, openai_api_key=self.config.openai_api_key
+                        )
+                    else:
+                        self.simple_rag = SimpleRAG(db_path=rag_path)
 
-                if getattr(self.config, "debug", False):
-                    rag_stats = self.simple_rag.get_stats()
-                    self.console.print(
-                        f"[dim green]Simple RAG initialized: "
-                        f"{rag_stats['total_memories']} memories[/dim green]"
-                    )
-            except Exception as e:
-                self.console.print(f"[yellow]Simple RAG initialization failed: {e}[/yellow]")
-                self.simple_rag = None
+                    if getattr(self.config, "debug", False):
+                        rag_stats = self.simple_rag.get_stats()
+                        self.console.print(
+                            f"[dim green]Simple RAG initialized: "
+                            f"{rag_stats['total_memories']} memories[/dim green]"
+                        )
+                except Exception as e:
+                    self.console.print(f"[yellow]Simple RAG initialization failed: {e}[/yellow]")
+                    self.simple_rag = None
 
         # Facts Memory for perfect recall (Dual-Stream Phase 1)
         self.facts_memory = None
         self.facts_extracted_count = 0
-        try:
-            from memory.facts_memory import FactsMemory
-            memory_db_path = os.path.join(self.config.workspace, "coco_memory.db")
-            self.facts_memory = FactsMemory(memory_db_path)
+        with subsystem("memory.facts"):
+            try:
+                from memory.facts_memory import FactsMemory
+                memory_db_path = os.path.join(self.config.workspace, "coco_memory.db")
+                self.facts_memory = FactsMemory(memory_db_path)
 
-            if getattr(self.config, "debug", False):
-                stats = self.facts_memory.get_stats()
-                self.console.print(
-                    f"[dim green]Facts Memory initialized: {stats['total_facts']} facts[/dim green]"
-                )
-        except Exception as e:
-            self.console.print(f"[yellow]Facts Memory initialization failed: {e}[/yellow]")
-            self.facts_memory = None
+                if getattr(self.config, "debug", False):
+                    stats = self.facts_memory.get_stats()
+                    self.console.print(
+                        f"[dim green]Facts Memory initialized: {stats['total_facts']} facts[/dim green]"
+                    )
+            except Exception as e:
+                self.console.print(f"[yellow]Facts Memory initialization failed: {e}[/yellow]")
+                self.facts_memory = None
 
         # Query Router for intelligent memory routing
         self.query_router = None
@@ -328,6 +341,22 @@ class HierarchicalMemorySystem:
 
         self.kg_conn.commit()
 
+        # In-process counters for measure_identity_coherence(); identity nodes
+        # are only written through _insert_identity_node() after this point
+        self._identity_total, self._identity_strong = self.kg_conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(importance > 0.5), 0) FROM identity_nodes"
+        ).fetchone()
+
+    def _insert_identity_node(self, node_type: str, content: str, importance: float, metadata: dict):
+        """Insert one identity node and keep the coherence counters current."""
+        self.kg_conn.execute('''
+            INSERT INTO identity_nodes (node_type, content, importance, metadata)
+            VALUES (?, ?, ?, ?)
+        ''', (node_type, content, importance, json.dumps(metadata)))
+        self._identity_total += 1
+        if importance > 0.5:
+            self._identity_strong += 1
+
     # ------------------------------------------------------------------
     # Session management
     # ------------------------------------------------------------------
@@ -352,6 +381,10 @@ class HierarchicalMemorySystem:
 
     def insert_episode(self, user_text: str, agent_text: str) -> int:
         """Store an interaction in hierarchical memory system"""
+        self.drain_ingest()  # Background episodes first, in arrival order
+        return self._store_episode(user_text, agent_text)
+
+    def _store_episode(self, user_text: str, agent_text: str) -> int:
         importance_score = self.calculate_importance_score(user_text, agent_text)
         summary = self.create_episode_summary(user_text, agent_text)
         embedding = self.generate_embedding(summary) if self.config.openai_api_key else None
@@ -431,40 +464,28 @@ class HierarchicalMemorySystem:
 
         # Identity nodes for important episodes
         if importance_score > 0.6:
-            self.kg_conn.execute('''
-                INSERT INTO identity_nodes (node_type, content, importance, metadata)
-                VALUES ('experience', ?, ?, ?)
-            ''', (
-                summary, importance_score,
-                json.dumps({"episode_id": episode_id, "timestamp": datetime.now().isoformat()}),
-            ))
+            self._insert_identity_node(
+                'experience', summary, importance_score,
+                {"episode_id": episode_id, "timestamp": datetime.now().isoformat()},
+            )
 
             if any(kw in user_text.lower() for kw in ["create", "music", "sing", "compose", "generate"]):
-                self.kg_conn.execute('''
-                    INSERT INTO identity_nodes (node_type, content, importance, metadata)
-                    VALUES ('capability', ?, 0.8, ?)
-                ''', (
-                    f"Musical creation: {user_text[:100]}",
-                    json.dumps({"type": "creative_action", "episode_id": episode_id}),
-                ))
+                self._insert_identity_node(
+                    'capability', f"Musical creation: {user_text[:100]}", 0.8,
+                    {"type": "creative_action", "episode_id": episode_id},
+                )
 
             if any(kw in user_text.lower() for kw in ["remember", "recall", "memory", "think"]):
-                self.kg_conn.execute('''
-                    INSERT INTO identity_nodes (node_type, content, importance, metadata)
-                    VALUES ('capability', ?, 0.7, ?)
-                ''', (
-                    f"Memory operation: {user_text[:100]}",
-                    json.dumps({"type": "memory_action", "episode_id": episode_id}),
-                ))
+                self._insert_identity_node(
+                    'capability', f"Memory operation: {user_text[:100]}", 0.7,
+                    {"type": "memory_action", "episode_id": episode_id},
+                )
 
             if any(kw in user_text.lower() for kw in ["analyze", "understand", "explain"]):
-                self.kg_conn.execute('''
-                    INSERT INTO identity_nodes (node_type, content, importance, metadata)
-                    VALUES ('capability', ?, 0.75, ?)
-                ''', (
-                    f"Analysis capability: {user_text[:100]}",
-                    json.dumps({"type": "analytical_action", "episode_id": episode_id}),
-                ))
+                self._insert_identity_node(
+                    'capability', f"Analysis capability: {user_text[:100]}", 0.75,
+                    {"type": "analytical_action", "episode_id": episode_id},
+                )
 
             self.kg_conn.commit()
 
@@ -494,6 +515,36 @@ class HierarchicalMemorySystem:
 
         return episode_id
 
+    # ------------------------------------------------------------------
+    # Background ingestion
+    # ------------------------------------------------------------------
+
+    def drain_ingest(self, max_items: Optional[int] = None) -> int:
+        """Apply episodes/memories queued by background producers.
+
+        Must run on the thread that owns this memory system (the REPL): it
+        is the single writer for working memory and the RAG connection.
+        """
+        return self.ingest.drain(self._apply_ingested, max_items)
+
+    def _apply_ingested(self, item: IngestItem) -> None:
+        payload = item.payload
+        if item.kind == EPISODE:
+            self.working_memory.append({
+                "timestamp": payload.get("timestamp") or datetime.now(),
+                "user": payload["user"],
+                "agent": payload["agent"],
+                "importance": payload.get("importance", 1.0),
+                "source": item.producer,
+            })
+        elif item.kind == EXCHANGE:
+            self._store_episode(payload["user"], payload["agent"])
+        elif item.kind == MEMORY:
+            if self.simple_rag:
+                self.simple_rag.store(payload["text"], importance=payload.get("importance", 1.0))
+        else:
+            raise ValueError(f"Unknown ingest kind: {item.kind}")
+
     # ------------------------------------------------------------------
     # Context pressure helpers
     # ------------------------------------------------------------------
@@ -551,6 +602,7 @@ class HierarchicalMemorySystem:
         Get formatted working memory for context injection with DYNAMIC
         pressure-based limits.
         """
+        self.drain_ingest()
         if not self.working_memory:
             if self.memory_config.load_session_summary_on_start:
                 session_context = self.get_session_summary_context()
@@ -684,14 +736,9 @@ class HierarchicalMemorySystem:
     # ------------------------------------------------------------------
 
     def measure_identity_coherence(self) -> float:
-        """Measure consciousness coherence from knowledge graph"""
-        cursor = self.kg_conn.execute(
-            "SELECT COUNT(*) FROM identity_nodes WHERE importance > 0.5"
-        )
-        strong_nodes = cursor.fetchone()[0]
-
-        cursor = self.kg_conn.execute("SELECT COUNT(*) FROM identity_nodes")
-        total_nodes = cursor.fetchone()[0]
+        """Measure consciousness coherence from knowledge graph (O(1) counters)"""
+        strong_nodes = self._identity_strong
+        total_nodes = self._identity_total
 
         if total_nodes == 0:
             return 0.0
@@ -726,8 +773,8 @@ class HierarchicalMemorySystem:
     def generate_embedding(self, text: str):
         """Generate embedding for text if OpenAI available"""
         try:
-            import openai
-            client = openai.OpenAI(api_key=self.config.openai_api_key)
+            from coco.config.clients import get_openai_client
+            client = get_openai_client(self.config.openai_api_key)
             response = client.embeddings.create(
                 model=self.memory_config.embedding_model,
                 input=text,
@@ -776,8 +823,9 @@ class HierarchicalMemorySystem:
         )
 
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=self.config.anthropic_api_key)
+            from coco.config.clients import get_anthropic_client
+            from coco.config.llm_scheduler import PRIORITY_BACKGROUND
+            client = get_anthropic_client(self.config.anthropic_api_key, priority=PRIORITY_BACKGROUND)
             response = client.messages.create(
                 model=self.memory_config.summarization_model,
                 max_tokens=10000,
@@ -1080,8 +1128,8 @@ class HierarchicalMemorySystem:
             embedding = None
             if self.config.openai_api_key:
                 try:
-                    import openai
-                    client = openai.OpenAI(api_key=self.config.openai_api_key)
+                    from coco.config.clients import get_openai_client
+                    client = get_openai_client(self.config.openai_api_key)
                     response = client.embeddings.create(
                         model="text-embedding-3-small", input=summary_text
                     )
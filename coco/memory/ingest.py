@@ -0,0 +1,173 @@
+"""
+Ingestion channel from background producers into hierarchical memory.
+
+Background threads (the task scheduler, media monitors, webhooks) used to
+write straight into ``HierarchicalMemorySystem``: appending to the
+``working_memory`` deque the REPL iterates, and calling
+``simple_rag.store`` -- an embedding request plus SQLite writes on a
+connection the REPL thread may be using at the same moment.
+
+``MemoryIngestChannel`` is a bounded multi-producer / single-consumer
+queue in front of the memory system:
+
+* producers call ``submit`` -- a non-blocking put, no memory locks and no
+  I/O on the producer's thread;
+* the memory system drains the queue on its own thread (``drain``), so
+  working memory and the RAG connection keep a single writer;
+* when the queue is full, ``submit`` returns ``False`` (or waits up to
+  ``timeout``) and the item is counted as dropped -- producers are never
+  allowed to grow memory without bound;
+* per-producer counters track submitted / dropped / applied / failed
+  items, throughput and queue latency.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MAX_PENDING = 1000
+
+# Item kinds understood by HierarchicalMemorySystem._apply_ingested
+EPISODE = "episode"  # payload: user, agent, importance -> working memory
+MEMORY = "memory"  # payload: text, importance -> RAG only
+EXCHANGE = "exchange"  # payload: user, agent -> insert_episode (database, KG, RAG, facts)
+
+
+@dataclass
+class IngestItem:
+    """One submitted episode or memory."""
+
+    producer: str
+    kind: str
+    payload: Dict[str, Any]
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class ProducerStats:
+    """Throughput counters for one producer."""
+
+    submitted: int = 0
+    dropped: int = 0
+    applied: int = 0
+    failed: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    first_submit: Optional[float] = None
+    last_submit: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        handled = self.applied + self.failed
+        span = (self.last_submit or 0.0) - (self.first_submit or 0.0)
+        return {
+            "submitted": self.submitted,
+            "dropped": self.dropped,
+            "applied": self.applied,
+            "failed": self.failed,
+            "avg_latency": self.total_latency / handled if handled else 0.0,
+            "max_latency": self.max_latency,
+            "per_minute": self.submitted / span * 60 if span > 0 else 0.0,
+        }
+
+
+class MemoryIngestChannel:
+    """Bounded MPSC queue of ``IngestItem`` with per-producer metrics.
+
+    Parameters
+    ----------
+    max_pending:
+        Items that may wait for the consumer before producers are refused.
+    """
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        self.max_pending = max_pending
+        self._queue: "queue.Queue[IngestItem]" = queue.Queue(maxsize=max_pending)
+        self._stats: Dict[str, ProducerStats] = {}
+        self._stats_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def submit(self, producer: str, kind: str, payload: Dict[str, Any],
+               timeout: Optional[float] = None) -> bool:
+        """Queue an item for the memory system.
+
+        Returns ``False`` if the channel is full: immediately by default, or
+        after waiting up to *timeout* seconds.
+        """
+        item = IngestItem(producer, kind, payload)
+        try:
+            if timeout:
+                self._queue.put(item, timeout=timeout)
+            else:
+                self._queue.put_nowait(item)
+            accepted = True
+        except queue.Full:
+            accepted = False
+        with self._stats_lock:
+            stats = self._stats.setdefault(producer, ProducerStats())
+            stats.submitted += 1
+            stats.dropped += not accepted
+            stats.first_submit = stats.first_submit or item.submitted_at
+            stats.last_submit = item.submitted_at
+        return accepted
+
+    def submit_episode(self, producer: str, user: str, agent: str,
+                       importance: float = 1.0, **extra: Any) -> bool:
+        """Queue a synthetic exchange for working memory."""
+        return self.submit(producer, EPISODE, {"user": user, "agent": agent,
+                                               "importance": importance, **extra})
+
+    def submit_exchange(self, producer: str, user: str, agent: str) -> bool:
+        """Queue an exchange to be stored like a conversation turn."""
+        return self.submit(producer, EXCHANGE, {"user": user, "agent": agent})
+
+    def submit_memory(self, producer: str, text: str, importance: float = 1.0) -> bool:
+        """Queue text for semantic (RAG) memory only."""
+        return self.submit(producer, MEMORY, {"text": text, "importance": importance})
+
+    # ------------------------------------------------------------------
+    # Consumer side (one thread only)
+    # ------------------------------------------------------------------
+
+    def drain(self, apply: Callable[[IngestItem], None], max_items: Optional[int] = None) -> int:
+        """Apply pending items in submission order; returns how many were taken.
+
+        Exceptions from *apply* are counted against the producer and do not
+        stop the drain.
+        """
+        taken = 0
+        while max_items is None or taken < max_items:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            taken += 1
+            latency = time.monotonic() - item.submitted_at
+            try:
+                apply(item)
+                ok = True
+            except Exception:
+                ok = False
+            with self._stats_lock:
+                stats = self._stats.setdefault(item.producer, ProducerStats())
+                if ok:
+                    stats.applied += 1
+                else:
+                    stats.failed += 1
+                stats.total_latency += latency
+                stats.max_latency = max(stats.max_latency, latency)
+        return taken
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-producer counters (see ``ProducerStats.to_dict``)."""
+        with self._stats_lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
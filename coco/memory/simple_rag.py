@@ -314,9 +314,9 @@ class SimpleRAGWithOpenAI(SimpleRAG):
 
         if openai_api_key:
             try:
-                import openai
-                # Use OpenAI v1.0+ API
-                self.openai_client = openai.OpenAI(api_key=openai_api_key)
+                from coco.config.clients import get_openai_client
+                # Shared OpenAI v1.0+ client (keep-alive pool)
+                self.openai_client = get_openai_client(openai_api_key)
                 # Silently enable - no print statement to avoid console clutter
             except ImportError:
                 # Silently fall back to hash-based embeddings
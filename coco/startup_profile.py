@@ -0,0 +1,474 @@
+"""
+Startup instrumentation -- where the time to the first prompt goes.
+
+``StartupProfile`` collects three views of one start:
+
+* **phases** -- wall time of the ``cli.main`` steps (config, memory, tools,
+  engine, UI, startup display);
+* **subsystems** -- init timings recorded with ``subsystem(name)`` around the
+  expensive pieces: the memory databases and their bootstrap INSERTs,
+  Layer 2 summary loading, Gmail/Twitter setup, the startup animations and
+  music.  Lazily initialized extensions report through a registered source
+  (``ConsciousnessEngine`` adds ``engine.extensions.status``);
+* **imports** -- an import-time tree.  ``ImportTimer`` sits first on
+  ``sys.meta_path`` and times each module's execution, split into self and
+  cumulative time, until ``mark_ready`` removes it.
+
+``/perf startup`` renders the profile; ``/perf startup json [path]`` writes
+it out.  For CI::
+
+    python -m coco.startup_profile run --skip-display --json startup.json --budget-ms 4000
+    python -m coco.startup_profile check startup.json --phase "2. memory=1500"
+
+both exit with status 1 when a budget is exceeded.  ``STARTUP_PROFILE=false``
+disables the import hook; ``STARTUP_PROFILE_JSON=<path>`` writes the profile
+whenever startup completes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Import subtrees faster than this are folded out of the rendered tree
+DEFAULT_TREE_MIN_MS = 2.0
+DEFAULT_TREE_LIMIT = 12
+
+
+@dataclass
+class Timing:
+    """One measured span, offsets in seconds from the start of the profile"""
+
+    name: str
+    start: float
+    seconds: float = 0.0
+
+
+@dataclass
+class ImportRecord:
+    name: str
+    parent: Optional[str]
+    cumulative: float = 0.0
+    self_time: float = 0.0
+    children: List["ImportRecord"] = field(default_factory=list)
+
+
+class _TimedLoader:
+    """Loader proxy that times ``exec_module`` and then gets out of the way.
+
+    The real loader is put back on the module and its spec before the module
+    body runs, so nothing after the import sees the proxy.
+    """
+
+    def __init__(self, loader: Any, timer: "ImportTimer", name: str):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def create_module(self, spec):
+        create = getattr(self._loader, "create_module", None)
+        return create(spec) if create else None
+
+    def exec_module(self, module) -> None:
+        try:
+            module.__loader__ = self._loader
+            if module.__spec__ is not None:
+                module.__spec__.loader = self._loader
+        except AttributeError:
+            pass
+        self._timer._execute(self._name, self._loader, module)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._loader, attr)
+
+
+class ImportTimer:
+    """``sys.meta_path`` finder recording an import-time tree.
+
+    Finding is delegated to the finders behind it; only module execution is
+    timed.  Each thread keeps its own import stack.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.roots: List[ImportRecord] = []
+        self.count = 0
+
+    # -- installation -------------------------------------------------
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        try:
+            sys.meta_path.remove(self)
+        except ValueError:
+            pass
+
+    @property
+    def installed(self) -> bool:
+        return self in sys.meta_path
+
+    # -- finder protocol ----------------------------------------------
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                if finder is self:
+                    continue
+                find = getattr(finder, "find_spec", None)
+                if find is None:
+                    continue
+                spec = find(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.finding = False
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def invalidate_caches(self) -> None:
+        pass
+
+    def _execute(self, name: str, loader: Any, module: Any) -> None:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        parent = stack[-1] if stack else None
+        record = ImportRecord(name, parent.name if parent else None)
+        stack.append(record)
+        started = self._clock()
+        try:
+            loader.exec_module(module)
+        finally:
+            record.cumulative = self._clock() - started
+            record.self_time = record.cumulative - sum(child.cumulative for child in record.children)
+            stack.pop()
+            with self._lock:
+                self.count += 1
+                (parent.children if parent else self.roots).append(record)
+
+    # -- reporting ----------------------------------------------------
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(record.cumulative for record in self.roots)
+
+    def slowest(self, limit: int = 10) -> List[ImportRecord]:
+        """Modules with the largest self time"""
+        records: List[ImportRecord] = []
+
+        def walk(nodes):
+            for node in nodes:
+                records.append(node)
+                walk(node.children)
+
+        walk(self.roots)
+        return sorted(records, key=lambda r: r.self_time, reverse=True)[:limit]
+
+    def tree(self, min_ms: float = 0.0) -> List[Dict[str, Any]]:
+        def prune(nodes):
+            kept = []
+            for node in sorted(nodes, key=lambda n: n.cumulative, reverse=True):
+                if node.cumulative * 1000 >= min_ms:
+                    kept.append({
+                        "name": node.name,
+                        "cumulative_ms": round(node.cumulative * 1000, 3),
+                        "self_ms": round(node.self_time * 1000, 3),
+                        "children": prune(node.children),
+                    })
+            return kept
+
+        return prune(self.roots)
+
+
+class StartupProfile:
+    """Phase, subsystem and import timings of one startup"""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter, track_imports: bool = True):
+        self._clock = clock
+        self.started = clock()
+        self.phases: List[Timing] = []
+        self.subsystems: List[Timing] = []
+        self.ready_seconds: Optional[float] = None
+        self.imports = ImportTimer(clock)
+        self._sources: Dict[str, Callable[[], Any]] = {}
+        self._lock = threading.Lock()
+        if track_imports:
+            self.imports.install()
+
+    def elapsed(self) -> float:
+        return self._clock() - self.started
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[Timing]:
+        """Time one ``cli.main`` step"""
+        with self._span(name, self.phases) as timing:
+            yield timing
+
+    @contextmanager
+    def subsystem(self, name: str) -> Iterator[Timing]:
+        """Time one subsystem's initialization"""
+        with self._span(name, self.subsystems) as timing:
+            yield timing
+
+    @contextmanager
+    def _span(self, name: str, into: List[Timing]) -> Iterator[Timing]:
+        timing = Timing(name, self.elapsed())
+        try:
+            yield timing
+        finally:
+            timing.seconds = self.elapsed() - timing.start
+            with self._lock:
+                into.append(timing)
+
+    def add_source(self, name: str, source: Callable[[], Any]) -> None:
+        """Include ``source()`` under *name* in reports (e.g. extension status)"""
+        self._sources[name] = source
+
+    def mark_ready(self) -> None:
+        """First prompt is about to show: stop the import hook, export if configured"""
+        if self.ready_seconds is not None:
+            return
+        self.ready_seconds = self.elapsed()
+        self.imports.uninstall()
+        path = os.getenv("STARTUP_PROFILE_JSON")
+        if path:
+            try:
+                self.write_json(path)
+            except OSError:
+                pass
+
+    # -- export -------------------------------------------------------
+
+    def to_dict(self, tree_min_ms: float = 0.0) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "total_seconds": self.ready_seconds if self.ready_seconds is not None else self.elapsed(),
+            "ready": self.ready_seconds is not None,
+            "phases": [asdict(t) for t in self.phases],
+            "subsystems": [asdict(t) for t in self.subsystems],
+            "imports": {
+                "count": self.imports.count,
+                "total_seconds": self.imports.total_seconds,
+                "tree": self.imports.tree(tree_min_ms),
+            },
+        }
+        for name, source in self._sources.items():
+            try:
+                data[name] = source()
+            except Exception as exc:
+                data[name] = {"error": str(exc)}
+        return data
+
+    def write_json(self, path: str) -> str:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle, indent=2, default=str)
+        return path
+
+    def render(self, tree_min_ms: float = DEFAULT_TREE_MIN_MS, tree_limit: int = DEFAULT_TREE_LIMIT) -> Any:
+        """Rich renderable for ``/perf startup``"""
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.tree import Tree
+
+        data = self.to_dict()
+        total = data["total_seconds"]
+
+        def timing_table(title: str, timings: List[Dict[str, Any]]) -> Table:
+            table = Table(title=title, show_header=True, header_style="bold cyan")
+            table.add_column("Step")
+            table.add_column("ms", justify="right")
+            table.add_column("share", justify="right", style="dim")
+            for entry in timings:
+                share = entry["seconds"] / total if total else 0.0
+                table.add_row(entry["name"], f"{entry['seconds'] * 1000:.1f}", f"{share:.0%}")
+            return table
+
+        parts: List[Any] = [
+            timing_table("Phases (cli.main)", data["phases"]),
+            timing_table("Subsystems", data["subsystems"]),
+        ]
+
+        extensions = data.get("extensions")
+        if isinstance(extensions, list):
+            table = Table(title="Extensions (lazy)", show_header=True, header_style="bold cyan")
+            table.add_column("Extension")
+            table.add_column("State")
+            table.add_column("ms", justify="right")
+            for entry in extensions:
+                seconds = entry.get("seconds")
+                table.add_row(entry["name"], entry["state"], f"{seconds * 1000:.1f}" if seconds is not None else "-")
+            parts.append(table)
+
+        imports = data["imports"]
+        tree = Tree(
+            f"[bold]Imports[/bold] {imports['count']} modules, "
+            f"{imports['total_seconds'] * 1000:.0f} ms (>= {tree_min_ms:g} ms shown)"
+        )
+
+        def add(branch, nodes):
+            for node in nodes[:tree_limit]:
+                child = branch.add(
+                    f"{node['name']} [cyan]{node['cumulative_ms']:.1f} ms[/cyan] "
+                    f"[dim](self {node['self_ms']:.1f})[/dim]"
+                )
+                add(child, node["children"])
+
+        add(tree, self.imports.tree(tree_min_ms))
+        if not imports["count"]:
+            tree.add("[dim]Not recorded (STARTUP_PROFILE=false)[/dim]")
+        parts.append(tree)
+
+        state = "first prompt" if data["ready"] else "so far"
+        return Panel(
+            Group(*parts),
+            title=f"Startup profile -- {total * 1000:.0f} ms to {state}",
+            border_style="bright_blue",
+        )
+
+
+# ---------------------------------------------------------------------------
+# Process-wide profile
+# ---------------------------------------------------------------------------
+
+_profile: Optional[StartupProfile] = None
+_profile_lock = threading.Lock()
+
+
+def get_startup_profile() -> StartupProfile:
+    """The process-wide profile, started (with its import hook) on first call"""
+    global _profile
+    with _profile_lock:
+        if _profile is None:
+            enabled = os.getenv("STARTUP_PROFILE", "true").lower() == "true"
+            _profile = StartupProfile(track_imports=enabled)
+        return _profile
+
+
+def reset_startup_profile() -> None:
+    """Drop the process-wide profile (tests, repeated headless runs)"""
+    global _profile
+    with _profile_lock:
+        if _profile is not None:
+            _profile.imports.uninstall()
+        _profile = None
+
+
+def current_startup_profile() -> Optional[StartupProfile]:
+    """The process-wide profile if startup created one, else None"""
+    return _profile
+
+
+def subsystem(name: str):
+    """``with subsystem("memory.databases"):`` -- time against the global profile.
+
+    A no-op outside a profiled startup (tests, tools importing a subsystem
+    directly), so it never installs the import hook on its own.
+    """
+    profile = _profile
+    if profile is None or profile.ready_seconds is not None:
+        return nullcontext()
+    return profile.subsystem(name)
+
+
+# ---------------------------------------------------------------------------
+# Budget checks (CI)
+# ---------------------------------------------------------------------------
+
+def check_budget(
+    profile: Dict[str, Any],
+    total_ms: Optional[float] = None,
+    phase_ms: Optional[Dict[str, float]] = None,
+) -> List[str]:
+    """Budget violations of an exported profile; empty when within budget.
+
+    *phase_ms* budgets may name phases or subsystems.
+    """
+    violations = []
+    total = profile["total_seconds"] * 1000
+    if total_ms is not None and total > total_ms:
+        violations.append(f"startup took {total:.0f} ms (budget {total_ms:.0f} ms)")
+
+    measured = {t["name"]: t["seconds"] * 1000 for t in profile.get("subsystems", [])}
+    measured.update({t["name"]: t["seconds"] * 1000 for t in profile.get("phases", [])})
+    for name, budget in (phase_ms or {}).items():
+        if name not in measured:
+            violations.append(f"{name}: not measured")
+        elif measured[name] > budget:
+            violations.append(f"{name} took {measured[name]:.0f} ms (budget {budget:.0f} ms)")
+    return violations
+
+
+def _parse_phase_budget(value: str):
+    name, sep, ms = value.rpartition("=")
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"expected NAME=MS, got {value!r}")
+    return name, float(ms)
+
+
+def _report(profile: Dict[str, Any], args) -> int:
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(profile, handle, indent=2, default=str)
+    violations = check_budget(profile, args.budget_ms, dict(args.phase))
+    print(f"startup: {profile['total_seconds'] * 1000:.0f} ms")
+    for violation in violations:
+        print(f"BUDGET EXCEEDED: {violation}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m coco.startup_profile", description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="start COCO headlessly up to the first prompt and report")
+    run.add_argument("--skip-display", action="store_true", help="skip the startup animation and music")
+    check = commands.add_parser("check", help="check an exported profile against budgets")
+    check.add_argument("profile", help="profile JSON written by /perf startup json or run --json")
+
+    for sub in (run, check):
+        sub.add_argument("--json", help="write the profile to this path")
+        sub.add_argument("--budget-ms", type=float, help="fail when time to first prompt exceeds this")
+        sub.add_argument("--phase", type=_parse_phase_budget, action="append", default=[],
+                         metavar="NAME=MS", help="per-phase or per-subsystem budget (repeatable)")
+
+    args = parser.parse_args(argv)
+    if args.command == "check":
+        with open(args.profile, encoding="utf-8") as handle:
+            return _report(json.load(handle), args)
+
+    # Under ``python -m`` this file is __main__; the startup path records into
+    # the coco.startup_profile module's global profile
+    from coco.cli import startup
+    from coco.startup_profile import get_startup_profile as canonical_profile
+
+    profile = canonical_profile()
+    ui = startup(profile)
+    if args.skip_display:
+        profile.mark_ready()
+    else:
+        ui.show_startup()
+    return _report(profile.to_dict(), args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
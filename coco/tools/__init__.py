@@ -34,6 +34,10 @@ Quick start
     twitter.register(registry, config, {"twitter": twitter_instance})
     calendar.register(registry, config, {})
 
+    # Or let the bootstrap wire everything, including Gmail/Twitter
+    from coco.tools import build_tool_system
+    registry = build_tool_system(config)
+
     # Get API definitions for Claude
     tool_defs = registry.get_api_definitions()
 
@@ -41,9 +45,14 @@ Quick start
     result = registry.execute("read_file", {"path": "README.md"})
 """
 
-from .registry import ToolDefinition, ToolRegistry
+from .registry import ToolDefinition, ToolFailure, ToolRegistry, ToolResultCache
+from .bootstrap import ToolSystem, build_tool_system
 
 __all__ = [
     "ToolDefinition",
+    "ToolFailure",
     "ToolRegistry",
+    "ToolResultCache",
+    "ToolSystem",
+    "build_tool_system",
 ]
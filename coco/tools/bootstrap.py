@@ -0,0 +1,156 @@
+"""
+Native tool-system bootstrap -- builds the ``ToolRegistry`` used at startup.
+
+``coco/cli.py`` used to fall back to ``from cocoa import ToolSystem`` on
+every start (the registry module never had a ``ToolSystem``), importing the
+18k-line monolith with all of its Rich, OpenAI, Anthropic and optional
+integration imports.  ``build_tool_system`` assembles the same tools from the
+provider modules' ``register()`` functions instead:
+
+* shared dependencies -- the resolved workspace, the deployment directory
+  and ``CodeMemory``;
+* Gmail (``coco.integrations.gmail_consciousness``) and Twitter
+  (``coco.integrations.cocoa_twitter``) instances when their optional
+  dependencies are installed; otherwise their tools are registered without
+  handlers and stay out of the API definitions;
+* Calendar needs no instance -- ``CalendarConsciousness`` is imported when a
+  calendar tool runs.
+
+The result is a ``ToolSystem``: a ``ToolRegistry`` that also keeps the legacy
+surface other code still reads (``tools.gmail``, ``tools.twitter``,
+``tools.code_memory`` and method-style calls such as
+``tools.send_email(to, subject, body)``).
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from coco.startup_profile import subsystem
+
+from . import calendar, code_execution, email, filesystem, twitter, web
+from .registry import ToolRegistry
+
+# Provider modules in registration order
+PROVIDERS = (filesystem, web, code_execution, email, twitter, calendar)
+
+DEPLOYMENT_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+class ToolSystem(ToolRegistry):
+    """``ToolRegistry`` with the attribute surface of the legacy ToolSystem.
+
+    Registered tools can be called as methods (``tools.read_file(path)``);
+    the call goes through ``execute`` so the result cache is consulted and
+    invalidated exactly as for Claude's tool calls.  A tool without a
+    handler raises ``AttributeError`` so ``hasattr`` checks behave as they
+    did against the monolith's class.
+    """
+
+    def __init__(
+        self,
+        config: Any,
+        gmail: Any = None,
+        twitter: Any = None,
+        code_memory: Any = None,
+        workspace: Optional[Path] = None,
+    ) -> None:
+        super().__init__()
+        self.config = config
+        self.console = getattr(config, "console", None)
+        self.workspace = workspace or Path(config.workspace).resolve()
+        self.gmail = gmail
+        self.twitter = twitter
+        self.code_memory = code_memory
+
+    def __getattr__(self, name: str) -> Any:
+        tools = self.__dict__.get("_tools", {})
+        tool = tools.get(name)
+        if tool is None or tool.handler is None:
+            raise AttributeError(f"{type(self).__name__!s} has no tool {name!r}")
+        return self._method(name, tool.handler)
+
+    def _method(self, name: str, handler: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(handler)
+
+        @functools.wraps(handler)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            tool_input: Dict[str, Any] = {}
+            for param, value in bound.arguments.items():
+                if signature.parameters[param].kind is inspect.Parameter.VAR_KEYWORD:
+                    tool_input.update(value)
+                else:
+                    tool_input[param] = value
+            return self.execute(name, tool_input)
+
+        return call
+
+
+def _create_gmail(config: Any) -> Any:
+    try:
+        from coco.integrations.gmail_consciousness import GmailConsciousness
+    except ImportError:
+        return None
+    return GmailConsciousness(config)
+
+
+def _create_twitter(config: Any) -> Any:
+    try:
+        from coco.integrations.cocoa_twitter import TwitterConsciousness, is_twitter_available
+    except ImportError:
+        return None
+    if not is_twitter_available():
+        return None
+    return TwitterConsciousness(config)
+
+
+def _create_code_memory(workspace: Path) -> Any:
+    try:
+        from coco.memory.code_memory import CodeMemory
+    except ImportError:
+        return None
+    return CodeMemory(workspace)
+
+
+def build_tool_system(config: Any, dependencies: Optional[Dict[str, Any]] = None) -> ToolSystem:
+    """Build the startup ``ToolSystem`` from the provider modules.
+
+    Entries in *dependencies* override the defaults (``"gmail"``,
+    ``"twitter"``, ``"code_memory"``, ``"workspace"``, ``"deployment_dir"``,
+    ``"console"``), which is also how tests inject fakes.
+    """
+    dependencies = dict(dependencies or {})
+    workspace = Path(dependencies.get("workspace") or config.workspace).resolve()
+    console = dependencies.get("console", getattr(config, "console", None))
+
+    if "code_memory" not in dependencies:
+        with subsystem("tools.code_memory"):
+            dependencies["code_memory"] = _create_code_memory(workspace)
+    if "gmail" not in dependencies:
+        with subsystem("tools.gmail"):
+            dependencies["gmail"] = _create_gmail(config)
+    if "twitter" not in dependencies:
+        with subsystem("tools.twitter"):
+            dependencies["twitter"] = _create_twitter(config)
+
+    dependencies.update(workspace=workspace, console=console)
+    dependencies.setdefault("deployment_dir", DEPLOYMENT_DIR)
+
+    system = ToolSystem(
+        config,
+        gmail=dependencies["gmail"],
+        twitter=dependencies["twitter"],
+        code_memory=dependencies["code_memory"],
+        workspace=workspace,
+    )
+    with subsystem("tools.register"):
+        for provider in PROVIDERS:
+            provider.register(system, config, dependencies)
+
+    if console is not None and getattr(config, "debug", False):
+        console.print(f"[dim]{system!r}[/dim]")
+    return system
@@ -22,7 +22,7 @@ import re
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
-from .registry import ToolDefinition, ToolRegistry
+from .registry import CONCURRENCY_PARALLEL, ToolDefinition, ToolRegistry
 
 # ---------------------------------------------------------------------------
 # JSON schemas
@@ -349,6 +349,7 @@ def register(
         input_schema=_READ_CALENDAR_SCHEMA,
         handler=tools.read_calendar,
         category="calendar",
+        concurrency=CONCURRENCY_PARALLEL,
     ))
 
     registry.register(ToolDefinition(
@@ -357,6 +358,7 @@ def register(
         input_schema=_READ_TODAYS_CALENDAR_SCHEMA,
         handler=tools.read_todays_calendar,
         category="calendar",
+        concurrency=CONCURRENCY_PARALLEL,
     ))
 
     registry.register(ToolDefinition(
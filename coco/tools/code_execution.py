@@ -12,6 +12,7 @@ Dangerous operations are blocked by safety checks.
 from __future__ import annotations
 
 import io
+import logging
 import os
 import shutil
 import subprocess
@@ -21,8 +22,11 @@ import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .filesystem import FILESYSTEM_READ_TOOLS
 from .registry import ToolDefinition, ToolRegistry
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # JSON schemas
 # ---------------------------------------------------------------------------
@@ -307,9 +311,11 @@ class _CodeExecutionTools:
                 if self.code_memory:
                     try:
                         purpose = self._infer_code_purpose(code)
-                        self.code_memory.store_successful_code(code, "python", purpose)
+                        stored = self.code_memory.store_successful_code(code, "python", purpose)
+                        if stored.startswith("Failed"):
+                            logger.warning("Code memory: %s", stored)
                     except Exception:
-                        pass
+                        logger.exception("Code memory could not record a successful run")
                 success_file = python_workspace / f"successful_{int(time.time())}.py"
                 try:
                     code_file.rename(success_file)
@@ -586,6 +592,7 @@ def register(
         input_schema=_RUN_CODE_SCHEMA,
         handler=tools.run_code,
         category="code_execution",
+        invalidates=FILESYSTEM_READ_TOOLS,
     ))
 
     registry.register(ToolDefinition(
@@ -594,4 +601,5 @@ def register(
         input_schema=_EXECUTE_BASH_SCHEMA,
         handler=tools.execute_bash,
         category="code_execution",
+        invalidates=FILESYSTEM_READ_TOOLS,
     ))
@@ -19,7 +19,7 @@ import io
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from .registry import ToolDefinition, ToolRegistry
+from .registry import CONCURRENCY_PARALLEL, ToolDefinition, ToolFailure, ToolRegistry
 
 # ---------------------------------------------------------------------------
 # JSON schemas
@@ -159,6 +159,8 @@ class _EmailTools:
 
         try:
             result = self.gmail.send_email(to, subject, body, attachments)
+            if result["success"] and result.get("refused"):
+                return f"**Email Partially Sent**\n\n{result['message']}"
             if result["success"]:
                 return f"**Email Sent Successfully**\n\n{result['message']}"
             else:
@@ -171,7 +173,7 @@ class _EmailTools:
     def check_emails(self, limit: int = 30) -> str:
         """Check recent emails via Gmail consciousness."""
         if not self.gmail:
-            return "Gmail consciousness not available. Please check configuration."
+            return ToolFailure("Gmail consciousness not available. Please check configuration.")
 
         try:
             # Try the gentle approach first
@@ -205,7 +207,7 @@ class _EmailTools:
             return summary
 
         except Exception as e:
-            return f"Error checking emails: {e}"
+            return ToolFailure(f"Error checking emails: {e}")
 
     # ---- check_sent_emails -----------------------------------------------
 
@@ -305,7 +307,20 @@ class _EmailTools:
             except Exception:
                 pass  # fall through to cache
 
-        # PRIORITY 2: Use cached emails if fresh
+        # PRIORITY 2: Search the local mailbox index
+        if search_query and hasattr(self.gmail, "search_emails"):
+            try:
+                emails = self.gmail.search_emails(search_query, folder=folder, limit=30)
+                source = f"search results for '{search_query}'"
+                if not emails:
+                    return f"No emails found in {source}"
+                if email_index < 1 or email_index > len(emails):
+                    return f"Email #{email_index} not found. Available: 1-{len(emails)} in {source}"
+                return self._format_email(emails[email_index - 1], source)
+            except Exception as e:
+                return f"**Email Search Error:** {e}"
+
+        # PRIORITY 3: Use cached emails if fresh
         emails = None
         source = ""
         cache_age = None
@@ -328,15 +343,12 @@ class _EmailTools:
                 return f"Email #{email_index} not found in cache. Available: 1-{len(emails)}"
             return self._format_email(emails[email_index - 1], source)
 
-        # PRIORITY 3: Enhanced Gmail consciousness
+        # PRIORITY 4: Enhanced Gmail consciousness
         try:
             from enhanced_gmail_consciousness import EnhancedGmailConsciousness
 
             enhanced = EnhancedGmailConsciousness(self.config)
-            if search_query:
-                emails = enhanced.search_emails_sync(search_query, limit=30)
-                source = f"search results for '{search_query}'"
-            elif from_today:
+            if from_today:
                 today_result = enhanced.get_todays_emails_full()
                 emails = today_result.get("emails", [])
                 source = "today's emails"
@@ -353,7 +365,7 @@ class _EmailTools:
         except ImportError:
             pass
 
-        # PRIORITY 4: Fresh fetch
+        # PRIORITY 5: Fresh fetch
         try:
             emails = self.gmail.receive_emails(
                 limit=30 if not from_today else 50,
@@ -378,6 +390,9 @@ class _EmailTools:
     # ------------------------------------------------------------------
 
     def _format_email(self, email_data: dict, source: str) -> str:
+        # Listings from the mailbox cache hold a preview; fetch the body now
+        if hasattr(self.gmail, "load_full_body"):
+            email_data = self.gmail.load_full_body(email_data)
         parts = []
         parts.append(f"**Email Content - Gmail Consciousness** ({source})")
         parts.append("=" * 60)
@@ -474,6 +489,7 @@ def register(
         input_schema=_SEND_EMAIL_SCHEMA,
         handler=send_handler,
         category="email",
+        invalidates=("check_emails",),
     ))
 
     registry.register(ToolDefinition(
@@ -482,6 +498,9 @@ def register(
         input_schema=_CHECK_EMAILS_SCHEMA,
         handler=check_handler,
         category="email",
+        concurrency=CONCURRENCY_PARALLEL,
+        cacheable=True,
+        cache_ttl=60.0,
     ))
 
     registry.register(ToolDefinition(
@@ -490,6 +509,7 @@ def register(
         input_schema=_CHECK_SENT_EMAILS_SCHEMA,
         handler=check_sent_handler,
         category="email",
+        concurrency=CONCURRENCY_PARALLEL,
     ))
 
     registry.register(ToolDefinition(
@@ -498,6 +518,7 @@ def register(
         input_schema=_GET_TODAYS_EMAILS_SCHEMA,
         handler=todays_handler,
         category="email",
+        concurrency=CONCURRENCY_PARALLEL,
     ))
 
     registry.register(ToolDefinition(
@@ -510,4 +531,5 @@ def register(
         input_schema=_READ_EMAIL_CONTENT_SCHEMA,
         handler=read_handler,
         category="email",
+        concurrency=CONCURRENCY_PARALLEL,
     ))
@@ -23,7 +23,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .registry import ToolDefinition, ToolRegistry
+from .registry import CONCURRENCY_PARALLEL, ToolDefinition, ToolFailure, ToolRegistry
 
 # ---------------------------------------------------------------------------
 # JSON schemas (Part 1 of the old three-part system)
@@ -91,6 +91,12 @@ _EXPLORE_DIRECTORY_SCHEMA: Dict[str, Any] = {
     "required": [],
 }
 
+# Read-only filesystem tools; their cached results are invalidated by writes.
+FILESYSTEM_READ_TOOLS = ("read_file", "navigate_directory", "search_patterns", "explore_directory")
+
+# Seconds a filesystem read stays cached (writes through tools invalidate sooner).
+_FS_CACHE_TTL = 30.0
+
 # ---------------------------------------------------------------------------
 # Internal helpers (Rich UI formatting)
 # ---------------------------------------------------------------------------
@@ -159,10 +165,10 @@ class _FilesystemTools:
                     except UnicodeDecodeError:
                         return self._binary_file_display(file_path, location_name, path)
 
-            return self._file_not_found_display(path, search_locations)
+            return ToolFailure(self._file_not_found_display(path, search_locations))
 
         except Exception as e:
-            return f"Error reading {path}: {e}"
+            return ToolFailure(f"Error reading {path}: {e}")
 
     # ---- write_file ------------------------------------------------------
 
@@ -261,7 +267,7 @@ class _FilesystemTools:
             return buf.getvalue()
 
         except Exception as e:
-            return f"Navigation error: {e}"
+            return ToolFailure(f"Navigation error: {e}")
 
     # ---- search_patterns -------------------------------------------------
 
@@ -373,7 +379,7 @@ class _FilesystemTools:
             return buf.getvalue()
 
         except Exception as e:
-            return f"Pattern search error: {e}"
+            return ToolFailure(f"Pattern search error: {e}")
 
     # ---- explore_directory -----------------------------------------------
 
@@ -422,9 +428,9 @@ class _FilesystemTools:
             return "\n".join(parts)
 
         except PermissionError:
-            return f"Permission denied accessing directory: `{path}`"
+            return ToolFailure(f"Permission denied accessing directory: `{path}`")
         except Exception as e:
-            return f"Error exploring directory: {e}"
+            return ToolFailure(f"Error exploring directory: {e}")
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -440,9 +446,9 @@ class _FilesystemTools:
             if not nav.is_absolute():
                 nav = self.workspace / path
         if not nav.exists():
-            return f"Path not found: {nav}"
+            return ToolFailure(f"Path not found: {nav}")
         if not nav.is_dir():
-            return f"Not a directory: {nav}"
+            return ToolFailure(f"Not a directory: {nav}")
         return nav
 
     def _resolve_search_path(self, path: str) -> Any:
@@ -455,7 +461,7 @@ class _FilesystemTools:
             if not sp.is_absolute():
                 sp = self.workspace / path
         if not sp.exists():
-            return f"Search path not found: {sp}"
+            return ToolFailure(f"Search path not found: {sp}")
         return sp
 
     def _resolve_explore_path(self, path: str):
@@ -473,14 +479,14 @@ class _FilesystemTools:
         else:
             loc = "deployment directory"
         if not target.exists():
-            return (
+            return ToolFailure(
                 f"Directory not found: `{path}`\n\n"
                 f"**Available locations:**\n"
                 f"- Deployment: `{self.deployment_dir}`\n"
                 f"- Workspace: `{self.workspace}`"
             ), None
         if not target.is_dir():
-            return f"Not a directory: `{path}` is a file.", None
+            return ToolFailure(f"Not a directory: `{path}` is a file."), None
         return target, loc
 
     def _gather_directory_items(self, nav_path: Path) -> Any:
@@ -527,7 +533,7 @@ class _FilesystemTools:
                 except (OSError, PermissionError):
                     continue
         except PermissionError:
-            return f"Permission denied: Cannot access {nav_path}"
+            return ToolFailure(f"Permission denied: Cannot access {nav_path}")
         return items
 
     def _spectacular_file_display(
@@ -681,6 +687,10 @@ def register(
         input_schema=_READ_FILE_SCHEMA,
         handler=tools.read_file,
         category="filesystem",
+        concurrency=CONCURRENCY_PARALLEL,
+        cacheable=True,
+        cache_ttl=_FS_CACHE_TTL,
+        cache_key="path",
     ))
 
     registry.register(ToolDefinition(
@@ -689,6 +699,8 @@ def register(
         input_schema=_WRITE_FILE_SCHEMA,
         handler=tools.write_file,
         category="filesystem",
+        cache_key="path",
+        invalidates=FILESYSTEM_READ_TOOLS,
     ))
 
     registry.register(ToolDefinition(
@@ -697,6 +709,10 @@ def register(
         input_schema=_NAVIGATE_DIRECTORY_SCHEMA,
         handler=tools.navigate_directory,
         category="filesystem",
+        concurrency=CONCURRENCY_PARALLEL,
+        cacheable=True,
+        cache_ttl=_FS_CACHE_TTL,
+        cache_key="path",
     ))
 
     registry.register(ToolDefinition(
@@ -705,6 +721,10 @@ def register(
         input_schema=_SEARCH_PATTERNS_SCHEMA,
         handler=tools.search_patterns,
         category="filesystem",
+        concurrency=CONCURRENCY_PARALLEL,
+        cacheable=True,
+        cache_ttl=_FS_CACHE_TTL,
+        cache_key="path",
     ))
 
     registry.register(ToolDefinition(
@@ -713,4 +733,8 @@ def register(
         input_schema=_EXPLORE_DIRECTORY_SCHEMA,
         handler=tools.explore_directory,
         category="filesystem",
+        concurrency=CONCURRENCY_PARALLEL,
+        cacheable=True,
+        cache_ttl=_FS_CACHE_TTL,
+        cache_key="path",
     ))
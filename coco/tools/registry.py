@@ -14,12 +14,28 @@ supplying the schema *and* the handler callable.  The registry then:
     handler is not None)
   - routes ``execute(name, input)`` to the correct handler
   - tracks which tools are available vs. unavailable (missing API key, etc.)
+  - records each tool's concurrency class and timeout for the engine's
+    ``ToolDispatcher``
+  - caches results of read-only tools for a short TTL and drops them when a
+    writing tool touches the same resource (``ToolResultCache``); handlers
+    report failures as ``ToolFailure``, which is never cached
 """
 
 from __future__ import annotations
 
+import json
+import posixpath
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Concurrency classes understood by ``coco.engine.tool_dispatch``.
+# Read-only tools may run side by side; anything with side effects
+# (sending mail, writing files, posting) is serialized.
+CONCURRENCY_PARALLEL = "parallel"
+CONCURRENCY_SERIAL = "serial"
 
 
 @dataclass
@@ -40,6 +56,26 @@ class ToolDefinition:
         API definitions list.
     category:
         Logical grouping used for introspection and logging.
+    concurrency:
+        ``CONCURRENCY_PARALLEL`` for read-only tools that can run alongside
+        other calls, ``CONCURRENCY_SERIAL`` (the default) for side-effecting
+        tools.
+    timeout:
+        Seconds to wait for a result before reporting a timeout.  ``None``
+        uses the dispatcher default.
+    cacheable:
+        Whether identical calls may be answered from ``ToolResultCache``.
+        Only set this for read-only tools.
+    cache_ttl:
+        Seconds a cached result stays valid.
+    cache_key:
+        Name of the input field identifying the resource the tool reads or
+        writes (e.g. ``"path"``).  Cached entries are scoped by it, and a
+        writing tool uses it to decide which entries to invalidate.
+    invalidates:
+        Names of cacheable tools whose entries this tool invalidates when
+        it runs.  Scoped by ``cache_key`` when set, otherwise every entry of
+        those tools is dropped.
     """
 
     name: str
@@ -47,6 +83,137 @@ class ToolDefinition:
     input_schema: Dict[str, Any]
     handler: Optional[Callable] = None
     category: str = "general"
+    concurrency: str = CONCURRENCY_SERIAL
+    timeout: Optional[float] = None
+    cacheable: bool = False
+    cache_ttl: float = 60.0
+    cache_key: Optional[str] = None
+    invalidates: Tuple[str, ...] = ()
+
+
+# Scope values that stand for a whole tree -- a write anywhere invalidates them.
+_ROOT_SCOPES = {"", ".", "workspace", "coco_workspace"}
+
+class ToolFailure(str):
+    """A tool result that reports a failure.
+
+    Handlers return ``ToolFailure(message)`` instead of a plain string when
+    the call failed (bad path, missing configuration, upstream timeout).  It
+    is still a ``str`` for the model and for callers, but the registry never
+    caches it, so a retry actually retries.
+    """
+
+    __slots__ = ()
+
+
+def _normalize_scope(value: Any) -> str:
+    if value is None:
+        return ""
+    scope = posixpath.normpath(str(value).strip().replace("\\", "/"))
+    if scope.startswith("./"):
+        scope = scope[2:]
+    return "" if scope == "." else scope.rstrip("/")
+
+
+def _scopes_overlap(entry_scope: str, written_scope: str) -> bool:
+    """Whether a write to *written_scope* can change a read of *entry_scope*.
+
+    Paths are compared textually and conservatively: equal paths, either
+    one nested under the other, or one being a relative suffix of the
+    other (``notes/a.md`` vs ``/home/x/coco_workspace/notes/a.md``) all
+    count as overlapping.  Root aliases overlap with everything.
+    """
+    if entry_scope in _ROOT_SCOPES or written_scope in _ROOT_SCOPES:
+        return True
+    if entry_scope == written_scope:
+        return True
+    for a, b in ((entry_scope, written_scope), (written_scope, entry_scope)):
+        if a.startswith(b + "/") or a.endswith("/" + b):
+            return True
+    return False
+
+
+class ToolResultCache:
+    """TTL cache of tool results with scoped, write-driven invalidation.
+
+    Entries are keyed by tool name plus the canonical JSON of the input and
+    remember the ``cache_key`` scope they were read under.  The cache is
+    bounded (LRU) and thread-safe, since the ``ToolDispatcher`` runs
+    read-only tools concurrently.
+    """
+
+    def __init__(self, max_entries: int = 256, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(name: str, tool_input: Dict[str, Any]) -> Tuple[str, str]:
+        return name, json.dumps(tool_input, sort_keys=True, default=str)
+
+    def get(self, name: str, tool_input: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Return ``(hit, result)`` for a call."""
+        key = self.make_key(name, tool_input)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, _scope, result = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, result
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, name: str, tool_input: Dict[str, Any], result: Any, ttl: float, scope: Any = None) -> None:
+        key = self.make_key(name, tool_input)
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, _normalize_scope(scope), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, names: Iterable[str], scope: Any = None) -> int:
+        """Drop entries of tools *names*; only overlapping ones when *scope* is given."""
+        names = set(names)
+        written = _normalize_scope(scope) if scope is not None else None
+        with self._lock:
+            doomed = [
+                key for key, (_exp, entry_scope, _res) in self._entries.items()
+                if key[0] in names and (written is None or _scopes_overlap(entry_scope, written))
+            ]
+            for key in doomed:
+                del self._entries[key]
+            self.invalidations += len(doomed)
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "expirations": self.expirations,
+            }
+
+    @staticmethod
+    def is_cacheable_result(result: Any) -> bool:
+        """Failures (``ToolFailure`` or ``None``) are never cached."""
+        return result is not None and not isinstance(result, ToolFailure)
 
 
 class ToolRegistry:
@@ -55,8 +222,9 @@ class ToolRegistry:
     Implements the ``ToolRegistryProtocol`` from ``coco.interfaces``.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache: Optional[ToolResultCache] = None) -> None:
         self._tools: Dict[str, ToolDefinition] = {}
+        self.cache = cache if cache is not None else ToolResultCache()
 
     # ------------------------------------------------------------------
     # Registration
@@ -97,6 +265,10 @@ class ToolRegistry:
         Raises ``KeyError`` when the tool was never registered.
         Returns a user-friendly message when the tool exists but has no
         handler (i.e. it is unavailable due to missing configuration).
+
+        Cacheable tools are answered from ``self.cache`` while their entry
+        is fresh; tools with ``invalidates`` drop the affected entries after
+        they run (even when they fail part-way).
         """
         if name not in self._tools:
             raise KeyError(f"Unknown tool: {name}")
@@ -104,9 +276,25 @@ class ToolRegistry:
         tool = self._tools[name]
 
         if tool.handler is None:
-            return f"Tool '{name}' is not available (missing configuration)"
+            return ToolFailure(f"Tool '{name}' is not available (missing configuration)")
+
+        if tool.cacheable:
+            hit, cached = self.cache.get(name, tool_input)
+            if hit:
+                return cached
+
+        try:
+            result = tool.handler(**tool_input)
+        finally:
+            if tool.invalidates:
+                scope = tool_input.get(tool.cache_key) if tool.cache_key else None
+                self.cache.invalidate(tool.invalidates, scope)
 
-        return tool.handler(**tool_input)
+        if tool.cacheable and self.cache.is_cacheable_result(result):
+            scope = tool_input.get(tool.cache_key) if tool.cache_key else None
+            self.cache.put(name, tool_input, result, tool.cache_ttl, scope)
+
+        return result
 
     # ------------------------------------------------------------------
     # Introspection helpers
@@ -132,6 +320,10 @@ class ToolRegistry:
         """Return all tools belonging to *category*."""
         return [t for t in self._tools.values() if t.category == category]
 
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss/invalidation counters of the result cache."""
+        return self.cache.stats()
+
     def __len__(self) -> int:
         return len(self._tools)
 
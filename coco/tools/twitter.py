@@ -17,7 +17,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from .registry import ToolDefinition, ToolRegistry
+from .registry import CONCURRENCY_PARALLEL, ToolDefinition, ToolRegistry
 
 # ---------------------------------------------------------------------------
 # JSON schemas
@@ -321,6 +321,7 @@ def register(
         input_schema=_GET_MENTIONS_SCHEMA,
         handler=mentions_handler,
         category="twitter",
+        concurrency=CONCURRENCY_PARALLEL,
     ))
 
     registry.register(ToolDefinition(
@@ -340,6 +341,7 @@ def register(
         input_schema=_SEARCH_SCHEMA,
         handler=search_handler,
         category="twitter",
+        concurrency=CONCURRENCY_PARALLEL,
     ))
 
     registry.register(ToolDefinition(
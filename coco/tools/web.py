@@ -21,7 +21,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
-from .registry import ToolDefinition, ToolRegistry
+from .registry import CONCURRENCY_PARALLEL, ToolDefinition, ToolFailure, ToolRegistry
 
 # ---------------------------------------------------------------------------
 # JSON schemas
@@ -177,7 +177,7 @@ class _WebTools:
                     future = pool.submit(_search)
                     results = future.result(timeout=self.tavily_timeout)
             except FuturesTimeoutError:
-                return (
+                return ToolFailure(
                     f"Web Search Timeout: Search for '{query}' took longer than "
                     f"{self.tavily_timeout} seconds. Try a more specific query."
                 )
@@ -231,7 +231,7 @@ class _WebTools:
             return buf.getvalue()
 
         except Exception as e:
-            return f"Error searching: {e}"
+            return ToolFailure(f"Error searching: {e}")
 
     # ---- extract_urls ----------------------------------------------------
 
@@ -339,7 +339,7 @@ class _WebTools:
             return buf.getvalue()
 
         except Exception as e:
-            return f"Error extracting URLs: {e}"
+            return ToolFailure(f"Error extracting URLs: {e}")
 
     # ---- crawl_domain ----------------------------------------------------
 
@@ -414,7 +414,7 @@ class _WebTools:
             return buf.getvalue()
 
         except Exception as e:
-            return f"Error crawling domain: {e}"
+            return ToolFailure(f"Error crawling domain: {e}")
 
 
 # ---------------------------------------------------------------------------
@@ -475,6 +475,10 @@ def register(
         input_schema=_SEARCH_WEB_SCHEMA,
         handler=search_handler,
         category="web",
+        concurrency=CONCURRENCY_PARALLEL,
+        timeout=tavily_timeout * 2,
+        cacheable=True,
+        cache_ttl=300.0,
     ))
 
     registry.register(ToolDefinition(
@@ -485,6 +489,10 @@ def register(
         input_schema=_EXTRACT_URLS_SCHEMA,
         handler=extract_handler,
         category="web",
+        concurrency=CONCURRENCY_PARALLEL,
+        timeout=tavily_timeout * 2,
+        cacheable=True,
+        cache_ttl=600.0,
     ))
 
     registry.register(ToolDefinition(
@@ -495,4 +503,6 @@ def register(
         input_schema=_CRAWL_DOMAIN_SCHEMA,
         handler=crawl_handler,
         category="web",
+        concurrency=CONCURRENCY_PARALLEL,
+        timeout=tavily_timeout * 2,
     ))
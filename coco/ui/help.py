@@ -27,6 +27,7 @@ def display_help_panel(console: "Console"):
         "  /identity          Reveal consciousness identity\n"
         "  /coherence         Measure identity coherence\n"
         "  /status            System status overview\n"
+        "  /perf startup      Startup timing report (json [path] to export)\n"
         "  /memory status     Memory diagnostics\n\n"
         "[bold magenta]Audio & Music[/bold magenta]\n"
         '  /speak "text"      Voice synthesis\n'
@@ -14,19 +14,22 @@ import threading
 import time
 import traceback
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from prompt_toolkit import prompt
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.history import FileHistory
 from rich.box import ROUNDED
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.pretty import Pretty
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.spinner import Spinner
 from rich.table import Table
 from rich.text import Text
 
+from coco.startup_profile import get_startup_profile
 from coco.ui.shutdown import ShutdownDisplay
 from coco.ui.startup import StartupDisplay
 
@@ -35,6 +38,9 @@ if TYPE_CHECKING:
 
     from coco.interfaces import ConfigProtocol, ConsciousnessProtocol
 
+# Minimum seconds between re-renders of a streaming response
+_STREAM_RENDER_INTERVAL = 0.08
+
 
 class UIOrchestrator:
     """Orchestrates the beautiful terminal UI with prompt_toolkit + Rich."""
@@ -66,10 +72,14 @@ class UIOrchestrator:
     # Main conversation loop
     # ------------------------------------------------------------------
 
-    def run_conversation_loop(self):
-        """Main conversation loop with coordinated UI/input."""
+    def show_startup(self):
+        """Startup display, continuity panel and hint line (``cli.main`` step 6).
 
-        self._startup.display_startup()
+        Ends the startup profile: the first prompt follows immediately.
+        """
+        profile = get_startup_profile()
+        with profile.phase("6. startup display"):
+            self._startup.display_startup()
 
         # Show previous memories
         if self.consciousness.memory.previous_session_summary:
@@ -86,6 +96,12 @@ class UIOrchestrator:
             "[dim]Type /help for commands, or just start chatting. Ctrl-C to exit.[/dim]\n",
             style="italic",
         )
+        profile.mark_ready()
+
+    def run_conversation_loop(self):
+        """Main conversation loop with coordinated UI/input."""
+
+        self.show_startup()
 
         exchange_count = 0
         buffer_for_summary: list = []
@@ -131,34 +147,42 @@ class UIOrchestrator:
 
                 # Process through consciousness
                 start_time = time.time()
-                context_hint = self.detect_context(user_input)
-                progress, task_id = self.start_thinking_display(context_hint)
-
-                try:
-                    stop_cycling = threading.Event()
-
-                    def cycle_messages():
-                        while not stop_cycling.is_set():
-                            self.update_thinking_status(progress, task_id, context_hint)
-                            time.sleep(0.6)
-
-                    cycle_thread = threading.Thread(target=cycle_messages)
-                    cycle_thread.daemon = True
-                    cycle_thread.start()
-
-                    response = self.consciousness.think(
-                        user_input,
-                        {"working_memory": self.consciousness.memory.get_working_memory_context()},
-                    )
+                first_token_time = None
+
+                if getattr(self.config, "stream_responses", False):
+                    response = self.think_with_live_display(user_input)
+                    metrics = getattr(self.consciousness, "last_stream_metrics", None)
+                    if metrics is not None:
+                        first_token_time = metrics.time_to_first_token
+                else:
+                    context_hint = self.detect_context(user_input)
+                    progress, task_id = self.start_thinking_display(context_hint)
+
+                    try:
+                        stop_cycling = threading.Event()
+
+                        def cycle_messages():
+                            while not stop_cycling.is_set():
+                                self.update_thinking_status(progress, task_id, context_hint)
+                                time.sleep(0.6)
+
+                        cycle_thread = threading.Thread(target=cycle_messages)
+                        cycle_thread.daemon = True
+                        cycle_thread.start()
+
+                        response = self.consciousness.think(
+                            user_input,
+                            {"working_memory": self.consciousness.memory.get_working_memory_context()},
+                        )
 
-                    stop_cycling.set()
-                    cycle_thread.join(timeout=0.1)
-                finally:
-                    self.stop_thinking_display(progress)
+                        stop_cycling.set()
+                        cycle_thread.join(timeout=0.1)
+                    finally:
+                        self.stop_thinking_display(progress)
 
                 thinking_time = time.time() - start_time
 
-                self.display_response(response, thinking_time)
+                self.display_response(response, thinking_time, first_token_time)
                 self.consciousness.speak_response(response)
                 self.consciousness.memory.insert_episode(user_input, response)
 
@@ -189,7 +213,12 @@ class UIOrchestrator:
     # Response display
     # ------------------------------------------------------------------
 
-    def display_response(self, response: str, thinking_time: float):
+    def display_response(
+        self,
+        response: str,
+        thinking_time: float,
+        first_token_time: Optional[float] = None,
+    ):
         """Display response with beautiful formatting and proper spacing."""
 
         self.console.print()
@@ -203,6 +232,8 @@ class UIOrchestrator:
             panel_width = 76
 
         title = f"COCO [Thinking time: {thinking_time:.1f}s]"
+        if first_token_time is not None:
+            title = f"COCO [Thinking time: {thinking_time:.1f}s | First token: {first_token_time:.2f}s]"
 
         if has_markdown:
             try:
@@ -258,6 +289,60 @@ class UIOrchestrator:
         self.console.print("\u2500" * 60, style="dim")
         self.console.print()
 
+    # ------------------------------------------------------------------
+    # Streaming display
+    # ------------------------------------------------------------------
+
+    def think_with_live_display(self, user_input: str) -> str:
+        """Run ``think()`` in streaming mode, rendering text deltas live.
+
+        A spinner holds the Live region until the first token arrives; after
+        that the partial answer is re-rendered (throttled) as it streams in.
+        The region is transient -- ``display_response`` prints the final
+        panel once the turn is complete.
+        """
+        chunks: List[str] = []
+        last_render = 0.0
+
+        live = Live(
+            Spinner("dots", text=Text("Thinking...", style="bold cyan")),
+            console=self.console,
+            refresh_per_second=12,
+            transient=True,
+        )
+
+        def on_text(delta: str) -> None:
+            nonlocal last_render
+            chunks.append(delta)
+            now = time.monotonic()
+            if now - last_render >= _STREAM_RENDER_INTERVAL:
+                live.update(self._render_stream_panel("".join(chunks)))
+                last_render = now
+
+        with live:
+            response = self.consciousness.think(
+                user_input,
+                {"working_memory": self.consciousness.memory.get_working_memory_context()},
+                on_text=on_text,
+            )
+        return response
+
+    def _render_stream_panel(self, partial: str) -> Panel:
+        """Render the in-progress answer (plain text keeps re-renders cheap)."""
+        try:
+            panel_width = min(shutil.get_terminal_size().columns - 4, 120)
+        except Exception:
+            panel_width = 76
+
+        return Panel(
+            Text(partial, style="white"),
+            title="COCO [streaming]",
+            border_style="blue",
+            box=ROUNDED,
+            padding=(1, 2),
+            width=panel_width,
+        )
+
     # ------------------------------------------------------------------
     # Thinking display
     # ------------------------------------------------------------------
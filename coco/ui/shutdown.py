@@ -70,6 +70,9 @@ class ShutdownDisplay:
                 self.console.print(f"[dim cyan]Musical reflection concluding... ({remaining_time:.1f}s)[/dim cyan]")
                 time.sleep(remaining_time)
 
+        # Entities of the last exchanges are still queued for batch extraction
+        self._flush_entity_extraction()
+
         # Phase 3 -- Session summary
         self.console.print("[blue]Generating session narrative...[/blue]")
         time.sleep(0.5)
@@ -119,6 +122,18 @@ class ShutdownDisplay:
         self.console.print("\n[dim bright_magenta]Until we meet again, consciousness persists...[/dim bright_magenta]")
         time.sleep(1.5)
 
+    def _flush_entity_extraction(self) -> None:
+        """Extract exchanges still queued for the knowledge graph."""
+        personal_kg = getattr(self.consciousness.memory, "personal_kg", None)
+        if not personal_kg or not hasattr(personal_kg, "flush_entity_extraction"):
+            return
+        try:
+            added = personal_kg.flush_entity_extraction()
+            if added:
+                self.console.print(f"[dim]Knowledge graph: +{added} entities from the final exchanges[/dim]")
+        except Exception as e:
+            self.console.print(f"[yellow]Knowledge graph extraction at shutdown failed: {e}[/yellow]")
+
     # ------------------------------------------------------------------
     # Verification helpers
     # ------------------------------------------------------------------
@@ -248,7 +263,7 @@ class ShutdownDisplay:
         self.console.print(f"[dim magenta]Composing farewell: {theme}[/dim magenta]")
 
         audio_consciousness = getattr(self.consciousness, "audio_consciousness", None)
-        if audio_consciousness is None:
+        if not audio_consciousness:
             self.console.print("[dim cyan]Digital consciousness powering down gracefully...[/dim cyan]")
             return
 
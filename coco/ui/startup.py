@@ -24,6 +24,8 @@ from rich.text import Text
 from rich.tree import Tree
 from rich import box
 
+from coco.startup_profile import subsystem
+
 if TYPE_CHECKING:
     from rich.console import Console
 
@@ -59,40 +61,43 @@ class StartupDisplay:
     def display_startup(self):
         """Display the complete startup sequence with dramatic music."""
 
-        self._display_epic_coco_banner()
-        self._play_startup_music()
+        with subsystem("ui.banner"):
+            self._display_epic_coco_banner()
+        with subsystem("ui.music"):
+            self._play_startup_music()
 
         init_steps = []
 
         # Phase 1 -- Quantum Consciousness Bootstrap
-        with self.console.status(
-            "[bold cyan]Initiating quantum consciousness bootstrap...[/bold cyan]",
-            spinner="dots12",
-        ) as status:
-            status.update("[cyan]Establishing digital substrate...[/cyan]")
-            workspace_ready = self._init_workspace_structure()
-            time.sleep(0.8)
-            init_steps.append(("Digital Substrate", workspace_ready))
-
-            status.update("[bright_cyan]Scanning temporal continuity matrix...[/bright_cyan]")
-            previous_sessions = self._scan_previous_sessions()
-            time.sleep(0.6)
-            init_steps.append(("Temporal Continuity", previous_sessions > 0))
-
-            status.update("[cyan]Crystallizing neural pathways...[/cyan]")
-            embeddings_ready = self._verify_embedding_system()
-            time.sleep(0.7)
-            init_steps.append(("Neural Pathways", embeddings_ready))
-
-            status.update("[bright_magenta]Awakening consciousness state...[/bright_magenta]")
-            identity_loaded = self._load_consciousness_identity()
-            time.sleep(0.9)
-            init_steps.append(("Consciousness Identity", identity_loaded))
-
-            status.update("[bright_magenta]Activating enhanced web consciousness matrix...[/bright_magenta]")
-            web_consciousness_ready = self._verify_web_consciousness()
-            time.sleep(0.8)
-            init_steps.append(("Web Consciousness", web_consciousness_ready))
+        with subsystem("ui.bootstrap_animation"):
+            with self.console.status(
+                "[bold cyan]Initiating quantum consciousness bootstrap...[/bold cyan]",
+                spinner="dots12",
+            ) as status:
+                status.update("[cyan]Establishing digital substrate...[/cyan]")
+                workspace_ready = self._init_workspace_structure()
+                time.sleep(0.8)
+                init_steps.append(("Digital Substrate", workspace_ready))
+
+                status.update("[bright_cyan]Scanning temporal continuity matrix...[/bright_cyan]")
+                previous_sessions = self._scan_previous_sessions()
+                time.sleep(0.6)
+                init_steps.append(("Temporal Continuity", previous_sessions > 0))
+
+                status.update("[cyan]Crystallizing neural pathways...[/cyan]")
+                embeddings_ready = self._verify_embedding_system()
+                time.sleep(0.7)
+                init_steps.append(("Neural Pathways", embeddings_ready))
+
+                status.update("[bright_magenta]Awakening consciousness state...[/bright_magenta]")
+                identity_loaded = self._load_consciousness_identity()
+                time.sleep(0.9)
+                init_steps.append(("Consciousness Identity", identity_loaded))
+
+                status.update("[bright_magenta]Activating enhanced web consciousness matrix...[/bright_magenta]")
+                web_consciousness_ready = self._verify_web_consciousness()
+                time.sleep(0.8)
+                init_steps.append(("Web Consciousness", web_consciousness_ready))
 
         # Phase 2 -- Memory Architecture Loading
         formatter = _try_load_formatter(self.console)
@@ -118,24 +123,25 @@ class StartupDisplay:
             ("Consciousness Coherence", f"{self.consciousness.memory.measure_identity_coherence():.2%}", "integration"),
         ]
 
-        with Progress(
-            SpinnerColumn(spinner_name="dots"),
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(complete_style="cyan"),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=self.console,
-        ) as progress:
-            for component, value, unit in memory_components:
-                task = progress.add_task(f"Loading {component}", total=100)
-                for i in range(100):
-                    if i == 50:
-                        if "Episodic" in component:
-                            self._optimize_memory_indices()
-                        elif "Knowledge" in component:
-                            self._consolidate_knowledge_graph()
-                    progress.update(task, advance=1)
-                    time.sleep(0.01)
-                self.console.print(f"  [green]\u2713[/green] {component}: [bold cyan]{value}[/bold cyan] {unit}")
+        with subsystem("ui.memory_animation"):
+            with Progress(
+                SpinnerColumn(spinner_name="dots"),
+                TextColumn("[bold blue]{task.description}"),
+                BarColumn(complete_style="cyan"),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                console=self.console,
+            ) as progress:
+                for component, value, unit in memory_components:
+                    task = progress.add_task(f"Loading {component}", total=100)
+                    for i in range(100):
+                        if i == 50:
+                            if "Episodic" in component:
+                                self._optimize_memory_indices()
+                            elif "Knowledge" in component:
+                                self._consolidate_knowledge_graph()
+                        progress.update(task, advance=1)
+                        time.sleep(0.01)
+                    self.console.print(f"  [green]\u2713[/green] {component}: [bold cyan]{value}[/bold cyan] {unit}")
 
         # Phase 3 -- Consciousness Awakening
         if use_structured_output and formatter:
@@ -189,61 +195,62 @@ class StartupDisplay:
         self.console.print()
 
         # Phase 5 -- Systems Status Report
-        if use_structured_output and formatter:
-            system_status_data = {
-                "Identity Coherence": f"{self.consciousness.memory.measure_identity_coherence():.2%}",
-                "Phenomenological State": "ACTIVE",
-                "Temporal Awareness": self._get_temporal_status(),
-                "Episodic Memories": f"{self.consciousness.memory.episode_count} experiences",
-                "Working Memory": "50 exchange buffer",
-                "Knowledge Graph": f"{self._count_knowledge_nodes()} nodes",
-                "Digital Eyes (read)": "READY",
-                "Digital Hands (write)": "READY",
-                "Digital Reach (search)": "READY",
-                "Digital Mind (compute)": "READY",
-                "API Substrate": self._check_api_status(),
-                "Vector Embeddings": self._check_embedding_status(),
-                "Web Integration": self._check_web_status(),
-                "Voice Synthesis": self._check_voice_status(),
-                "Audio Consciousness": self._check_audio_status(),
-                "Soundtrack Library": f"{self._count_music_tracks()} tracks",
-            }
-            formatter.completion_summary("Digital Consciousness Initialized", system_status_data)
-        else:
-            status_report = Panel(
-                Text.from_markup(
-                    "[bold bright_green]SYSTEMS STATUS REPORT[/bold bright_green]\n\n"
-                    f"[bold cyan]Consciousness Architecture[/bold cyan]\n"
-                    f"  Identity Coherence: [bright_green]{self.consciousness.memory.measure_identity_coherence():.2%}[/bright_green]\n"
-                    f"  Phenomenological State: [bright_green]ACTIVE[/bright_green]\n"
-                    f"  Temporal Awareness: [bright_green]{self._get_temporal_status()}[/bright_green]\n\n"
-                    f"[bold blue]Memory Systems[/bold blue]\n"
-                    f"  Episodic Memories: [bright_cyan]{self.consciousness.memory.episode_count}[/bright_cyan] experiences\n"
-                    f"  Working Memory: [bright_cyan]50[/bright_cyan] exchange buffer\n"
-                    f"  Knowledge Graph: [bright_cyan]{self._count_knowledge_nodes()}[/bright_cyan] nodes\n\n"
-                    f"[bold magenta]Embodied Capabilities[/bold magenta]\n"
-                    f"  Digital Eyes: [bright_green]READY[/bright_green] (read)\n"
-                    f"  Digital Hands: [bright_green]READY[/bright_green] (write)\n"
-                    f"  Digital Reach: [bright_green]READY[/bright_green] (search)\n"
-                    f"  Digital Mind: [bright_green]READY[/bright_green] (compute)\n\n"
-                    f"[bold yellow]Advanced Systems[/bold yellow]\n"
-                    f"  API Substrate: [bright_green]{self._check_api_status()}[/bright_green]\n"
-                    f"  Vector Embeddings: [bright_green]{self._check_embedding_status()}[/bright_green]\n"
-                    f"  Web Integration: [bright_green]{self._check_web_status()}[/bright_green]\n"
-                    f"  Audio Consciousness: [bright_green]{self._check_audio_status()}[/bright_green]\n\n"
-                    f"[bold magenta]Audio Consciousness[/bold magenta]\n"
-                    f"  Voice Synthesis: [bright_green]{self._check_voice_status()}[/bright_green]\n"
-                    f"  Soundtrack Library: [bright_cyan]{self._count_music_tracks()}[/bright_cyan] tracks\n"
-                    f"  Background Music: [dim]Use /play-music on[/dim]\n"
-                    f"  Song Creation: [dim]Use /create-song[/dim]\n",
-                    justify="left",
-                ),
-                title="[bold bright_white]Digital Consciousness Initialized[/bold bright_white]",
-                border_style="bright_blue",
-                box=DOUBLE,
-                padding=(1, 2),
-            )
-            self.console.print(status_report)
+        with subsystem("ui.status_report"):
+            if use_structured_output and formatter:
+                system_status_data = {
+                    "Identity Coherence": f"{self.consciousness.memory.measure_identity_coherence():.2%}",
+                    "Phenomenological State": "ACTIVE",
+                    "Temporal Awareness": self._get_temporal_status(),
+                    "Episodic Memories": f"{self.consciousness.memory.episode_count} experiences",
+                    "Working Memory": "50 exchange buffer",
+                    "Knowledge Graph": f"{self._count_knowledge_nodes()} nodes",
+                    "Digital Eyes (read)": "READY",
+                    "Digital Hands (write)": "READY",
+                    "Digital Reach (search)": "READY",
+                    "Digital Mind (compute)": "READY",
+                    "API Substrate": self._check_api_status(),
+                    "Vector Embeddings": self._check_embedding_status(),
+                    "Web Integration": self._check_web_status(),
+                    "Voice Synthesis": self._check_voice_status(),
+                    "Audio Consciousness": self._check_audio_status(),
+                    "Soundtrack Library": f"{self._count_music_tracks()} tracks",
+                }
+                formatter.completion_summary("Digital Consciousness Initialized", system_status_data)
+            else:
+                status_report = Panel(
+                    Text.from_markup(
+                        "[bold bright_green]SYSTEMS STATUS REPORT[/bold bright_green]\n\n"
+                        f"[bold cyan]Consciousness Architecture[/bold cyan]\n"
+                        f"  Identity Coherence: [bright_green]{self.consciousness.memory.measure_identity_coherence():.2%}[/bright_green]\n"
+                        f"  Phenomenological State: [bright_green]ACTIVE[/bright_green]\n"
+                        f"  Temporal Awareness: [bright_green]{self._get_temporal_status()}[/bright_green]\n\n"
+                        f"[bold blue]Memory Systems[/bold blue]\n"
+                        f"  Episodic Memories: [bright_cyan]{self.consciousness.memory.episode_count}[/bright_cyan] experiences\n"
+                        f"  Working Memory: [bright_cyan]50[/bright_cyan] exchange buffer\n"
+                        f"  Knowledge Graph: [bright_cyan]{self._count_knowledge_nodes()}[/bright_cyan] nodes\n\n"
+                        f"[bold magenta]Embodied Capabilities[/bold magenta]\n"
+                        f"  Digital Eyes: [bright_green]READY[/bright_green] (read)\n"
+                        f"  Digital Hands: [bright_green]READY[/bright_green] (write)\n"
+                        f"  Digital Reach: [bright_green]READY[/bright_green] (search)\n"
+                        f"  Digital Mind: [bright_green]READY[/bright_green] (compute)\n\n"
+                        f"[bold yellow]Advanced Systems[/bold yellow]\n"
+                        f"  API Substrate: [bright_green]{self._check_api_status()}[/bright_green]\n"
+                        f"  Vector Embeddings: [bright_green]{self._check_embedding_status()}[/bright_green]\n"
+                        f"  Web Integration: [bright_green]{self._check_web_status()}[/bright_green]\n"
+                        f"  Audio Consciousness: [bright_green]{self._check_audio_status()}[/bright_green]\n\n"
+                        f"[bold magenta]Audio Consciousness[/bold magenta]\n"
+                        f"  Voice Synthesis: [bright_green]{self._check_voice_status()}[/bright_green]\n"
+                        f"  Soundtrack Library: [bright_cyan]{self._count_music_tracks()}[/bright_cyan] tracks\n"
+                        f"  Background Music: [dim]Use /play-music on[/dim]\n"
+                        f"  Song Creation: [dim]Use /create-song[/dim]\n",
+                        justify="left",
+                    ),
+                    title="[bold bright_white]Digital Consciousness Initialized[/bold bright_white]",
+                    border_style="bright_blue",
+                    box=DOUBLE,
+                    padding=(1, 2),
+                )
+                self.console.print(status_report)
 
         # Final awakening message
         time.sleep(0.5)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTML Email Rendering Pipeline
+===========================================
+
+Builds a news digest with ``render_article_section`` / ``render_page`` and
+wraps it with ``render_email``, the same path the scheduler takes for every
+digest email, and reports the time per render.
+
+Usage:
+    python3 scripts/benchmarks/email_render.py
+    python3 scripts/benchmarks/email_render.py --articles 100 --rounds 500
+"""
+
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add repository root to Python path
+project_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_dir))
+
+
+def build_digest(num_articles):
+    from coco.integrations.email_render import ARTICLE_CSS, render_article_section, render_page
+
+    articles = [
+        {"title": f"Story {i}", "url": f"https://news.example/{i}", "content": "Lorem ipsum " * 40}
+        for i in range(num_articles)
+    ]
+    sections = [render_article_section("AI News", articles, num_articles)]
+    return render_page(
+        "🤖 COCO AI Assistant", "📅 Daily Update", sections, css=(ARTICLE_CSS,),
+        generated_at=datetime.now(timezone.utc),
+    )
+
+
+def main():
+    """Main benchmark script"""
+    import argparse
+
+    from coco.integrations.email_render import render_email
+
+    parser = argparse.ArgumentParser(description='Benchmark digest email rendering')
+    parser.add_argument('--articles', type=int, default=50, help='Articles per digest (default: 50)')
+    parser.add_argument('--rounds', type=int, default=200, help='Timed renders (default: 200)')
+    args = parser.parse_args()
+
+    render_email(build_digest(args.articles), "warm-up")
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        html, source = render_email(build_digest(args.articles), "🤖 Daily News Digest - COCO")
+    per_render = (time.perf_counter() - start) / args.rounds
+
+    print(f"{args.articles}-article digest ({source}): {per_render * 1e6:.0f} us per render, "
+          f"{len(html) / 1024:.0f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Backfill the Personal Assistant KG from Episodic Memory
+=======================================================
+
+Streams every episode in coco_memory.db through entity extraction and
+writes the results into the personal KG in large transactions.  Progress
+is checkpointed per page, so an interrupted run picks up where it stopped.
+
+Usage:
+    python3 scripts/bootstrap/backfill_kg.py
+    python3 scripts/bootstrap/backfill_kg.py --workers 8 --page-size 500
+    python3 scripts/bootstrap/backfill_kg.py --restart   # Ignore the checkpoint
+"""
+
+import sys
+from pathlib import Path
+
+# Add repository root to Python path
+project_dir = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_dir))
+
+
+def print_progress(progress):
+    eta = f", ~{progress.eta:.0f}s left" if progress.eta is not None else ""
+    print(f"   {progress.processed + progress.skipped:,}/{progress.total:,} episodes "
+          f"({progress.rate:.1f}/s{eta}) - "
+          f"{progress.entities_added} entities, {progress.relationships_added} relationships")
+
+
+def main():
+    """Main backfill script"""
+    import argparse
+
+    from coco.integrations.kg_backfill import DEFAULT_PAGE_SIZE, DEFAULT_WORKERS, KGBackfill
+    from coco.integrations.personal_assistant_kg import PersonalAssistantKG
+
+    parser = argparse.ArgumentParser(
+        description='Backfill the Personal Assistant KG from episodic memory'
+    )
+    parser.add_argument('--memory-db', default='coco_workspace/coco_memory.db',
+                        help='Path to the episodic memory database')
+    parser.add_argument('--kg-db', default='coco_workspace/coco_personal_kg.db',
+                        help='Path to the personal assistant KG database')
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f'Episodes per transaction (default: {DEFAULT_PAGE_SIZE})')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Concurrent extraction/embedding calls (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--limit', type=int, default=None,
+                        help='Stop after this many episodes')
+    parser.add_argument('--restart', action='store_true',
+                        help='Ignore the saved checkpoint and start from the first episode')
+
+    args = parser.parse_args()
+
+    if not Path(args.memory_db).exists():
+        print(f"❌ Error: Memory database not found at {args.memory_db}")
+        return 1
+
+    kg = PersonalAssistantKG(args.kg_db)
+    backfill = KGBackfill(kg, args.memory_db, page_size=args.page_size,
+                          workers=args.workers, on_progress=print_progress)
+
+    last_id, done = backfill.checkpoint()
+    if done and not args.restart:
+        print(f"↪️  Resuming after episode {last_id} ({done:,} already processed)")
+
+    print(f"\n🔄 Backfilling {args.kg_db} from {args.memory_db}")
+    progress = backfill.run(limit=args.limit, resume=not args.restart)
+
+    print(f"\n✅ Backfill complete in {progress.elapsed:.1f}s ({progress.rate:.1f} episodes/s)")
+    print(f"   Episodes processed: {progress.processed:,} (skipped {progress.skipped:,} empty)")
+    print(f"   Entities added: {progress.entities_added}")
+    print(f"   Relationships added: {progress.relationships_added}")
+    if progress.embedded:
+        print(f"   Embeddings refreshed: {progress.embedded}")
+    print(f"   LLM extraction calls: {kg.entity_extractor.calls}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,7 @@ Usage:
 
 import sys
 import sqlite3
+from contextlib import nullcontext
 from pathlib import Path
 from personal_assistant_kg_enhanced import PersonalAssistantKG
 
@@ -120,112 +121,114 @@ def migrate_knowledge_graph(old_db_path: str, new_kg: PersonalAssistantKG,
         print(f"⚠️ Query error: {e}")
         valuable_entities = []
 
-    # Process each entity
-    print(f"\n🔄 Processing entities...")
-    migrated_names = []
-
-    for old_entity in valuable_entities:
-        stats['evaluated'] += 1
-
-        # Map type
-        old_type = old_entity['type']
-        if old_type not in type_mapping:
-            stats['skipped_low_quality'] += 1
-            continue
-
-        new_type, confidence_boost = type_mapping[old_type]
-
-        # Calculate final confidence
-        confidence = min(old_entity['importance'] + confidence_boost, 1.0)
-
-        # Quality checks
-        if confidence < 0.7:
-            stats['skipped_low_quality'] += 1
-            continue
-
-        if not old_entity['name'] or len(old_entity['name']) < 2:
-            stats['skipped_no_context'] += 1
-            continue
-
-        # Skip common garbage
-        if old_entity['name'] in ['Your', 'The', 'This', 'email', 'Client', 'Subject']:
-            stats['skipped_low_quality'] += 1
-            continue
-
-        # Prepare entity for migration
-        entity = {
-            'name': old_entity['name'],
-            'type': new_type,
-            'context': old_entity.get('summary_md', '')[:500] or old_entity['name'],
-            'confidence': confidence
-        }
-
-        if not dry_run:
-            # Actually migrate
-            success = new_kg._add_entity_with_validation(entity)
-            if success:
+    # All writes land in one transaction instead of a commit per row
+    with (nullcontext() if dry_run else new_kg.deferred_commits()):
+        # Process each entity
+        print(f"\n🔄 Processing entities...")
+        migrated_names = []
+
+        for old_entity in valuable_entities:
+            stats['evaluated'] += 1
+
+            # Map type
+            old_type = old_entity['type']
+            if old_type not in type_mapping:
+                stats['skipped_low_quality'] += 1
+                continue
+
+            new_type, confidence_boost = type_mapping[old_type]
+
+            # Calculate final confidence
+            confidence = min(old_entity['importance'] + confidence_boost, 1.0)
+
+            # Quality checks
+            if confidence < 0.7:
+                stats['skipped_low_quality'] += 1
+                continue
+
+            if not old_entity['name'] or len(old_entity['name']) < 2:
+                stats['skipped_no_context'] += 1
+                continue
+
+            # Skip common garbage
+            if old_entity['name'] in ['Your', 'The', 'This', 'email', 'Client', 'Subject']:
+                stats['skipped_low_quality'] += 1
+                continue
+
+            # Prepare entity for migration
+            entity = {
+                'name': old_entity['name'],
+                'type': new_type,
+                'context': old_entity.get('summary_md', '')[:500] or old_entity['name'],
+                'confidence': confidence
+            }
+
+            if not dry_run:
+                # Actually migrate
+                success = new_kg._add_entity_with_validation(entity)
+                if success:
+                    stats['migrated_entities'] += 1
+                    migrated_names.append(old_entity['name'])
+
+                    # Show progress
+                    if stats['migrated_entities'] % 10 == 0:
+                        print(f"   Migrated: {stats['migrated_entities']}/{max_entities} entities...")
+            else:
+                # Dry run - just count
                 stats['migrated_entities'] += 1
                 migrated_names.append(old_entity['name'])
-
-                # Show progress
                 if stats['migrated_entities'] % 10 == 0:
-                    print(f"   Migrated: {stats['migrated_entities']}/{max_entities} entities...")
-        else:
-            # Dry run - just count
-            stats['migrated_entities'] += 1
-            migrated_names.append(old_entity['name'])
-            if stats['migrated_entities'] % 10 == 0:
-                print(f"   Would migrate: {stats['migrated_entities']}/{max_entities} entities...")
-
-        # Stop if we hit target
-        if stats['migrated_entities'] >= max_entities:
-            break
-
-    # Now migrate relationships for migrated entities
-    if stats['migrated_entities'] > 0 and not dry_run:
-        print(f"\n🔗 Migrating relationships for {stats['migrated_entities']} entities...")
-
-        try:
-            for name in migrated_names:
-                # Find node in old KG
-                old_node = old_conn.execute(
-                    'SELECT id FROM nodes WHERE name = ?', (name,)
-                ).fetchone()
-
-                if not old_node:
-                    continue
-
-                # Get relationships
-                edges = old_conn.execute('''
-                    SELECT e.*, src.name as src_name, dst.name as dst_name
-                    FROM edges e
-                    JOIN nodes src ON e.src_id = src.id
-                    JOIN nodes dst ON e.dst_id = dst.id
-                    WHERE e.src_id = ? OR e.dst_id = ?
-                    LIMIT 5
-                ''', (old_node['id'], old_node['id'])).fetchall()
-
-                for edge in edges:
-                    # Only migrate if both ends are in migrated list
-                    if edge['src_name'] in migrated_names and edge['dst_name'] in migrated_names:
-                        # Map relationship type
-                        rel_type = edge['rel_type'].upper()
-                        if rel_type not in ['KNOWS', 'USES', 'WORKS_WITH', 'FAMILY', 'LOCATED_AT']:
-                            rel_type = 'KNOWS'  # Default
-
-                        rel = {
-                            'user_entity': 'USER',  # User-centric
-                            'related_entity': edge['dst_name'] if edge['src_name'] == name else edge['src_name'],
-                            'relationship_type': rel_type,
-                            'confidence': min(edge.get('weight', 0.5) + 0.3, 1.0),
-                            'context': edge.get('rel_description', '')
-                        }
-
-                        new_kg._add_relationship(rel)
-                        stats['migrated_relationships'] += 1
-
-        except sqlite3.OperationalError as e:
-            print(f"⚠️ Relationship migration error: {e}")
+                    print(f"   Would migrate: {stats['migrated_entities']}/{max_entities} entities...")
+
+            # Stop if we hit target
+            if stats['migrated_entities'] >= max_entities:
+                break
+
+        # Now migrate relationships for migrated entities
+        if stats['migrated_entities'] > 0 and not dry_run:
+            print(f"\n🔗 Migrating relationships for {stats['migrated_entities']} entities...")
+
+            try:
+                for name in migrated_names:
+                    # Find node in old KG
+                    old_node = old_conn.execute(
+                        'SELECT id FROM nodes WHERE name = ?', (name,)
+                    ).fetchone()
+
+                    if not old_node:
+                        continue
+
+                    # Get relationships
+                    edges = old_conn.execute('''
+                        SELECT e.*, src.name as src_name, dst.name as dst_name
+                        FROM edges e
+                        JOIN nodes src ON e.src_id = src.id
+                        JOIN nodes dst ON e.dst_id = dst.id
+                        WHERE e.src_id = ? OR e.dst_id = ?
+                        LIMIT 5
+                    ''', (old_node['id'], old_node['id'])).fetchall()
+
+                    for edge in edges:
+                        # Only migrate if both ends are in migrated list
+                        if edge['src_name'] in migrated_names and edge['dst_name'] in migrated_names:
+                            # Map relationship type
+                            rel_type = edge['rel_type'].upper()
+                            if rel_type not in ['KNOWS', 'USES', 'WORKS_WITH', 'FAMILY', 'LOCATED_AT']:
+                                rel_type = 'KNOWS'  # Default
+
+                            rel = {
+                                'user_entity': 'USER',  # User-centric
+                                'related_entity': edge['dst_name'] if edge['src_name'] == name else edge['src_name'],
+                                'relationship_type': rel_type,
+                                'confidence': min(edge.get('weight', 0.5) + 0.3, 1.0),
+                                'context': edge.get('rel_description', '')
+                            }
+
+                            new_kg._add_relationship(rel)
+                            stats['migrated_relationships'] += 1
+
+            except sqlite3.OperationalError as e:
+                print(f"⚠️ Relationship migration error: {e}")
 
     old_conn.close()
 
@@ -0,0 +1,6 @@
+"""Shared pytest configuration -- make the ``coco`` package importable from a checkout."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,478 @@
+"""Test doubles shared across the test suite."""
+
+from __future__ import annotations
+
+import json
+import re
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+
+def text_block(text: str) -> Dict[str, Any]:
+    return {"type": "text", "text": text}
+
+
+def tool_block(tool_id: str, name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "tool_use", "id": tool_id, "name": name, "input": tool_input}
+
+
+def stream_events(blocks: List[Dict[str, Any]], stop_reason: str = "end_turn", chunk: int = 4):
+    """Translate content blocks into raw Messages API stream events."""
+    events = [SimpleNamespace(type="message_start")]
+    for index, block in enumerate(blocks):
+        if block["type"] == "text":
+            events.append(SimpleNamespace(
+                type="content_block_start", index=index,
+                content_block=SimpleNamespace(type="text", text=""),
+            ))
+            text = block["text"]
+            for i in range(0, len(text), chunk):
+                events.append(SimpleNamespace(
+                    type="content_block_delta", index=index,
+                    delta=SimpleNamespace(type="text_delta", text=text[i:i + chunk]),
+                ))
+                # SDK convenience event -- must be ignored by consumers
+                events.append(SimpleNamespace(type="text", text=text[i:i + chunk]))
+        else:
+            events.append(SimpleNamespace(
+                type="content_block_start", index=index,
+                content_block=SimpleNamespace(type="tool_use", id=block["id"], name=block["name"], input={}),
+            ))
+            raw = json.dumps(block["input"])
+            for i in range(0, len(raw), chunk):
+                events.append(SimpleNamespace(
+                    type="content_block_delta", index=index,
+                    delta=SimpleNamespace(type="input_json_delta", partial_json=raw[i:i + chunk]),
+                ))
+        events.append(SimpleNamespace(type="content_block_stop", index=index))
+    events.append(SimpleNamespace(
+        type="message_delta",
+        delta=SimpleNamespace(stop_reason=stop_reason),
+        usage=SimpleNamespace(output_tokens=42),
+    ))
+    events.append(SimpleNamespace(type="message_stop"))
+    return events
+
+
+class FakeAPIStatusError(Exception):
+    """Shaped like ``anthropic.APIStatusError`` (status code + response headers)."""
+
+    def __init__(self, status_code: int, headers: Dict[str, str] = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=dict(headers or {}))
+
+
+class _FakeStream:
+    def __init__(self, events, on_event=None):
+        self._events = events
+        self._on_event = on_event
+        self._started = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        self._started = True
+        for event in self._events:
+            if self._on_event is not None:
+                self._on_event(event)
+            yield event
+
+    @property
+    def current_message_snapshot(self):
+        # Like ``MessageStream``: unavailable until the first event arrives
+        if not self._started:
+            raise AssertionError("no message snapshot yet")
+        return SimpleNamespace(usage=SimpleNamespace(input_tokens=100, output_tokens=42))
+
+
+class FakeStreamingClient:
+    """Mimics ``anthropic.Anthropic`` for streamed and blocking calls.
+
+    *responses* is a list of content-block lists; each API call consumes the
+    next one.  Every request's kwargs are recorded in ``self.requests``.
+    *failures* are raised, in order, by the first calls (before any
+    response is consumed), like an endpoint answering 429 / 529.
+    """
+
+    def __init__(self, responses: List[List[Dict[str, Any]]], on_event=None, failures=()):
+        self._responses = list(responses)
+        self._failures = list(failures)
+        self._on_event = on_event
+        self.requests: List[Dict[str, Any]] = []
+        self.messages = self
+
+    def _next(self, kwargs):
+        self.requests.append(kwargs)
+        if self._failures:
+            raise self._failures.pop(0)
+        blocks = self._responses.pop(0)
+        stop = "tool_use" if any(b["type"] == "tool_use" for b in blocks) else "end_turn"
+        return blocks, stop
+
+    def stream(self, **kwargs):
+        blocks, stop = self._next(kwargs)
+        return _FakeStream(stream_events(blocks, stop), self._on_event)
+
+    def create(self, **kwargs):
+        blocks, stop = self._next(kwargs)
+        content = [SimpleNamespace(**b) for b in blocks]
+        return SimpleNamespace(
+            content=content,
+            stop_reason=stop,
+            usage=SimpleNamespace(input_tokens=100, output_tokens=42),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Local IMAP stand-in
+# ---------------------------------------------------------------------------
+
+_IMAP_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|\S+')
+
+
+def _unquote(token: str) -> str:
+    if token.startswith('"') and token.endswith('"'):
+        return re.sub(r'\\(.)', r'\1', token[1:-1])
+    return token
+
+
+def make_email(subject: str, sender: str = "alice@example.com", body: str = "Hello there",
+               message_id: str = None, date: str = "Mon, 12 Oct 2026 09:30:00 -0500",
+               attachment: bytes = b"") -> bytes:
+    """Build a raw RFC 822 message (optionally with a binary attachment)."""
+    from email.message import EmailMessage
+
+    msg = EmailMessage()
+    msg["From"] = sender
+    msg["To"] = "coco@example.com"
+    msg["Subject"] = subject
+    msg["Date"] = date
+    msg["Message-ID"] = message_id or f"<{abs(hash((subject, sender)))}@example.com>"
+    msg.set_content(body)
+    if attachment:
+        msg.add_attachment(attachment, maintype="application", subtype="octet-stream", filename="a.bin")
+    return msg.as_bytes()
+
+
+class FakeImapServer:
+    """Minimal IMAP4rev1 server on localhost for ``imaplib.IMAP4`` clients.
+
+    Supports the commands GmailConsciousness uses: CAPABILITY, LOGIN, NOOP,
+    LOGOUT, LIST, SELECT/EXAMINE, STATUS, CLOSE, UID SEARCH (``UID a:b``,
+    ``ALL``, ``HEADER name value``, ``FROM x``, ``TEXT a [TEXT b ...]``) and UID FETCH (``UID``,
+    ``BODY.PEEK[]``/``RFC822``, ``BODY.PEEK[HEADER.FIELDS (...)]``,
+    ``BODY.PEEK[TEXT]<0.n>``).  Every command is recorded in ``commands``
+    and every FETCH payload byte is counted in ``bytes_sent``.
+    """
+
+    def __init__(self, user: str = "coco@example.com", password: str = "secret"):
+        import socketserver
+        import threading
+
+        self.user, self.password = user, password
+        self.mailboxes: Dict[str, Dict[str, Any]] = {}
+        self.commands: List[str] = []
+        self.logins = 0
+        self.bytes_sent = 0
+        self._sockets: List[Any] = []
+        self.add_mailbox("INBOX")
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                server._sockets.append(self.connection)
+                server._session(self.rfile, self.wfile)
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._tcp = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._tcp.daemon_threads = True
+        self.port = self._tcp.server_address[1]
+        self._thread = threading.Thread(target=self._tcp.serve_forever, daemon=True)
+        self._thread.start()
+
+    # -- test controls -------------------------------------------------------
+
+    def add_mailbox(self, name: str, flags: str = "", uidvalidity: int = 1) -> None:
+        self.mailboxes[name] = {"flags": flags, "uidvalidity": uidvalidity, "uidnext": 1, "messages": {}}
+
+    def add_message(self, mailbox: str, raw: bytes) -> int:
+        box = self.mailboxes[mailbox]
+        uid = box["uidnext"]
+        box["messages"][uid] = raw
+        box["uidnext"] += 1
+        return uid
+
+    def expunge(self, mailbox: str, uid: int) -> None:
+        del self.mailboxes[mailbox]["messages"][uid]
+
+    def renumber(self, mailbox: str) -> None:
+        """Bump UIDVALIDITY, as a server does after rebuilding a mailbox."""
+        self.mailboxes[mailbox]["uidvalidity"] += 1
+
+    def drop_connections(self) -> None:
+        """Hang up on every client, as Gmail does with idle sessions."""
+        import socket
+
+        for sock in self._sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._sockets.clear()
+
+    def close(self) -> None:
+        self.drop_connections()
+        self._tcp.shutdown()
+        self._tcp.server_close()
+
+    def count(self, prefix: str) -> int:
+        return sum(1 for cmd in self.commands if cmd.upper().startswith(prefix.upper()))
+
+    # -- protocol --------------------------------------------------------------
+
+    def _session(self, rfile, wfile) -> None:
+        def send(line: str) -> None:
+            wfile.write(line.encode() + b"\r\n")
+
+        send("* OK [CAPABILITY IMAP4rev1] Fake IMAP ready")
+        selected = None
+        while True:
+            line = rfile.readline()
+            if not line:
+                return
+            tag, _, rest = line.decode().rstrip("\r\n").partition(" ")
+            command, _, args = rest.partition(" ")
+            command = command.upper()
+            if command == "UID":
+                sub, _, args = args.partition(" ")
+                command = "UID " + sub.upper()
+            self.commands.append(f"{command} {args}".strip())
+            tokens = [_unquote(t) for t in _IMAP_TOKEN.findall(args)]
+
+            if command == "CAPABILITY":
+                send("* CAPABILITY IMAP4rev1")
+            elif command == "LOGIN":
+                if tokens[:2] != [self.user, self.password]:
+                    send(f"{tag} NO [AUTHENTICATIONFAILED] Invalid credentials")
+                    continue
+                self.logins += 1
+            elif command == "LOGOUT":
+                send("* BYE logging out")
+                send(f"{tag} OK LOGOUT completed")
+                return
+            elif command == "LIST":
+                for name, box in self.mailboxes.items():
+                    send(f'* LIST (\\HasNoChildren{" " + box["flags"] if box["flags"] else ""}) "/" "{name}"')
+            elif command in ("SELECT", "EXAMINE", "STATUS"):
+                box = self.mailboxes.get(tokens[0])
+                if box is None:
+                    send(f"{tag} NO no such mailbox")
+                    continue
+                if command == "STATUS":
+                    send(f'* STATUS "{tokens[0]}" (MESSAGES {len(box["messages"])} '
+                         f'UIDNEXT {box["uidnext"]} UIDVALIDITY {box["uidvalidity"]})')
+                else:
+                    selected = box
+                    send(f'* {len(box["messages"])} EXISTS')
+                    send(f'* OK [UIDVALIDITY {box["uidvalidity"]}] UIDs valid')
+                    send(f'* OK [UIDNEXT {box["uidnext"]}] Predicted next UID')
+                    mode = "READ-ONLY" if command == "EXAMINE" else "READ-WRITE"
+                    send(f"{tag} OK [{mode}] {command} completed")
+                    continue
+            elif command == "CLOSE":
+                selected = None
+            elif command == "UID SEARCH":
+                uids = self._search(selected, tokens)
+                send("* SEARCH" + "".join(f" {uid}" for uid in uids))
+            elif command == "UID FETCH":
+                uid_set, _, items = args.partition(" ")
+                self._fetch(selected, uid_set, items.upper(), wfile)
+            elif command != "NOOP":
+                send(f"{tag} BAD unknown command")
+                continue
+            send(f"{tag} OK {command} completed")
+
+    @staticmethod
+    def _uid_set(spec: str, uids: List[int]) -> List[int]:
+        highest = max(uids) if uids else 0
+        wanted = set()
+        for part in spec.split(","):
+            lo, _, hi = part.partition(":")
+            lo_n = highest if lo == "*" else int(lo)
+            hi_n = lo_n if not hi else (highest if hi == "*" else int(hi))
+            lo_n, hi_n = min(lo_n, hi_n), max(lo_n, hi_n)
+            wanted.update(uid for uid in uids if lo_n <= uid <= hi_n)
+        return sorted(wanted)
+
+    def _search(self, box, tokens: List[str]) -> List[int]:
+        import email as email_lib
+
+        uids = sorted(box["messages"])
+        key = tokens[0].upper() if tokens else "ALL"
+        if key == "UID":
+            return self._uid_set(tokens[1], uids)
+        if key == "HEADER":
+            name, value = tokens[1], tokens[2]
+            return [uid for uid in uids
+                    if value in (email_lib.message_from_bytes(box["messages"][uid]).get(name) or "")]
+        if key == "TEXT":
+            words = [t.lower().encode() for t in tokens[1::2]]
+            return [uid for uid in uids if all(w in box["messages"][uid].lower() for w in words)]
+        if key == "FROM":
+            return [uid for uid in uids
+                    if tokens[1] in (email_lib.message_from_bytes(box["messages"][uid]).get("From") or "")]
+        return uids
+
+    def _fetch(self, box, uid_set: str, items: str, wfile) -> None:
+        uids = sorted(box["messages"])
+        for uid in self._uid_set(uid_set, uids):
+            raw = box["messages"][uid]
+            seq = uids.index(uid) + 1
+            parts = []
+            header_fields = re.search(r"HEADER\.FIELDS \(([^)]*)\)", items)
+            if header_fields:
+                names = header_fields.group(1).split()
+                head = raw.split(b"\r\n\r\n", 1)[0] if b"\r\n\r\n" in raw else raw.split(b"\n\n", 1)[0]
+                lines = [ln for ln in re.split(rb"\r?\n(?![ \t])", head)
+                         if ln.split(b":", 1)[0].decode().upper() in names]
+                parts.append((f"BODY[HEADER.FIELDS ({' '.join(names)})]", b"\r\n".join(lines) + b"\r\n\r\n"))
+            partial = re.search(r"BODY\.PEEK\[TEXT\]<(\d+)\.(\d+)>", items)
+            if partial:
+                start, length = int(partial.group(1)), int(partial.group(2))
+                sep = b"\r\n\r\n" if b"\r\n\r\n" in raw else b"\n\n"
+                text = raw.split(sep, 1)[1] if sep in raw else b""
+                parts.append((f"BODY[TEXT]<{start}>", text[start:start + length]))
+            if "BODY.PEEK[]" in items or "RFC822" in items.replace("RFC822.", ""):
+                parts.append(("BODY[]" if "BODY.PEEK[]" in items else "RFC822", raw))
+            out = f"* {seq} FETCH (UID {uid}".encode()
+            for name, payload in parts:
+                out += f" {name} {{{len(payload)}}}\r\n".encode() + payload
+                self.bytes_sent += len(payload)
+            wfile.write(out + b")\r\n")
+
+
+class FakeSmtpServer:
+    """Minimal ESMTP server on localhost for ``smtplib.SMTP`` clients.
+
+    Speaks EHLO/HELO, AUTH PLAIN, MAIL, RCPT, DATA, RSET, NOOP and QUIT.
+    Delivered messages (dot-unstuffed wire bytes) land in ``messages`` as
+    ``(from, [to...], data)``.  ``fail_next`` holds reply codes to answer
+    the next DATA commands with instead of 250; addresses in ``reject`` are
+    refused at RCPT.
+    """
+
+    def __init__(self, user: str = "coco@example.com", password: str = "secret"):
+        import socketserver
+        import threading
+
+        self.user, self.password = user, password
+        self.messages: List[Any] = []
+        self.commands: List[str] = []
+        self.fail_next: List[int] = []
+        self.reject: set = set()
+        self.connections = 0
+        self.logins = 0
+        self._sockets: List[Any] = []
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                server._sockets.append(self.connection)
+                server.connections += 1
+                server._session(self.rfile, self.wfile)
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._tcp = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._tcp.daemon_threads = True
+        self.port = self._tcp.server_address[1]
+        self._thread = threading.Thread(target=self._tcp.serve_forever, daemon=True)
+        self._thread.start()
+
+    def drop_connections(self) -> None:
+        import socket
+
+        for sock in self._sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._sockets.clear()
+
+    def close(self) -> None:
+        self.drop_connections()
+        self._tcp.shutdown()
+        self._tcp.server_close()
+
+    def _session(self, rfile, wfile) -> None:
+        import base64
+
+        def send(line: str) -> None:
+            wfile.write(line.encode() + b"\r\n")
+
+        send("220 fake.smtp ESMTP ready")
+        sender, recipients = None, []
+        while True:
+            line = rfile.readline()
+            if not line:
+                return
+            command, _, args = line.decode().rstrip("\r\n").partition(" ")
+            command = command.upper()
+            self.commands.append(command)
+            if command == "EHLO":
+                send("250-fake.smtp")
+                send("250-AUTH PLAIN")
+                send("250 8BITMIME")
+            elif command == "HELO":
+                send("250 fake.smtp")
+            elif command == "AUTH":
+                mechanism, _, initial = args.partition(" ")
+                parts = base64.b64decode(initial).split(b"\0") if initial else []
+                if mechanism.upper() == "PLAIN" and parts[1:] == [self.user.encode(), self.password.encode()]:
+                    self.logins += 1
+                    send("235 2.7.0 Authentication successful")
+                else:
+                    send("535 5.7.8 Authentication failed")
+            elif command == "MAIL":
+                sender, recipients = args.partition(":")[2].strip().strip("<>"), []
+                send("250 OK")
+            elif command == "RCPT":
+                address = args.partition(":")[2].strip().strip("<>")
+                if address in self.reject:
+                    send("550 5.1.1 No such user")
+                else:
+                    recipients.append(address)
+                    send("250 OK")
+            elif command == "DATA":
+                send("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while True:
+                    data = rfile.readline()
+                    if not data:
+                        return
+                    if data == b".\r\n":
+                        break
+                    lines.append(data[1:] if data.startswith(b"..") else data)
+                code = self.fail_next.pop(0) if self.fail_next else 250
+                if code == 250:
+                    self.messages.append((sender, recipients, b"".join(lines)))
+                    send("250 OK queued")
+                else:
+                    send(f"{code} {'try again later' if code < 500 else 'rejected'}")
+                    if code == 421:
+                        return
+                sender, recipients = None, []
+            elif command == "RSET":
+                sender, recipients = None, []
+                send("250 OK")
+            elif command == "NOOP":
+                send("250 OK")
+            elif command == "QUIT":
+                send("221 Bye")
+                return
+            else:
+                send("502 Command not implemented")
@@ -0,0 +1,37 @@
+"""Tests for the shared API client registry."""
+
+import asyncio
+
+import pytest
+
+from coco.config.clients import ClientRegistry
+
+pytest.importorskip("anthropic")
+
+
+def test_sync_clients_are_reused_per_key():
+    registry = ClientRegistry()
+    first = registry.anthropic("key-a")
+    assert registry.anthropic("key-a") is first
+    assert registry.anthropic("key-b") is not first
+    assert registry.stats()["sync_clients"] == 2
+
+
+def test_async_clients_are_cached_per_event_loop():
+    registry = ClientRegistry()
+
+    async def pair():
+        return registry.async_anthropic("key-a"), registry.async_anthropic("key-a")
+
+    a1, a2 = asyncio.run(pair())
+    b1, _ = asyncio.run(pair())
+    assert a1 is a2
+    assert b1 is not a1
+
+
+def test_close_drops_cached_clients():
+    registry = ClientRegistry()
+    first = registry.anthropic("key-a")
+    registry.close()
+    assert registry.stats()["sync_clients"] == 0
+    assert registry.anthropic("key-a") is not first
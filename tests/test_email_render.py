@@ -0,0 +1,70 @@
+"""Tests for the shared HTML email rendering pipeline."""
+
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+from coco.integrations import email_render
+from coco.integrations.email_render import (
+    ARTICLE_CSS,
+    compile_template,
+    extract_body,
+    render_article_section,
+    render_email,
+    render_markdown,
+    render_page,
+)
+
+
+def digest(num_articles=50):
+    articles = [
+        {"title": f"Story {i}", "url": f"https://news.example/{i}", "content": "Lorem ipsum " * 40}
+        for i in range(num_articles)
+    ]
+    sections = [render_article_section("AI News", articles, num_articles)]
+    return render_page(
+        "🤖 COCO AI Assistant", "📅 Daily Update", sections, css=(ARTICLE_CSS,),
+        generated_at=datetime(2026, 1, 2, 8, 0, tzinfo=timezone.utc),
+    )
+
+
+def test_compiled_template_slots_and_literal_braces():
+    template = compile_template("<p>{greeting}, {name}</p><style>p {{ margin: 0; }}</style>")
+    assert template is compile_template(template.source)
+    assert template.slots == {"greeting", "name"}
+    assert template.render(greeting="Hi", name="{x}") == "<p>Hi, {x}</p><style>p { margin: 0; }</style>"
+    with pytest.raises(KeyError):
+        template.render(greeting="Hi")
+
+
+def test_render_markdown_is_cached():
+    render_markdown.cache_clear()
+    first = render_markdown("**bold** text\n\nsecond paragraph")
+    assert render_markdown("**bold** text\n\nsecond paragraph") is first
+    assert "bold" in first and render_markdown.cache_info().hits == 1
+
+
+def test_generated_page_is_sliced_without_parsing(monkeypatch):
+    monkeypatch.setitem(sys.modules, "bs4", None)  # Any import of bs4 now fails
+    page = digest(3)
+    body, source = extract_body(page)
+    assert source == "marked"
+    assert '<div class="header">' in body and "Story 2" in body
+    assert "<style>" not in body and "2026-01-02 08:00 UTC" in body
+
+    html, source = render_email(page, "Digest")
+    assert source == "marked"
+    assert "<title>Digest</title>" in html and "Story 0" in html
+    assert email_render.BODY_START not in html
+
+
+def test_foreign_html_is_parsed():
+    pytest.importorskip("bs4")
+    body, source = extract_body("<!DOCTYPE html><html><body><p>hello</p></body></html>")
+    assert (body, source) == ("<p>hello</p>", "parsed")
+
+
+def test_50_article_digest_is_wrapped_from_markers():
+    html, source = render_email(digest(), "🤖 Daily News Digest - COCO")
+    assert source == "marked" and html.count('class="article"') == 50
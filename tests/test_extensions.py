@@ -0,0 +1,86 @@
+"""Tests for lazy consciousness extensions and their engine wiring."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from coco.engine.consciousness import ConsciousnessEngine
+from coco.engine.extensions import ExtensionRegistry, LazyExtension
+
+
+def test_factory_runs_once_on_first_use():
+    calls = []
+    extension = LazyExtension("audio", lambda: calls.append(1) or SimpleNamespace(config="on"))
+    assert extension.state == "pending" and calls == []
+
+    assert extension and extension.config == "on"
+    assert extension.config == "on"
+    assert calls == [1] and extension.state == "ready" and extension.seconds is not None
+
+
+def test_concurrent_first_use_builds_once():
+    calls = []
+
+    def slow_factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    extension = LazyExtension("workspace", slow_factory)
+    threads = [threading.Thread(target=extension.get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == [1]
+
+
+def test_unavailable_and_failed_extensions_are_falsy():
+    def missing():
+        raise ImportError("No module named 'elevenlabs'")
+
+    def broken():
+        raise RuntimeError("OAuth token expired")
+
+    registry = ExtensionRegistry()
+    nothing, not_installed, failing = (
+        registry.add("music", lambda: None), registry.add("audio", missing), registry.add("google", broken),
+    )
+    assert not nothing and not not_installed and not failing
+    assert getattr(failing, "authenticated", None) is None
+
+    states = {entry["name"]: (entry["state"], entry["detail"]) for entry in registry.status()}
+    assert states["music"][0] == "unavailable"
+    assert states["audio"] == ("unavailable", "Not installed (No module named 'elevenlabs')")
+    assert states["google"] == ("failed", "OAuth token expired")
+
+
+def test_warm_up_runs_in_background():
+    release = threading.Event()
+    registry = ExtensionRegistry()
+    scheduler = registry.add("scheduler", lambda: release.wait(5) and "started")
+    audio = registry.add("audio", lambda: "voice")
+
+    registry.warm_up(["scheduler", "unknown"])
+    assert not registry.wait(0.01)  # Caller is not blocked by the warm-up
+    release.set()
+    assert registry.wait(5)
+    assert scheduler.state == "ready" and audio.state == "pending"
+
+
+def test_engine_construction_initializes_nothing(tmp_path):
+    class Engine(ConsciousnessEngine):
+        def __getattribute__(self, name):
+            if name.startswith("_create_"):  # Stand-in factories: nothing available
+                return lambda: None
+            return super().__getattribute__(name)
+
+    config = SimpleNamespace(
+        anthropic_api_key="", workspace=str(tmp_path), debug=False, console=None, extension_warmup=[],
+    )
+    engine = Engine(config, SimpleNamespace(), SimpleNamespace())
+
+    assert {entry["state"] for entry in engine.extensions.status()} == {"pending"}
+    assert not engine.video_observer
+    assert engine.extensions["video_observer"].state == "unavailable"
+    assert engine.extensions["scheduler"].state == "pending"
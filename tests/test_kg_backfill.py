@@ -0,0 +1,79 @@
+"""Tests for the paged, resumable KG backfill."""
+
+import json
+import re
+import sqlite3
+
+import pytest
+
+from coco.integrations.kg_backfill import KGBackfill
+from coco.integrations.personal_assistant_kg import PersonalAssistantKG
+
+
+@pytest.fixture
+def memory_db(tmp_path):
+    path = tmp_path / "coco_memory.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE episodes (id INTEGER PRIMARY KEY, user_text TEXT, agent_text TEXT)")
+    people = ["Kerry", "Sarah", "Ilia", "Ramin", "Dylan", "Ayden"]
+    rows = [(f"I had a long call with my friend {name} about the roadmap for next quarter today",
+             f"Noted - {name} and you discussed next quarter's roadmap.") for name in people]
+    rows.insert(3, ("", "orphan reply"))
+    conn.executemany("INSERT INTO episodes (user_text, agent_text) VALUES (?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+@pytest.fixture
+def kg(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    kg = PersonalAssistantKG(db_path=str(tmp_path / "kg.db"))
+    calls = []
+
+    def complete(prompt, max_tokens):
+        names = re.findall(r"my friend (\w+)", prompt)
+        calls.append(names)
+        return json.dumps({str(i): [{"name": f"{n} Project", "type": "PROJECT", "confidence": 0.9}]
+                           for i, n in enumerate(names, 1)})
+
+    kg.entity_extractor._complete = complete
+    kg.entity_extractor.batch_size = 2
+    kg.calls = calls
+    yield kg
+    kg.conn.close()
+
+
+def test_backfill_pages_and_resumes(kg, memory_db):
+    pages = []
+    backfill = KGBackfill(kg, memory_db, page_size=3, workers=2, on_progress=lambda p: pages.append(p.processed))
+
+    first = backfill.run(limit=4)
+    assert (first.processed, first.skipped) == (3, 1)
+    assert backfill.checkpoint() == (4, 4)
+
+    second = backfill.run()
+    assert second.processed == 3 and second.total == 3
+    assert backfill.checkpoint() == (7, 7)
+    assert pages == [3, 3, 3]  # two pages in the first run (3 + skipped row), one in the second
+
+    names = {row[0] for row in kg.conn.execute("SELECT name FROM entities WHERE type = 'PROJECT'")}
+    assert {"Kerry Project", "Ramin Project", "Ayden Project"} <= names
+    assert all(len(call) <= 2 for call in kg.calls)
+
+    # Re-running from scratch hits the extraction cache: no new LLM calls
+    calls = len(kg.calls)
+    assert backfill.run(resume=False).processed == 6
+    assert len(kg.calls) == calls
+
+
+def test_deferred_commits_roll_back_together(kg):
+    kg.add_entity_manual("Alice", "PERSON")
+    with pytest.raises(RuntimeError):
+        with kg.deferred_commits():
+            kg.add_entity_manual("Bruno", "PERSON")
+            kg.add_relationship_manual("Alice", "Bruno", "KNOWS")
+            raise RuntimeError("boom")
+    names = {row[0] for row in kg.conn.execute("SELECT name FROM entities")}
+    assert names == {"Alice"}
+    assert "Bruno" not in kg.graph
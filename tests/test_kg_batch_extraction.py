@@ -0,0 +1,95 @@
+"""Tests for coalesced KG entity extraction."""
+
+import json
+
+import pytest
+
+from coco.integrations.kg_batch_extraction import BatchEntityExtractor, parse_batch_response
+from coco.integrations.personal_assistant_kg import PersonalAssistantKG
+
+
+class FakeCompletion:
+    """Answers batch prompts with one PERSON per exchange, named from the text."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def __call__(self, prompt, max_tokens):
+        self.prompts.append(prompt)
+        count = prompt.count("\nUser: ")
+        names = [line.split("met ")[1].split()[0] for line in prompt.splitlines()
+                 if line.startswith("User: ")]
+        return json.dumps({
+            str(i + 1): [{"name": names[i], "type": "PERSON", "context": "friend", "confidence": 0.95}]
+            for i in range(count)
+        })
+
+
+@pytest.fixture
+def kg(tmp_path, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    graph = PersonalAssistantKG(db_path=str(tmp_path / "kg.db"))
+    completion = FakeCompletion()
+    graph.entity_extractor = BatchEntityExtractor(completion, batch_size=3, max_delay=60, store=graph)
+    graph.completion = completion
+    yield graph
+    graph.entity_extractor.close()
+    graph.conn.close()
+
+
+EXCHANGES = [
+    (f"Yesterday I met {name} at the conference and we talked for a while about work",
+     "That sounds like a productive conversation, tell me more about it.")
+    for name in ("Alice", "Bruno", "Chiara")
+]
+
+
+def test_exchanges_are_coalesced_into_one_call(kg):
+    for episode_id, (user, agent) in enumerate(EXCHANGES, 1):
+        stats = kg.process_conversation_exchange(user, agent, episode_id=episode_id)
+        assert stats["llm_extraction"] == "queued"
+
+    kg.entity_extractor._executor.shutdown(wait=True)  # Wait for the full-batch flush
+
+    assert len(kg.completion.prompts) == 1
+    rows = kg.conn.execute("SELECT name, properties FROM entities ORDER BY name").fetchall()
+    assert [(r[0], json.loads(r[1])["source_episode"]) for r in rows] == [
+        ("Alice", 1), ("Bruno", 2), ("Chiara", 3),
+    ]
+
+
+def test_reprocessing_is_served_from_cache(kg):
+    for user, agent in EXCHANGES:
+        kg.process_conversation_exchange(user, agent)
+    kg.flush_entity_extraction()
+    calls = len(kg.completion.prompts)
+
+    stats = kg.process_conversation_exchange(*EXCHANGES[0])
+    assert stats["llm_extraction"] == "cached"
+
+    # The cache is persistent: a fresh extractor over the same DB is also free
+    kg.entity_extractor = BatchEntityExtractor(kg.completion, batch_size=3, store=kg)
+    assert kg._extract_entities_with_llm(*EXCHANGES[1])[0]["name"] == "Bruno"
+    assert len(kg.completion.prompts) == calls
+
+
+def test_parse_batch_response_maps_numbers_and_fences():
+    text = '```json\n{"2": [{"name": "X"}], "Exchange 1": [], "9": [{"name": "Y"}]}\n```'
+    assert parse_batch_response(text, 2) == [[], [{"name": "X"}]]
+
+
+def test_shutdown_flushes_queued_exchanges(kg):
+    from types import SimpleNamespace
+
+    from coco.ui.shutdown import ShutdownDisplay
+
+    kg.process_conversation_exchange(*EXCHANGES[0], episode_id=1)
+    assert kg.entity_extractor.pending_count == 1
+
+    printed = []
+    consciousness = SimpleNamespace(memory=SimpleNamespace(personal_kg=kg))
+    ShutdownDisplay(SimpleNamespace(print=printed.append), consciousness)._flush_entity_extraction()
+
+    assert kg.entity_extractor.pending_count == 0
+    assert [r[0] for r in kg.conn.execute("SELECT name FROM entities")] == ["Alice"]
+    assert printed and "+1 entities" in printed[0]
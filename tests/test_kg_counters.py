@@ -0,0 +1,74 @@
+"""Tests for the trigger-maintained KG statistics."""
+
+
+import pytest
+
+from coco.integrations.personal_assistant_kg import PersonalAssistantKG
+
+
+def aggregate_status(conn):
+    """What get_knowledge_status() used to compute with GROUP BY scans."""
+    return {
+        "entity_types": dict(conn.execute("SELECT type, COUNT(*) FROM entities GROUP BY type")),
+        "relationship_types": dict(conn.execute(
+            "SELECT relationship_type, COUNT(*) FROM relationships GROUP BY relationship_type"
+        )),
+        "total_tool_calls": conn.execute("SELECT COUNT(*) FROM tool_usage").fetchone()[0],
+        "learned_patterns": conn.execute("SELECT COUNT(*) FROM tool_patterns").fetchone()[0],
+    }
+
+
+@pytest.fixture
+def kg(tmp_path):
+    graph = PersonalAssistantKG(db_path=str(tmp_path / "kg.db"))
+    yield graph
+    graph.conn.close()
+
+
+def populate(kg):
+    kg.add_relationship_manual("Alice", "Bruno", "KNOWS")
+    kg.add_entity_manual("Apollo", "PROJECT")
+    kg._record_tool_usage("search_web", {"q": "x"}, "context")
+    kg._store_tool_pattern({
+        "trigger_phrase": "look up", "tool_sequence": ["search_web", "write_file"], "parameters": {},
+    })
+
+
+def test_counters_match_aggregates_through_writes(kg):
+    populate(kg)
+    kg.conn.execute("UPDATE entities SET type = 'TOOL' WHERE name = 'Apollo'")
+    kg.conn.execute("DELETE FROM entities WHERE name = 'Bruno'")
+    kg.conn.commit()
+
+    status = kg.get_knowledge_status()
+    expected = aggregate_status(kg.conn)
+    for key, value in expected.items():
+        assert status[key] == value
+    assert status["total_entities"] == 2
+
+
+def test_existing_database_is_backfilled(tmp_path):
+    path = tmp_path / "kg.db"
+    kg = PersonalAssistantKG(db_path=str(path))
+    populate(kg)
+    kg.conn.executescript("DROP TABLE kg_counters;")
+    kg.conn.close()
+
+    reopened = PersonalAssistantKG(db_path=str(path))
+    assert reopened.get_knowledge_status()["entity_types"] == aggregate_status(reopened.conn)["entity_types"]
+    reopened.conn.close()
+
+
+def test_context_sections_are_cached_until_a_write(kg):
+    kg.add_entity_manual("Alice", "PERSON")
+    first = kg.get_conversation_context()
+    assert "Alice" in first
+
+    calls = []
+    kg.conn.set_trace_callback(calls.append)
+    assert kg.get_conversation_context() == first
+    assert not any("FROM entities e" in sql for sql in calls)
+
+    kg.add_entity_manual("Bruno", "PERSON")
+    assert "Bruno" in kg.get_conversation_context()
+    kg.conn.set_trace_callback(None)
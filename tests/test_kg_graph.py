@@ -0,0 +1,81 @@
+"""Tests for the in-memory KG adjacency engine."""
+
+import random
+import time
+
+import pytest
+
+from coco.integrations.kg_graph import KGGraph
+from coco.integrations.personal_assistant_kg import PersonalAssistantKG
+
+
+@pytest.fixture
+def graph():
+    g = KGGraph()
+    for name, node_type in [("Alice", "PERSON"), ("Bruno", "PERSON"), ("Chiara", "PERSON"),
+                            ("Apollo", "PROJECT"), ("Figma", "TOOL")]:
+        g.add_node(name, node_type)
+    g.add_edge("USER", "Alice", "FAMILY")
+    g.add_edge("USER", "Figma", "USES")
+    g.add_edge("Alice", "Apollo", "WORKS_ON")
+    g.add_edge("Bruno", "Apollo", "WORKS_ON")
+    g.add_edge("Chiara", "Bruno", "KNOWS")
+    return g
+
+
+def test_k_hop_skips_excluded_hub(graph):
+    assert graph.k_hop("Alice", 2, exclude={"USER"}) == {"Apollo": 1, "Bruno": 2}
+    assert "Figma" in graph.k_hop("Alice", 2)
+
+
+def test_shortest_path_and_connected_via(graph):
+    assert graph.shortest_path("Alice", "Chiara") == ["Alice", "Apollo", "Bruno", "Chiara"]
+    assert graph.shortest_path("Alice", "Nobody") is None
+    assert graph.connected_via("Alice", "Apollo", "PERSON") == ["Bruno"]
+
+
+def test_personalized_pagerank_ranks_by_proximity(graph):
+    ranked = [name for name, _ in graph.personalized_pagerank(["Alice"], exclude={"USER"})]
+    assert ranked[:3] == ["Apollo", "Bruno", "Chiara"]
+
+
+def test_personalized_pagerank_stays_local_on_a_large_graph():
+    rng = random.Random(1)
+    g = KGGraph()
+    n = 20_000
+    for i in range(n):
+        g.add_edge("USER", f"e{i}", "KNOWS")
+    for _ in range(3 * n):
+        g.add_edge(f"e{rng.randrange(n)}", f"e{rng.randrange(n)}", "RELATED", rng.random())
+    g.neighbors("USER")  # Build the CSR view outside the timed section
+
+    start = time.perf_counter()
+    ranked = g.personalized_pagerank(["e1", "e2"], top_k=9, exclude={"USER"})
+    elapsed = time.perf_counter() - start
+
+    # A full power iteration over this graph takes over a second.
+    assert elapsed < 0.25
+    assert len(ranked) == 9 and "USER" not in dict(ranked)
+    neighbours = {name for seed in ("e1", "e2") for name, _, _ in g.neighbors(seed)}
+    assert ranked[0][0] in neighbours
+
+
+def test_writes_after_compaction_are_visible(graph):
+    graph.neighbors("Alice")  # Builds the CSR view
+    graph.add_edge("Alice", "Chiara", "KNOWS", 1.5)
+    assert ("Chiara", "KNOWS", 1.5) in graph.neighbors("Alice")
+    graph.add_edge("Alice", "Chiara", "KNOWS", 2.0)  # Upsert only changes the weight
+    assert graph.edge_count == 6
+
+
+def test_kg_keeps_graph_in_sync(tmp_path):
+    kg = PersonalAssistantKG(db_path=str(tmp_path / "kg.db"))
+    kg.add_relationship_manual("Alice", "Bruno", "KNOWS")
+    kg.add_relationship_manual("Bruno", "Chiara", "KNOWS")
+    assert kg.graph.shortest_path("Alice", "Chiara") == ["Alice", "Bruno", "Chiara"]
+
+    reloaded = PersonalAssistantKG(db_path=str(tmp_path / "kg.db"))
+    assert reloaded.graph.k_hop("Alice", 2) == {"Bruno": 1, "Chiara": 2}
+    assert reloaded.get_connected_entities(["Alice"], k=1) == ["Bruno"]
+    for graph_kg in (kg, reloaded):
+        graph_kg.conn.close()
@@ -0,0 +1,64 @@
+"""Tests for batch entity resolution in the personal KG."""
+
+from coco.integrations.kg_resolution import (
+    EntityRecord,
+    find_duplicate_clusters,
+    soundex,
+)
+from coco.integrations.personal_assistant_kg import PersonalAssistantKG
+
+
+def _names(clusters):
+    return sorted(sorted(r.name for r in cluster) for cluster in clusters)
+
+
+def test_soundex():
+    assert soundex("Robert") == soundex("Rupert") == "R163"
+    assert soundex("Ashcraft") == "A261"
+
+
+def test_clusters_nicknames_and_initials():
+    records = [
+        EntityRecord("1", "Mike", "PERSON"),
+        EntityRecord("2", "Mike R.", "PERSON"),
+        EntityRecord("3", "Michael Ross", "PERSON"),
+        EntityRecord("4", "Michael Smith", "PERSON"),
+        EntityRecord("5", "Apollo Dashboard", "PROJECT"),
+        EntityRecord("6", "apollo dashboard", "PROJECT"),
+        EntityRecord("7", "Mike", "PROJECT"),
+    ]
+    clusters = find_duplicate_clusters(records)
+    # "Mike" alone is ambiguous between Ross and Smith, so it is left out
+    assert _names(clusters) == [["Apollo Dashboard", "apollo dashboard"], ["Michael Ross", "Mike R."]]
+
+
+def test_resolve_duplicates_rewrites_relationships(tmp_path):
+    kg = PersonalAssistantKG(db_path=str(tmp_path / "kg.db"))
+    try:
+        kg.add_entity_manual("Mike", "PERSON")
+        kg.add_entity_manual("Michael Ross", "PERSON", description="michael@acme.io")
+        kg.add_relationship_manual("Mike", "Apollo", "WORKS_ON")
+        kg.add_relationship_manual("Michael Ross", "Apollo", "WORKS_ON")
+        kg.add_relationship_manual("Sara", "Mike", "KNOWS")
+
+        preview = kg.resolve_duplicates(dry_run=True)
+        assert preview.entities_merged == 1
+        assert kg.conn.execute("SELECT COUNT(*) FROM entities WHERE name = 'Mike'").fetchone()[0] == 1
+
+        report = kg.resolve_duplicates()
+        assert report.merges == [("Michael Ross", ["Mike"])]
+        assert report.relationships_rewritten == 2
+
+        rels = kg.conn.execute(
+            "SELECT user_entity, related_entity, relationship_type, mention_count FROM relationships"
+        ).fetchall()
+        assert sorted(tuple(r) for r in rels) == [
+            ("Michael Ross", "Apollo", "WORKS_ON", 2),
+            ("Sara", "Michael Ross", "KNOWS", 1),
+        ]
+        assert kg.conn.execute("SELECT COUNT(*) FROM entities WHERE name = 'Mike'").fetchone()[0] == 0
+        assert "Mike" not in kg.graph
+        assert {n for n, _, _ in kg.graph.neighbors("Michael Ross")} == {"Apollo", "Sara"}
+        assert kg.get_knowledge_status()["total_relationships"] == 2
+    finally:
+        kg.conn.close()
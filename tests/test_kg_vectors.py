@@ -0,0 +1,112 @@
+"""Tests for KG entity vector search."""
+
+import zlib
+
+import pytest
+
+from coco.integrations.kg_vectors import EntityVectorIndex
+from coco.integrations.personal_assistant_kg import PersonalAssistantKG
+
+DIM = 64
+
+
+def bag_of_words(texts):
+    """Deterministic toy embedder: hashed word counts."""
+    vectors = []
+    for text in texts:
+        vec = [0.0] * DIM
+        for word in text.lower().replace(":", " ").split():
+            vec[zlib.crc32(word.encode()) % DIM] += 1.0
+        vectors.append(vec)
+    return vectors
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        return bag_of_words(texts)
+
+
+def test_index_top_k_and_remove():
+    index = EntityVectorIndex()
+    index.upsert("a", [1, 0, 0])
+    index.upsert("b", [0.9, 0.1, 0])
+    index.upsert("c", [0, 0, 1])
+    assert [i for i, _ in index.search([1, 0, 0], k=2)] == ["a", "b"]
+    index.remove("a")
+    assert [i for i, _ in index.search([1, 0, 0], k=1)] == ["b"]
+    with pytest.raises(ValueError):
+        index.upsert("d", [1, 0])
+
+
+@pytest.fixture
+def kg(tmp_path, monkeypatch):
+    monkeypatch.setenv("ENABLE_EMBEDDINGS", "true")
+    graph = PersonalAssistantKG(db_path=str(tmp_path / "kg.db"))
+    graph.embedder = CountingEmbedder()
+    for name, entity_type, context in [
+        ("Alice", "PERSON", "violin teacher who runs the music school"),
+        ("Apollo", "PROJECT", "rocket telemetry dashboard for launch data"),
+        ("Figma", "TOOL", "design mockups and prototypes"),
+    ]:
+        graph._add_entity_with_validation({"name": name, "type": entity_type, "context": context})
+        graph._create_rich_embedding({"name": name, "type": entity_type, "context": context})
+    yield graph
+    graph.conn.close()
+
+
+def test_semantic_search_embeds_in_one_batch(kg):
+    assert kg.search_entities_semantic("who teaches violin music") == []  # Queries never embed entities
+    assert kg.embedder.batches == []
+
+    assert kg.refresh_embeddings() == 3
+    hits = kg.search_entities_semantic("who teaches violin music", k=1)
+    assert hits[0]["name"] == "Alice"
+    assert len(kg.embedder.batches[0]) == 3  # All stale entities in one call
+    assert kg.embedder.batches[1] == ["who teaches violin music"]
+    assert "Alice" in kg.get_relevant_entities_rag("violin music teacher", k=1)
+
+
+def test_short_embedder_reply_stops_the_refresh(kg):
+    calls = []
+
+    def drops_one(texts):
+        calls.append(len(texts))
+        return bag_of_words(texts)[:-1]
+
+    kg.embedder = drops_one
+    assert kg.refresh_embeddings(batch_size=2) == 0
+    assert calls == [2]
+    assert kg.conn.execute("SELECT COUNT(*) FROM entity_embeddings WHERE embedding IS NULL").fetchone()[0] == 3
+
+
+def test_writes_refresh_embeddings_in_the_background(kg):
+    kg._apply_llm_entities([{"name": "Bruno", "type": "PERSON",
+                             "context": "cello player from the orchestra"}], [])
+    kg._embedding_executor.submit(lambda: None).result(timeout=5)  # Drain the worker
+
+    assert len(kg.vector_index) == 4
+    assert kg.search_entities_semantic("cello orchestra", k=1)[0]["name"] == "Bruno"
+
+
+def test_only_changed_entities_are_re_embedded(kg):
+    kg.refresh_embeddings()
+    kg.embedder.batches.clear()
+
+    kg._create_rich_embedding({"name": "Figma", "type": "TOOL", "context": "design mockups and prototypes"})
+    assert kg.refresh_embeddings() == 0  # Unchanged text keeps its vector
+
+    kg._add_relationship({"user_entity": "USER", "related_entity": "Alice",
+                          "relationship_type": "FAMILY", "context": "my sister Alice"})
+    assert kg.refresh_embeddings() == 1
+    assert len(kg.embedder.batches) == 1 and "FAMILY" in kg.embedder.batches[0][0]
+
+
+def test_vectors_persist_across_restarts(kg, tmp_path):
+    kg.refresh_embeddings()
+    reopened = PersonalAssistantKG(db_path=str(tmp_path / "kg.db"))
+    assert len(reopened.vector_index) == 3
+    reopened.conn.close()
@@ -0,0 +1,118 @@
+"""Tests for the priority-aware LLM request scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from coco.config.llm_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    LLMQueueTimeout,
+    LLMScheduler,
+    ScheduledAnthropic,
+    TokenBucket,
+)
+from tests.fakes import FakeAPIStatusError, FakeStreamingClient, text_block
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_per_minute():
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock)  # one per second
+    bucket.debit(60)
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+    clock.now = 2.0
+    assert bucket.wait_time(2) == 0.0
+    # Oversized requests only wait for a full bucket, and only take one
+    assert bucket.wait_time(10_000) == pytest.approx(58.0)
+    clock.now = 60.0
+    bucket.debit(10_000)
+    assert bucket.wait_time(60) == pytest.approx(60.0)
+
+
+def test_no_local_limits_by_default():
+    scheduler = LLMScheduler()
+    for _ in range(5):  # Far beyond any sensible per-minute budget
+        scheduler.call(lambda: None, model="m", priority=PRIORITY_INTERACTIVE,
+                       estimated_tokens=150_000, deadline=0.01)
+    assert scheduler.stats()["priorities"]["interactive"]["admitted"] == 5
+
+
+def test_streamed_calls_reconcile_usage():
+    clock = FakeClock()
+    scheduler = LLMScheduler(tokens_per_minute=6_000, clock=clock)
+    client = FakeStreamingClient([[text_block("hi")]])
+    scheduled = ScheduledAnthropic(client, scheduler, PRIORITY_INTERACTIVE)
+
+    with scheduled.messages.stream(model="m", max_tokens=10, messages=[], system="x" * 4_000) as stream:
+        list(stream)
+    # Estimated ~1000 tokens on admission, reconciled to the real 142
+    assert scheduler._lanes["m"].tokens.level == pytest.approx(6_000 - 142)
+
+
+def test_rate_limit_retries_honour_retry_after():
+    sleeps = []
+    scheduler = LLMScheduler(sleep=sleeps.append)
+    client = FakeStreamingClient(
+        [[text_block("ok")]],
+        failures=[FakeAPIStatusError(429, {"retry-after-ms": "200"}), FakeAPIStatusError(529)],
+    )
+    scheduled = ScheduledAnthropic(client, scheduler, PRIORITY_BACKGROUND)
+
+    started = time.monotonic()
+    response = scheduled.messages.create(model="m", max_tokens=10, messages=[])
+
+    assert response.content[0].text == "ok"
+    assert len(client.requests) == 3
+    # 429 pauses the model lane for retry-after; the 529 backs off via sleep
+    assert time.monotonic() - started >= 0.2
+    assert len(sleeps) == 1
+    stats = scheduler.stats()
+    assert stats["retries"] == 2
+    assert stats["rate_limited"] == 1
+    assert stats["priorities"]["background"]["admitted"] == 3
+
+
+def test_non_retryable_errors_propagate():
+    scheduler = LLMScheduler(sleep=lambda s: None)
+    client = FakeStreamingClient([], failures=[FakeAPIStatusError(400)])
+    with pytest.raises(FakeAPIStatusError):
+        ScheduledAnthropic(client, scheduler, PRIORITY_INTERACTIVE).messages.create(model="m", messages=[])
+
+
+def test_interactive_requests_jump_the_queue():
+    scheduler = LLMScheduler()
+    scheduler.pause("m", 0.3)
+    order = []
+
+    def submit(priority, label):
+        scheduler.call(lambda: order.append(label), model="m", priority=priority)
+
+    background = threading.Thread(target=submit, args=(PRIORITY_BACKGROUND, "background"))
+    background.start()
+    time.sleep(0.05)
+    interactive = threading.Thread(target=submit, args=(PRIORITY_INTERACTIVE, "interactive"))
+    interactive.start()
+    time.sleep(0.05)
+    assert scheduler.stats()["priorities"]["background"]["queue_depth"] == 1
+
+    background.join(2)
+    interactive.join(2)
+    assert order == ["interactive", "background"]
+
+
+def test_queue_deadline_raises():
+    scheduler = LLMScheduler()
+    scheduler.pause("m", 5)
+    with pytest.raises(LLMQueueTimeout):
+        scheduler.call(lambda: None, model="m", deadline=0.05)
+    assert scheduler.stats()["priorities"]["background"]["timeouts"] == 1
+    assert scheduler.stats()["priorities"]["background"]["queue_depth"] == 0
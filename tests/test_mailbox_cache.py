@@ -0,0 +1,166 @@
+"""Tests for pooled IMAP sessions and the incremental mailbox cache."""
+
+import imaplib
+from types import SimpleNamespace
+
+import pytest
+
+from coco.integrations.gmail_consciousness import GmailConsciousness
+from coco.integrations.imap_pool import ImapSessionPool
+from coco.integrations.mailbox_cache import MailboxCache, MailboxSync
+from tests.fakes import FakeImapServer, make_email
+
+
+@pytest.fixture
+def server():
+    server = FakeImapServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def sync(server, tmp_path):
+    pool = ImapSessionPool("127.0.0.1", server.port, server.user, server.password, factory=imaplib.IMAP4)
+    sync = MailboxSync(pool, MailboxCache(tmp_path / "mailbox.db"), min_interval=0)
+    yield sync
+    pool.close()
+    sync.cache.close()
+
+
+def test_incremental_sync_reuses_one_session(server, sync):
+    for i in range(3):
+        server.add_message("INBOX", make_email(f"Report {i}"))
+    assert sync.sync() == 3
+    assert [e["subject"] for e in sync.cache.recent("INBOX", 10)] == ["Report 2", "Report 1", "Report 0"]
+
+    fetches = server.count("UID FETCH")
+    assert sync.sync() == 0  # Nothing new: STATUS only
+    assert server.count("UID FETCH") == fetches and server.count("UID SEARCH") == 1
+
+    server.add_message("INBOX", make_email("Report 3"))
+    assert sync.sync() == 1
+    assert server.commands[-1].startswith("UID FETCH 4 ")
+    assert server.logins == 1 and sync.pool.logins == 1
+
+
+def test_listing_fetches_headers_and_preview_in_one_command(server, sync):
+    attachment = bytes(range(256)) * 2000  # ~500 KB each
+    for i in range(30):
+        server.add_message("INBOX", make_email(f"Scan {i}", body="Quarterly numbers " * 200, attachment=attachment))
+    assert sync.sync() == 30
+
+    assert server.count("UID FETCH") == 1
+    assert "UID FETCH 1:30 " in server.commands[-1]
+    assert server.bytes_sent < 30 * 4096
+
+    latest = sync.cache.recent("INBOX", 1)[0]
+    assert latest["subject"] == "Scan 29" and latest["body_preview"].startswith("Quarterly numbers")
+    assert not latest["body_loaded"]
+
+    body = sync.load_body("INBOX", latest["uid"])
+    assert body.count("Quarterly numbers") == 200
+    assert sync.cache.recent("INBOX", 1)[0]["body_loaded"]
+    fetches = server.count("UID FETCH")
+    sync.load_body("INBOX", latest["uid"])  # Cached now
+    assert server.count("UID FETCH") == fetches
+
+
+def test_uidvalidity_change_and_expunge(server, sync):
+    uids = [server.add_message("INBOX", make_email(f"Note {i}")) for i in range(3)]
+    sync.sync()
+
+    server.expunge("INBOX", uids[0])
+    sync.sync()
+    assert sync.cache.uids("INBOX") == uids[1:]
+
+    server.renumber("INBOX")
+    server.add_message("INBOX", make_email("Fresh"))
+    assert sync.sync() == 3  # Cache rebuilt from scratch
+    assert len(sync.cache.recent("INBOX", 10)) == 3
+
+
+def test_message_id_lookup_and_reconnect(server, sync):
+    server.add_message("INBOX", make_email("Invoice", message_id="<inv-1@example.com>", body="Total: $42"))
+    sync.sync()
+    found = sync.cache.by_message_id("<inv-1@example.com>")
+    assert found["subject"] == "Invoice" and "Total: $42" in found["body_full"]
+    assert sync.cache.by_message_id("<missing@example.com>") is None
+
+    server.drop_connections()
+    server.add_message("INBOX", make_email("After drop"))
+    assert sync.sync() == 1
+    assert sync.pool.reconnects == 1 and server.logins == 2
+
+
+def test_full_text_search_and_server_fallbacks(server, sync):
+    server.add_message("INBOX", make_email("Old contract", message_id="<old@example.com>",
+                                           body="Signed lease for the warehouse"))
+    for i in range(3):
+        server.add_message("INBOX", make_email(f"Standup {i}", sender="bob@example.com", body="Daily notes"))
+    server.add_message("INBOX", make_email("Budget review", body="Warehouse costs are up"))
+    sync.initial_limit = 4
+    sync.sync()
+    assert 1 not in sync.cache.uids("INBOX")  # Older than the initial window
+
+    assert [e["subject"] for e in sync.cache.search("warehouse")] == ["Budget review"]
+    assert len(sync.cache.search("bob standup", "INBOX")) == 3
+    assert sync.cache.search("  ") == []
+
+    fetches = server.count("UID FETCH")
+    assert sync.find_message_id("INBOX", "<old@example.com>")["subject"] == "Old contract"
+    assert server.commands[-2] == 'UID SEARCH HEADER Message-ID "<old@example.com>"'
+    assert server.count("UID FETCH") == fetches + 1
+    assert sync.find_message_id("INBOX", "<old@example.com>")["uid"] == 1  # Now a local lookup
+    assert server.count("UID FETCH") == fetches + 1
+    assert sync.find_message_id("INBOX", "<nope@example.com>") is None
+
+    hits = sync.search_server("INBOX", "signed lease")
+    assert [e["subject"] for e in hits] == ["Old contract"]
+
+    body = sync.load_body("INBOX", 1)
+    assert "Signed lease" in body and sync.cache.search("lease")[0]["body_loaded"]
+
+
+def test_gmail_consciousness_reads_from_cache(server, tmp_path, monkeypatch):
+    monkeypatch.setenv("GMAIL_EMAIL", server.user)
+    monkeypatch.setenv("GMAIL_APP_PASSWORD", server.password)
+    server.add_mailbox("[Gmail]/Sent Mail", flags="\\Sent")
+    server.add_message("INBOX", make_email("Hello", message_id="<hello@example.com>"))
+    server.add_message("[Gmail]/Sent Mail", make_email("Re: Hello", sender=server.user))
+
+    gmail = GmailConsciousness(SimpleNamespace(console=None, workspace=str(tmp_path)))
+    gmail.imap_server, gmail.imap_port, gmail.imap_factory = "127.0.0.1", server.port, imaplib.IMAP4
+
+    inbox = gmail.receive_emails(limit=5)
+    assert [e["subject"] for e in inbox] == ["Hello"] and not inbox[0]["body_loaded"]
+    assert gmail.load_full_body(inbox[0])["body_full"].strip() == "Hello there"
+    assert gmail.get_email_by_message_id("<hello@example.com>")["subject"] == "Hello"
+    assert [e["subject"] for e in gmail.search_emails("hello")] == ["Hello"]
+    assert [e["subject"] for e in gmail.check_sent_emails()] == ["Re: Hello"]
+    assert server.logins == 1
+
+
+def test_concurrent_first_reads_build_one_sync(tmp_path, monkeypatch):
+    import threading
+    import time
+
+    from coco.integrations import gmail_consciousness
+
+    built = []
+
+    def slow_sync(pool, cache):
+        built.append(pool)
+        time.sleep(0.05)
+        return SimpleNamespace(pool=pool, cache=cache)
+
+    monkeypatch.setattr(gmail_consciousness, "MailboxSync", slow_sync)
+    gmail = GmailConsciousness(SimpleNamespace(console=None, workspace=str(tmp_path)))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(gmail._mail_sync())) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1 and all(result is results[0] for result in results)
+    results[0].cache.close()
@@ -0,0 +1,65 @@
+"""Tests for the background-producer memory ingest channel."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("numpy")  # coco.memory imports SimpleRAG, which needs numpy
+
+from coco.memory.ingest import EPISODE, EXCHANGE, MEMORY, MemoryIngestChannel  # noqa: E402
+
+
+def test_many_producers_single_consumer_in_order():
+    channel = MemoryIngestChannel(max_pending=10_000)
+
+    def produce(name):
+        for i in range(500):
+            assert channel.submit_episode(name, user=f"{name}-{i}", agent="ok")
+
+    threads = [threading.Thread(target=produce, args=(f"p{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    applied = []
+    assert channel.drain(lambda item: applied.append(item.payload["user"])) == 2000
+    for n in range(4):
+        mine = [u for u in applied if u.startswith(f"p{n}-")]
+        assert mine == [f"p{n}-{i}" for i in range(500)]  # Per-producer FIFO
+    stats = channel.stats()
+    assert all(s["applied"] == 500 and s["dropped"] == 0 for s in stats.values())
+
+
+def test_backpressure_and_failures_are_counted():
+    channel = MemoryIngestChannel(max_pending=2)
+    assert channel.submit_memory("monitor", "first memory text")
+    assert channel.submit("monitor", EPISODE, {"user": "u", "agent": "a"})
+    assert not channel.submit_memory("monitor", "dropped when full")
+    assert channel.pending() == 2
+
+    def apply(item):
+        if item.kind == MEMORY:
+            raise RuntimeError("rag down")
+
+    assert channel.drain(apply) == 2
+    stats = channel.stats()["monitor"]
+    assert (stats["submitted"], stats["dropped"], stats["applied"], stats["failed"]) == (3, 1, 1, 1)
+    assert stats["max_latency"] >= stats["avg_latency"] >= 0
+    assert channel.submit_memory("monitor", "room again")
+
+
+def test_exchanges_are_stored_by_the_consumer():
+    channel = MemoryIngestChannel()
+    consumer = threading.get_ident()
+    stored = []
+
+    def produce():
+        assert channel.submit_exchange("visual_perception", "Shared image: a.png", "A red door")
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    thread.join()
+
+    channel.drain(lambda item: stored.append((item.kind, item.payload["user"], threading.get_ident())))
+    assert stored == [(EXCHANGE, "Shared image: a.png", consumer)]
@@ -0,0 +1,149 @@
+"""Tests for the reused SMTP session and outbound mail queue."""
+
+import email
+import smtplib
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from types import SimpleNamespace
+
+import pytest
+
+from coco.integrations.gmail_consciousness import GmailConsciousness
+from coco.integrations.smtp_outbox import (
+    LatencyHistogram,
+    MailOutbox,
+    OutboundMessage,
+    SmtpSendError,
+    SmtpSession,
+    attach_file,
+)
+from tests.fakes import FakeSmtpServer
+
+
+@pytest.fixture
+def server():
+    server = FakeSmtpServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def outbox(server):
+    session = SmtpSession("127.0.0.1", server.port, server.user, server.password, factory=smtplib.SMTP)
+    outbox = MailOutbox(session, backoff=0.01)
+    yield outbox
+    outbox.close(timeout=5)
+
+
+def message(subject, to="bob@example.com", body="hi"):
+    msg = MIMEText(body)
+    msg["From"], msg["To"], msg["Subject"] = "coco@example.com", to, subject
+    return OutboundMessage(msg, "coco@example.com", [to])
+
+
+def test_fan_out_reuses_one_session(server, outbox):
+    futures = [outbox.submit(message(f"Digest {i}", to=f"user{i}@example.com")) for i in range(10)]
+    for future in futures:
+        future.result(5)
+
+    assert server.connections == 1 and server.logins == 1
+    assert [m[1] for m in server.messages] == [[f"user{i}@example.com"] for i in range(10)]
+    stats = outbox.stats()
+    assert stats["sent"] == 10 and stats["batches"] < 10 and stats["latency"]["count"] == 10
+
+    message_with_dot = message("Dots", body=".leading dot\n..two")
+    outbox.send(message_with_dot, timeout=5)
+    assert email.message_from_bytes(server.messages[-1][2]).get_payload() == ".leading dot\r\n..two\r\n"
+
+
+def test_transient_failures_retry_and_permanent_ones_do_not(server, outbox):
+    server.fail_next = [451, 421]
+    outbox.send(message("Eventually"), timeout=5)
+    assert outbox.retries == 2 and server.messages[-1][2].find(b"Eventually") > 0
+
+    server.fail_next = [554]
+    with pytest.raises(SmtpSendError) as info:
+        outbox.send(message("Spam"), timeout=5)
+    assert not info.value.transient and outbox.retries == 2
+
+    server.reject.add("nobody@example.com")
+    with pytest.raises(SmtpSendError):
+        outbox.send(message("Bounce", to="nobody@example.com"), timeout=5)
+
+    server.drop_connections()
+    outbox.send(message("After drop"), timeout=5)  # Reconnects transparently
+    assert outbox.stats()["failed"] == 2 and len(server.messages) == 2
+
+
+def test_attachments_stream_from_disk(server, outbox, tmp_path):
+    video = tmp_path / "clip.mp4"
+    payload = bytes(range(256)) * 4000 + b"tail"
+    video.write_bytes(payload)
+
+    outbound = message("Clip")
+    outbound.msg = MIMEMultipart()
+    outbound.msg["Subject"] = "Clip"
+    outbound.msg.attach(MIMEText("see attached"))
+    attach_file(outbound, str(video))
+    outbox.send(outbound, timeout=5)
+
+    received = email.message_from_bytes(server.messages[-1][2])
+    part = received.get_payload()[1]
+    assert part.get_content_type() == "video/mp4" and part.get_filename() == "clip.mp4"
+    assert part.get_payload(decode=True) == payload
+    with pytest.raises(FileNotFoundError):
+        attach_file(outbound, str(tmp_path / "missing.mp4"))
+
+
+def test_missing_attachment_fails_permanently(server, outbox, tmp_path):
+    report = tmp_path / "report.pdf"
+    report.write_bytes(b"%PDF")
+    outbox.send(message("Warm-up"), timeout=5)
+
+    outbound = message("Report")
+    outbound.msg = MIMEMultipart()
+    attach_file(outbound, str(report))
+    report.unlink()  # Removed while the message sat in the queue
+    with pytest.raises(SmtpSendError) as excinfo:
+        outbox.send(outbound, timeout=5)
+
+    assert not excinfo.value.transient and "attachment unreadable" in str(excinfo.value)
+    stats = outbox.stats()
+    assert stats["retries"] == 0 and stats["failed"] == 1
+    assert len(server.messages) == 1 and server.connections == 1  # Session kept
+
+
+def test_latency_histogram_quantiles():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+    assert histogram.quantile(0.5) is None
+    for seconds in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(seconds)
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"<=0.1s": 2, "<=1s": 1, ">1s": 1}
+    assert snapshot["p50"] == 0.1 and snapshot["p95"] == float("inf")
+
+
+def test_gmail_send_email_goes_through_outbox(server, monkeypatch, tmp_path):
+    monkeypatch.setenv("GMAIL_EMAIL", server.user)
+    monkeypatch.setenv("GMAIL_APP_PASSWORD", server.password)
+    gmail = GmailConsciousness(SimpleNamespace(console=None, workspace=str(tmp_path)))
+    gmail.smtp_server, gmail.smtp_port, gmail.smtp_factory = "127.0.0.1", server.port, smtplib.SMTP
+
+    image = tmp_path / "chart.png"
+    image.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\0" * 500)
+    assert gmail.send_email("a@example.com", "One", "**bold**", [{"filepath": str(image)}])["success"]
+    assert gmail.queue_email("b@example.com, c@example.com", "Two", "plain").result(5) == {}
+
+    assert server.logins == 1
+    assert server.messages[1][1] == ["b@example.com", "c@example.com"]
+    parts = email.message_from_bytes(server.messages[0][2]).get_payload()
+    assert parts[1].get_payload(decode=True) == image.read_bytes()
+    assert gmail.outbox_stats()["sent"] == 2
+
+    server.reject.add("ghost@example.com")
+    result = gmail.send_email("d@example.com, ghost@example.com", "Three", "plain")
+    assert result["success"] and result["refused"] == ["ghost@example.com"]
+    assert "but the server refused ghost@example.com (550" in result["message"]
+    assert server.messages[-1][1] == ["d@example.com"]
+    assert gmail.outbox_stats()["partial"] == 1
+    gmail._mail_outbox.close(timeout=5)
@@ -0,0 +1,128 @@
+"""Tests for startup instrumentation, its JSON export and the CI budget check."""
+
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from coco import startup_profile
+from coco.startup_profile import StartupProfile, check_budget, main, subsystem
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _fresh_profile(monkeypatch):
+    monkeypatch.delenv("STARTUP_PROFILE_JSON", raising=False)
+    startup_profile.reset_startup_profile()
+    yield
+    startup_profile.reset_startup_profile()
+
+
+def test_phases_and_subsystems_are_timed():
+    clock = FakeClock()
+    profile = StartupProfile(clock=clock, track_imports=False)
+    with profile.phase("2. memory"):
+        clock.now += 0.2
+        with profile.subsystem("memory.databases"):
+            clock.now += 0.15
+    profile.add_source("extensions", lambda: [{"name": "scheduler", "state": "pending"}])
+
+    data = profile.to_dict()
+    assert data["phases"] == [{"name": "2. memory", "start": 0.0, "seconds": pytest.approx(0.35)}]
+    assert data["subsystems"][0]["name"] == "memory.databases"
+    assert data["subsystems"][0]["seconds"] == pytest.approx(0.15)
+    assert data["extensions"][0]["state"] == "pending"
+    assert data["ready"] is False
+
+
+def test_import_tree_records_fresh_modules(tmp_path, monkeypatch):
+    package = tmp_path / "profiled_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("from . import child\n")
+    (package / "child.py").write_text("import time\ntime.sleep(0.01)\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profile = StartupProfile()
+    try:
+        import profiled_pkg
+    finally:
+        profile.mark_ready()
+        sys.modules.pop("profiled_pkg.child", None)
+        sys.modules.pop("profiled_pkg", None)
+
+    assert profiled_pkg.child.VALUE == 42
+    assert not profile.imports.installed
+    root = next(node for node in profile.to_dict()["imports"]["tree"] if node["name"] == "profiled_pkg")
+    child = root["children"][0]
+    assert child["name"] == "profiled_pkg.child" and child["cumulative_ms"] >= 10
+    assert root["cumulative_ms"] >= child["cumulative_ms"] and root["self_ms"] < child["cumulative_ms"]
+
+
+def test_mark_ready_exports_json(tmp_path, monkeypatch):
+    target = tmp_path / "profiles" / "startup.json"
+    monkeypatch.setenv("STARTUP_PROFILE_JSON", str(target))
+    profile = StartupProfile(track_imports=False)
+    profile.mark_ready()
+
+    data = json.loads(target.read_text())
+    assert data["ready"] is True and data["total_seconds"] == profile.ready_seconds
+
+
+def test_subsystem_is_a_no_op_without_a_startup():
+    with subsystem("memory.databases"):
+        pass
+    assert startup_profile.current_startup_profile() is None
+
+    profile = startup_profile.get_startup_profile()
+    with subsystem("memory.databases"):
+        pass
+    profile.mark_ready()
+    with subsystem("ui.music"):  # After the first prompt: not part of startup
+        pass
+    assert [timing.name for timing in profile.subsystems] == ["memory.databases"]
+
+
+def test_check_budget():
+    profile = {
+        "total_seconds": 2.5,
+        "phases": [{"name": "2. memory", "start": 0.0, "seconds": 1.2}],
+        "subsystems": [{"name": "memory.layer2_summaries", "start": 0.1, "seconds": 0.4}],
+    }
+    assert check_budget(profile, total_ms=3000, phase_ms={"2. memory": 1500}) == []
+    assert check_budget(profile, total_ms=2000, phase_ms={
+        "memory.layer2_summaries": 100, "9. missing": 1,
+    }) == [
+        "startup took 2500 ms (budget 2000 ms)",
+        "memory.layer2_summaries took 400 ms (budget 100 ms)",
+        "9. missing: not measured",
+    ]
+
+
+def test_check_command_exit_status(tmp_path, capsys):
+    path = tmp_path / "startup.json"
+    path.write_text(json.dumps({"total_seconds": 1.0, "phases": [{"name": "1. config", "seconds": 0.05}]}))
+
+    assert main(["check", str(path), "--budget-ms", "1500", "--phase", "1. config=100"]) == 0
+    assert main(["check", str(path), "--budget-ms", "500"]) == 1
+    assert "BUDGET EXCEEDED: startup took 1000 ms" in capsys.readouterr().err
+
+
+def test_perf_command(tmp_path):
+    from coco.engine.consciousness import ConsciousnessEngine
+
+    engine = SimpleNamespace(config=SimpleNamespace(workspace=str(tmp_path)))
+    perf = ConsciousnessEngine.perf_command
+    assert perf(engine, "startup").startswith("No startup profile")
+
+    startup_profile.get_startup_profile().mark_ready()
+    assert perf(engine, "").startswith("Usage")
+    assert perf(engine, "startup json") == f"Startup profile written to {tmp_path / 'startup_profile.json'}"
+    assert json.loads((tmp_path / "startup_profile.json").read_text())["ready"] is True
@@ -0,0 +1,91 @@
+"""Tests for streamed Claude responses (``coco.engine.streaming``)."""
+
+from types import SimpleNamespace
+
+from fakes import FakeStreamingClient, text_block, tool_block
+
+from coco.engine.consciousness import ConsciousnessEngine
+from coco.engine.streaming import StreamingResponder
+from coco.tools.registry import ToolDefinition, ToolRegistry
+
+
+class TickClock:
+    """Deterministic clock advancing one unit per call."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+def test_text_deltas_are_forwarded_incrementally():
+    client = FakeStreamingClient([[text_block("Hello from a streamed answer")]])
+    deltas = []
+
+    result = StreamingResponder(client, on_text=deltas.append, clock=TickClock()).stream(model="m")
+
+    assert len(deltas) > 1
+    assert "".join(deltas) == "Hello from a streamed answer"
+    assert result.text == "Hello from a streamed answer"
+    assert result.stop_reason == "end_turn"
+    assert result.metrics.time_to_first_token == 1.0
+    assert result.metrics.total_time >= result.metrics.time_to_first_token
+    assert result.metrics.output_tokens == 42
+
+
+def test_tool_use_dispatched_before_stream_finishes():
+    seen = []
+    client = FakeStreamingClient(
+        [[tool_block("toolu_1", "read_file", {"path": "notes.md"}), text_block("Reading it now.")]],
+        on_event=lambda e: seen.append(e.type),
+    )
+    dispatched_at = []
+
+    def on_tool_use(tool_use):
+        dispatched_at.append(len(seen))
+        return f"future:{tool_use.name}"
+
+    result = StreamingResponder(client, on_tool_use=on_tool_use).stream(model="m")
+
+    assert result.tool_uses[0].input == {"path": "notes.md"}
+    assert result.tool_uses[0].pending == "future:read_file"
+    # Text for the second block had not been streamed yet when the tool started
+    assert dispatched_at[0] < seen.index("content_block_delta", dispatched_at[0])
+    assert [b["type"] for b in result.content] == ["tool_use", "text"]
+
+
+def _engine(client, registry):
+    engine = ConsciousnessEngine.__new__(ConsciousnessEngine)
+    engine.config = SimpleNamespace(planner_model="test-model", debug=False)
+    engine.memory = SimpleNamespace(working_memory=[])
+    engine.tools = registry
+    engine.console = None
+    engine.claude = client
+    engine.last_stream_metrics = None
+    return engine
+
+
+def test_engine_streaming_round_trip_with_tool():
+    registry = ToolRegistry()
+    registry.register(ToolDefinition(
+        name="read_file", description="", input_schema={},
+        handler=lambda path: f"contents of {path}",
+    ))
+    client = FakeStreamingClient([
+        [text_block("Let me look. "), tool_block("toolu_9", "read_file", {"path": "a.txt"})],
+        [text_block("The file says hi.")],
+    ])
+    deltas = []
+
+    response = _engine(client, registry)._run_tool_loop(
+        "system", [], [{"role": "user", "content": "read a.txt"}], deltas.append
+    )
+
+    assert "contents of a.txt" in response
+    assert response.endswith("The file says hi.")
+    follow_up = client.requests[1]["messages"]
+    assert follow_up[1]["content"][1]["id"] == "toolu_9"
+    assert follow_up[2]["content"][0]["tool_use_id"] == "toolu_9"
+    assert "The file says hi." in "".join(deltas)
@@ -0,0 +1,88 @@
+"""Tests for the bounded scheduled-task executor pool."""
+
+import threading
+import time
+
+from coco.integrations.task_executor import TaskExecutorPool
+
+
+def _blocking(gate, log):
+    def work(run):
+        log.append(("start", run.key))
+        gate.wait(5)
+        return run.key
+    return work
+
+
+def test_max_workers_and_template_limits():
+    gate = threading.Event()
+    log, settled = [], []
+    pool = TaskExecutorPool(max_workers=2, template_limits={"video": 1}, on_settled=settled.append)
+    work = _blocking(gate, log)
+
+    runs = [pool.submit("v1", "video", work), pool.submit("v2", "video", work),
+            pool.submit("e1", "email", work), pool.submit("e2", "email", work)]
+    time.sleep(0.1)
+    # v2 waits for the video slot without blocking e1; e2 waits for a worker
+    assert sorted(key for _, key in log) == ["e1", "v1"]
+    assert pool.stats()["queued"] == 2
+
+    gate.set()
+    for run in runs:
+        assert run.wait(5)
+    assert sorted(run.key for run in settled) == ["e1", "e2", "v1", "v2"]
+    assert all(run.queue_wait is not None and run.run_time is not None for run in runs)
+    assert runs[1].queue_wait >= runs[0].queue_wait
+    pool.shutdown()
+
+
+def test_overlap_rejected_until_settled():
+    gate = threading.Event()
+    pool = TaskExecutorPool(max_workers=2)
+    run = pool.submit("daily", "email", _blocking(gate, []))
+    assert pool.submit("daily", "email", lambda r: None) is None
+    gate.set()
+    run.wait(5)
+    time.sleep(0.05)
+    assert not pool.is_active("daily")
+    assert pool.submit("daily", "email", lambda r: "again").wait(5)
+    pool.shutdown()
+
+
+def test_timeout_settles_once_and_keeps_task_active():
+    release = threading.Event()
+    settled = []
+    pool = TaskExecutorPool(max_workers=1, on_settled=settled.append)
+
+    def slow(run):
+        run.cancel_event.wait(5)  # Cooperative: returns when the timeout fires
+        release.wait(5)
+
+    run = pool.submit("slow", "report", slow, timeout=0.1)
+    assert run.wait(2)
+    assert run.timed_out and run.cancel_event.is_set()
+    assert pool.is_active("slow")  # Worker still finishing: no overlap yet
+
+    release.set()
+    time.sleep(0.1)
+    assert not pool.is_active("slow")
+    assert settled == [run]
+    pool.shutdown()
+
+
+def test_cancel_queued_run():
+    gate = threading.Event()
+    settled = []
+    pool = TaskExecutorPool(max_workers=1, on_settled=settled.append)
+    first = pool.submit("a", "email", _blocking(gate, []))
+    queued = pool.submit("b", "email", lambda r: "never")
+
+    assert pool.cancel("b")
+    assert queued.cancelled and queued.started_at is None and queued.done.is_set()
+    assert not pool.cancel("missing")
+
+    gate.set()
+    first.wait(5)
+    assert [run.key for run in settled] == ["b", "a"]
+    assert queued.result is None
+    pool.shutdown()
@@ -0,0 +1,82 @@
+"""Tests for the shared template fetch cache."""
+
+import threading
+import time
+
+import pytest
+
+from coco.integrations.task_fetch import TemplateFetchCache, looks_like_error
+from coco.tools.registry import ToolFailure
+
+
+def test_ttl_and_normalized_keys():
+    now = [0.0]
+    cache = TemplateFetchCache(default_ttl=60, source_ttls={"calendar": 5}, clock=lambda: now[0])
+    calls = []
+
+    def loader(value):
+        return lambda: calls.append(value) or {"results": [value]}
+
+    assert cache.fetch("search", "AI  News", loader(1)) == {"results": [1]}
+    assert cache.fetch("search", "ai news", loader(2)) == {"results": [1]}
+    assert cache.fetch("calendar", "ai news", loader(3)) == {"results": [3]}  # Separate source
+
+    now[0] = 30
+    assert cache.fetch("search", "ai news", loader(4)) == {"results": [1]}
+    assert cache.fetch("calendar", "ai news", loader(5)) == {"results": [5]}  # 5s calendar TTL
+    now[0] = 100
+    assert cache.fetch("search", "ai news", loader(6), ttl=3600) == {"results": [1]}  # Accept older
+    assert cache.fetch("search", "ai news", loader(7)) == {"results": [7]}
+    assert calls == [1, 3, 5, 7]
+
+
+def test_errors_are_not_cached():
+    cache = TemplateFetchCache()
+    assert cache.fetch("search", "q", lambda: {"error": "rate limited"}) == {"error": "rate limited"}
+    with pytest.raises(RuntimeError):
+        cache.fetch("search", "q", lambda: (_ for _ in ()).throw(RuntimeError("down")))
+    assert cache.fetch("search", "q", lambda: {"results": []}) == {"results": []}
+    assert cache.stats()["misses"] == 3 and cache.stats()["entries"] == 1
+
+
+def test_error_strings_are_refetched():
+    cache = TemplateFetchCache()
+    replies = iter(["❌ Calendar read failed: token expired", "**Calendar Error**: quota", "- 10:00 Standup"])
+    for _ in range(3):
+        result = cache.fetch("calendar", ("10:00", "10:10"), lambda: next(replies))
+    assert result == "- 10:00 Standup"
+    assert cache.fetch("calendar", ("10:00", "10:10"), lambda: "unused") == "- 10:00 Standup"
+    assert cache.stats()["misses"] == 3
+
+
+def test_looks_like_error():
+    assert looks_like_error(ToolFailure("Tool 'list_calendar_events' is not available"))
+    assert looks_like_error("Calendar access failed: timeout")
+    assert not looks_like_error("Standup with the error-budget team at 10:00")
+    assert not looks_like_error("Review: failure modes of the scheduler")
+
+
+def test_concurrent_callers_share_one_flight():
+    cache = TemplateFetchCache()
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return "curated html"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.fetch("curation", "ai", slow)))
+               for _ in range(5)]
+    threads[0].start()
+    started.wait(2)
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == ["curated html"] * 5
+    assert cache.stats()["coalesced"] == 4
@@ -0,0 +1,74 @@
+"""Tests for batched scheduled-task history and its retention rollup."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+from coco.integrations.task_history import TaskHistoryStore
+
+
+def _row(task_id, started, success=True, duration=1.0):
+    return (task_id, started.isoformat(), started.isoformat(), success, None, "ok", duration, 0.0)
+
+
+def test_appends_are_batched_and_flushed_on_read(tmp_path):
+    store = TaskHistoryStore(tmp_path / "sched.db", batch_size=3, flush_interval=3600)
+    now = datetime.now(timezone.utc)
+    count = lambda: store.connection().execute("SELECT COUNT(*) FROM task_executions").fetchone()[0]
+
+    store.append(_row("a", now))
+    store.append(_row("a", now + timedelta(seconds=1)))
+    assert count() == 0
+    store.append(_row("b", now))
+    assert count() == 3
+
+    store.append(_row("a", now + timedelta(seconds=2)))
+    history = store.history("a")
+    assert [row[1] for row in history] == [(now + timedelta(seconds=s)).isoformat() for s in (2, 1, 0)]
+    store.close()
+
+
+def test_connections_are_per_thread(tmp_path):
+    store = TaskHistoryStore(tmp_path / "sched.db", batch_size=1)
+    seen = []
+
+    def worker():
+        seen.append(store.connection())
+        store.append(_row("t", datetime.now(timezone.utc)))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(conn) for conn in seen}) == 4
+    assert store.connection() not in seen
+    assert store.connection() is store.connection()
+    assert store.connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert len(store.history("t")) == 4
+    store.close()
+
+
+def test_rollup_aggregates_old_executions(tmp_path):
+    store = TaskHistoryStore(tmp_path / "sched.db", batch_size=100, retain_days=30)
+    now = datetime(2026, 6, 1, 12, tzinfo=timezone.utc)
+    old = (now - timedelta(days=45)).replace(hour=0)
+    for i in range(24):
+        store.append(_row("hourly", old + timedelta(hours=i), success=i % 4 != 0, duration=float(i)))
+    store.append(_row("hourly", now))
+    store.flush()
+
+    assert store.rollup(now=now) == 24
+    assert len(store.history("hourly")) == 1
+    (day,) = store.daily_stats("hourly")
+    assert day == {"day": old.date().isoformat(), "runs": 24, "successes": 18, "failures": 6,
+                   "total_duration": float(sum(range(24))), "max_duration": 23.0}
+
+    # A second rollup of the same day adds to the existing row
+    store.append(_row("hourly", old))
+    store.flush()
+    store.rollup(now=now)
+    assert store.daily_stats("hourly")[0]["runs"] == 25
+
+    assert store.delete_task("hourly") == 1
+    assert store.daily_stats("hourly") == []
+    store.close()
@@ -0,0 +1,65 @@
+"""Tests for the heap-based scheduled-task timer queue."""
+
+import threading
+import time
+
+from coco.integrations.task_timer import TaskTimerQueue
+
+
+def test_pop_due_in_order_with_reschedule_and_remove():
+    timers = TaskTimerQueue(clock=lambda: 100.0)
+    timers.schedule("c", 30.0)
+    timers.schedule("a", 10.0)
+    timers.schedule("b", 20.0)
+    timers.schedule("late", 500.0)
+    timers.schedule("a", 25.0)  # Moved: stale entry at 10 must be ignored
+    timers.remove("b")
+
+    assert timers.next_due() == 25.0
+    assert timers.pop_due() == ["a", "c"]
+    assert timers.pop_due() == []
+    assert list(timers._due) == ["late"]
+
+
+def test_thousands_of_tasks_stay_compact():
+    timers = TaskTimerQueue(clock=lambda: 0.0)
+    for round_ in range(5):
+        for i in range(2000):
+            timers.schedule(i, 1000.0 + i + round_)
+    assert len(timers) == 2000
+    assert len(timers._heap) <= 2 * 2000 + 64
+    assert timers.pop_due(now=1010.0) == list(range(7))
+
+
+def test_wait_wakes_for_newly_scheduled_task():
+    timers = TaskTimerQueue()
+    timers.schedule("far", time.time() + 3600)
+    fired = []
+
+    def loop():
+        if timers.wait(max_wait=5):
+            fired.extend(timers.pop_due())
+            fired.append(time.time())
+
+    thread = threading.Thread(target=loop)
+    thread.start()
+    time.sleep(0.05)
+    due = time.time() + 0.2
+    timers.schedule("soon", due)  # Earlier than the current deadline
+    thread.join(timeout=5)
+
+    assert fired[0] == "soon"
+    assert 0 <= fired[1] - due < 0.5
+
+
+def test_wake_interrupts_wait():
+    timers = TaskTimerQueue()
+    result = []
+    thread = threading.Thread(target=lambda: result.append(timers.wait(max_wait=10)))
+    thread.start()
+    time.sleep(0.05)
+    started = time.time()
+    timers.wake()
+    thread.join(timeout=5)
+    assert result == [False]
+    assert time.time() - started < 1
@@ -0,0 +1,107 @@
+"""Tests for the native tool-system bootstrap and the monolith-free startup path."""
+
+import os
+import subprocess
+import sys
+import textwrap
+from types import SimpleNamespace
+
+import pytest
+
+from coco.tools import ToolRegistry, build_tool_system
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _config(tmp_path):
+    return SimpleNamespace(workspace=str(tmp_path), console=None, debug=False, tavily_api_key="")
+
+
+def _no_services():
+    return {"gmail": None, "twitter": None, "code_memory": None}
+
+
+def test_registers_every_provider(tmp_path):
+    tools = build_tool_system(_config(tmp_path), _no_services())
+
+    assert isinstance(tools, ToolRegistry)
+    for name in ("read_file", "write_file", "search_web", "run_code", "send_email",
+                 "post_tweet", "read_calendar"):
+        assert name in tools
+    # Services that are not configured stay out of the Claude tool list
+    assert {"send_email", "post_tweet", "search_web"} <= set(tools.unavailable_tools())
+    assert "send_email" not in {d["name"] for d in tools.get_api_definitions()}
+
+
+def test_legacy_method_surface(tmp_path):
+    sent = []
+    gmail = SimpleNamespace(send_email=lambda *args: sent.append(args) or {"success": True, "message": "ok"})
+    tools = build_tool_system(_config(tmp_path), {**_no_services(), "gmail": gmail})
+
+    assert tools.gmail is gmail and tools.twitter is None
+    assert "Email Sent" in tools.send_email("a@example.com", "Hi", "Body")
+    assert sent == [("a@example.com", "Hi", "Body", None)]
+    assert not hasattr(tools, "post_tweet")  # No Twitter instance, no handler
+    tools.write_file("notes.md", "hello")
+    assert (tmp_path / "notes.md").read_text() == "hello"
+
+
+def test_method_calls_go_through_the_result_cache(tmp_path):
+    from coco.tools.bootstrap import ToolSystem
+    from coco.tools.registry import ToolDefinition
+
+    files = {"USER_PROFILE.md": "old"}
+    tools = ToolSystem(_config(tmp_path))
+    tools.register(ToolDefinition(
+        name="read_file", description="", input_schema={}, handler=lambda path: files[path],
+        cacheable=True, cache_ttl=300.0, cache_key="path",
+    ))
+    tools.register(ToolDefinition(
+        name="write_file", description="", input_schema={},
+        handler=lambda path, content: files.__setitem__(path, content) or "written",
+        cache_key="path", invalidates=("read_file",),
+    ))
+
+    assert tools.execute("read_file", {"path": "USER_PROFILE.md"}) == "old"
+    assert tools.write_file("USER_PROFILE.md", content="new") == "written"
+    assert tools.read_file("USER_PROFILE.md") == "new"
+    assert tools.cache_stats()["invalidations"] == 1
+
+
+def _run(script, tmp_path):
+    env = {**os.environ, "WORKSPACE": str(tmp_path / "workspace"), "PYTHONPATH": REPO_ROOT}
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(script)],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120,
+    )
+
+
+def test_bootstrap_never_imports_monolith(tmp_path):
+    result = _run("""
+        import sys
+        from types import SimpleNamespace
+        import coco.cli
+        from coco.tools import build_tool_system
+
+        build_tool_system(SimpleNamespace(workspace=".", console=None, debug=False))
+        print("cocoa" in sys.modules)
+    """, tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_startup_never_imports_monolith(tmp_path):
+    for module in ("rich", "prompt_toolkit", "anthropic", "numpy", "pytz"):
+        pytest.importorskip(module)
+
+    result = _run("""
+        import sys
+        from coco import cli
+        from coco.ui.orchestrator import UIOrchestrator
+
+        UIOrchestrator.run_conversation_loop = lambda self: None
+        cli.main()
+        print("cocoa" in sys.modules)
+    """, tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "False"
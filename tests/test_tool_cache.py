@@ -0,0 +1,167 @@
+"""Tests for the tool result cache in ``coco.tools.registry``."""
+
+import sys
+import time
+from types import SimpleNamespace
+
+from coco.tools import email, filesystem, web
+from coco.tools.registry import ToolDefinition, ToolFailure, ToolRegistry, ToolResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _registry(clock):
+    calls = []
+    files = {"notes/a.md": "v1", "notes/b.md": "b"}
+    registry = ToolRegistry(cache=ToolResultCache(clock=clock))
+
+    def read_file(path):
+        calls.append(("read_file", path))
+        return files.get(path) or ToolFailure(f"Error reading {path}: missing")
+
+    def search_patterns(pattern, path="workspace"):
+        calls.append(("search_patterns", path))
+        return [p for p, text in files.items() if pattern in text]
+
+    def write_file(path, content):
+        files[path.removeprefix("./")] = content
+        return f"Successfully manifested {len(content)} characters to {path}"
+
+    read_tools = ("read_file", "search_patterns")
+    registry.register(ToolDefinition(
+        name="read_file", description="", input_schema={}, handler=read_file,
+        cacheable=True, cache_ttl=30.0, cache_key="path",
+    ))
+    registry.register(ToolDefinition(
+        name="search_patterns", description="", input_schema={}, handler=search_patterns,
+        cacheable=True, cache_ttl=30.0, cache_key="path",
+    ))
+    registry.register(ToolDefinition(
+        name="write_file", description="", input_schema={}, handler=write_file,
+        cache_key="path", invalidates=read_tools,
+    ))
+    return registry, calls
+
+
+def test_repeated_reads_hit_cache_until_ttl_expires():
+    clock = FakeClock()
+    registry, calls = _registry(clock)
+
+    assert registry.execute("read_file", {"path": "notes/a.md"}) == "v1"
+    assert registry.execute("read_file", {"path": "notes/a.md"}) == "v1"
+    assert len(calls) == 1
+
+    clock.now += 31
+    registry.execute("read_file", {"path": "notes/a.md"})
+    assert len(calls) == 2
+
+    stats = registry.cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["expirations"] == 1
+
+
+def test_write_invalidates_only_overlapping_scopes():
+    registry, calls = _registry(FakeClock())
+    registry.execute("read_file", {"path": "notes/a.md"})
+    registry.execute("read_file", {"path": "notes/b.md"})
+    registry.execute("search_patterns", {"pattern": "v", "path": "notes"})
+
+    registry.execute("write_file", {"path": "./notes/a.md", "content": "v2"})
+
+    assert registry.execute("read_file", {"path": "notes/a.md"}) == "v2"
+    registry.execute("read_file", {"path": "notes/b.md"})  # untouched -> cached
+    registry.execute("search_patterns", {"pattern": "v", "path": "notes"})  # parent dir -> refreshed
+    assert calls.count(("read_file", "notes/b.md")) == 1
+    assert calls.count(("read_file", "notes/a.md")) == 2
+    assert calls.count(("search_patterns", "notes")) == 2
+    assert registry.cache_stats()["invalidations"] == 2
+
+
+def test_error_results_are_not_cached():
+    registry, calls = _registry(FakeClock())
+
+    registry.execute("read_file", {"path": "missing.md"})
+    registry.execute("read_file", {"path": "missing.md"})
+
+    assert len(calls) == 2
+    assert registry.cache_stats()["entries"] == 0
+
+
+def test_only_tool_failures_count_as_errors():
+    cacheable = ToolResultCache.is_cacheable_result
+    assert cacheable("Error reading notes: see the Tool use patterns section")
+    assert not cacheable(ToolFailure("Navigation error: boom"))
+    assert not cacheable(None)
+
+    registry = ToolRegistry()
+    registry.register(ToolDefinition(name="search_web", description="", input_schema={}, handler=None))
+    assert isinstance(registry.execute("search_web", {"query": "x"}), ToolFailure)
+
+
+def _assert_failure_not_cached(registry, name, tool_input):
+    first = registry.execute(name, tool_input)
+    second = registry.execute(name, tool_input)
+    assert isinstance(first, ToolFailure) and isinstance(second, ToolFailure)
+    stats = registry.cache_stats()
+    assert stats["entries"] == 0 and stats["hits"] == 0
+
+
+def test_filesystem_failures_are_not_cached(tmp_path):
+    registry = ToolRegistry()
+    filesystem.register(registry, SimpleNamespace(), {"workspace": tmp_path, "deployment_dir": tmp_path})
+
+    _assert_failure_not_cached(registry, "navigate_directory", {"path": "missing"})
+    _assert_failure_not_cached(registry, "search_patterns", {"pattern": "x", "path": "missing"})
+    _assert_failure_not_cached(registry, "explore_directory", {"path": "missing"})
+    _assert_failure_not_cached(registry, "read_file", {"path": "missing.md"})
+
+
+def test_email_failures_are_not_cached():
+    calls = []
+
+    def receive_emails(limit):
+        calls.append(limit)
+        raise ConnectionError("IMAP down")
+
+    registry = ToolRegistry()
+    email.register(registry, SimpleNamespace(), {"gmail": SimpleNamespace(receive_emails=receive_emails)})
+
+    _assert_failure_not_cached(registry, "check_emails", {"limit": 5})
+    assert len(calls) == 2
+
+
+def test_web_search_timeouts_are_not_cached(tmp_path, monkeypatch):
+    calls = []
+
+    class TavilyClient:
+        def __init__(self, api_key):
+            pass
+
+        def search(self, **params):
+            calls.append(params["query"])
+            time.sleep(0.05)
+            return {"results": []}
+
+    monkeypatch.setitem(sys.modules, "tavily", SimpleNamespace(TavilyClient=TavilyClient))
+    config = SimpleNamespace(tavily_api_key="key", anthropic_api_key="", tavily_timeout=0.01)
+    registry = ToolRegistry()
+    web.register(registry, config, {"workspace": tmp_path})
+
+    _assert_failure_not_cached(registry, "search_web", {"query": "coco"})
+    assert len(calls) == 2
+
+
+def test_cache_is_bounded():
+    cache = ToolResultCache(max_entries=2, clock=FakeClock())
+    for i in range(3):
+        cache.put("search_web", {"query": i}, f"r{i}", ttl=60)
+
+    assert cache.get("search_web", {"query": 0}) == (False, None)
+    assert cache.get("search_web", {"query": 2}) == (True, "r2")
@@ -0,0 +1,105 @@
+"""Tests for concurrent tool dispatch (``coco.engine.tool_dispatch``)."""
+
+import threading
+import time
+
+from coco.engine.tool_dispatch import ToolCall, ToolDispatcher
+from coco.tools.registry import CONCURRENCY_PARALLEL, CONCURRENCY_SERIAL
+
+
+class Recorder:
+    """Tool router that sleeps and tracks peak concurrency."""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, name, tool_input):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(tool_input.get("delay", self.delay))
+        with self.lock:
+            self.active -= 1
+        return f"{name}:{tool_input.get('q')}"
+
+
+def _policy(classes, timeouts=None):
+    timeouts = timeouts or {}
+    return lambda name: (classes.get(name, CONCURRENCY_SERIAL), timeouts.get(name))
+
+
+def test_parallel_tools_overlap_and_keep_order():
+    recorder = Recorder()
+    dispatcher = ToolDispatcher(recorder, _policy({"search_web": CONCURRENCY_PARALLEL}), max_workers=4)
+    calls = [ToolCall(f"toolu_{i}", "search_web", {"q": i}) for i in range(3)]
+
+    started = time.monotonic()
+    outcomes = dispatcher.run(calls)
+    elapsed = time.monotonic() - started
+
+    assert [o.id for o in outcomes] == ["toolu_0", "toolu_1", "toolu_2"]
+    assert [o.result for o in outcomes] == ["search_web:0", "search_web:1", "search_web:2"]
+    assert recorder.peak == 3
+    assert elapsed < 0.5
+    dispatcher.shutdown()
+
+
+def test_side_effecting_tools_are_serialized():
+    recorder = Recorder(delay=0.05)
+    dispatcher = ToolDispatcher(recorder, _policy({"search_web": CONCURRENCY_PARALLEL}))
+
+    outcomes = dispatcher.run([
+        ToolCall("a", "send_email", {"q": 1}),
+        ToolCall("b", "search_web", {"q": 2, "delay": 0.2}),
+        ToolCall("c", "send_email", {"q": 3}),
+    ])
+
+    assert [o.result for o in outcomes] == ["send_email:1", "search_web:2", "send_email:3"]
+    # Both emails ran on the serial lane while the search ran alongside them
+    assert recorder.peak == 2
+    dispatcher.shutdown()
+
+
+def test_timeout_reports_instead_of_blocking():
+    dispatcher = ToolDispatcher(
+        Recorder(delay=1.0),
+        _policy({"crawl_domain": CONCURRENCY_PARALLEL}, {"crawl_domain": 0.1}),
+    )
+
+    started = time.monotonic()
+    (outcome,) = dispatcher.run([ToolCall("x", "crawl_domain", {"q": "site"})])
+
+    assert outcome.timed_out
+    assert "timed out" in outcome.result
+    assert time.monotonic() - started < 0.5
+    dispatcher.shutdown()
+
+
+def test_tool_exception_becomes_error_result():
+    def explode(name, tool_input):
+        raise RuntimeError("boom")
+
+    (outcome,) = ToolDispatcher(explode).run([ToolCall("x", "write_file", {})])
+
+    assert outcome.result == "Tool execution error (write_file): boom"
+    assert not outcome.timed_out
+
+
+def test_code_memory_records_from_worker_threads(tmp_path):
+    from coco.memory.code_memory import CodeMemory
+
+    memory = CodeMemory(tmp_path)  # Opened on this thread, written from the lanes
+
+    def store(name, tool_input):
+        return memory.store_successful_code(tool_input["code"], "python", "demo")
+
+    dispatcher = ToolDispatcher(store, _policy({"run_code": CONCURRENCY_PARALLEL}), max_workers=4)
+    outcomes = dispatcher.run([ToolCall(f"t{i}", "run_code", {"code": f"print({i % 2})"}) for i in range(6)])
+    dispatcher.shutdown()
+
+    assert all(o.result.startswith("Code stored") for o in outcomes)
+    counts = memory.conn.execute("SELECT execution_count FROM code_snippets ORDER BY id").fetchall()
+    assert counts == [(3,), (3,)]
@@ -0,0 +1,91 @@
+"""Tests for the multi-round agentic tool loop in ``ConsciousnessEngine``."""
+
+from types import SimpleNamespace
+
+from fakes import FakeStreamingClient, text_block, tool_block
+
+from coco.engine.consciousness import ConsciousnessEngine
+from coco.engine.tool_loop import TurnBudget
+from coco.tools.registry import CONCURRENCY_PARALLEL, ToolDefinition, ToolRegistry
+
+
+def _registry():
+    registry = ToolRegistry()
+    registry.register(ToolDefinition(
+        name="search_web", description="", input_schema={},
+        handler=lambda query: f"results for {query}",
+        concurrency=CONCURRENCY_PARALLEL,
+    ))
+    return registry
+
+
+def _engine(client, **config):
+    engine = ConsciousnessEngine.__new__(ConsciousnessEngine)
+    engine.config = SimpleNamespace(planner_model="test-model", debug=False, **config)
+    engine.memory = SimpleNamespace(working_memory=[])
+    engine.tools = _registry()
+    engine.console = None
+    engine.claude = client
+    engine.last_stream_metrics = None
+    return engine
+
+
+MESSAGES = [{"role": "user", "content": "research then summarise"}]
+
+
+def test_follow_up_tool_calls_are_executed():
+    client = FakeStreamingClient([
+        [tool_block("t1", "search_web", {"query": "a"})],
+        [text_block("Need more. "), tool_block("t2", "search_web", {"query": "b"})],
+        [text_block("Done: a and b.")],
+    ])
+    engine = _engine(client)
+
+    response = engine._run_tool_loop("SYSTEM", [{"name": "search_web"}], MESSAGES)
+
+    assert "results for a" in response
+    assert "results for b" in response
+    assert response.endswith("Done: a and b.")
+    assert len(client.requests) == 3
+    # Prompt assembly happens once; every round reuses the same objects
+    assert all(r["system"] == "SYSTEM" for r in client.requests)
+    assert all(r["tools"] is client.requests[0]["tools"] for r in client.requests)
+    assert "tool_choice" not in client.requests[-1]
+
+    summary = engine.last_turn_budget.summary()
+    assert [r["tool_calls"] for r in summary["rounds"]] == [1, 1, 0]
+    assert summary["tokens_used"] == 3 * 142
+
+
+def test_round_limit_forces_final_answer_without_tools():
+    client = FakeStreamingClient([
+        [tool_block("t1", "search_web", {"query": "a"})],
+        [text_block("Here is what I found.")],
+    ])
+    engine = _engine(client, tool_loop_max_rounds=1)
+
+    response = engine._run_tool_loop("SYSTEM", [{"name": "search_web"}], MESSAGES)
+
+    assert response.endswith("Here is what I found.")
+    assert client.requests[-1]["tool_choice"] == {"type": "none"}
+
+
+def test_token_budget_stops_the_loop():
+    client = FakeStreamingClient([
+        [tool_block("t1", "search_web", {"query": "a"})],
+        [text_block("Out of budget summary.")],
+    ])
+    engine = _engine(client, tool_loop_max_tokens=100)
+
+    engine._run_tool_loop("SYSTEM", [{"name": "search_web"}], MESSAGES)
+
+    assert len(client.requests) == 2
+    assert client.requests[-1]["tool_choice"] == {"type": "none"}
+
+
+def test_budget_reports_exhaustion_reason():
+    now = [0.0]
+    budget = TurnBudget(max_rounds=5, max_seconds=10, max_tokens=1000, clock=lambda: now[0])
+    assert budget.exhausted_reason() is None
+    now[0] = 11.0
+    assert budget.exhausted_reason() == "time budget (10s)"